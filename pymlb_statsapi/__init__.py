@@ -1,5 +1,7 @@
 """Top-level package for MLB StatsAPI ETL App."""
 
+from typing import TYPE_CHECKING
+
 from .__version__ import __version__
 
 __author__ = "Nikolaus P. Schuetz"
@@ -7,3 +9,15 @@ __email__ = "poweredgesports@gmail.com"
 # __version__ = '0.1.3'
 
 from .model import StatsAPI, api
+
+if TYPE_CHECKING:
+    from .model.aio import AsyncStatsAPI
+
+
+def __getattr__(name: str):
+    # AsyncStatsAPI loads asyncio, so it's only imported when asked for
+    if name == "AsyncStatsAPI":
+        from .model import AsyncStatsAPI
+
+        return AsyncStatsAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
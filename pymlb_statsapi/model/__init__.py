@@ -2,5 +2,59 @@
 created by nikos at 4/21/21
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .batch import BatchCall, BatchResult
 from .factory import APIResponse, Endpoint, EndpointMethod
+from .ratelimit import FileLockBucket, RateLimiter, TokenBucket
 from .registry import StatsAPI, api, create_stats_api
+from .retry import RequestFailedError, RetryBudget, RetryPolicy
+from .session import HTTPSession
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from .aio import AsyncEndpoint, AsyncHTTPSession, AsyncStatsAPI
+    from .backfill import Backfill, BackfillCheckpoint
+    from .cache import FileCache, MemoryCache, ResponseCache, SQLiteCache
+    from .cas import ContentStore
+    from .instrumentation import Instrumentation, MetricsRegistry
+    from .live import LiveEvent, LiveGameTracker
+    from .scheduler import LiveScheduler
+    from .segments import SegmentLog
+    from .structs import Struct, StructDecoder
+
+# Exports imported on first access, so importing the package only loads what a plain
+# request needs (and never asyncio or sqlite3)
+_LAZY = {
+    "AsyncEndpoint": ".aio",
+    "AsyncHTTPSession": ".aio",
+    "AsyncStatsAPI": ".aio",
+    "Backfill": ".backfill",
+    "BackfillCheckpoint": ".backfill",
+    "FileCache": ".cache",
+    "MemoryCache": ".cache",
+    "ResponseCache": ".cache",
+    "SQLiteCache": ".cache",
+    "ContentStore": ".cas",
+    "Instrumentation": ".instrumentation",
+    "MetricsRegistry": ".instrumentation",
+    "LiveEvent": ".live",
+    "LiveGameTracker": ".live",
+    "LiveScheduler": ".scheduler",
+    "SegmentLog": ".segments",
+    "Struct": ".structs",
+    "StructDecoder": ".structs",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
@@ -0,0 +1,479 @@
+"""
+Asyncio client for MLB StatsAPI endpoints.
+
+``AsyncStatsAPI`` builds the same endpoints and methods from the same JSON schemas as
+``StatsAPI``, but every generated method is an ``async def`` that returns the same
+``APIResponse`` objects. Requests go through ``AsyncHTTPSession``, which bounds the
+number of requests in flight with a semaphore so one event loop can keep hundreds of
+requests running without opening hundreds of connections.
+
+Requires the optional ``httpx`` dependency::
+
+    pip install 'pymlb-statsapi[async]'
+
+Usage:
+    import asyncio
+    from pymlb_statsapi.model.aio import AsyncStatsAPI
+
+    async def main():
+        async with AsyncStatsAPI() as api:
+            schedule = await api.Schedule.schedule(sportId=1, date="2024-10-27")
+            game_pks = [g["gamePk"] for d in schedule.json()["dates"] for g in d["games"]]
+            boxscores = await asyncio.gather(*(api.Game.boxscore(game_pk=pk) for pk in game_pks))
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator, Callable, Iterable
+from functools import partial
+from time import perf_counter
+
+import requests
+
+from pymlb_statsapi.utils.log import LogMixin, sampled
+
+from .batch import BatchCall, BatchResult, arun_batch
+from .cache import CacheEntry, ResponseCache
+from .factory import APIResponse, Endpoint, EndpointMethod, build_response
+from .instrumentation import Instrumentation, RequestEvent
+from .ratelimit import RateLimiter
+from .registry import StatsAPI
+from .retry import RequestFailedError, RetryPolicy
+from .session import HTTPSession
+from .singleflight import SingleFlight
+
+
+class AsyncHTTPSession(LogMixin):
+    """
+    Async connection-pooled HTTP session with bounded concurrency.
+
+    The ``httpx.AsyncClient`` and the semaphore are created lazily inside the running
+    event loop. Transport errors are re-raised as ``requests`` exceptions so retry
+    handling is identical to the synchronous client.
+
+    Environment Variables:
+        PYMLB_STATSAPI__MAX_CONCURRENCY: Max requests in flight per session (default: 100)
+    """
+
+    MAX_CONCURRENCY = int(os.environ.get("PYMLB_STATSAPI__MAX_CONCURRENCY", "100"))
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        max_keepalive_connections: int | None = None,
+        headers: dict[str, str] | None = None,
+    ):
+        """
+        Configure the session (no client or connections are created here).
+
+        Args:
+            max_concurrency: Max requests in flight; also caps open connections
+            max_keepalive_connections: Idle connections kept alive (default: HTTPSession.POOL_MAXSIZE)
+            headers: Extra default headers sent with every request
+        """
+        super().__init__()
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.max_keepalive_connections = max_keepalive_connections or HTTPSession.POOL_MAXSIZE
+        self.headers = {**HTTPSession.DEFAULT_HEADERS, **(headers or {})}
+        self._client = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(max_concurrency={self.max_concurrency}, "
+            f"open={self._client is not None})"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    @property
+    def client(self):
+        """The underlying ``httpx.AsyncClient``, created on first access."""
+        if self._client is None:
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "AsyncStatsAPI requires httpx: pip install 'pymlb-statsapi[async]'"
+                ) from e
+
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+            self.log.debug("Opened %s", self)
+        return self._client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding the number of requests in flight."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @property
+    def is_open(self) -> bool:
+        """True if a client is currently open."""
+        return self._client is not None
+
+    # httpcore trace steps reported as instrumentation timings
+    TRACE_STEPS = {"connect_tcp": "connect", "start_tls": "tls"}
+
+    def _tracer(self, trace: dict) -> Callable:
+        """httpx trace extension filling ``trace`` with connect, tls and ttfb seconds."""
+        began = perf_counter()
+        started: dict[str, float] = {}
+
+        async def on_trace(name: str, info: dict):
+            # e.g. "connection.connect_tcp.started", "http11.receive_response_headers.complete"
+            step, _, phase = name.rpartition(".")
+            if phase == "started":
+                started[step] = perf_counter()
+            elif phase == "complete" and step in started:
+                elapsed = perf_counter() - started.pop(step)
+                kind = step.rpartition(".")[2]
+                if kind in self.TRACE_STEPS:
+                    trace[self.TRACE_STEPS[kind]] = elapsed
+                elif kind == "receive_response_headers":
+                    trace["ttfb"] = perf_counter() - began
+
+        return on_trace
+
+    async def get(
+        self,
+        url: str,
+        timeout: float | None = None,
+        headers: dict | None = None,
+        trace: dict | None = None,
+    ) -> requests.Response:
+        """
+        Issue a GET request, waiting for a concurrency slot first.
+
+        Args:
+            url: Fully resolved request URL
+            timeout: Request timeout in seconds
+            headers: Extra request headers
+            trace: Filled with connect / tls / ttfb seconds and bytes_wire, if given
+
+        Returns:
+            requests.Response with the body already loaded
+        """
+        import httpx
+
+        async with self.semaphore:
+            extensions = {"trace": self._tracer(trace)} if trace is not None else None
+            try:
+                response = await self.client.get(
+                    url, timeout=timeout, headers=headers, extensions=extensions
+                )
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+
+        if trace is not None:
+            trace["bytes_wire"] = response.num_bytes_downloaded
+        return build_response(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=response.content,
+            headers=dict(response.headers),
+            elapsed_ms=response.elapsed.total_seconds() * 1000,
+            reason=response.reason_phrase,
+        )
+
+    async def aclose(self):
+        """Close the client and all pooled connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+            self.log.debug("Closed %s", self)
+
+
+class AsyncEndpoint(Endpoint):
+    """
+    Endpoint whose generated methods are coroutine functions.
+
+    Parameter validation, URL building and response wrapping are shared with
+    ``Endpoint``; only the transport and the retry sleep are asynchronous.
+    """
+
+    is_async = True
+    session_class = AsyncHTTPSession
+
+    async def _execute_request(
+        self,
+        endpoint_method: EndpointMethod,
+        path_params: dict | None = None,
+        query_params: dict | None = None,
+    ) -> APIResponse:
+        """
+        Validate parameters, serve from cache if possible, otherwise fetch with retries.
+
+        Args:
+            endpoint_method: The method definition
+            path_params: Path parameters
+            query_params: Query parameters
+
+        Returns:
+            APIResponse object
+
+        Raises:
+            AssertionError: If parameters are invalid or the request fails after all retries
+            requests.exceptions.RequestException: If the connection fails after all retries
+        """
+        validated_path, validated_query, url = self._prepare_request(
+            endpoint_method, path_params, query_params
+        )
+        if self.instrumentation is None:
+            return await self._request(endpoint_method, validated_path, validated_query, url)
+
+        event = self.instrumentation.start(self.endpoint_name, endpoint_method.method_name, url)
+        try:
+            api_response = await self._request(
+                endpoint_method, validated_path, validated_query, url, event
+            )
+        except Exception as e:
+            self.instrumentation.finish(event, error=e)
+            raise
+        self.instrumentation.finish(event, api_response)
+        return api_response
+
+    async def _request(
+        self,
+        endpoint_method: EndpointMethod,
+        validated_path: dict,
+        validated_query: dict,
+        url: str,
+        event: RequestEvent | None = None,
+    ) -> APIResponse:
+        """Serve a validated request from the cache, or fetch it and update the cache."""
+        cache_key = self._cache_key(endpoint_method, validated_path, validated_query)
+        fresh, stale = self._cache_lookup(cache_key)
+        if fresh is not None:
+            return self._wrap_cached(fresh, endpoint_method, validated_path, validated_query)
+        if stale is not None and self.cache.serve_stale(stale):
+            self.cache.arefresh_in_background(
+                cache_key[0],
+                partial(self._fetch_and_store, endpoint_method, url, cache_key, stale),
+            )
+            return self._wrap_stale(stale, endpoint_method, validated_path, validated_query)
+
+        fetch = partial(self._fetch_and_store, endpoint_method, url, cache_key, stale, event)
+        try:
+            if self._coalesces(endpoint_method):
+                (response, retry_info, cache_kwargs), shared = await self.single_flight.ado(
+                    url, fetch
+                )
+                if shared and event is not None:
+                    event.coalesced = True
+            else:
+                response, retry_info, cache_kwargs = await fetch()
+        except (RequestFailedError, requests.exceptions.RequestException) as e:
+            if stale is None or not self.cache.serve_stale_on_error(stale, e):
+                raise
+            return self._wrap_stale(stale, endpoint_method, validated_path, validated_query, e)
+        return self._wrap_response(
+            response,
+            endpoint_method,
+            validated_path,
+            validated_query,
+            retry_info=retry_info,
+            **cache_kwargs,
+        )
+
+    async def _fetch_and_store(
+        self,
+        endpoint_method: EndpointMethod,
+        url: str,
+        cache_key: tuple[str, float] | None,
+        stale: CacheEntry | None,
+        event: RequestEvent | None = None,
+    ) -> tuple[requests.Response, dict, dict]:
+        """Fetch a cache miss (conditionally, given a stale entry) and update the cache."""
+        headers = self._conditional_headers(stale)
+        response, retry_info = await self._fetch(endpoint_method, url, headers=headers, event=event)
+
+        cache_kwargs = {}
+        if cache_key is not None:
+            response, cache_kwargs = self._cache_store(cache_key, response, stale)
+        return response, retry_info, cache_kwargs
+
+    async def _fetch(
+        self,
+        endpoint_method: EndpointMethod,
+        url: str,
+        headers: dict | None = None,
+        event: RequestEvent | None = None,
+    ) -> tuple[requests.Response, dict]:
+        """
+        GET the URL, retrying as the retry policy allows.
+
+        Args:
+            endpoint_method: The method definition (for logging)
+            url: Fully resolved request URL
+            headers: Extra request headers (conditional headers allow a 304 response)
+            event: Instrumentation event receiving the attempts and transfer timings
+
+        Returns:
+            Tuple of (requests.Response with status 200, or 304 for conditional requests;
+            retry info with attempts and backoff_seconds)
+
+        Raises:
+            RequestFailedError: On a non-retryable status, or once retries are exhausted
+            requests.exceptions.RequestException: If the connection fails after all retries
+        """
+        kwargs = {"timeout": self.TIMEOUT}
+        if headers:
+            kwargs["headers"] = headers
+        self.retry_policy.record_request()
+
+        log = self.log
+        attempt = 0
+        backoff = 0.0
+        while True:
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire(self.endpoint_name)
+                if log.isEnabledFor(logging.INFO) and sampled():
+                    log.info("GET %s", url)
+                if event is None:
+                    response = await self.session.get(url, **kwargs)
+                else:
+                    event.attempts = attempt + 1
+                    trace: dict = {}
+                    started = perf_counter()
+                    response = await self.session.get(url, trace=trace, **kwargs)
+                    event.record_transfer(response, perf_counter() - started, trace)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(self.endpoint_name, response)
+                self._check_response(response, allow_not_modified=bool(headers))
+                return response, {"attempts": attempt + 1, "backoff_seconds": round(backoff, 3)}
+
+            except (RequestFailedError, requests.exceptions.RequestException) as e:
+                delay = self._retry_delay(endpoint_method, attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                backoff += delay
+                attempt += 1
+
+    def batch(
+        self,
+        method_name: str,
+        params_list: Iterable[dict],
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Call one method for many parameter sets concurrently.
+
+        Same as ``Endpoint.batch`` but returns an async iterator; ``max_workers`` bounds
+        the number of tasks in flight.
+
+        Example:
+            >>> async for result in api.Game.batch("boxscore", [{"game_pk": pk} for pk in pks]):
+            ...     print(result.ok)
+        """
+        method = getattr(self, method_name)
+        label = f"{self.endpoint_name}.{method_name}"
+        calls = (
+            BatchCall(method=method, params=dict(params), label=label) for params in params_list
+        )
+        return arun_batch(calls, max_concurrency=max_workers, ordered=ordered)
+
+
+class AsyncStatsAPI(StatsAPI):
+    """
+    Async StatsAPI registry: every endpoint method is awaitable.
+
+    Use ``async with AsyncStatsAPI() as api`` or call ``await api.aclose()`` to release
+    connections; the synchronous ``close()`` is not available.
+    """
+
+    endpoint_class = AsyncEndpoint
+    session_class = AsyncHTTPSession
+
+    def __init__(
+        self,
+        excluded_methods: dict[str, set[str]] | None = None,
+        session: AsyncHTTPSession | None = None,
+        cache: ResponseCache | None = None,
+        lazy: bool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+        single_flight: SingleFlight | None = None,
+    ):
+        """
+        Initialize the async API registry.
+
+        Args:
+            excluded_methods: Dict mapping endpoint names to sets of method names to exclude.
+                             Defaults to EXCLUDED_METHODS if not provided.
+            session: Async session shared by all endpoints. If not provided, the registry
+                     creates (and owns) one.
+            cache: Optional response cache shared by all endpoints. Backends are
+                   synchronous; prefer MemoryCache inside an event loop.
+            lazy: Build endpoints and methods on first access (default: PYMLB_STATSAPI__LAZY)
+            rate_limiter: Client-side rate limiter shared by all endpoints; waits use
+                          ``asyncio.sleep`` (default: RateLimiter.from_env())
+            retry_policy: Retry policy shared by all endpoints (default: RetryPolicy())
+            instrumentation: Request hooks and metrics shared by all endpoints
+                             (default: Instrumentation.from_env())
+            single_flight: Coalescing of identical in-flight requests, across the tasks
+                           of one event loop (default: SingleFlight.from_env())
+        """
+        super().__init__(
+            excluded_methods=excluded_methods,
+            session=session,
+            cache=cache,
+            lazy=lazy,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            instrumentation=instrumentation,
+            single_flight=single_flight,
+        )
+
+    def batch(
+        self,
+        calls: Iterable[tuple[str | Callable, dict]],
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Execute many method calls concurrently (see ``StatsAPI.batch``).
+
+        Returns:
+            Async iterator of BatchResult
+        """
+        return arun_batch(
+            self._resolve_batch_calls(calls), max_concurrency=max_workers, ordered=ordered
+        )
+
+    async def aclose(self):
+        """Close the async session if it was created by this registry."""
+        if self._owns_session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def close(self):
+        raise TypeError(f"{self.__class__.__name__} must be closed with 'await aclose()'")
+
+    def __enter__(self):
+        raise TypeError(f"Use 'async with {self.__class__.__name__}()' instead of 'with'")
@@ -0,0 +1,303 @@
+"""
+Resumable historical backfills.
+
+``Backfill`` downloads every game in a date range:
+
+1. ``Schedule.schedule`` is fetched for each date (all ``sport_ids`` in one call) and
+   expanded into one work item per game and method (``Game.boxscore``,
+   ``Game.linescore`` and ``Game.playByPlay`` by default)
+2. Work items run concurrently on a ``run_batch`` thread pool; pass ``rate`` (or a
+   registry with a ``RateLimiter``) to stay under a request budget
+3. Every response is written with ``APIResponse.save_json`` to its ``get_uri`` path
+
+Each completed item is recorded in a ``BackfillCheckpoint`` (a SQLite file) with the
+path it was saved to, and a schedule with every game on it (gamePk and status).
+``game_filter`` is applied to those games when they are expanded. Running the same
+backfill again, e.g. after a crash hours in, skips every item whose file is still on
+disk without any request. The exception is anything that can still change. A schedule
+is fetched again while any of its games isn't final (scheduled, in progress,
+suspended), so games that finish later are picked up. Responses of games that weren't
+final (with ``game_filter=None``) are fetched again too.
+
+Usage:
+    from pymlb_statsapi.model.backfill import Backfill
+
+    backfill = Backfill("2024-03-28", "2024-09-30", sport_ids=[1], rate=10, prefix="backfill")
+    stats = backfill.run()
+    print(stats, backfill.failures)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from pymlb_statsapi.utils.codec import codec
+from pymlb_statsapi.utils.log import LogMixin
+
+from .batch import BatchCall, run_batch
+from .factory import APIResponse, build_resource_path
+
+DEFAULT_METHODS = ("Game.boxscore", "Game.linescore", "Game.playByPlay")
+
+
+def date_range(start: str | date, end: str | date) -> Iterator[date]:
+    """Dates from ``start`` to ``end``, both included (YYYY-MM-DD strings or dates)."""
+    day = date.fromisoformat(start) if isinstance(start, str) else start
+    last = date.fromisoformat(end) if isinstance(end, str) else end
+    while day <= last:
+        yield day
+        day += timedelta(days=1)
+
+
+def is_final(game: dict) -> bool:
+    """Default game filter: only games whose abstract state is Final."""
+    return game.get("status", {}).get("abstractGameState") == "Final"
+
+
+@dataclass
+class WorkItem:
+    """One request of a backfill, identified by its resource path."""
+
+    endpoint: str
+    method: str
+    params: dict = field(default_factory=dict)
+    # Fetch even if checkpointed, e.g. for a game that wasn't final yet
+    refetch: bool = False
+
+    @property
+    def key(self) -> str:
+        """Checkpoint key: the resource path of the request."""
+        params = {
+            name: ",".join(map(str, value)) if isinstance(value, list | tuple) else str(value)
+            for name, value in self.params.items()
+        }
+        return build_resource_path(self.endpoint, self.method, {}, params)
+
+
+class BackfillCheckpoint:
+    """
+    Completed work items of a backfill, stored in a SQLite file.
+
+    A single connection is shared across threads behind a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS completed (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                children TEXT,
+                completed_at REAL NOT NULL
+            )
+            """
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path})"
+
+    def get(self, key: str) -> tuple[str, list | None] | None:
+        """(saved path, children) of a completed item, or None (children: schedule games)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, children FROM completed WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], codec.loads(row[1]) if row[1] is not None else None
+
+    def is_done(self, key: str) -> bool:
+        """True if the item completed and its file is still on disk."""
+        entry = self.get(key)
+        return entry is not None and os.path.exists(entry[0])
+
+    def mark(self, key: str, path: str, children: list | None = None):
+        """Record a completed item."""
+        encoded = codec.dumps(children).decode() if children is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completed (key, path, children, completed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, path, encoded, time.time()),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM completed").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class Backfill(LogMixin):
+    """
+    Download schedules and per-game responses for a date range, resumably.
+
+    Environment Variables:
+        PYMLB_STATSAPI__BASE_FILE_PATH: Base directory responses are saved under
+            (see ``APIResponse.get_uri``)
+    """
+
+    def __init__(
+        self,
+        start: str | date,
+        end: str | date,
+        sport_ids: Iterable[int] = (1,),
+        methods: Iterable[str] = DEFAULT_METHODS,
+        api=None,
+        rate: float | None = None,
+        checkpoint: BackfillCheckpoint | str | None = None,
+        prefix: str = "",
+        gzip: bool = True,
+        max_workers: int | None = None,
+        game_filter: Callable[[dict], bool] | None = is_final,
+    ):
+        """
+        Args:
+            start: First date (YYYY-MM-DD)
+            end: Last date, included
+            sport_ids: Sports to fetch schedules for (1 = MLB, 11-14 = MiLB levels)
+            methods: "Endpoint.method" names called with ``game_pk`` for every game
+            api: StatsAPI registry (default: the shared ``api``, or a new one with a
+                 RateLimiter when ``rate`` is given)
+            rate: Max requests per second across all workers
+            checkpoint: Checkpoint or path of its SQLite file (default:
+                        ``<base path>/<prefix>/backfill.sqlite``)
+            prefix: Storage prefix passed to save_json / get_uri
+            gzip: Save responses gzipped
+            max_workers: Concurrent requests (default: PYMLB_STATSAPI__BATCH_WORKERS)
+            game_filter: Which schedule games to backfill (default: final games; None
+                         for all). Called with ``{"gamePk": ..., "status": {...}}`` per game.
+        """
+        super().__init__()
+        if api is None:
+            if rate is not None:
+                from .ratelimit import RateLimiter
+                from .registry import StatsAPI
+
+                api = StatsAPI(rate_limiter=RateLimiter(rate=rate))
+            else:
+                from .registry import api
+        self.api = api
+        self.dates = list(date_range(start, end))
+        self.sport_ids = list(sport_ids)
+        self.methods = [tuple(method.split(".", 1)) for method in methods]
+        self.prefix = prefix
+        self.gzip = gzip
+        self.max_workers = max_workers
+        self.game_filter = game_filter
+        if not isinstance(checkpoint, BackfillCheckpoint):
+            base = os.environ.get("PYMLB_STATSAPI__BASE_FILE_PATH", "./.var/local/mlb_statsapi")
+            checkpoint = BackfillCheckpoint(
+                checkpoint or os.path.join(base, prefix, "backfill.sqlite")
+            )
+        self.checkpoint = checkpoint
+        self.stats = {"fetched": 0, "skipped": 0, "failed": 0, "games": 0, "bytes": 0}
+        self.failures: list[tuple[str, Exception]] = []
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.dates[0] if self.dates else None}.."
+            f"{self.dates[-1] if self.dates else None}, sport_ids={self.sport_ids})"
+        )
+
+    def schedule_items(self) -> list[WorkItem]:
+        """One schedule request per date."""
+        return [
+            WorkItem("schedule", "schedule", {"sportId": self.sport_ids, "date": day.isoformat()})
+            for day in self.dates
+        ]
+
+    def game_items(self, game_pk: int, refetch: bool = False) -> list[WorkItem]:
+        """One request per configured method for a game."""
+        return [
+            WorkItem(endpoint.lower(), method, {"game_pk": game_pk}, refetch=refetch)
+            for endpoint, method in self.methods
+        ]
+
+    def _fetch(self, item: WorkItem) -> APIResponse:
+        """Request, save and checkpoint one item (runs on a batch worker thread)."""
+        method = getattr(self.api.get_endpoint(item.endpoint), item.method)
+        response = method(**item.params)
+        saved = response.save_json(prefix=self.prefix, gzip=self.gzip)
+        children = self._games(response.json()) if item.endpoint == "schedule" else None
+        # Checkpoint right after the write, so a crash can't leave an unrecorded file
+        self.checkpoint.mark(item.key, saved["path"], children)
+        return response
+
+    def _run_items(self, items: Iterable[WorkItem]):
+        """Fetch the items that aren't checkpointed yet."""
+        calls = (
+            BatchCall(method=self._fetch, params={"item": item}, label=item.key)
+            for item in items
+            if not self._skip(item)
+        )
+        for result in run_batch(calls, max_workers=self.max_workers, ordered=False):
+            if not result.ok:
+                self.stats["failed"] += 1
+                self.failures.append((result.call.label, result.error))
+                self.log.warning("Backfill of %s failed: %s", result.call.label, result.error)
+                continue
+            self.stats["fetched"] += 1
+            self.stats["bytes"] += len(result.response.content)
+
+    def _skip(self, item: WorkItem) -> bool:
+        if item.refetch:
+            return False
+        entry = self.checkpoint.get(item.key)
+        if entry is None or not os.path.exists(entry[0]):
+            return False
+        if item.endpoint == "schedule" and not all(map(is_final, entry[1] or [])):
+            # Games not final yet may still finish: fetch the schedule again
+            return False
+        self.stats["skipped"] += 1
+        return True
+
+    @staticmethod
+    def _games(schedule: dict) -> list[dict]:
+        """gamePk and status of every game on a schedule, for the checkpoint."""
+        return [
+            {"gamePk": game["gamePk"], "status": game.get("status", {})}
+            for day in schedule.get("dates", [])
+            for game in day.get("games", [])
+        ]
+
+    def run(self) -> dict:
+        """
+        Run (or resume) the backfill.
+
+        Returns:
+            Stats: fetched, skipped (already checkpointed), failed, games and bytes.
+            Failed items are listed in ``failures`` and retried by the next run.
+        """
+        schedules = self.schedule_items()
+        self._run_items(schedules)
+
+        def games() -> Iterator[WorkItem]:
+            seen = set()
+            for schedule in schedules:
+                entry = self.checkpoint.get(schedule.key)
+                for game in (entry[1] or []) if entry else []:
+                    if self.game_filter is not None and not self.game_filter(game):
+                        continue
+                    # Suspended games appear on the schedule of both dates
+                    if game["gamePk"] not in seen:
+                        seen.add(game["gamePk"])
+                        self.stats["games"] += 1
+                        yield from self.game_items(game["gamePk"], refetch=not is_final(game))
+
+        self._run_items(games())
+        self.log.info("%s finished: %s", self, self.stats)
+        return dict(self.stats)
@@ -0,0 +1,176 @@
+"""
+Batch execution of many endpoint method calls.
+
+A batch is an iterable of calls; each call runs through the normal generated method, so
+parameter validation and retries behave exactly as for a single call. Calls run on a
+bounded thread pool (or as bounded asyncio tasks for the async client) and results
+stream back as ``BatchResult`` objects, either in submission order or as they complete.
+A failing call is captured on its result instead of aborting the batch.
+
+Usage:
+    from pymlb_statsapi import api
+
+    schedule = api.Schedule.schedule(sportId=1, date="2024-10-27").json()
+    game_pks = [g["gamePk"] for d in schedule["dates"] for g in d["games"]]
+
+    for result in api.Game.batch("boxscore", [{"game_pk": pk} for pk in game_pks]):
+        if result.ok:
+            result.response.save_json(prefix="mlb-data")
+        else:
+            print(f"{result.call} failed: {result.error}")
+
+    # Mixed methods through the registry
+    calls = [("Game.boxscore", {"game_pk": 747175}), ("Game.linescore", {"game_pk": 747175})]
+    responses = [r.response for r in api.batch(calls)]
+"""
+
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .factory import APIResponse
+
+MAX_WORKERS = int(os.environ.get("PYMLB_STATSAPI__BATCH_WORKERS", "8"))
+
+
+@dataclass
+class BatchCall:
+    """A single method call in a batch."""
+
+    method: Callable
+    params: dict = field(default_factory=dict)
+    label: str = ""
+
+    def __str__(self):
+        args = ", ".join(f"{k}={v!r}" for k, v in self.params.items())
+        return f"{self.label or getattr(self.method, '__name__', 'call')}({args})"
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch call: either a response or the error it raised."""
+
+    index: int
+    call: BatchCall
+    response: "APIResponse | None" = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the call returned a response."""
+        return self.error is None
+
+
+def _run_call(index: int, call: BatchCall) -> BatchResult:
+    try:
+        return BatchResult(index=index, call=call, response=call.method(**call.params))
+    except Exception as e:
+        return BatchResult(index=index, call=call, error=e)
+
+
+def run_batch(
+    calls: Iterable[BatchCall],
+    max_workers: int | None = None,
+    ordered: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Execute calls on a bounded thread pool and stream back their results.
+
+    Calls are pulled from ``calls`` lazily, keeping at most ``2 * max_workers`` in
+    flight, so arbitrarily long generators can be batched without materializing them.
+
+    Args:
+        calls: Calls to execute
+        max_workers: Thread pool size (default: PYMLB_STATSAPI__BATCH_WORKERS or 8).
+                     Keep it at or below the session pool size to reuse connections.
+        ordered: Yield results in submission order (True) or as they complete (False)
+
+    Yields:
+        BatchResult for every call
+    """
+    max_workers = max_workers or MAX_WORKERS
+    window = 2 * max_workers
+    indexed = enumerate(calls)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="statsapi-batch") as pool:
+
+        def submit(n: int) -> list[Future]:
+            return [pool.submit(_run_call, i, call) for i, call in islice(indexed, n)]
+
+        pending: deque[Future] | set[Future] = deque() if ordered else set()
+        try:
+            if ordered:
+                pending.extend(submit(window))
+                while pending:
+                    result = pending.popleft().result()
+                    pending.extend(submit(1))
+                    yield result
+            else:
+                pending |= set(submit(window))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    pending |= set(submit(len(done)))
+                    for future in done:
+                        yield future.result()
+        finally:
+            # Consumer stopped early: don't start calls nobody will read
+            for future in pending:
+                future.cancel()
+
+
+async def _arun_call(index: int, call: BatchCall) -> BatchResult:
+    try:
+        return BatchResult(index=index, call=call, response=await call.method(**call.params))
+    except Exception as e:
+        return BatchResult(index=index, call=call, error=e)
+
+
+async def arun_batch(
+    calls: Iterable[BatchCall],
+    max_concurrency: int | None = None,
+    ordered: bool = True,
+) -> AsyncIterator[BatchResult]:
+    """
+    Execute async method calls as bounded asyncio tasks and stream back their results.
+
+    Args:
+        calls: Calls whose methods are coroutine functions (AsyncEndpoint methods)
+        max_concurrency: Max tasks in flight (default: PYMLB_STATSAPI__BATCH_WORKERS or 8).
+                         The session semaphore still bounds actual HTTP concurrency.
+        ordered: Yield results in submission order (True) or as they complete (False)
+
+    Yields:
+        BatchResult for every call
+    """
+    # Imported here so sync-only users never load asyncio
+    import asyncio
+
+    max_concurrency = max_concurrency or MAX_WORKERS
+    indexed = enumerate(calls)
+
+    def submit(n: int) -> list[asyncio.Task]:
+        return [asyncio.ensure_future(_arun_call(i, call)) for i, call in islice(indexed, n)]
+
+    pending: deque[asyncio.Task] | set[asyncio.Task] = deque() if ordered else set()
+    try:
+        if ordered:
+            pending.extend(submit(max_concurrency))
+            while pending:
+                result = await pending.popleft()
+                pending.extend(submit(1))
+                yield result
+        else:
+            pending |= set(submit(max_concurrency))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending |= set(submit(len(done)))
+                for task in done:
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
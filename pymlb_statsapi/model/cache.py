@@ -0,0 +1,727 @@
+"""
+Opt-in response caching for MLB StatsAPI requests.
+
+Responses are keyed by the same deterministic resource path as ``APIResponse.get_path()``
+(endpoint, method, path params and sorted query params), so identical requests are
+served locally until their TTL expires. TTLs are configured per ``endpoint.method``
+with glob patterns: reference data such as ``config.*`` or ``season.*`` can be cached
+for a day while ``game.liveGameV1`` is cached for a few seconds.
+
+Three storage backends are provided:
+- ``MemoryCache``: in-process LRU
+- ``FileCache``: one metadata + body file pair per entry under a directory
+- ``SQLiteCache``: a single SQLite database file
+
+Backends keep entries past their TTL (until evicted) so later layers can revalidate
+or serve them stale; freshness is decided by ``ResponseCache``.
+
+With ``revalidate=True``, an expired entry that carries an ``ETag`` or ``Last-Modified``
+validator is revalidated with ``If-None-Match`` / ``If-Modified-Since``. A ``304 Not
+Modified`` refreshes the entry's TTL and the stored body is returned, so polling an
+unchanged resource transfers only headers.
+
+Expired entries can also be served without waiting for the network (RFC 5861):
+
+- ``stale_while_revalidate``: for this many seconds past expiry the stored response is
+  returned immediately while a background refresh updates the entry
+- ``stale_if_error``: for this many seconds past expiry the stored response is
+  returned when the request fails (connection errors, timeouts, 429 and 5xx)
+
+Stale responses carry ``cache_info`` status ``stale`` or ``stale-if-error`` with
+``stale_seconds`` (and the ``error`` served around), recorded in ``get_metadata()``.
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.cache import ResponseCache, SQLiteCache
+
+    cache = ResponseCache(
+        SQLiteCache("statsapi-cache.db"), ttls={"standings.*": 600}, revalidate=True
+    )
+    api = StatsAPI(cache=cache)
+
+    api.Standings.standings("regularSeason", leagueId=103, season=2024)  # network
+    api.Standings.standings("regularSeason", leagueId=103, season=2024)  # cache hit
+    print(cache.stats)  # {'hits': 1, 'misses': 1, 'stores': 1, 'revalidations': 0, ...}
+
+    # Dashboards: answer instantly from copies up to 30s stale, and for up to an hour
+    # when StatsAPI is down
+    cache = ResponseCache(stale_while_revalidate=30, stale_if_error=3600)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from fnmatch import fnmatchcase
+
+import requests
+
+from pymlb_statsapi.utils.log import LogMixin
+
+from .factory import build_response
+from .retry import RequestFailedError
+
+# Headers of a 304 that must not overwrite the stored response's headers
+_BODY_HEADERS = {"content-length", "content-type", "content-encoding", "transfer-encoding"}
+
+# TTLs in seconds by "endpoint.method" glob. 0 disables caching for a match.
+DEFAULT_TTLS = {
+    "config.*": 24 * 60 * 60,
+    "season.*": 24 * 60 * 60,
+    "sports.*": 24 * 60 * 60,
+    "league.*": 24 * 60 * 60,
+    "division.*": 24 * 60 * 60,
+    "conference.*": 24 * 60 * 60,
+    "standings.*": 5 * 60,
+    "schedule.*": 60,
+    "game.liveGameV1": 5,
+    "game.liveGameDiffPatchV1": 0,
+    "game.liveTimestampv11": 0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with the metadata needed to rebuild it."""
+
+    key: str
+    url: str
+    status_code: int
+    content: bytes
+    headers: dict = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+    stored_at: float = 0.0
+    expires_at: float = 0.0
+
+    @classmethod
+    def from_response(cls, key: str, response: requests.Response, ttl: float) -> "CacheEntry":
+        """Build an entry from a live response, expiring ``ttl`` seconds from now."""
+        now = time.time()
+        return cls(
+            key=key,
+            url=response.url,
+            status_code=response.status_code,
+            content=response.content,
+            headers=dict(response.headers),
+            elapsed_ms=response.elapsed.total_seconds() * 1000,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+
+    def _header(self, name: str) -> str | None:
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def etag(self) -> str | None:
+        """ETag validator of the stored response"""
+        return self._header("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Last-Modified validator of the stored response"""
+        return self._header("Last-Modified")
+
+    @property
+    def has_validators(self) -> bool:
+        """True if the entry can be revalidated with a conditional request"""
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> dict:
+        """Request headers that revalidate this entry."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """True if the entry has not reached its expiry time."""
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the entry was stored."""
+        return (now if now is not None else time.time()) - self.stored_at
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a ``requests.Response`` for wrapping in an APIResponse."""
+        return build_response(
+            url=self.url,
+            status_code=self.status_code,
+            content=self.content,
+            headers=self.headers,
+            elapsed_ms=self.elapsed_ms,
+        )
+
+    def meta(self) -> dict:
+        """JSON-serializable entry metadata (everything except the body)."""
+        meta = asdict(self)
+        meta.pop("content")
+        return meta
+
+    @classmethod
+    def from_meta(cls, meta: dict, content: bytes) -> "CacheEntry":
+        """Rebuild an entry from ``meta()`` output and the stored body."""
+        return cls(content=content, **meta)
+
+
+class CacheBackend(LogMixin, ABC):
+    """
+    Base class for cache storage backends.
+
+    Backends are thread-safe key/value stores of CacheEntry objects with LRU eviction
+    once ``max_entries`` is exceeded. They never drop an entry because it expired.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        super().__init__()
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._lock = threading.RLock()
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key`` (fresh or not) and mark it recently used."""
+
+    @abstractmethod
+    def set(self, entry: CacheEntry):
+        """Store ``entry``, evicting least recently used entries if over capacity."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries."""
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def close(self):
+        """Release any resources held by the backend."""
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache."""
+
+    def __init__(self, max_entries: int | None = 1024):
+        super().__init__(max_entries=max_entries)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, entry: CacheEntry):
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while self.max_entries is not None and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class FileCache(CacheBackend):
+    """
+    On-disk cache: each entry is a ``.meta.json`` + ``.body`` file pair.
+
+    Files are sharded by the first two hex characters of the key's SHA-256. File
+    modification times track recency for LRU eviction. A running entry count avoids
+    walking the directory on every ``set``: only once it passes ``max_entries`` are the
+    least recently used entries evicted, in one batch down to 90% of ``max_entries``.
+
+    Environment Variables:
+        PYMLB_STATSAPI__CACHE_DIR: Default cache directory (default: ./.var/cache/mlb_statsapi)
+    """
+
+    def __init__(self, directory: str | None = None, max_entries: int | None = None):
+        super().__init__(max_entries=max_entries)
+        self.directory = directory or os.environ.get(
+            "PYMLB_STATSAPI__CACHE_DIR", "./.var/cache/mlb_statsapi"
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        # Entries on disk, counted on first use and recounted at each eviction
+        self._count: int | None = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(directory={self.directory})"
+
+    def _paths(self, key: str) -> tuple[str, str]:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, digest[:2], digest)
+        return base + ".meta.json", base + ".body"
+
+    def _meta_files(self) -> list[str]:
+        meta_files = []
+        for root, _, files in os.walk(self.directory):
+            meta_files.extend(os.path.join(root, f) for f in files if f.endswith(".meta.json"))
+        return meta_files
+
+    def get(self, key: str) -> CacheEntry | None:
+        meta_path, body_path = self._paths(key)
+        with self._lock:
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(body_path, "rb") as f:
+                    content = f.read()
+            except (FileNotFoundError, json.JSONDecodeError):
+                return None
+            os.utime(meta_path)
+        return CacheEntry.from_meta(meta, content)
+
+    def set(self, entry: CacheEntry):
+        meta_path, body_path = self._paths(entry.key)
+        with self._lock:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            new = not os.path.exists(meta_path)
+            # Body first, then metadata: a reader never sees metadata without its body
+            for path, data in (
+                (body_path, entry.content),
+                (meta_path, json.dumps(entry.meta()).encode("utf-8")),
+            ):
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            if self.max_entries is not None:
+                if self._count is None:
+                    self._count = len(self._meta_files())
+                elif new:
+                    self._count += 1
+                if self._count > self.max_entries:
+                    self._evict()
+
+    def _evict(self):
+        # Recount: other processes may share the directory
+        meta_files = self._meta_files()
+        excess = len(meta_files) - (self.max_entries - self.max_entries // 10)
+        if len(meta_files) > self.max_entries:
+            for meta_path in sorted(meta_files, key=os.path.getmtime)[:excess]:
+                self._remove(meta_path)
+                self.evictions += 1
+            self._count = len(meta_files) - excess
+        else:
+            self._count = len(meta_files)
+
+    @staticmethod
+    def _remove(meta_path: str) -> bool:
+        """Remove an entry's files; True if its metadata existed."""
+        existed = True
+        for path in (meta_path, meta_path[: -len(".meta.json")] + ".body"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                existed = existed and path != meta_path
+        return existed
+
+    def delete(self, key: str):
+        with self._lock:
+            if self._remove(self._paths(key)[0]) and self._count:
+                self._count -= 1
+
+    def clear(self):
+        with self._lock:
+            for meta_path in self._meta_files():
+                self._remove(meta_path)
+            self._count = 0
+
+    def __len__(self) -> int:
+        return len(self._meta_files())
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Cache stored in a single SQLite database.
+
+    A single connection is shared across threads behind a lock; the database can be
+    shared by several processes (SQLite handles file locking).
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: int | None = None):
+        super().__init__(max_entries=max_entries)
+        self.path = path
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                meta TEXT NOT NULL,
+                content BLOB NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path})"
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta, content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CacheEntry.from_meta(json.loads(row[0]), bytes(row[1]))
+
+    def set(self, entry: CacheEntry):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, meta, content, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (entry.key, json.dumps(entry.meta()), entry.content, time.time()),
+            )
+            if self.max_entries is not None:
+                excess = len(self) - self.max_entries
+                if excess > 0:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE key IN "
+                        "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                        (excess,),
+                    )
+                    self.evictions += excess
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache(LogMixin):
+    """
+    Cache policy in front of ``Endpoint._execute_request``.
+
+    Decides the TTL for each ``endpoint.method``, looks up fresh entries, stores new
+    responses in the backend and counts hits, misses and stores.
+
+    Environment Variables:
+        PYMLB_STATSAPI__CACHE_TTL: TTL in seconds for methods without a TTL rule (default: 60)
+        PYMLB_STATSAPI__CACHE_STALE_WHILE_REVALIDATE: Seconds past expiry an entry is
+            served while it refreshes in the background (default: 0, off)
+        PYMLB_STATSAPI__CACHE_STALE_IF_ERROR: Seconds past expiry an entry is served
+            when the request fails (default: 0, off)
+    """
+
+    DEFAULT_TTL = float(os.environ.get("PYMLB_STATSAPI__CACHE_TTL", "60"))
+    STALE_WHILE_REVALIDATE = float(
+        os.environ.get("PYMLB_STATSAPI__CACHE_STALE_WHILE_REVALIDATE", "0")
+    )
+    STALE_IF_ERROR = float(os.environ.get("PYMLB_STATSAPI__CACHE_STALE_IF_ERROR", "0"))
+
+    # Threads running stale-while-revalidate refreshes of synchronous endpoints
+    REFRESH_WORKERS = 4
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float | None = None,
+        revalidate: bool = False,
+        stale_while_revalidate: float | None = None,
+        stale_if_error: float | None = None,
+    ):
+        """
+        Args:
+            backend: Storage backend (default: MemoryCache())
+            ttls: TTL overrides by "endpoint.method" glob, merged over DEFAULT_TTLS.
+                  Exact names win over globs; longer globs win over shorter ones.
+            default_ttl: TTL for methods matching no rule (default: DEFAULT_TTL)
+            revalidate: Revalidate expired entries with conditional requests
+            stale_while_revalidate: Seconds past expiry an entry is served immediately
+                                    while refreshed in the background
+                                    (default: STALE_WHILE_REVALIDATE)
+            stale_if_error: Seconds past expiry an entry is served when the request
+                            fails (default: STALE_IF_ERROR)
+        """
+        super().__init__()
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl if default_ttl is not None else self.DEFAULT_TTL
+        self.revalidate = revalidate
+        self.stale_while_revalidate = (
+            stale_while_revalidate
+            if stale_while_revalidate is not None
+            else self.STALE_WHILE_REVALIDATE
+        )
+        self.stale_if_error = stale_if_error if stale_if_error is not None else self.STALE_IF_ERROR
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.revalidations = 0
+        self.stale_served = 0
+        self.stale_errors = 0
+        self._ttl_cache: dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Keys being refreshed in the background, and what runs the refreshes
+        self._refreshing: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._tasks: set = set()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(backend={self.backend!r})"
+
+    def ttl_for(self, endpoint_name: str, method_name: str) -> float:
+        """
+        Resolve the TTL in seconds for an endpoint method.
+
+        Example:
+            >>> ResponseCache().ttl_for("config", "gameStatus")
+            86400
+        """
+        name = f"{endpoint_name}.{method_name}"
+        ttl = self._ttl_cache.get(name)
+        if ttl is None:
+            if name in self.ttls:
+                ttl = self.ttls[name]
+            else:
+                matches = [p for p in self.ttls if fnmatchcase(name, p)]
+                ttl = self.ttls[max(matches, key=len)] if matches else self.default_ttl
+            self._ttl_cache[name] = ttl
+        return ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key`` if it is fresh, counting a hit or miss."""
+        entry = self.backend.get(key)
+        fresh = entry is not None and entry.is_fresh()
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry if fresh else None
+
+    def lookup(self, key: str) -> tuple[CacheEntry | None, CacheEntry | None]:
+        """
+        Look up ``key`` for a request about to be made.
+
+        Counts a hit when a fresh entry exists and a miss otherwise.
+
+        Returns:
+            Tuple of (fresh entry, stale entry). At most one is set; the second is only
+            returned when the expired entry can still be used: revalidated (when
+            revalidation is enabled and it has validators) or served stale (while
+            within the stale_while_revalidate or stale_if_error window).
+        """
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is not None and entry.is_fresh(now):
+            with self._lock:
+                self.hits += 1
+            return entry, None
+        with self._lock:
+            self.misses += 1
+        if entry is None:
+            return None, None
+        if self.revalidate and entry.has_validators:
+            return None, entry
+        if self.staleness(entry, now) <= max(self.stale_while_revalidate, self.stale_if_error):
+            return None, entry
+        return None, None
+
+    def staleness(self, entry: CacheEntry, now: float | None = None) -> float:
+        """Seconds since ``entry`` expired (0 while fresh)."""
+        return max((now if now is not None else time.time()) - entry.expires_at, 0.0)
+
+    def serve_stale(self, entry: CacheEntry) -> bool:
+        """True if an expired entry may be served while it refreshes in the background."""
+        if self.stale_while_revalidate <= 0 or self.staleness(entry) > self.stale_while_revalidate:
+            return False
+        with self._lock:
+            self.stale_served += 1
+        return True
+
+    def serve_stale_on_error(self, entry: CacheEntry, error: BaseException) -> bool:
+        """
+        True if an expired entry may be served in place of a failed request.
+
+        Connection errors and timeouts qualify, as do 429 and 5xx responses; other
+        statuses (e.g. a 404 for a bad parameter) are raised as usual.
+        """
+        if self.stale_if_error <= 0 or self.staleness(entry) > self.stale_if_error:
+            return False
+        if isinstance(error, RequestFailedError):
+            if error.status_code != 429 and error.status_code < 500:
+                return False
+        elif not isinstance(error, requests.exceptions.RequestException):
+            return False
+        with self._lock:
+            self.stale_errors += 1
+        return True
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: str):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def is_refreshing(self, key: str) -> bool:
+        """True while a background refresh of ``key`` is running."""
+        with self._lock:
+            return key in self._refreshing
+
+    def refresh_in_background(self, key: str, refresh: Callable[[], object]) -> bool:
+        """
+        Run ``refresh`` on the cache's thread pool, unless ``key`` is already refreshing.
+
+        Returns:
+            True if a refresh was started
+        """
+        if not self._claim_refresh(key):
+            return False
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+                )
+        self._executor.submit(self._run_refresh, key, refresh)
+        return True
+
+    def _run_refresh(self, key: str, refresh: Callable[[], object]):
+        try:
+            refresh()
+        except Exception as e:
+            self.log.warning("Background refresh of %s failed: %s", key, e)
+        finally:
+            self._release_refresh(key)
+
+    def arefresh_in_background(self, key: str, refresh: Callable[[], Awaitable]) -> bool:
+        """
+        Async ``refresh_in_background``: run ``refresh()`` as a task on the running loop.
+
+        Returns:
+            True if a refresh was started
+        """
+        if not self._claim_refresh(key):
+            return False
+
+        async def run():
+            try:
+                await refresh()
+            except Exception as e:
+                self.log.warning("Background refresh of %s failed: %s", key, e)
+            finally:
+                self._release_refresh(key)
+
+        import asyncio
+
+        # Hold a reference until done; the loop only keeps weak references to tasks
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def refresh(self, entry: CacheEntry, response: requests.Response, ttl: float) -> CacheEntry:
+        """
+        Refresh a stale entry after a ``304 Not Modified``.
+
+        The stored body is kept; headers sent with the 304 (new validators, Date,
+        Cache-Control) replace the stored ones and the TTL restarts.
+        """
+        now = time.time()
+        headers = dict(entry.headers)
+        for name, value in response.headers.items():
+            if name.lower() not in _BODY_HEADERS:
+                headers = {k: v for k, v in headers.items() if k.lower() != name.lower()}
+                headers[name] = value
+        refreshed = replace(entry, headers=headers, stored_at=now, expires_at=now + ttl)
+        self.backend.set(refreshed)
+        with self._lock:
+            self.revalidations += 1
+        return refreshed
+
+    def put(self, key: str, response: requests.Response, ttl: float) -> CacheEntry:
+        """Store a response under ``key`` for ``ttl`` seconds."""
+        entry = CacheEntry.from_response(key, response, ttl)
+        self.backend.set(entry)
+        with self._lock:
+            self.stores += 1
+        return entry
+
+    def invalidate(self, key: str):
+        """Remove ``key`` from the backend."""
+        self.backend.delete(key)
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.stores = self.revalidations = 0
+            self.stale_served = self.stale_errors = 0
+            self.backend.evictions = 0
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss/store/revalidation/stale/eviction counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "revalidations": self.revalidations,
+            "stale": self.stale_served,
+            "stale_if_error": self.stale_errors,
+            "evictions": self.backend.evictions,
+            "size": len(self.backend),
+        }
+
+    def close(self):
+        """Wait for background refreshes, then close the backend."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.backend.close()
@@ -0,0 +1,329 @@
+"""
+Content-addressed, deduplicated response store.
+
+``save_json`` writes one file per request, so an archive built by polling holds the
+same bytes over and over: a roster that didn't change for a month is a month of
+identical files. ``ContentStore`` keeps every unique body once:
+
+- ``objects/ab/abcdef...``: bodies named by the SHA-256 of their bytes, sharded by the
+  first two hex characters and gzipped unless ``gzip=False``
+- ``index.sqlite``: one row per stored response (resource path key, timestamp,
+  content hash and metadata), so every capture is kept while its body is shared
+
+Responses can be looked up by key (latest, or as of a timestamp), listed by key prefix
+and deleted; ``gc()`` then removes bodies no response refers to any more.
+
+Usage:
+    from pymlb_statsapi import api
+    from pymlb_statsapi.model.cas import ContentStore
+
+    store = ContentStore()
+    store.put(api.Team.roster(teamId=147, date="2024-07-01"))
+    store.get("team/roster/teamId=147/date=2024-07-01")  # APIResponse
+    store.stats()  # {"responses": ..., "objects": ..., "dedup_ratio": ...}
+"""
+
+import gzip as gzip_module
+import hashlib
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+
+from pymlb_statsapi.utils.codec import codec
+from pymlb_statsapi.utils.log import LogMixin
+
+from .factory import APIResponse, atomic_open, write_chunks
+
+
+class ContentStore(LogMixin):
+    """
+    Responses stored once per unique body, indexed by request key and timestamp.
+
+    The index is a single SQLite connection shared across threads behind a lock.
+    Writes and ``gc()`` in one process are safe together; run ``gc()`` while no other
+    process writes to the same store.
+
+    Environment Variables:
+        PYMLB_STATSAPI__CAS_DIR: Default store directory
+            (default: <PYMLB_STATSAPI__BASE_FILE_PATH>/cas)
+    """
+
+    def __init__(self, directory: str | None = None, gzip: bool = True):
+        """
+        Args:
+            directory: Store directory (default: PYMLB_STATSAPI__CAS_DIR)
+            gzip: Compress new bodies with gzip (level PYMLB_STATSAPI__GZIP_LEVEL)
+        """
+        super().__init__()
+        self.directory = directory or os.environ.get(
+            "PYMLB_STATSAPI__CAS_DIR",
+            os.path.join(
+                os.environ.get("PYMLB_STATSAPI__BASE_FILE_PATH", "./.var/local/mlb_statsapi"),
+                "cas",
+            ),
+        )
+        self.gzip = gzip
+        os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.directory, "index.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS objects (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                gzip INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS responses (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                metadata TEXT
+            );
+            CREATE INDEX IF NOT EXISTS responses_key ON responses (key, timestamp);
+            CREATE INDEX IF NOT EXISTS responses_hash ON responses (hash);
+            """
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(directory={self.directory})"
+
+    def object_path(self, digest: str, gzip: bool | None = None) -> str:
+        """Path of the body with SHA-256 ``digest``."""
+        gzip = self.gzip if gzip is None else gzip
+        return os.path.join(
+            self.directory, "objects", digest[:2], digest[2:] + (".gz" if gzip else "")
+        )
+
+    def _write_object(self, path: str, content: bytes, gzip: bool) -> int:
+        with atomic_open(path, gzip=gzip, compresslevel=APIResponse.GZIP_LEVEL) as f:
+            write_chunks(f, content)
+        return os.path.getsize(path)
+
+    def put(self, response: APIResponse, prefix: str = "") -> dict:
+        """
+        Store a response under its resource path (``get_path(prefix)``).
+
+        Returns:
+            Dict with 'key', 'hash', 'timestamp', 'size' and 'new' (True if the body
+            wasn't stored yet)
+        """
+        return self.put_bytes(
+            response.get_path(prefix=prefix),
+            response.content,
+            timestamp=response.timestamp,
+            metadata=response.get_metadata(),
+        )
+
+    def put_bytes(
+        self, key: str, content: bytes, timestamp: str, metadata: dict | None = None
+    ) -> dict:
+        """
+        Store a body under ``key`` at ``timestamp`` (ISO 8601, UTC).
+
+        Args:
+            key: Request key, normally an ``APIResponse.get_path()``
+            content: Body bytes
+            timestamp: Capture time; versions of a key are ordered by it
+            metadata: ``APIResponse.get_metadata()`` output, needed by ``get()``
+
+        Returns:
+            Dict with 'key', 'hash', 'timestamp', 'size' and 'new'
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        row = self._object(digest)
+        gzip = self.gzip if row is None else bool(row[2])
+        path = self.object_path(digest, gzip)
+        if not os.path.exists(path):
+            # Written outside the lock; identical concurrent writes rename over each other
+            self._write_object(path, content, gzip)
+        encoded = codec.dumps(metadata).decode() if metadata is not None else None
+        with self._lock:
+            # gc() holds the lock, so the body can't disappear between check and insert
+            if not os.path.exists(path):
+                self._write_object(path, content, gzip)
+            new = (
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO objects (hash, size, stored_size, gzip) "
+                    "VALUES (?, ?, ?, ?)",
+                    (digest, len(content), os.path.getsize(path), int(gzip)),
+                ).rowcount
+                == 1
+            )
+            self._conn.execute(
+                "INSERT INTO responses (key, timestamp, hash, metadata) VALUES (?, ?, ?, ?)",
+                (key, timestamp, digest, encoded),
+            )
+        if new:
+            self.log.debug("Stored new object %s for %s", digest, key)
+        return {
+            "key": key,
+            "hash": digest,
+            "timestamp": timestamp,
+            "size": len(content),
+            "new": new,
+        }
+
+    def _object(self, digest: str) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT size, stored_size, gzip FROM objects WHERE hash = ?", (digest,)
+            ).fetchone()
+
+    def read(self, digest: str) -> bytes:
+        """
+        Body bytes with SHA-256 ``digest``.
+
+        Raises:
+            KeyError: If the store has no such body
+        """
+        row = self._object(digest)
+        if row is None:
+            raise KeyError(digest)
+        path = self.object_path(digest, bool(row[2]))
+        opener = gzip_module.open if row[2] else open
+        with opener(path, "rb") as f:
+            return f.read()
+
+    def lookup(self, key: str, at: str | None = None) -> dict | None:
+        """
+        Index entry of the latest version of ``key``, or the latest at or before ``at``.
+
+        Returns:
+            Dict with 'key', 'timestamp', 'hash' and 'metadata', or None
+        """
+        query = "SELECT key, timestamp, hash, metadata FROM responses WHERE key = ?"
+        params: tuple = (key,)
+        if at is not None:
+            query += " AND timestamp <= ?"
+            params += (at,)
+        with self._lock:
+            row = self._conn.execute(
+                query + " ORDER BY timestamp DESC, id DESC LIMIT 1", params
+            ).fetchone()
+        if row is None:
+            return None
+        metadata = codec.loads(row[3]) if row[3] is not None else None
+        return {"key": row[0], "timestamp": row[1], "hash": row[2], "metadata": metadata}
+
+    def get(self, key: str, at: str | None = None) -> APIResponse | None:
+        """
+        The latest stored response for ``key`` (as of ``at``, if given), or None.
+
+        Raises:
+            ValueError: If the version was stored by ``put_bytes`` without metadata
+        """
+        entry = self.lookup(key, at)
+        if entry is None:
+            return None
+        if entry["metadata"] is None:
+            raise ValueError(f"{key} at {entry['timestamp']} was stored without metadata")
+        return APIResponse.from_metadata(entry["metadata"], self.read(entry["hash"]))
+
+    def versions(self, key: str) -> list[dict]:
+        """Every stored version of ``key``, oldest first ('timestamp', 'hash', 'size')."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.timestamp, r.hash, o.size FROM responses r "
+                "JOIN objects o ON o.hash = r.hash WHERE r.key = ? ORDER BY r.timestamp, r.id",
+                (key,),
+            ).fetchall()
+        return [{"timestamp": t, "hash": h, "size": s} for t, h, s in rows]
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        """Stored keys starting with ``prefix``, in order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT key FROM responses WHERE substr(key, 1, ?) = ? ORDER BY key",
+                (len(prefix), prefix),
+            ).fetchall()
+        for (key,) in rows:
+            yield key
+
+    def delete(self, key: str | None = None, before: str | None = None) -> int:
+        """
+        Remove the versions of ``key`` (or of every key), optionally only older ones.
+
+        Bodies stay on disk until ``gc()``.
+
+        Args:
+            key: Key to remove (default: all keys)
+            before: Only remove versions captured before this timestamp
+
+        Returns:
+            Number of versions removed
+        """
+        if key is not None and before is not None:
+            query, params = "DELETE FROM responses WHERE key = ? AND timestamp < ?", (key, before)
+        elif key is not None:
+            query, params = "DELETE FROM responses WHERE key = ?", (key,)
+        elif before is not None:
+            query, params = "DELETE FROM responses WHERE timestamp < ?", (before,)
+        else:
+            query, params = "DELETE FROM responses", ()
+        with self._lock:
+            return self._conn.execute(query, params).rowcount
+
+    def gc(self) -> dict:
+        """
+        Remove bodies that no stored response refers to.
+
+        Returns:
+            Dict with 'objects' removed and 'bytes' freed on disk
+        """
+        removed, freed = 0, 0
+        with self._lock:
+            orphans = self._conn.execute(
+                "SELECT hash, stored_size, gzip FROM objects "
+                "WHERE hash NOT IN (SELECT hash FROM responses)"
+            ).fetchall()
+            for digest, stored_size, gzip in orphans:
+                try:
+                    os.remove(self.object_path(digest, bool(gzip)))
+                except FileNotFoundError:
+                    pass
+                self._conn.execute("DELETE FROM objects WHERE hash = ?", (digest,))
+                removed += 1
+                freed += stored_size
+        self.log.info("%s gc removed %s objects (%s bytes)", self, removed, freed)
+        return {"objects": removed, "bytes": freed}
+
+    def stats(self) -> dict:
+        """
+        Responses, unique bodies and sizes.
+
+        Returns:
+            Dict with 'responses', 'keys', 'objects', 'logical_bytes' (every version's
+            body), 'unique_bytes', 'stored_bytes' (on disk) and 'dedup_ratio'
+            (logical / stored)
+        """
+        with self._lock:
+            responses, keys, logical = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT r.key), COALESCE(SUM(o.size), 0) "
+                "FROM responses r JOIN objects o ON o.hash = r.hash"
+            ).fetchone()
+            objects, unique, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) "
+                "FROM objects"
+            ).fetchone()
+        return {
+            "responses": responses,
+            "keys": keys,
+            "objects": objects,
+            "logical_bytes": logical,
+            "unique_bytes": unique,
+            "stored_bytes": stored,
+            "dedup_ratio": round(logical / stored, 3) if stored else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
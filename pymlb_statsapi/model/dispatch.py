@@ -0,0 +1,241 @@
+"""
+Generated endpoint methods built from shared dispatchers instead of ``exec``.
+
+The ``exec`` engine compiles a new function from source for every schema operation. The
+``dispatch`` engine (the default) precomputes a routing table per operation once and
+binds it to one of four dispatcher functions that are compiled with this module: sync or
+async, single or overloaded. Each generated method carries an ``inspect.Signature`` so
+``help()``, ``inspect.signature`` and IDEs see the same signature as before, and calls
+route positional/keyword arguments and resolve overloads exactly like the ``exec`` engine.
+
+Select the engine with ``PYMLB_STATSAPI__METHOD_ENGINE=dispatch|exec``.
+"""
+
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .factory import Endpoint, EndpointMethod
+
+METHOD_ENGINES = ("dispatch", "exec")
+
+_POSITIONAL = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_KEYWORD = inspect.Parameter.KEYWORD_ONLY
+
+
+def _bind(route: "MethodRoute | OverloadRoute", args: tuple, kwargs: dict) -> dict:
+    """
+    Map positional arguments to names, or let ``Signature.bind`` raise for a bad call.
+
+    Only used off the fast path (positional arguments, unknown or missing names), so bad
+    calls raise the same TypeError as a regular function would.
+    """
+    if args and len(args) <= len(route.positional):
+        named = dict(zip(route.positional, args, strict=False))
+        if named.keys().isdisjoint(kwargs):
+            args, kwargs = (), {**named, **kwargs}
+    if args or not (route.accepted.issuperset(kwargs) and route.required.issubset(kwargs)):
+        return route.signature.bind(*args, **kwargs).arguments
+    return kwargs
+
+
+@dataclass(frozen=True)
+class MethodRoute:
+    """Routing table for a single (non-overloaded) operation."""
+
+    endpoint_method: "EndpointMethod"
+    signature: inspect.Signature
+    positional: tuple[str, ...]
+    path_names: frozenset[str]
+    query_names: tuple[str, ...]
+    required: frozenset[str]
+    accepted: frozenset[str]
+
+    @classmethod
+    def from_method(cls, endpoint_method: "EndpointMethod") -> "MethodRoute":
+        """
+        Build the route for an operation.
+
+        Signature pattern (same as the exec engine):
+        - Required path params: required positional/keyword args
+        - Optional path params: optional positional/keyword args (default=None)
+        - Query params not also in the path: keyword-only args (default=None)
+        """
+        path_defs = {p["name"]: p for p in endpoint_method.path_params}
+        # Deduplicated in schema order; path takes precedence over query
+        query_names = tuple(
+            dict.fromkeys(
+                p["name"] for p in endpoint_method.query_params if p["name"] not in path_defs
+            )
+        )
+
+        required = [name for name, p in path_defs.items() if p["required"]]
+        optional = [name for name, p in path_defs.items() if not p["required"]]
+        parameters = [inspect.Parameter(name, _POSITIONAL) for name in required]
+        parameters += [inspect.Parameter(name, _POSITIONAL, default=None) for name in optional]
+        parameters += [inspect.Parameter(name, _KEYWORD, default=None) for name in query_names]
+
+        return cls(
+            endpoint_method=endpoint_method,
+            signature=inspect.Signature(parameters),
+            positional=tuple(required + optional),
+            path_names=frozenset(path_defs),
+            query_names=query_names,
+            required=frozenset(required),
+            accepted=frozenset(path_defs) | frozenset(query_names),
+        )
+
+    def route(self, args: tuple, kwargs: dict) -> tuple[dict | None, dict | None]:
+        """
+        Split call arguments into path and query params, dropping None values.
+
+        Raises:
+            TypeError: If the arguments don't match the signature
+        """
+        if args or not (self.accepted.issuperset(kwargs) and self.required.issubset(kwargs)):
+            kwargs = _bind(self, args, kwargs)
+
+        # Order doesn't matter: validation rebuilds both dicts in schema order
+        path_params = {}
+        query_params = {}
+        for name, value in kwargs.items():
+            if value is not None:
+                if name in self.path_names:
+                    path_params[name] = value
+                else:
+                    query_params[name] = value
+        return path_params or None, query_params or None
+
+
+@dataclass(frozen=True)
+class OverloadRoute:
+    """Routing table for an operation nickname shared by several paths."""
+
+    endpoint_name: str
+    method_name: str
+    signature: inspect.Signature
+    positional: tuple[str, ...]
+    required: frozenset[str]
+    accepted: frozenset[str]
+    # (path param names, same as a set, query param names, method), fewest path params first
+    variants: tuple[tuple[tuple[str, ...], frozenset[str], frozenset[str], "EndpointMethod"], ...]
+
+    @classmethod
+    def from_variants(
+        cls,
+        endpoint_name: str,
+        method_name: str,
+        method_variants: list[tuple[list[str], "EndpointMethod"]],
+    ) -> "OverloadRoute":
+        """Build the route from (path_param_names, endpoint_method) variants, sorted."""
+        names = set()
+        for _, endpoint_method in method_variants:
+            names.update(p["name"] for p in endpoint_method.path_params)
+            names.update(p["name"] for p in endpoint_method.query_params)
+        param_names = tuple(sorted(names))
+
+        return cls(
+            endpoint_name=endpoint_name,
+            method_name=method_name,
+            signature=inspect.Signature(
+                [inspect.Parameter(name, _POSITIONAL, default=None) for name in param_names]
+            ),
+            positional=param_names,
+            required=frozenset(),
+            accepted=frozenset(param_names),
+            variants=tuple(
+                (
+                    tuple(path_names),
+                    frozenset(path_names),
+                    frozenset(p["name"] for p in endpoint_method.query_params),
+                    endpoint_method,
+                )
+                for path_names, endpoint_method in method_variants
+            ),
+        )
+
+    def route(self, args: tuple, kwargs: dict) -> tuple["EndpointMethod", dict | None, dict | None]:
+        """
+        Pick the first variant whose path params were all provided and split the params.
+
+        Raises:
+            TypeError: If the arguments don't match the signature
+            AssertionError: If no variant matches the provided params
+        """
+        if args or not self.accepted.issuperset(kwargs):
+            kwargs = _bind(self, args, kwargs)
+        provided = {n: v for n, v in kwargs.items() if v is not None}
+
+        for path_names, path_set, query_set, endpoint_method in self.variants:
+            if path_set.issubset(provided):
+                path_params = {n: provided[n] for n in path_names}
+                query_params = {
+                    n: v for n, v in provided.items() if n not in path_set and n in query_set
+                }
+                return endpoint_method, path_params or None, query_params or None
+
+        param_options = [
+            f"  - Path params: {', '.join(path_names) or 'none'}"
+            for path_names, *_ in self.variants
+        ]
+        raise AssertionError(
+            f"{self.endpoint_name}.{self.method_name}: No matching variant for provided "
+            f"params={set(provided.keys())}.\n"
+            f"Available variants:\n" + "\n".join(param_options)
+        )
+
+
+def bind_method(endpoint: "Endpoint", route: MethodRoute) -> Callable:
+    """Bind a single-operation route to the endpoint's sync or async dispatcher."""
+    endpoint_method = route.endpoint_method
+
+    if endpoint.is_async:
+
+        async def method(*args, **kwargs):
+            path_params, query_params = route.route(args, kwargs)
+            return await endpoint._execute_request(
+                endpoint_method=endpoint_method,
+                path_params=path_params,
+                query_params=query_params,
+            )
+
+    else:
+
+        def method(*args, **kwargs):
+            path_params, query_params = route.route(args, kwargs)
+            return endpoint._execute_request(
+                endpoint_method=endpoint_method,
+                path_params=path_params,
+                query_params=query_params,
+            )
+
+    method.__signature__ = route.signature
+    return method
+
+
+def bind_overloaded_method(endpoint: "Endpoint", route: OverloadRoute) -> Callable:
+    """Bind an overload route to the endpoint's sync or async dispatcher."""
+    if endpoint.is_async:
+
+        async def method(*args, **kwargs):
+            endpoint_method, path_params, query_params = route.route(args, kwargs)
+            return await endpoint._execute_request(
+                endpoint_method=endpoint_method,
+                path_params=path_params,
+                query_params=query_params,
+            )
+
+    else:
+
+        def method(*args, **kwargs):
+            endpoint_method, path_params, query_params = route.route(args, kwargs)
+            return endpoint._execute_request(
+                endpoint_method=endpoint_method,
+                path_params=path_params,
+                query_params=query_params,
+            )
+
+    method.__signature__ = route.signature
+    return method
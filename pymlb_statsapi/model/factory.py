@@ -12,15 +12,182 @@ Key features:
 """
 
 import gzip as gzip_module
-import json
+import logging
 import os
-from datetime import datetime, timezone
-from time import sleep
+import re
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, partial
+from time import perf_counter, sleep
+from typing import IO, TYPE_CHECKING
 from urllib.parse import ParseResult, urlencode, urlparse
 
 import requests
+from requests.structures import CaseInsensitiveDict
+
+from pymlb_statsapi.utils.codec import codec
+from pymlb_statsapi.utils.compression import Compressor, get_compressor
+from pymlb_statsapi.utils.log import LogMixin, sampled
+
+from .batch import BatchCall, BatchResult, run_batch
+from .dispatch import (
+    METHOD_ENGINES,
+    MethodRoute,
+    OverloadRoute,
+    bind_method,
+    bind_overloaded_method,
+)
+from .retry import RequestFailedError, RetryPolicy
+from .session import HTTPSession
+from .validation import ValidationPlan
+
+if TYPE_CHECKING:
+    from .cache import CacheEntry, ResponseCache
+    from .instrumentation import Instrumentation, RequestEvent
+    from .ratelimit import RateLimiter
+    from .singleflight import SingleFlight
+
+
+# Marks an APIResponse whose body hasn't been parsed yet
+_UNPARSED = object()
+
+# The "copyright" member the StatsAPI puts first in every document, which json() drops
+_COPYRIGHT_MEMBER = re.compile(rb'\{\s*"copyright"\s*:\s*"(?:[^"\\]|\\.)*"\s*,?')
+
+
+def build_response(
+    url: str,
+    status_code: int,
+    content: bytes,
+    headers: dict | None = None,
+    elapsed_ms: float = 0.0,
+    reason: str | None = None,
+) -> requests.Response:
+    """
+    Build a ``requests.Response`` from already-received parts.
+
+    Used wherever a response body arrives without going through ``requests`` (async
+    transports, caches, on-disk stores) so it can still be wrapped in an APIResponse.
 
-from pymlb_statsapi.utils.log import LogMixin
+    Args:
+        url: Request URL
+        status_code: HTTP status code
+        content: Decoded response body
+        headers: Response headers
+        elapsed_ms: Time taken by the original request in milliseconds
+        reason: HTTP reason phrase
+
+    Returns:
+        requests.Response with the body already loaded
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.elapsed = timedelta(milliseconds=elapsed_ms)
+    response.reason = reason
+    response.encoding = "utf-8"
+    return response
+
+
+@contextmanager
+def atomic_open(
+    file_path: str,
+    gzip: bool = False,
+    compresslevel: int = 6,
+    compressor: Compressor | None = None,
+) -> Iterator[IO[bytes]]:
+    """
+    Open a binary file for writing that only appears at ``file_path`` once complete.
+
+    Data goes to a temporary file in the same directory, which is renamed over
+    ``file_path`` on success and removed on error, so readers never see a partial file.
+
+    Args:
+        file_path: Destination path (parent directories are created)
+        gzip: Compress everything written through the returned file
+        compresslevel: gzip compression level (1-9)
+        compressor: Compress with this instead (overrides ``gzip``)
+
+    Yields:
+        Writable binary file object
+    """
+    parent_dir = os.path.dirname(file_path)
+    if parent_dir:
+        os.makedirs(parent_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=parent_dir or ".", prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            if compressor is not None:
+                with compressor.writer(raw) as f:
+                    yield f
+            elif gzip:
+                with gzip_module.GzipFile(
+                    filename="", mode="wb", fileobj=raw, compresslevel=compresslevel, mtime=0
+                ) as f:
+                    yield f
+            else:
+                yield raw
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_chunks(f: IO[bytes], data: bytes | memoryview, chunk_size: int = 1 << 20) -> int:
+    """Write ``data`` in ``chunk_size`` slices (no copies) and return the bytes written."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        f.write(view[start : start + chunk_size])
+    return len(view)
+
+
+def build_resource_path(
+    endpoint_name: str,
+    method_name: str,
+    path_params: dict | None = None,
+    query_params: dict | None = None,
+    prefix: str = "",
+) -> str:
+    """
+    Build the deterministic resource path for a request.
+
+    This is the key format used by ``APIResponse.get_path()``, storage URIs and the
+    response cache: ``{prefix}/{endpoint}/{method}/{path_params}/{sorted_query_params}``.
+
+    Args:
+        endpoint_name: Endpoint name (e.g., 'schedule')
+        method_name: Method name (e.g., 'schedule')
+        path_params: Validated path parameters
+        query_params: Validated query parameters
+        prefix: Optional prefix to prepend (separated by /)
+
+    Returns:
+        Path string
+    """
+    parts = []
+    if prefix:
+        parts.append(prefix)
+
+    parts.extend([endpoint_name, method_name])
+
+    # Add path params (sorted for consistency)
+    if path_params:
+        parts.append("&".join(f"{k}={v}" for k, v in sorted(path_params.items())))
+
+    # Add query params (sorted for consistency)
+    if query_params:
+        parts.append("&".join(f"{k}={v}" for k, v in sorted(query_params.items())))
+
+    return "/".join(parts)
 
 
 class APIResponse(LogMixin):
@@ -31,6 +198,8 @@ class APIResponse(LogMixin):
     and provides convenient access to URL components for cache key generation.
     """
 
+    GZIP_LEVEL = int(os.environ.get("PYMLB_STATSAPI__GZIP_LEVEL", "6"))
+
     def __init__(
         self,
         response: requests.Response,
@@ -38,6 +207,10 @@ class APIResponse(LogMixin):
         method_name: str,
         path_params: dict | None = None,
         query_params: dict | None = None,
+        timestamp: str | None = None,
+        cache_info: dict | None = None,
+        retry_info: dict | None = None,
+        instrumentation: "Instrumentation | None" = None,
     ):
         super().__init__()
         self.response = response
@@ -45,7 +218,17 @@ class APIResponse(LogMixin):
         self.method_name = method_name
         self.path_params = path_params or {}
         self.query_params = query_params or {}
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        # Responses served from a cache keep the timestamp of the original API call
+        self.timestamp = timestamp or datetime.now(timezone.utc).isoformat()
+        # Cache status when served through a ResponseCache (None when caching is off)
+        self.cache_info = cache_info
+        # Attempts and backoff for responses fetched from the network (None otherwise)
+        self.retry_info = retry_info
+        # Receives the parse time of json() when instrumentation is on
+        self.instrumentation = instrumentation
+        # Parsed body, memoized by json(), and its structs, memoized by decode()
+        self._data = _UNPARSED
+        self._decoded = _UNPARSED
 
         # Parse URL components
         parsed = urlparse(response.url)
@@ -67,14 +250,64 @@ class APIResponse(LogMixin):
         """True if status code is 2xx"""
         return self.response.ok
 
-    def json(self) -> dict | list:
-        """Parse response as JSON"""
-        data = self.response.json()
+    @property
+    def from_cache(self) -> bool:
+        """True if this response body was served from a cache instead of the network"""
+        return bool(self.cache_info) and self.cache_info.get("status") in (
+            "hit",
+            "revalidated",
+            "stale",
+            "stale-if-error",
+        )
+
+    def json(self, fresh: bool = False) -> dict | list:
+        """
+        Parse response as JSON (with the copyright notice removed).
+
+        The body is parsed once with the fastest available codec and the result is
+        memoized, so repeat calls, ``to_dict`` and ``save_json(indent=...)`` share it.
+        Treat it as read-only; pass ``fresh=True`` for a newly parsed copy to modify.
+
+        Args:
+            fresh: Parse again and return an independent copy (the memo is kept)
+        """
+        if not fresh and self._data is not _UNPARSED:
+            return self._data
+        if self.instrumentation is None:
+            data = codec.loads(self.response.content)
+        else:
+            started = perf_counter()
+            data = codec.loads(self.response.content)
+            self.instrumentation.parsed(
+                self.endpoint_name,
+                self.method_name,
+                perf_counter() - started,
+                len(self.response.content),
+            )
         # Remove copyright notice if present
-        if isinstance(data, dict) and "copyright" in data:
-            data.pop("copyright")
+        if isinstance(data, dict):
+            data.pop("copyright", None)
+        if not fresh:
+            self._data = data
         return data
 
+    def decode(self):
+        """
+        Parse response into slotted structs generated from the endpoint's schema models.
+
+        Uses much less memory than the dicts from ``json()`` and supports attribute
+        access (``game.gameData.teams.home.name``). The result is memoized; convert it
+        back with ``pymlb_statsapi.model.structs.to_builtins``.
+        """
+        if self._decoded is _UNPARSED:
+            # Reuse the dicts if json() already parsed the body; otherwise parse a
+            # fresh copy that isn't kept once it's converted
+            data = self._data if self._data is not _UNPARSED else self.json(fresh=True)
+            from .structs import decoder
+
+            self._decoded = decoder.decode_response(data, self.endpoint_name, self.method_name)
+        return self._decoded
+
     @property
     def text(self) -> str:
         """Response body as text"""
@@ -101,6 +334,10 @@ class APIResponse(LogMixin):
             dict: Metadata with the following structure:
                 - request: Request metadata (endpoint, method, params, url, timestamp)
                 - response: Response metadata (status_code, headers, elapsed, content_length)
+                - cache: Cache status (status, key, age_seconds, ttl_seconds), only present
+                         when the response went through a ResponseCache
+                - retry: Attempts made and seconds spent in backoff (attempts,
+                         backoff_seconds), only present for network responses
 
         Example:
             >>> response = StatsAPI.Schedule.schedule(sportId=1, date="2025-06-01")
@@ -129,7 +366,7 @@ class APIResponse(LogMixin):
               }
             }
         """
-        return {
+        metadata = {
             "request": {
                 "endpoint_name": self.endpoint_name,
                 "method_name": self.method_name,
@@ -151,6 +388,41 @@ class APIResponse(LogMixin):
                 "headers": self.headers,
             },
         }
+        if self.cache_info is not None:
+            metadata["cache"] = dict(self.cache_info)
+        if self.retry_info is not None:
+            metadata["retry"] = dict(self.retry_info)
+        return metadata
+
+    @classmethod
+    def from_metadata(cls, metadata: dict, content: bytes) -> "APIResponse":
+        """
+        Rebuild a stored response from ``get_metadata()`` output and its body.
+
+        Args:
+            metadata: Metadata saved with the response
+            content: Response body bytes
+
+        Returns:
+            APIResponse with the original request, timestamp, status and headers
+        """
+        request, response = metadata["request"], metadata["response"]
+        return cls(
+            build_response(
+                url=request["url"],
+                status_code=response["status_code"],
+                content=content,
+                headers=response.get("headers"),
+                elapsed_ms=response.get("elapsed_ms") or 0.0,
+            ),
+            endpoint_name=request["endpoint_name"],
+            method_name=request["method_name"],
+            path_params=request.get("path_params"),
+            query_params=request.get("query_params"),
+            timestamp=request.get("timestamp"),
+            cache_info=metadata.get("cache"),
+            retry_info=metadata.get("retry"),
+        )
 
     def to_dict(self, include_data: bool = True) -> dict:
         """
@@ -206,25 +478,17 @@ class APIResponse(LogMixin):
         Returns:
             Path string suitable for use across different storage protocols
         """
-        parts = []
-        if prefix:
-            parts.append(prefix)
-
-        parts.extend([self.endpoint_name, self.method_name])
-
-        # Add path params (sorted for consistency)
-        if self.path_params:
-            path_str = "&".join(f"{k}={v}" for k, v in sorted(self.path_params.items()))
-            parts.append(path_str)
-
-        # Add query params (sorted for consistency)
-        if self.query_params:
-            query_str = "&".join(f"{k}={v}" for k, v in sorted(self.query_params.items()))
-            parts.append(query_str)
-
-        return "/".join(parts)
+        return build_resource_path(
+            self.endpoint_name,
+            self.method_name,
+            self.path_params,
+            self.query_params,
+            prefix=prefix,
+        )
 
-    def get_uri(self, prefix: str = "", gzip: bool = False) -> ParseResult:
+    def get_uri(
+        self, prefix: str = "", gzip: bool = False, compression: Compressor | None = None
+    ) -> ParseResult:
         """
         Generate full file URI as a ParseResult for this API response.
 
@@ -236,6 +500,7 @@ class APIResponse(LogMixin):
         Args:
             prefix: Optional directory prefix
             gzip: Whether to add .gz extension (default: False)
+            compression: Add this compressor's extension instead (overrides ``gzip``)
 
         Environment Variables:
             PYMLB_STATSAPI__BASE_FILE_PATH: Base directory for storage
@@ -260,7 +525,10 @@ class APIResponse(LogMixin):
         resource_path = self.get_path(prefix=prefix)
 
         base_path = os.environ.get("PYMLB_STATSAPI__BASE_FILE_PATH", "./.var/local/mlb_statsapi")
-        extension = ".json.gz" if gzip else ".json"
+        if compression is not None:
+            extension = ".json" + compression.extension
+        else:
+            extension = ".json.gz" if gzip else ".json"
         full_path = os.path.join(base_path, resource_path + extension)
 
         # For file URLs, path should start with /
@@ -271,17 +539,44 @@ class APIResponse(LogMixin):
             scheme="file", netloc="", path=full_path, params="", query="", fragment=""
         )
 
-    def save_json(self, file_path: str | None = None, gzip: bool = False, prefix: str = "") -> dict:
+    def save_json(
+        self,
+        file_path: str | None = None,
+        gzip: bool = False,
+        prefix: str = "",
+        raw: bool = False,
+        indent: int | None = None,
+        compression: str | Compressor | None = None,
+    ) -> dict:
         """
         Save response JSON to a file.
 
+        By default the file is ``{"metadata": {...}, "data": <body>}`` where the body is
+        the response bytes streamed as received: nothing is parsed or re-serialized, so a
+        large ``liveGameV1`` document is never held in memory more than once. Only the
+        leading ``copyright`` member is cut, so ``data`` matches ``json()``. A body that
+        isn't a JSON object or array is parsed instead, so a non-JSON body raises like
+        ``json()`` rather than producing an invalid file. Writes are atomic (temp file +
+        rename).
+
         Args:
             file_path: Path to save the JSON file. If None, auto-generates using get_uri().
             gzip: Whether to gzip the output (default: False)
             prefix: Optional directory prefix (only used if file_path is None)
+            raw: Write only the response body, with metadata in a ``<file>.meta.json``
+                 sidecar (default: False)
+            indent: Pretty-print with this indent instead of streaming the body. Parses
+                    and re-serializes the data (default: None, no pretty-printing)
+            compression: Compressor, or its name (e.g. "gzip:9", "zstd:19"), to use
+                         instead of ``gzip``; auto-generated paths take its extension.
+                         See ``pymlb_statsapi.utils.compression``.
+
+        Environment Variables:
+            PYMLB_STATSAPI__GZIP_LEVEL: gzip compression level (default: 6)
 
         Returns:
-            Dict with 'path', 'bytes_written', and 'uri' (ParseResult) keys
+            Dict with 'path', 'bytes_written' (uncompressed), 'timestamp', 'uri'
+            (ParseResult, when auto-generated) and 'metadata_path' (raw mode) keys
 
         Examples:
             >>> # Save to explicit path
@@ -293,45 +588,66 @@ class APIResponse(LogMixin):
             >>> # Save gzipped with custom prefix
             >>> response.save_json(gzip=True, prefix="raw-data")
 
+            >>> # Body only, exactly as served, with a metadata sidecar
+            >>> response.save_json(prefix="raw-data", raw=True)
+
+            >>> # zstd, or zstd with the method's trained dictionary
+            >>> response.save_json(compression="zstd:19")
+            >>> response.save_json(compression=dictionaries.compressor("game", "liveGameV1"))
+
+            >>> # Human-readable output
+            >>> response.save_json("/tmp/boxscore.json", indent=2)
+
             >>> # Get URI details when auto-generating
             >>> result = response.save_json(prefix="mlb-data")
             >>> result['path']  # String path
             >>> result['uri'].scheme  # 'file'
             >>> result['uri'].geturl()  # Full file:// URI
         """
+        if isinstance(compression, str):
+            compression = get_compressor(compression)
         uri = None
         if file_path is None:
             # Auto-generate path using get_uri()
-            uri = self.get_uri(prefix=prefix, gzip=gzip)
+            uri = self.get_uri(prefix=prefix, gzip=gzip, compression=compression)
             # Extract path from ParseResult
             file_path = uri.path
 
-        # Create parent directory if it doesn't exist
-        parent_dir = os.path.dirname(file_path)
-        if parent_dir:
-            os.makedirs(parent_dir, exist_ok=True)
-
-        # Prepare data with metadata wrapper
-        data_with_metadata = {
-            "metadata": self.get_metadata(),
-            "data": self.json(),
-        }
-
-        if gzip:
-            with gzip_module.open(file_path, "wt", encoding="utf-8") as f:
-                content = json.dumps(data_with_metadata, indent=2)
-                bytes_written = f.write(content)
-        else:
-            with open(file_path, "w", encoding="utf-8") as f:
-                content = json.dumps(data_with_metadata, indent=2)
-                bytes_written = f.write(content)
-
-        self.log.info(f"Saved {self} to {file_path} (gzip={gzip})")
-        result = {
-            "path": file_path,
-            "bytes_written": bytes_written,
-            "timestamp": self.timestamp,
-        }
+        metadata = self.get_metadata()
+        result = {"path": file_path, "timestamp": self.timestamp}
+
+        with atomic_open(
+            file_path, gzip=gzip, compresslevel=self.GZIP_LEVEL, compressor=compression
+        ) as f:
+            if raw:
+                bytes_written = write_chunks(f, self.content)
+            elif indent is not None:
+                content = codec.dumps({"metadata": metadata, "data": self.json()}, indent=indent)
+                bytes_written = write_chunks(f, content)
+            else:
+                header = b'{"metadata": ' + codec.dumps(metadata) + b', "data": '
+                body = self.content.strip()
+                if body[:1] + body[-1:] in (b"{}", b"[]"):
+                    # Splice the body into the envelope as-is, minus the copyright member
+                    copyright_member = _COPYRIGHT_MEMBER.match(body)
+                    if copyright_member is not None:
+                        header += b"{"
+                        body = memoryview(body)[copyright_member.end() :]
+                else:
+                    body = codec.dumps(self.json()) if body else b"null"
+                bytes_written = write_chunks(f, header)
+                bytes_written += write_chunks(f, body)
+                bytes_written += write_chunks(f, b"}\n")
+
+        if raw:
+            metadata_path = file_path + ".meta.json"
+            with atomic_open(metadata_path) as f:
+                f.write(codec.dumps(metadata, indent=indent))
+            result["metadata_path"] = metadata_path
+
+        compressed = compression.name if compression is not None else "gzip" if gzip else "none"
+        self.log.info("Saved %s to %s (compression=%s, raw=%s)", self, file_path, compressed, raw)
+        result["bytes_written"] = bytes_written
         if uri:
             result["uri"] = uri
         return result
@@ -563,6 +879,11 @@ class EndpointMethod:
 
         return "\n".join(lines)
 
+    @cached_property
+    def validation_plan(self) -> ValidationPlan:
+        """Parameter checks precomputed from the schema, compiled on first validation."""
+        return ValidationPlan(self)
+
     def validate_and_resolve_params(
         self,
         path_params: dict | None = None,
@@ -581,92 +902,31 @@ class EndpointMethod:
         Raises:
             AssertionError: If required parameters are missing or invalid
         """
-        path_params = dict(path_params or {})
-        query_params = dict(query_params or {})
-
-        # Validate path parameters
-        validated_path_params = {}
-        for param_def in self.path_params:
-            param_name = param_def["name"]
-
-            if param_def["required"] and param_name not in path_params:
-                raise AssertionError(
-                    f"{self.method_name}: path parameter '{param_name}' is required"
-                )
-
-            if param_name in path_params:
-                value = path_params.pop(param_name)
-
-                # Handle list values (should only have one item for path params)
-                if isinstance(value, list):
-                    if len(value) != 1:
-                        raise AssertionError(
-                            f"{self.method_name}: path parameter '{param_name}' must have exactly one value, got {value}"
-                        )
-                    value = value[0]
-
-                # Validate enum if present
-                if "enum" in param_def and param_def["enum"]:
-                    valid_values = {str(v).lower() for v in param_def["enum"]}
-                    if str(value).lower() not in valid_values:
-                        raise AssertionError(
-                            f"{self.method_name}: '{param_name}' must be one of {param_def['enum']}, got '{value}'"
-                        )
-
-                validated_path_params[param_name] = str(value)
-
-        # Check for unrecognized path params
-        if path_params:
-            raise AssertionError(
-                f"{self.method_name}: unrecognized path parameters: {list(path_params.keys())}"
-            )
-
-        # Validate query parameters
-        validated_query_params = {}
-        for param_def in self.query_params:
-            param_name = param_def["name"]
-
-            if param_def["required"] and param_name not in query_params:
-                raise AssertionError(
-                    f"{self.method_name}: query parameter '{param_name}' is required"
-                )
-
-            if param_name in query_params:
-                value = query_params.pop(param_name)
-
-                # Handle list values
-                if isinstance(value, list):
-                    allow_multiple = param_def.get("allowMultiple", False)
-                    if not allow_multiple and len(value) > 1:
-                        raise AssertionError(
-                            f"{self.method_name}: query parameter '{param_name}' does not allow multiple values"
-                        )
-                    value = ",".join(str(v) for v in value)
-                else:
-                    value = str(value)
-
-                validated_query_params[param_name] = value
-
-        # Check for unrecognized query params
-        if query_params:
-            raise AssertionError(
-                f"{self.method_name}: unrecognized query parameters: {list(query_params.keys())}"
-            )
-
-        # Resolve path with parameters
-        resolved_path = self.path_template.format(**validated_path_params)
-
-        return validated_path_params, validated_query_params, resolved_path
+        return self.validation_plan.validate(path_params, query_params)
 
 
 class Endpoint(LogMixin):
     """
     Dynamically generated endpoint class that creates methods from JSON schema.
+
+    Method definitions are parsed up front; with ``lazy=True`` the generated functions
+    are compiled on first attribute access instead of in ``__init__``.
+
+    Environment Variables:
+        PYMLB_STATSAPI__LAZY: Default for ``lazy`` (on unless set to 0)
+        PYMLB_STATSAPI__METHOD_ENGINE: How generated methods are built: ``dispatch``
+            (shared dispatchers, default) or ``exec`` (compiled from source per method)
     """
 
     BASE_URL = "https://statsapi.mlb.com/api"
     MAX_RETRIES = int(os.environ.get("PYMLB_STATSAPI__MAX_RETRIES", "3"))
     TIMEOUT = int(os.environ.get("PYMLB_STATSAPI__TIMEOUT", "30"))
+    LAZY = os.environ.get("PYMLB_STATSAPI__LAZY", "1").lower() not in ("0", "false", "no")
+    METHOD_ENGINE = os.environ.get("PYMLB_STATSAPI__METHOD_ENGINE", "dispatch")
+
+    # Generated methods are plain functions; AsyncEndpoint generates coroutine functions
+    is_async = False
+    session_class = HTTPSession
 
     def __init__(
         self,
@@ -674,17 +934,67 @@ class Endpoint(LogMixin):
         schema: dict,
         endpoint_config: dict,
         excluded_methods: set[str] | None = None,
+        session: HTTPSession | None = None,
+        cache: "ResponseCache | None" = None,
+        lazy: bool | None = None,
+        rate_limiter: "RateLimiter | None" = None,
+        retry_policy: RetryPolicy | None = None,
+        instrumentation: "Instrumentation | None" = None,
+        single_flight: "SingleFlight | None" = None,
     ):
         super().__init__()
+        assert self.METHOD_ENGINE in METHOD_ENGINES, (
+            f"Unknown method engine {self.METHOD_ENGINE!r}, expected one of {METHOD_ENGINES}"
+        )
         self.endpoint_name = endpoint_name
         self.schema = schema
         self.endpoint_config = endpoint_config
         self.excluded_methods = excluded_methods or set()
+        # Pooled session, normally shared by every endpoint of a StatsAPI registry
+        self.session = session if session is not None else self.session_class()
+        # Optional response cache, normally shared by every endpoint of a StatsAPI registry
+        self.cache = cache
+        # Optional client-side rate limiter, normally shared by every endpoint of a registry
+        self.rate_limiter = rate_limiter
+        # Retry decisions and budget, normally shared by every endpoint of a registry
+        self.retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy(max_retries=self.MAX_RETRIES)
+        )
+        # Optional request hooks and metrics, normally shared by every endpoint of a registry
+        self.instrumentation = instrumentation
+        # Optional coalescing of identical in-flight requests, normally shared by a registry
+        self.single_flight = single_flight
+
+        # Generated methods are compiled on first attribute access unless lazy is off
+        self.lazy = lazy if lazy is not None else self.LAZY
+        self._pending_methods: dict[str, Callable[[], None]] = {}
+        self._compile_lock = threading.Lock()
 
         # Build method registry
         self._methods: dict[str, EndpointMethod] = {}
         self._initialize_methods()
 
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails, i.e. for methods not yet compiled
+        pending = self.__dict__.get("_pending_methods")
+        if pending is None or name not in pending:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        with self._compile_lock:
+            compile_method = pending.pop(name, None)
+            if compile_method is not None:
+                compile_method()
+        return self.__dict__[name]
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._pending_methods))
+
+    def _defer(self, method_name: str, compile_method: Callable[[], None]):
+        """Compile a generated method now, or on first access if the endpoint is lazy."""
+        if self.lazy:
+            self._pending_methods[method_name] = compile_method
+        else:
+            compile_method()
+
     def _initialize_methods(self):
         """Build the method registry from schema and config."""
         # First pass: collect all operations and detect duplicates
@@ -707,8 +1017,10 @@ class Endpoint(LogMixin):
 
         if duplicate_nicknames:
             self.log.debug(
-                f"{self.endpoint_name}: Found {len(duplicate_nicknames)} overloaded methods: "
-                f"{', '.join(sorted(duplicate_nicknames))}"
+                "%s: Found %s overloaded methods: %s",
+                self.endpoint_name,
+                len(duplicate_nicknames),
+                ", ".join(sorted(duplicate_nicknames)),
             )
 
         # Second pass: create methods with disambiguation if needed
@@ -717,7 +1029,7 @@ class Endpoint(LogMixin):
         for nickname, operations in operations_by_nickname.items():
             # Skip if explicitly excluded
             if nickname in self.excluded_methods:
-                self.log.debug(f"Skipping excluded method: {self.endpoint_name}.{nickname}")
+                self.log.debug("Skipping excluded method: %s.%s", self.endpoint_name, nickname)
                 continue
 
             # If only one operation, no disambiguation needed
@@ -734,7 +1046,7 @@ class Endpoint(LogMixin):
                     config_path=config_path,
                 )
                 self._methods[nickname] = endpoint_method
-                self._add_method(nickname, endpoint_method)
+                self._defer(nickname, partial(self._add_method, nickname, endpoint_method))
                 continue
 
             # Multiple operations with same nickname
@@ -759,7 +1071,8 @@ class Endpoint(LogMixin):
             method_variants.sort(key=lambda x: len(x[0]))
 
             # Create an overloaded method that routes based on provided path_params
-            self._add_overloaded_method(nickname, method_variants)
+            self._methods[nickname] = method_variants[0][1]
+            self._defer(nickname, partial(self._add_overloaded_method, nickname, method_variants))
 
             # Store all variants for introspection
             for path_params, method in method_variants:
@@ -767,6 +1080,14 @@ class Endpoint(LogMixin):
                 internal_name = f"__{nickname}{suffix}"
                 self._methods[internal_name] = method
 
+    @property
+    def _def_keyword(self) -> str:
+        return "async def" if self.is_async else "def"
+
+    @property
+    def _await_keyword(self) -> str:
+        return "await " if self.is_async else ""
+
     def _add_overloaded_method(
         self, method_name: str, method_variants: list[tuple[list[str], EndpointMethod]]
     ):
@@ -791,6 +1112,50 @@ class Endpoint(LogMixin):
         # Keep them all, but only add each unique name once to signature
         all_unique_params = all_path_params | all_query_params
 
+        if self.METHOD_ENGINE == "exec":
+            overloaded_func = self._exec_overloaded_method(
+                method_name, method_variants, all_unique_params
+            )
+        else:
+            overloaded_func = bind_overloaded_method(
+                self, OverloadRoute.from_variants(self.endpoint_name, method_name, method_variants)
+            )
+
+        # Build docstring
+        variant_docs = []
+        for param_names, endpoint_method in method_variants:
+            param_str = f"[{', '.join(param_names)}]" if param_names else "[base]"
+            variant_docs.append(f"    Variant {param_str}: {endpoint_method.path_template}")
+
+        overloaded_func.__name__ = method_name
+        overloaded_func.__doc__ = f"""Overloaded method with {len(method_variants)} variants.
+
+{chr(10).join(variant_docs)}
+
+Call with appropriate parameters to route to the correct variant.
+Provide the path parameters for your desired variant, plus any query parameters.
+
+Args:
+    Parameters (optional): {", ".join(sorted(all_unique_params)) if all_unique_params else "None"}
+    Note: Which parameters are path vs query depends on the variant matched.
+
+Returns:
+    APIResponse: Response object with .json(), .save_json(), and .get_uri() methods
+        """
+
+        # Attach to instance
+        setattr(self, method_name, overloaded_func)
+
+        # Also store in _methods dict for the primary variant (usually base)
+        self._methods[method_name] = method_variants[0][1]
+
+    def _exec_overloaded_method(
+        self,
+        method_name: str,
+        method_variants: list[tuple[list[str], EndpointMethod]],
+        all_unique_params: set[str],
+    ):
+        """Compile the overloaded routing function from generated source (exec engine)."""
         # Build signature with all possible params (all optional since variants differ)
         sig_parts = []
 
@@ -805,7 +1170,7 @@ class Endpoint(LogMixin):
 
         # Generate overloaded function
         func_code = f"""
-def overloaded_impl({signature}):
+{self._def_keyword} overloaded_impl({signature}):
     # Collect all provided params
     all_provided = {{}}
     for name in [{all_params_list}]:
@@ -834,7 +1199,7 @@ def overloaded_impl({signature}):
                 if name not in path_param_names and name in variant_query_param_names:
                     query_params[name] = value
 
-            return endpoint._execute_request(
+            return {self._await_keyword}endpoint._execute_request(
                 endpoint_method=endpoint_method,
                 path_params=path_params if path_params else None,
                 query_params=query_params if query_params else None,
@@ -859,41 +1224,16 @@ def overloaded_impl({signature}):
             "method_name": method_name,
         }
         exec(func_code, namespace)  # nosec B102 - Safe: func_code is generated internally from schema
-        overloaded_func = namespace["overloaded_impl"]
-
-        # Build docstring
-        variant_docs = []
-        for param_names, endpoint_method in method_variants:
-            param_str = f"[{', '.join(param_names)}]" if param_names else "[base]"
-            variant_docs.append(f"    Variant {param_str}: {endpoint_method.path_template}")
-
-        overloaded_func.__name__ = method_name
-        overloaded_func.__doc__ = f"""Overloaded method with {len(method_variants)} variants.
-
-{chr(10).join(variant_docs)}
-
-Call with appropriate parameters to route to the correct variant.
-Provide the path parameters for your desired variant, plus any query parameters.
-
-Args:
-    Parameters (optional): {", ".join(sorted(all_unique_params)) if all_unique_params else "None"}
-    Note: Which parameters are path vs query depends on the variant matched.
-
-Returns:
-    APIResponse: Response object with .json(), .save_json(), and .get_uri() methods
-        """
-
-        # Attach to instance
-        setattr(self, method_name, overloaded_func)
-
-        # Also store in _methods dict for the primary variant (usually base)
-        self._methods[method_name] = method_variants[0][1]
+        return namespace["overloaded_impl"]
 
     def _add_method(self, method_name: str, endpoint_method: EndpointMethod):
         """Dynamically add a method with clean signature - all params as direct arguments."""
 
         # Create function with schema-driven signature
-        method_func = self._create_method_with_signature(endpoint_method)
+        if self.METHOD_ENGINE == "exec":
+            method_func = self._create_method_with_signature(endpoint_method)
+        else:
+            method_func = bind_method(self, MethodRoute.from_method(endpoint_method))
 
         # Set method metadata
         method_func.__name__ = method_name
@@ -904,7 +1244,7 @@ Returns:
 
     def _create_method_with_signature(self, endpoint_method: EndpointMethod):
         """
-        Create a function where all parameters become direct function arguments.
+        Compile a function where all parameters become direct function arguments (exec engine).
 
         The schema defines whether a param is path or query - users don't need to know.
 
@@ -959,7 +1299,7 @@ Returns:
 
         # Generate function using exec (captured in closure)
         func_code = f"""
-def method_impl({signature}):
+{self._def_keyword} method_impl({signature}):
     # Route arguments to path_params dict
     path_params = {{}}
 {path_routing}
@@ -969,7 +1309,7 @@ def method_impl({signature}):
 {query_routing}
 
     # Execute request with routed params
-    return endpoint._execute_request(
+    return {self._await_keyword}endpoint._execute_request(
         endpoint_method=method_def,
         path_params=path_params if path_params else None,
         query_params=query_params if query_params else None,
@@ -1039,82 +1379,388 @@ def method_impl({signature}):
 
         return "\n".join(lines)
 
+    def _prepare_request(
+        self,
+        endpoint_method: EndpointMethod,
+        path_params: dict | None = None,
+        query_params: dict | None = None,
+    ) -> tuple[dict, dict, str]:
+        """
+        Validate parameters and build the full request URL.
+
+        Returns:
+            Tuple of (validated_path_params, validated_query_params, url)
+
+        Raises:
+            AssertionError: If parameters are missing or invalid
+        """
+        validated_path, validated_query, resolved_path = (
+            endpoint_method.validate_and_resolve_params(path_params, query_params)
+        )
+
+        url = self.BASE_URL + resolved_path
+        if validated_query:
+            url += "?" + urlencode(validated_query)
+
+        return validated_path, validated_query, url
+
+    def _check_response(self, response: requests.Response, allow_not_modified: bool = False):
+        """Raise RequestFailedError for any non-200 response (304 allowed when revalidating)."""
+        if response.status_code == 304 and allow_not_modified:
+            return
+        if response.status_code != 200:
+            raise RequestFailedError(response)
+
+    def _wrap_response(
+        self,
+        response: requests.Response,
+        endpoint_method: EndpointMethod,
+        validated_path: dict,
+        validated_query: dict,
+        **kwargs,
+    ) -> APIResponse:
+        """Wrap a raw response in an APIResponse (kwargs are passed to APIResponse)."""
+        api_response = APIResponse(
+            response=response,
+            endpoint_name=self.endpoint_name,
+            method_name=endpoint_method.method_name,
+            path_params=validated_path,
+            query_params=validated_query,
+            instrumentation=self.instrumentation,
+            **kwargs,
+        )
+        log = self.log
+        if log.isEnabledFor(logging.INFO) and sampled():
+            log.info("Success: %r", api_response)
+        return api_response
+
+    def _cache_key(
+        self, endpoint_method: EndpointMethod, validated_path: dict, validated_query: dict
+    ) -> tuple[str, float] | None:
+        """Return (cache key, ttl) if this request should be cached, else None."""
+        if self.cache is None:
+            return None
+        ttl = self.cache.ttl_for(self.endpoint_name, endpoint_method.method_name)
+        if ttl <= 0:
+            return None
+        key = build_resource_path(
+            self.endpoint_name, endpoint_method.method_name, validated_path, validated_query
+        )
+        return key, ttl
+
+    def _cache_lookup(
+        self, cache_key: tuple[str, float] | None
+    ) -> tuple["CacheEntry | None", "CacheEntry | None"]:
+        """Return (fresh entry, stale entry to revalidate) for a cache key."""
+        if cache_key is None:
+            return None, None
+        return self.cache.lookup(cache_key[0])
+
+    def _cache_kwargs(self, entry: "CacheEntry", status: str) -> dict:
+        """APIResponse kwargs (timestamp, cache_info) for a response tied to a cache entry."""
+        return {
+            "timestamp": datetime.fromtimestamp(entry.stored_at, timezone.utc).isoformat(),
+            "cache_info": {
+                "status": status,
+                "key": entry.key,
+                "age_seconds": round(max(entry.age(), 0.0), 3),
+                "ttl_seconds": entry.expires_at - entry.stored_at,
+            },
+        }
+
+    def _cache_store(
+        self,
+        cache_key: tuple[str, float],
+        response: requests.Response,
+        stale: "CacheEntry | None" = None,
+    ) -> tuple[requests.Response, dict]:
+        """
+        Store a fetched response, or refresh the stale entry on a 304.
+
+        Returns:
+            Tuple of (response to wrap, APIResponse kwargs describing the cache outcome)
+        """
+        key, ttl = cache_key
+        if response.status_code == 304 and stale is not None:
+            entry = self.cache.refresh(stale, response, ttl)
+            self.log.debug("Cache revalidated: %s", key)
+            return entry.to_response(), self._cache_kwargs(entry, "revalidated")
+        entry = self.cache.put(key, response, ttl)
+        return response, self._cache_kwargs(entry, "miss")
+
+    def _wrap_cached(
+        self,
+        entry: "CacheEntry",
+        endpoint_method: EndpointMethod,
+        validated_path: dict,
+        validated_query: dict,
+    ) -> APIResponse:
+        """Wrap a cache entry in an APIResponse carrying the original call timestamp."""
+        self.log.debug("Cache hit: %s", entry.key)
+        return self._wrap_response(
+            entry.to_response(),
+            endpoint_method,
+            validated_path,
+            validated_query,
+            **self._cache_kwargs(entry, "hit"),
+        )
+
+    def _wrap_stale(
+        self,
+        entry: "CacheEntry",
+        endpoint_method: EndpointMethod,
+        validated_path: dict,
+        validated_query: dict,
+        error: Exception | None = None,
+    ) -> APIResponse:
+        """
+        Wrap an expired cache entry served stale, recording how stale it is.
+
+        Without ``error`` the entry is served while it refreshes in the background
+        (status ``stale``); with one it replaces the failed request (``stale-if-error``).
+        """
+        kwargs = self._cache_kwargs(entry, "stale" if error is None else "stale-if-error")
+        kwargs["cache_info"]["stale_seconds"] = round(self.cache.staleness(entry), 3)
+        if error is None:
+            self.log.debug("Cache stale, refreshing: %s", entry.key)
+        else:
+            kwargs["cache_info"]["error"] = f"{type(error).__name__}: {error}"[:500]
+            self.log.warning(
+                "%s: Serving stale %s after error: %s", endpoint_method, entry.key, error
+            )
+        return self._wrap_response(
+            entry.to_response(), endpoint_method, validated_path, validated_query, **kwargs
+        )
+
     def _execute_request(
         self,
         endpoint_method: EndpointMethod,
         path_params: dict | None = None,
         query_params: dict | None = None,
-        attempt: int = 0,
     ) -> APIResponse:
         """
-        Execute the HTTP request with retry logic.
+        Validate parameters, serve from cache if possible, otherwise fetch with retries.
+
+        When the cache has a stale entry with validators and revalidation is enabled, the
+        request is sent conditionally and a 304 is served from the stored body. Within
+        the cache's stale_while_revalidate window an expired entry is returned at once
+        and refreshed in the background; within stale_if_error it replaces a failed
+        request.
 
         Args:
             endpoint_method: The method definition
             path_params: Path parameters
             query_params: Query parameters
-            attempt: Current retry attempt (internal)
 
         Returns:
             APIResponse object
 
         Raises:
-            Exception: If request fails after all retries
+            AssertionError: If parameters are invalid or the request fails after all retries
+            requests.exceptions.RequestException: If the connection fails after all retries
         """
+        validated_path, validated_query, url = self._prepare_request(
+            endpoint_method, path_params, query_params
+        )
+        if self.instrumentation is None:
+            return self._request(endpoint_method, validated_path, validated_query, url)
+
+        event = self.instrumentation.start(self.endpoint_name, endpoint_method.method_name, url)
         try:
-            # Validate and resolve parameters
-            validated_path, validated_query, resolved_path = (
-                endpoint_method.validate_and_resolve_params(path_params, query_params)
+            api_response = self._request(
+                endpoint_method, validated_path, validated_query, url, event
             )
+        except Exception as e:
+            self.instrumentation.finish(event, error=e)
+            raise
+        self.instrumentation.finish(event, api_response)
+        return api_response
 
-            # Build full URL
-            url = self.BASE_URL + resolved_path
-            if validated_query:
-                url += "?" + urlencode(validated_query)
-
-            # Execute request
-            self.log.info(f"GET {url}")
-            response = requests.get(
-                url,
-                headers={"Accept-Encoding": "gzip"},
-                timeout=self.TIMEOUT,
+    def _request(
+        self,
+        endpoint_method: EndpointMethod,
+        validated_path: dict,
+        validated_query: dict,
+        url: str,
+        event: "RequestEvent | None" = None,
+    ) -> APIResponse:
+        """Serve a validated request from the cache, or fetch it and update the cache."""
+        cache_key = self._cache_key(endpoint_method, validated_path, validated_query)
+        fresh, stale = self._cache_lookup(cache_key)
+        if fresh is not None:
+            return self._wrap_cached(fresh, endpoint_method, validated_path, validated_query)
+        if stale is not None and self.cache.serve_stale(stale):
+            self.cache.refresh_in_background(
+                cache_key[0],
+                partial(self._fetch_and_store, endpoint_method, url, cache_key, stale),
             )
+            return self._wrap_stale(stale, endpoint_method, validated_path, validated_query)
 
-            # Check status
-            if response.status_code != 200:
-                raise AssertionError(
-                    f"Request failed with status {response.status_code}: {response.text[:500]}"
-                )
+        fetch = partial(self._fetch_and_store, endpoint_method, url, cache_key, stale, event)
+        try:
+            if self._coalesces(endpoint_method):
+                (response, retry_info, cache_kwargs), shared = self.single_flight.do(url, fetch)
+                if shared and event is not None:
+                    event.coalesced = True
+            else:
+                response, retry_info, cache_kwargs = fetch()
+        except (RequestFailedError, requests.exceptions.RequestException) as e:
+            if stale is None or not self.cache.serve_stale_on_error(stale, e):
+                raise
+            return self._wrap_stale(stale, endpoint_method, validated_path, validated_query, e)
+        return self._wrap_response(
+            response,
+            endpoint_method,
+            validated_path,
+            validated_query,
+            retry_info=retry_info,
+            **cache_kwargs,
+        )
+
+    def _coalesces(self, endpoint_method: EndpointMethod) -> bool:
+        """Whether identical in-flight calls of this method share one request."""
+        return self.single_flight is not None and self.single_flight.enabled_for(
+            self.endpoint_name, endpoint_method.method_name
+        )
 
-            # Wrap and return
-            api_response = APIResponse(
-                response=response,
-                endpoint_name=self.endpoint_name,
-                method_name=endpoint_method.method_name,
-                path_params=validated_path,
-                query_params=validated_query,
+    def _conditional_headers(self, stale: "CacheEntry | None") -> dict | None:
+        """Headers revalidating a stale entry, if the cache revalidates."""
+        if stale is None or not self.cache.revalidate:
+            return None
+        return stale.conditional_headers() or None
+
+    def _fetch_and_store(
+        self,
+        endpoint_method: EndpointMethod,
+        url: str,
+        cache_key: tuple[str, float] | None,
+        stale: "CacheEntry | None",
+        event: "RequestEvent | None" = None,
+    ) -> tuple[requests.Response, dict, dict]:
+        """
+        Fetch a cache miss (conditionally, given a stale entry) and update the cache.
+
+        Returns:
+            Tuple of (response to wrap, retry info, APIResponse cache kwargs)
+        """
+        headers = self._conditional_headers(stale)
+        response, retry_info = self._fetch(endpoint_method, url, headers=headers, event=event)
+
+        cache_kwargs = {}
+        if cache_key is not None:
+            response, cache_kwargs = self._cache_store(cache_key, response, stale)
+        return response, retry_info, cache_kwargs
+
+    def _retry_delay(
+        self, endpoint_method: EndpointMethod, attempt: int, error: Exception
+    ) -> float | None:
+        """Ask the retry policy how long to wait after a failed attempt (None: give up)."""
+        delay = self.retry_policy.next_delay(attempt, error)
+        if delay is None:
+            self.log.error(
+                "%s: Request failed after %s attempt(s): %s", endpoint_method, attempt + 1, error
+            )
+        else:
+            self.log.warning(
+                "%s: Request failed (attempt %s/%s), retrying in %.2fs: %s",
+                endpoint_method,
+                attempt + 1,
+                self.retry_policy.max_retries + 1,
+                delay,
+                error,
             )
+        return delay
+
+    def _fetch(
+        self,
+        endpoint_method: EndpointMethod,
+        url: str,
+        headers: dict | None = None,
+        event: "RequestEvent | None" = None,
+    ) -> tuple[requests.Response, dict]:
+        """
+        GET the URL, retrying as the retry policy allows.
 
-            self.log.info(f"Success: {api_response}")
-            return api_response
+        Args:
+            endpoint_method: The method definition (for logging)
+            url: Fully resolved request URL
+            headers: Extra request headers (conditional headers allow a 304 response)
+            event: Instrumentation event receiving the attempts and transfer timings
 
-        except (AssertionError, requests.exceptions.RequestException) as e:
-            if attempt < self.MAX_RETRIES:
-                self.log.warning(
-                    f"{endpoint_method}: Request failed (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}"
-                )
-                sleep(attempt)  # Exponential backoff
-                return self._execute_request(
-                    endpoint_method=endpoint_method,
-                    path_params=path_params,
-                    query_params=query_params,
-                    attempt=attempt + 1,
-                )
-            else:
-                self.log.error(
-                    f"{endpoint_method}: Request failed after {self.MAX_RETRIES} retries: {e}"
-                )
-                raise
+        Returns:
+            Tuple of (requests.Response with status 200, or 304 for conditional requests;
+            retry info with attempts and backoff_seconds)
+
+        Raises:
+            RequestFailedError: On a non-retryable status, or once retries are exhausted
+            requests.exceptions.RequestException: If the connection fails after all retries
+        """
+        kwargs = {"timeout": self.TIMEOUT}
+        if headers:
+            kwargs["headers"] = headers
+        self.retry_policy.record_request()
+
+        log = self.log
+        attempt = 0
+        backoff = 0.0
+        while True:
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(self.endpoint_name)
+                if log.isEnabledFor(logging.INFO) and sampled():
+                    log.info("GET %s", url)
+                if event is None:
+                    response = self.session.get(url, **kwargs)
+                else:
+                    event.attempts = attempt + 1
+                    started = perf_counter()
+                    response = self.session.get(url, **kwargs)
+                    event.record_transfer(response, perf_counter() - started)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(self.endpoint_name, response)
+                self._check_response(response, allow_not_modified=bool(headers))
+                return response, {"attempts": attempt + 1, "backoff_seconds": round(backoff, 3)}
+
+            except (RequestFailedError, requests.exceptions.RequestException) as e:
+                delay = self._retry_delay(endpoint_method, attempt, e)
+                if delay is None:
+                    raise
+                sleep(delay)
+                backoff += delay
+                attempt += 1
+
+    def batch(
+        self,
+        method_name: str,
+        params_list: Iterable[dict],
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Call one method for many parameter sets concurrently.
+
+        Each call goes through the generated method, so validation and retries are
+        unchanged. Errors are captured per item on ``BatchResult.error``.
+
+        Args:
+            method_name: Name of the method to call (e.g., 'boxscore')
+            params_list: Keyword arguments for each call
+            max_workers: Max concurrent calls (see batch.run_batch)
+            ordered: Yield results in submission order (True) or as they complete (False)
+
+        Returns:
+            Iterator of BatchResult
+
+        Example:
+            >>> results = api.Game.batch("boxscore", [{"game_pk": pk} for pk in game_pks])
+            >>> responses = [r.response for r in results if r.ok]
+        """
+        method = getattr(self, method_name)
+        label = f"{self.endpoint_name}.{method_name}"
+        calls = (
+            BatchCall(method=method, params=dict(params), label=label) for params in params_list
+        )
+        return run_batch(calls, max_workers=max_workers, ordered=ordered)
 
     def get_method_names(self) -> list[str]:
         """Get list of available method names."""
@@ -0,0 +1,502 @@
+"""
+Request instrumentation: hooks, per-method metrics and Prometheus / OpenTelemetry export.
+
+Instrumentation is off unless an ``Instrumentation`` is given to the registry (or
+``PYMLB_STATSAPI__METRICS`` is set); endpoints then only check one attribute per request.
+When it is on, every request produces a ``RequestEvent``:
+
+- ``start`` when the request is issued, ``end`` when it returns or fails, carrying the
+  status code, attempts, cache status, bytes on the wire vs decoded, and the timings of
+  the final attempt where the transport reports them (``ttfb`` and ``download``
+  always; ``connect`` (including DNS) and ``tls`` with the async client)
+- ``parse`` events carry the time ``APIResponse.json()`` spent decoding the body
+
+Events go to registered hooks and into a ``MetricsRegistry`` of per ``endpoint.method``
+histograms and counters, which renders as Prometheus text or OTLP JSON.
+
+Environment Variables:
+    PYMLB_STATSAPI__METRICS: Instrument the default registry when set to 1
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.instrumentation import Instrumentation
+
+    instrumentation = Instrumentation()
+    instrumentation.add_hook(lambda kind, event: print(kind, event))
+    api = StatsAPI(instrumentation=instrumentation)
+    api.Schedule.schedule(sportId=1, date="2024-07-13").json()
+    print(instrumentation.to_prometheus())
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import requests
+
+from pymlb_statsapi.utils.log import LogMixin
+
+if TYPE_CHECKING:
+    from .factory import APIResponse
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1 << 10, 4 << 10, 16 << 10, 64 << 10, 256 << 10, 1 << 20, 4 << 20, 16 << 20)
+
+# name -> (help text, bucket bounds)
+HISTOGRAMS = {
+    "request_duration_seconds": ("Request time including retries and backoff", DURATION_BUCKETS),
+    "ttfb_seconds": ("Time until the response headers arrived", DURATION_BUCKETS),
+    "download_seconds": ("Time spent reading the response body", DURATION_BUCKETS),
+    "connect_seconds": ("TCP connect time, including DNS", DURATION_BUCKETS),
+    "tls_seconds": ("TLS handshake time", DURATION_BUCKETS),
+    "parse_seconds": ("JSON parse time", DURATION_BUCKETS),
+    "response_size_bytes": ("Response size on the wire", SIZE_BUCKETS),
+}
+
+# name -> help text
+COUNTERS = {
+    "requests_total": "Requests, including ones served from the cache",
+    "errors_total": "Requests that failed",
+    "retries_total": "Attempts retried after a failure",
+    "cache_hits_total": "Requests served from the cache",
+    "cache_revalidated_total": "Stale cache entries revalidated with a 304",
+    "cache_misses_total": "Cacheable requests fetched from the network",
+    "cache_stale_total": "Expired entries served while refreshing in the background",
+    "cache_stale_if_error_total": "Expired entries served in place of a failed request",
+    "coalesced_total": "Requests that shared another caller's in-flight request",
+    "wire_bytes_total": "Response bytes received on the wire",
+    "decoded_bytes_total": "Response bytes after content decoding",
+}
+
+CACHE_COUNTERS = {
+    "hit": "cache_hits_total",
+    "revalidated": "cache_revalidated_total",
+    "miss": "cache_misses_total",
+    "stale": "cache_stale_total",
+    "stale-if-error": "cache_stale_if_error_total",
+}
+
+
+def wire_size(response: requests.Response) -> int:
+    """Bytes a response took on the wire (compressed), falling back to the decoded size."""
+    tell = getattr(getattr(response, "raw", None), "tell", None)
+    if callable(tell):
+        try:
+            size = tell()
+        except Exception:
+            size = 0
+        if isinstance(size, int) and size > 0:
+            return size
+    length = response.headers.get("Content-Length")
+    if length and str(length).isdigit():
+        return int(length)
+    return len(response.content)
+
+
+@dataclass
+class RequestEvent:
+    """
+    One API call, from issue to result.
+
+    Attributes:
+        endpoint: Endpoint name (e.g. ``schedule``)
+        method: Method name (e.g. ``schedule``)
+        url: Request URL
+        started: ``time.perf_counter()`` when the request was issued
+        duration: Seconds until the result, including retries and backoff (end only)
+        status_code: HTTP status of the final response (None on transport errors)
+        error: The exception the request failed with (end only)
+        attempts: Network attempts made (0 for cache hits)
+        cache: Cache status (hit, miss, revalidated, stale, stale-if-error), None when
+            not cached
+        coalesced: Whether the call shared another caller's in-flight request
+        bytes_wire: Response bytes on the wire (0 for cache hits)
+        bytes_decoded: Response bytes after content decoding
+        timings: Seconds per phase of the final attempt: ttfb and download, plus
+            connect and tls when the transport reports them
+    """
+
+    endpoint: str
+    method: str
+    url: str
+    started: float = field(default_factory=time.perf_counter)
+    duration: float | None = None
+    status_code: int | None = None
+    error: BaseException | None = None
+    attempts: int = 0
+    cache: str | None = None
+    coalesced: bool = False
+    bytes_wire: int | None = None
+    bytes_decoded: int | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def record_transfer(
+        self, response: requests.Response, seconds: float, trace: dict | None = None
+    ):
+        """
+        Record the timings and sizes of a network attempt (later attempts overwrite).
+
+        Args:
+            response: The response received
+            seconds: Wall time of the transport call
+            trace: Timings and wire size reported by the transport, if any
+        """
+        trace = trace or {}
+        ttfb = trace.get("ttfb", response.elapsed.total_seconds())
+        self.timings = {key: trace[key] for key in ("connect", "tls") if key in trace}
+        self.timings["ttfb"] = ttfb
+        self.timings["download"] = max(seconds - ttfb, 0.0)
+        self.status_code = response.status_code
+        self.bytes_wire = trace.get("bytes_wire") or wire_size(response)
+        self.bytes_decoded = len(response.content)
+
+
+@dataclass(frozen=True)
+class ParseEvent:
+    """Time ``APIResponse.json()`` spent parsing a body of ``size`` bytes."""
+
+    endpoint: str
+    method: str
+    seconds: float
+    size: int
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus ``le`` semantics (not thread-safe)."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Iterable[float]):
+        self.bounds = tuple(bounds)
+        # One count per bound plus the +Inf bucket (not cumulative)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[int]:
+        """Cumulative counts per bound, ending with the +Inf bucket (== count)."""
+        total, result = 0, []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation within its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        lower, seen = 0.0, 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if i == len(self.bounds):
+                    # Beyond the last bound: the best estimate is that bound
+                    return self.bounds[-1] if self.bounds else 0.0
+                upper = self.bounds[i]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            if i < len(self.bounds):
+                lower = self.bounds[i]
+        return lower
+
+
+class MetricsRegistry:
+    """Histograms and counters per metric and ``endpoint.method`` (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._counters: dict[tuple[str, str, str], float] = {}
+        self.started_at = time.time()
+
+    def observe(self, metric: str, endpoint: str, method: str, value: float):
+        """Add a value to a histogram from ``HISTOGRAMS``."""
+        key = (metric, endpoint, method)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(HISTOGRAMS[metric][1])
+            histogram.observe(value)
+
+    def increment(self, metric: str, endpoint: str, method: str, value: float = 1):
+        """Add to a counter from ``COUNTERS``."""
+        key = (metric, endpoint, method)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def histogram(self, metric: str, endpoint: str, method: str) -> Histogram | None:
+        return self._histograms.get((metric, endpoint, method))
+
+    def counter(self, metric: str, endpoint: str, method: str) -> float:
+        return self._counters.get((metric, endpoint, method), 0)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Current values per ``endpoint.method``.
+
+        Returns:
+            Dict like ``{"schedule.schedule": {"requests_total": 3,
+            "request_duration_seconds": {"count", "sum", "p50", "p95", "p99"}, ...}}``
+        """
+        result: dict[str, dict] = {}
+        with self._lock:
+            for (metric, endpoint, method), value in sorted(self._counters.items()):
+                result.setdefault(f"{endpoint}.{method}", {})[metric] = value
+            for (metric, endpoint, method), histogram in sorted(self._histograms.items()):
+                result.setdefault(f"{endpoint}.{method}", {})[metric] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
+                }
+        return result
+
+    def to_prometheus(self, prefix: str = "pymlb_statsapi") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for metric, help_text in COUNTERS.items():
+                series = sorted((k[1:], v) for k, v in self._counters.items() if k[0] == metric)
+                if not series:
+                    continue
+                name = f"{prefix}_{metric}"
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (endpoint, method), value in series:
+                    lines.append(f"{name}{{{_labels(endpoint, method)}}} {_number(value)}")
+            for metric, (help_text, _) in HISTOGRAMS.items():
+                series = sorted((k[1:], h) for k, h in self._histograms.items() if k[0] == metric)
+                if not series:
+                    continue
+                name = f"{prefix}_{metric}"
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for (endpoint, method), histogram in series:
+                    labels = _labels(endpoint, method)
+                    bounds = [_number(b) for b in histogram.bounds] + ["+Inf"]
+                    for bound, count in zip(bounds, histogram.cumulative(), strict=True):
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{labels}}} {_number(histogram.sum)}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_otlp(self, prefix: str = "pymlb_statsapi", service_name: str = "pymlb-statsapi") -> dict:
+        """
+        Render all metrics as an OTLP/JSON ``ExportMetricsServiceRequest``.
+
+        The result can be POSTed to an OpenTelemetry collector's ``/v1/metrics``.
+        Values are cumulative since the registry was created (or last reset).
+        """
+        start = str(int(self.started_at * 1e9))
+        now = str(time.time_ns())
+        metrics = []
+        with self._lock:
+            for metric, help_text in COUNTERS.items():
+                points = [
+                    {
+                        "attributes": _attributes(endpoint, method),
+                        "startTimeUnixNano": start,
+                        "timeUnixNano": now,
+                        "asDouble": float(value),
+                    }
+                    for (name, endpoint, method), value in sorted(self._counters.items())
+                    if name == metric
+                ]
+                if points:
+                    metrics.append(
+                        {
+                            "name": f"{prefix}.{metric}",
+                            "description": help_text,
+                            "sum": {
+                                "dataPoints": points,
+                                "aggregationTemporality": 2,
+                                "isMonotonic": True,
+                            },
+                        }
+                    )
+            for metric, (help_text, bounds) in HISTOGRAMS.items():
+                points = [
+                    {
+                        "attributes": _attributes(endpoint, method),
+                        "startTimeUnixNano": start,
+                        "timeUnixNano": now,
+                        "count": str(histogram.count),
+                        "sum": histogram.sum,
+                        "bucketCounts": [str(count) for count in histogram.counts],
+                        "explicitBounds": list(bounds),
+                    }
+                    for (name, endpoint, method), histogram in sorted(self._histograms.items())
+                    if name == metric
+                ]
+                if points:
+                    metrics.append(
+                        {
+                            "name": f"{prefix}.{metric}",
+                            "description": help_text,
+                            "unit": "By" if metric.endswith("_bytes") else "s",
+                            "histogram": {"dataPoints": points, "aggregationTemporality": 2},
+                        }
+                    )
+        resource = {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]}
+        return {
+            "resourceMetrics": [
+                {
+                    "resource": resource,
+                    "scopeMetrics": [{"scope": {"name": "pymlb_statsapi"}, "metrics": metrics}],
+                }
+            ]
+        }
+
+
+def _labels(endpoint: str, method: str) -> str:
+    return f'endpoint="{_escape(endpoint)}",method="{_escape(method)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _attributes(endpoint: str, method: str) -> list[dict]:
+    return [
+        {"key": "endpoint", "value": {"stringValue": endpoint}},
+        {"key": "method", "value": {"stringValue": method}},
+    ]
+
+
+class Instrumentation(LogMixin):
+    """
+    Collects request events into metrics and passes them to hooks.
+
+    Normally shared by every endpoint of a registry. Hooks are called as
+    ``hook(kind, event)`` with kind ``start`` / ``end`` (a ``RequestEvent``) or
+    ``parse`` (a ``ParseEvent``), on the thread that made the request; a hook that
+    raises is logged and skipped.
+    """
+
+    ENABLED = os.environ.get("PYMLB_STATSAPI__METRICS", "0").lower() in ("1", "true", "yes")
+
+    def __init__(
+        self,
+        hooks: Iterable[Callable[[str, object], None]] = (),
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            hooks: Callbacks receiving ``(kind, event)``
+            metrics: Registry to record into (default: a new MetricsRegistry)
+        """
+        super().__init__()
+        self.hooks = list(hooks)
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(hooks={len(self.hooks)})"
+
+    @classmethod
+    def from_env(cls) -> "Instrumentation | None":
+        """Instrumentation if enabled in the environment, else None."""
+        return cls() if cls.ENABLED else None
+
+    def add_hook(self, hook: Callable[[str, object], None]) -> Callable[[str, object], None]:
+        """Register a hook (returns it, so this works as a decorator)."""
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: Callable[[str, object], None]):
+        self.hooks.remove(hook)
+
+    def _emit(self, kind: str, event):
+        for hook in self.hooks:
+            try:
+                hook(kind, event)
+            except Exception as e:
+                self.log.warning("Instrumentation hook %r failed on %s: %s", hook, kind, e)
+
+    def start(self, endpoint: str, method: str, url: str) -> RequestEvent:
+        """Open the event of a request that is being issued."""
+        event = RequestEvent(endpoint, method, url)
+        if self.hooks:
+            self._emit("start", event)
+        return event
+
+    def finish(
+        self,
+        event: RequestEvent,
+        response: "APIResponse | None" = None,
+        error: BaseException | None = None,
+    ):
+        """Complete a request's event with its response or error and record it."""
+        event.duration = time.perf_counter() - event.started
+        if response is not None:
+            event.status_code = response.status_code
+            if response.cache_info is not None:
+                event.cache = response.cache_info.get("status")
+            if event.bytes_decoded is None:
+                # Served without a network attempt
+                event.bytes_wire = 0
+                event.bytes_decoded = len(response.content)
+        if error is not None:
+            event.error = error
+            status = getattr(getattr(error, "response", None), "status_code", None)
+            event.status_code = status if isinstance(status, int) else event.status_code
+        self.record(event)
+        if self.hooks:
+            self._emit("end", event)
+
+    def record(self, event: RequestEvent):
+        """Add a finished request to the metrics."""
+        metrics, endpoint, method = self.metrics, event.endpoint, event.method
+        metrics.increment("requests_total", endpoint, method)
+        if event.error is not None:
+            metrics.increment("errors_total", endpoint, method)
+        if event.attempts > 1:
+            metrics.increment("retries_total", endpoint, method, event.attempts - 1)
+        if event.cache in CACHE_COUNTERS:
+            metrics.increment(CACHE_COUNTERS[event.cache], endpoint, method)
+        if event.coalesced:
+            metrics.increment("coalesced_total", endpoint, method)
+        if event.duration is not None:
+            metrics.observe("request_duration_seconds", endpoint, method, event.duration)
+        for phase, seconds in event.timings.items():
+            metrics.observe(f"{phase}_seconds", endpoint, method, seconds)
+        if event.bytes_wire:
+            metrics.observe("response_size_bytes", endpoint, method, event.bytes_wire)
+            metrics.increment("wire_bytes_total", endpoint, method, event.bytes_wire)
+        if event.bytes_decoded:
+            metrics.increment("decoded_bytes_total", endpoint, method, event.bytes_decoded)
+
+    def parsed(self, endpoint: str, method: str, seconds: float, size: int):
+        """Record the time spent parsing a response body."""
+        self.metrics.observe("parse_seconds", endpoint, method, seconds)
+        if self.hooks:
+            self._emit("parse", ParseEvent(endpoint, method, seconds, size))
+
+    def snapshot(self) -> dict[str, dict]:
+        """See MetricsRegistry.snapshot."""
+        return self.metrics.snapshot()
+
+    def to_prometheus(self, prefix: str = "pymlb_statsapi") -> str:
+        """See MetricsRegistry.to_prometheus."""
+        return self.metrics.to_prometheus(prefix)
+
+    def to_otlp(self, prefix: str = "pymlb_statsapi", service_name: str = "pymlb-statsapi") -> dict:
+        """See MetricsRegistry.to_otlp."""
+        return self.metrics.to_otlp(prefix, service_name)
@@ -0,0 +1,238 @@
+"""
+Incremental tracking of live games.
+
+Re-downloading ``Game.liveGameV1`` (several MB late in a game) every few seconds is
+mostly wasted: between two polls only a pitch or two changes. ``LiveGameTracker``
+downloads the full feed once and then:
+
+1. Polls ``Game.liveTimestampv11``, the list of the feed's timecodes; nothing else is
+   requested while its last timecode is the document's ``metaData.timeStamp``
+2. Otherwise requests ``Game.liveGameDiffPatchV1`` from the document's timecode and
+   applies the JSON Patch operations to the in-memory document. If the API answers
+   with a full document instead (it does when the client is too far behind), that
+   replaces the document
+3. Falls back to a full ``liveGameV1`` refetch if a patch doesn't apply
+
+After each update the plays and play events added since the last one are emitted as
+``LiveEvent`` items, so consumers see a stream instead of diffing documents.
+
+Usage:
+    from pymlb_statsapi.model.live import LiveGameTracker
+
+    tracker = LiveGameTracker(game_pk=747175)
+    for event in tracker.stream():
+        if event.kind == "event" and event.data.get("isPitch"):
+            print(event.data["details"]["description"])
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from pymlb_statsapi.utils.jsonpatch import JSONPatchError, apply_patch
+from pymlb_statsapi.utils.log import LogMixin
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    """
+    Something new in a tracked game.
+
+    Attributes:
+        kind: ``play`` (a new plate appearance started), ``event`` (a new play event,
+            e.g. a pitch), ``complete`` (a play finished) or ``status`` (the game's
+            detailedState changed)
+        at_bat_index: Index of the play in ``allPlays`` (None for status changes)
+        event_index: Index of the event in the play's ``playEvents`` (None otherwise)
+        data: The play, play event or ``gameData.status`` from the document (don't
+            modify it)
+    """
+
+    kind: str
+    at_bat_index: int | None
+    event_index: int | None
+    data: dict
+
+
+class LiveGameTracker(LogMixin):
+    """
+    Keeps a ``liveGameV1`` document current with diff patches.
+
+    Not thread-safe: poll a tracker from one thread (one tracker per game).
+    """
+
+    # Seconds between polls when the feed doesn't suggest one (metaData.wait)
+    DEFAULT_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        game_pk: int,
+        api=None,
+        replay: bool = False,
+        interval: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            game_pk: Game to track
+            api: StatsAPI registry (default: the shared ``api``)
+            replay: Emit the plays already in the first document (default: only new ones)
+            interval: Seconds between polls (default: the feed's metaData.wait)
+            sleep: Sleep function used by stream()
+        """
+        super().__init__()
+        if api is None:
+            from .registry import api
+        self.game_pk = game_pk
+        self.game = api.Game
+        self.replay = replay
+        self.interval = interval
+        self.sleep = sleep
+        self.document: dict | None = None
+        # Number of play events seen per play, which plays were seen complete, and the
+        # last detailedState emitted
+        self._event_counts: list[int] = []
+        self._completed: set[int] = set()
+        self._detailed_state: str | None = None
+        self.stats = {
+            "polls": 0,
+            "requests": 0,
+            "full_fetches": 0,
+            "patches": 0,
+            "patch_failures": 0,
+            "bytes": 0,
+        }
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(game_pk={self.game_pk}, timecode={self.timecode})"
+
+    @property
+    def timecode(self) -> str | None:
+        """The document's ``metaData.timeStamp`` (None before the first fetch)."""
+        if self.document is None:
+            return None
+        return self.document.get("metaData", {}).get("timeStamp")
+
+    @property
+    def status(self) -> dict:
+        """``gameData.status`` of the current document ({} before the first fetch)."""
+        if self.document is None:
+            return {}
+        return self.document.get("gameData", {}).get("status") or {}
+
+    @property
+    def is_final(self) -> bool:
+        """True once the game's abstract state is Final."""
+        return self.status.get("abstractGameState") == "Final"
+
+    @property
+    def plays(self) -> list:
+        """``liveData.plays.allPlays`` of the current document."""
+        if self.document is None:
+            return []
+        return self.document.get("liveData", {}).get("plays", {}).get("allPlays") or []
+
+    def _get(self, method_name: str, **params):
+        response = getattr(self.game, method_name)(game_pk=self.game_pk, **params)
+        self.stats["requests"] += 1
+        self.stats["bytes"] += len(response.content)
+        return response.json()
+
+    def _fetch_full(self):
+        self.log.debug("Fetching full liveGameV1 for %s", self.game_pk)
+        self.document = self._get("liveGameV1")
+        self.stats["full_fetches"] += 1
+
+    def refresh(self) -> list[LiveEvent]:
+        """
+        Download the full feed and replace the document.
+
+        Returns:
+            Plays and play events added since the previous update (none on the first
+            fetch unless ``replay``)
+        """
+        first = self.document is None
+        self._fetch_full()
+        if first and not self.replay:
+            self._mark_seen()
+            return []
+        return self._new_events()
+
+    def poll(self) -> list[LiveEvent]:
+        """
+        Bring the document up to date once.
+
+        Returns:
+            Plays and play events added since the previous update
+        """
+        self.stats["polls"] += 1
+        if self.document is None:
+            return self.refresh()
+
+        timecodes = self._get("liveTimestampv11")
+        if not timecodes or timecodes[-1] == self.timecode:
+            return []
+
+        patch = self._get("liveGameDiffPatchV1", startTimecode=self.timecode)
+        if isinstance(patch, dict):
+            # The API sends the whole document when a diff isn't available
+            self.document = patch
+            self.stats["full_fetches"] += 1
+            return self._new_events()
+
+        try:
+            document = self.document
+            for entry in patch:
+                document = apply_patch(document, entry.get("diff", []))
+        except (JSONPatchError, AttributeError, TypeError) as e:
+            self.log.warning("Patch for %s failed (%s), refetching full feed", self.game_pk, e)
+            self.stats["patch_failures"] += 1
+            return self.refresh()
+        self.document = document
+        self.stats["patches"] += 1
+        return self._new_events()
+
+    def stream(self, max_polls: int | None = None) -> Iterator[LiveEvent]:
+        """
+        Poll until the game is final, yielding new plays and play events.
+
+        Args:
+            max_polls: Stop after this many polls (default: run until Final)
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            yield from self.poll()
+            polls += 1
+            if self.is_final:
+                return
+            wait = self.document.get("metaData", {}).get("wait") if self.document else None
+            self.sleep(self.interval or wait or self.DEFAULT_INTERVAL)
+
+    def _mark_seen(self):
+        self._detailed_state = self.status.get("detailedState")
+        plays = self.plays
+        self._event_counts = [len(play.get("playEvents") or []) for play in plays]
+        self._completed = {
+            i for i, play in enumerate(plays) if play.get("about", {}).get("isComplete")
+        }
+
+    def _new_events(self) -> list[LiveEvent]:
+        """Status changes, plays, play events and completions not emitted yet."""
+        events = []
+        status = self.status
+        if status.get("detailedState") != self._detailed_state:
+            events.append(LiveEvent("status", None, None, status))
+            self._detailed_state = status.get("detailedState")
+        counts = self._event_counts
+        for i, play in enumerate(self.plays):
+            play_events = play.get("playEvents") or []
+            if i >= len(counts):
+                events.append(LiveEvent("play", i, None, play))
+                counts.append(0)
+            for j in range(counts[i], len(play_events)):
+                events.append(LiveEvent("event", i, j, play_events[j]))
+            counts[i] = max(counts[i], len(play_events))
+            if i not in self._completed and play.get("about", {}).get("isComplete"):
+                events.append(LiveEvent("complete", i, None, play))
+                self._completed.add(i)
+        return events
@@ -0,0 +1,354 @@
+"""
+Client-side rate limiting for MLB StatsAPI requests.
+
+Every request made by ``Endpoint._fetch`` (and ``AsyncEndpoint._fetch``) first takes a
+token from a ``RateLimiter``: one global bucket for the whole host plus optional
+per-endpoint buckets. Buckets refill at ``rate`` tokens per second up to ``burst``
+tokens, so short bursts go out immediately and sustained traffic is smoothed to the
+configured rate instead of tripping server-side throttling.
+
+Buckets are thread-safe. With ``lock_dir`` set, bucket state lives in small files
+guarded by ``fcntl.flock`` so every process on the machine shares the same budget
+(POSIX only).
+
+The limiter adapts to the server: a ``429 Too Many Requests`` (or any response with a
+``Retry-After`` header) pauses the affected buckets for the requested time and halves
+their rate; each successful response then restores a tenth of the configured rate.
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.ratelimit import RateLimiter
+
+    limiter = RateLimiter(rate=5, burst=10, endpoint_limits={"game": (2, 4)})
+    api = StatsAPI(rate_limiter=limiter)
+
+Or from the environment, for every registry created without an explicit limiter::
+
+    PYMLB_STATSAPI__RATE_LIMIT=5 PYMLB_STATSAPI__RATE_BURST=10 python my_job.py
+"""
+
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import requests
+
+from pymlb_statsapi.utils.log import LogMixin
+
+# tokens, updated (epoch seconds; may be in the future while paused), current rate
+_STATE = struct.Struct("<ddd")
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Parse a ``Retry-After`` header into seconds to wait.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+        now: Current epoch time (default: time.time())
+
+    Returns:
+        Seconds to wait (>= 0), or None if the header is missing or malformed
+
+    Example:
+        >>> parse_retry_after("120")
+        120.0
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - (now if now is not None else time.time()), 0.0)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    ``reserve()`` takes a token immediately and returns how long the caller must wait
+    before using it, so waiting happens outside the lock and callers are served in
+    reservation order.
+    """
+
+    def __init__(
+        self, rate: float, burst: float | None = None, clock: Callable[[], float] | None = None
+    ):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (default: max(rate, 1))
+            clock: Time source in seconds (default: time.monotonic)
+        """
+        assert rate > 0, f"rate must be positive, got {rate}"
+        self.base_rate = float(rate)
+        self.burst = float(burst) if burst else max(self.base_rate, 1.0)
+        self.clock = clock or time.monotonic
+        self._state = [self.burst, self.clock(), self.base_rate]
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rate={self.rate:g}, burst={self.burst:g})"
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[list[float]]:
+        """Yield the mutable [tokens, updated, rate] state under the bucket's lock."""
+        with self._lock:
+            yield self._state
+
+    def _refill(self, state: list[float], now: float):
+        tokens, updated, rate = state
+        if now > updated:
+            state[0] = min(self.burst, tokens + (now - updated) * rate)
+            state[1] = now
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate (lower than ``base_rate`` after throttling)."""
+        with self._locked_state() as state:
+            return state[2]
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take ``tokens`` now and return the seconds to wait before using them.
+
+        Returns:
+            0.0 if tokens were available, otherwise the delay until they will be
+        """
+        with self._locked_state() as state:
+            now = self.clock()
+            self._refill(state, now)
+            state[0] -= tokens
+            return max(state[1] - now, 0.0) + max(-state[0], 0.0) / state[2]
+
+    def pause(self, delay: float):
+        """
+        Stop handing out tokens for ``delay`` seconds.
+
+        One request may go when the pause ends; after that the bucket refills at its
+        rate instead of releasing a full burst.
+        """
+        with self._locked_state() as state:
+            now = self.clock()
+            self._refill(state, now)
+            if now + delay > state[1]:
+                state[0] = min(state[0], 1.0)
+                state[1] = now + delay
+
+    def throttle(self, factor: float, min_rate: float):
+        """Multiply the refill rate by ``factor``, not going below ``min_rate``."""
+        with self._locked_state() as state:
+            self._refill(state, self.clock())
+            state[2] = max(min(state[2] * factor, state[2]), min_rate)
+
+    def recover(self, step: float):
+        """Raise the refill rate by ``step``, up to ``base_rate``."""
+        with self._locked_state() as state:
+            if state[2] < self.base_rate:
+                self._refill(state, self.clock())
+                state[2] = min(state[2] + step, self.base_rate)
+
+
+class FileLockBucket(TokenBucket):
+    """
+    Token bucket whose state is shared by every process that opens the same file.
+
+    The 24-byte state file is read and rewritten under an exclusive ``fcntl.flock``
+    on every operation. Wall-clock time is used so all processes agree on it.
+    """
+
+    def __init__(self, path: str | Path, rate: float, burst: float | None = None):
+        """
+        Args:
+            path: State file (created if missing)
+            rate: Tokens added per second
+            burst: Bucket capacity (default: max(rate, 1))
+        """
+        try:
+            import fcntl
+        except ImportError as e:
+            raise RuntimeError("FileLockBucket requires fcntl (POSIX only)") from e
+        self._fcntl = fcntl
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(rate, burst, clock=time.time)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path}, rate={self.base_rate:g}, burst={self.burst:g})"
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[list[float]]:
+        with self._lock, open(self.path, "a+b") as f:
+            self._fcntl.flock(f, self._fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                data = f.read(_STATE.size)
+                if len(data) == _STATE.size:
+                    state = list(_STATE.unpack(data))
+                else:
+                    state = [self.burst, self.clock(), self.base_rate]
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(_STATE.pack(*state))
+                f.flush()
+            finally:
+                self._fcntl.flock(f, self._fcntl.LOCK_UN)
+
+
+class RateLimiter(LogMixin):
+    """
+    Global and per-endpoint request budgets with 429 / Retry-After adaptation.
+
+    Environment Variables:
+        PYMLB_STATSAPI__RATE_LIMIT: Global requests per second; 0 disables (default: 0)
+        PYMLB_STATSAPI__RATE_BURST: Global burst size (default: max(rate, 1))
+        PYMLB_STATSAPI__RATE_LIMIT_DIR: Share buckets across processes through state
+            files in this directory (default: unset, in-process only)
+    """
+
+    RATE = float(os.environ.get("PYMLB_STATSAPI__RATE_LIMIT", "0"))
+    BURST = float(os.environ.get("PYMLB_STATSAPI__RATE_BURST", "0"))
+    LOCK_DIR = os.environ.get("PYMLB_STATSAPI__RATE_LIMIT_DIR") or None
+
+    # Pause applied on a 429 that carries no usable Retry-After
+    DEFAULT_PAUSE = 1.0
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        endpoint_limits: dict[str, float | tuple[float, float]] | None = None,
+        lock_dir: str | Path | None = None,
+        backoff: float = 0.5,
+        min_rate_fraction: float = 0.1,
+        max_pause: float = 300.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: Global requests per second; 0 means no global limit (default: RATE)
+            burst: Global burst size (default: BURST, or max(rate, 1))
+            endpoint_limits: Per-endpoint budgets by endpoint name, as a rate or a
+                             (rate, burst) pair, e.g. {"game": (2, 4)}
+            lock_dir: Directory for cross-process bucket state (default: LOCK_DIR)
+            backoff: Rate multiplier applied when throttled
+            min_rate_fraction: Throttling never goes below this fraction of a bucket's rate
+            max_pause: Upper bound on a single Retry-After pause, in seconds
+            sleep: Blocking sleep used by ``acquire`` (injectable for tests)
+        """
+        super().__init__()
+        rate = self.RATE if rate is None else rate
+        burst = burst if burst is not None else (self.BURST or None)
+        self.lock_dir = (
+            Path(lock_dir) if lock_dir else (Path(self.LOCK_DIR) if self.LOCK_DIR else None)
+        )
+        self.backoff = backoff
+        self.min_rate_fraction = min_rate_fraction
+        self.max_pause = max_pause
+        self.sleep = sleep
+        self.throttled = 0
+        self.waited = 0.0
+
+        self.global_bucket = self._make_bucket("_global", rate, burst) if rate else None
+        self.endpoint_buckets: dict[str, TokenBucket] = {}
+        for endpoint_name, limit in (endpoint_limits or {}).items():
+            endpoint_rate, endpoint_burst = limit if isinstance(limit, tuple) else (limit, None)
+            self.endpoint_buckets[endpoint_name] = self._make_bucket(
+                endpoint_name, endpoint_rate, endpoint_burst
+            )
+        self._stats_lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(global={self.global_bucket!r}, "
+            f"endpoints={sorted(self.endpoint_buckets)})"
+        )
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter | None":
+        """Limiter configured from the environment, or None if rate limiting is off."""
+        return cls() if cls.RATE > 0 else None
+
+    def _make_bucket(self, name: str, rate: float, burst: float | None) -> TokenBucket:
+        if self.lock_dir is not None:
+            return FileLockBucket(self.lock_dir / f"{name}.bucket", rate, burst)
+        return TokenBucket(rate, burst)
+
+    def buckets(self, endpoint_name: str) -> list[TokenBucket]:
+        """The buckets a request to ``endpoint_name`` draws from."""
+        buckets = [self.global_bucket] if self.global_bucket is not None else []
+        if endpoint_name in self.endpoint_buckets:
+            buckets.append(self.endpoint_buckets[endpoint_name])
+        return buckets
+
+    def reserve(self, endpoint_name: str) -> float:
+        """
+        Take a token from every bucket that applies and return the seconds to wait.
+
+        Returns:
+            The longest wait across the global and endpoint buckets
+        """
+        wait = max((bucket.reserve() for bucket in self.buckets(endpoint_name)), default=0.0)
+        if wait > 0:
+            with self._stats_lock:
+                self.waited += wait
+        return wait
+
+    def acquire(self, endpoint_name: str) -> float:
+        """Block until a request to ``endpoint_name`` may be sent; returns the time waited."""
+        wait = self.reserve(endpoint_name)
+        if wait > 0:
+            self.log.debug("Rate limited %s: waiting %.3fs", endpoint_name, wait)
+            self.sleep(wait)
+        return wait
+
+    async def aacquire(self, endpoint_name: str) -> float:
+        """Async ``acquire``: waits with ``asyncio.sleep`` instead of blocking the loop."""
+        import asyncio
+
+        wait = self.reserve(endpoint_name)
+        if wait > 0:
+            self.log.debug("Rate limited %s: waiting %.3fs", endpoint_name, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, endpoint_name: str, response: requests.Response):
+        """
+        Adapt to a response: back off on throttling, recover on success.
+
+        A 429, or any response with a ``Retry-After`` header, pauses the buckets for the
+        requested time (``DEFAULT_PAUSE`` if none is given) and multiplies their rate by
+        ``backoff``. A 2xx/304 raises each throttled bucket's rate by a tenth of its
+        configured rate.
+        """
+        status = response.status_code
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if status == 429 or retry_after is not None:
+            pause = min(
+                retry_after if retry_after is not None else self.DEFAULT_PAUSE, self.max_pause
+            )
+            with self._stats_lock:
+                self.throttled += 1
+            self.log.warning(
+                "Throttled by server on %s (status %s): pausing %.1fs", endpoint_name, status, pause
+            )
+            for bucket in self.buckets(endpoint_name):
+                bucket.pause(pause)
+                bucket.throttle(self.backoff, bucket.base_rate * self.min_rate_fraction)
+        elif 200 <= status < 400:
+            for bucket in self.buckets(endpoint_name):
+                bucket.recover(bucket.base_rate / 10)
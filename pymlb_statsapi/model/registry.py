@@ -17,12 +17,28 @@ Usage:
     file_path = response.get_uri(protocol="file", prefix="mlb-data")
     s3_uri = response.get_uri(protocol="s3", prefix="raw-data", gzip=True)
     redis_key = response.get_uri(protocol="redis", prefix="mlb")
+
+    # Release pooled connections when done (or use the registry as a context manager)
+    api.close()
 """
 
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
 from pymlb_statsapi.utils.log import LogMixin
 from pymlb_statsapi.utils.schema_loader import sl
 
+from .batch import BatchCall, BatchResult, run_batch
 from .factory import Endpoint
+from .instrumentation import Instrumentation
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .session import HTTPSession
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from .cache import ResponseCache
 
 # Configuration for methods to exclude (broken or unimplemented in API)
 EXCLUDED_METHODS = {
@@ -41,72 +57,161 @@ class StatsAPI(LogMixin):
     """
     StatsAPI registry that generates endpoint classes from JSON schemas.
 
+    By default the registry is lazy: constructing it only lists the available schemas.
+    An endpoint's schema is loaded and its ``Endpoint`` built on first attribute access
+    (``api.Schedule``), and each generated method is compiled on first access
+    (``api.Schedule.schedule``). Pass ``lazy=False`` (or set ``PYMLB_STATSAPI__LAZY=0``)
+    to build everything up front.
+
     Attributes:
         All endpoint names are available as attributes (e.g., .Schedule, .Game, .Team)
     """
 
-    def __init__(self, excluded_methods: dict[str, set[str]] | None = None):
+    endpoint_class = Endpoint
+    session_class = HTTPSession
+
+    def __init__(
+        self,
+        excluded_methods: dict[str, set[str]] | None = None,
+        session: HTTPSession | None = None,
+        cache: "ResponseCache | None" = None,
+        lazy: bool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+        single_flight: SingleFlight | None = None,
+    ):
         """
         Initialize the dynamic API registry.
 
         Args:
             excluded_methods: Dict mapping endpoint names to sets of method names to exclude.
                              Defaults to EXCLUDED_METHODS if not provided.
+            session: Connection-pooled session shared by all endpoints. If not provided,
+                     the registry creates (and owns) one.
+            cache: Optional response cache shared by all endpoints (off by default)
+            lazy: Build endpoints and methods on first access (default: PYMLB_STATSAPI__LAZY,
+                  which is on unless set to 0)
+            rate_limiter: Client-side rate limiter shared by all endpoints
+                          (default: RateLimiter.from_env(), off unless PYMLB_STATSAPI__RATE_LIMIT is set)
+            retry_policy: Retry policy shared by all endpoints, so its retry budget is
+                          global to the registry (default: RetryPolicy())
+            instrumentation: Request hooks and metrics shared by all endpoints
+                             (default: Instrumentation.from_env(), off unless
+                             PYMLB_STATSAPI__METRICS is set)
+            single_flight: Coalescing of identical in-flight requests shared by all
+                           endpoints (default: SingleFlight.from_env(), off unless
+                           PYMLB_STATSAPI__SINGLE_FLIGHT=1)
         """
         super().__init__()
         self.excluded_methods = (
             excluded_methods if excluded_methods is not None else EXCLUDED_METHODS
         )
+        self._owns_session = session is None
+        self.session = session if session is not None else self.session_class()
+        self.cache = cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter.from_env()
+        self.retry_policy = (
+            retry_policy
+            if retry_policy is not None
+            else RetryPolicy(max_retries=self.endpoint_class.MAX_RETRIES)
+        )
+        self.instrumentation = (
+            instrumentation if instrumentation is not None else Instrumentation.from_env()
+        )
+        self.single_flight = single_flight if single_flight is not None else SingleFlight.from_env()
+        self.lazy = lazy if lazy is not None else self.endpoint_class.LAZY
         self._endpoints: dict[str, Endpoint] = {}
-        self._endpoint_config = sl.load_endpoint_model()
-        self._initialize_endpoints()
+        self._failed: set[str] = set()
+        self._endpoint_config: dict | None = None
+        self._lock = threading.RLock()
+        # Endpoint names come from the schema file listing; no schema is read yet
+        self._available = [
+            schema_file.replace(".json", "") for schema_file in sl.get_available_schemas()
+        ]
+        self._attr_names = {name.capitalize(): name for name in self._available}
+        if not self.lazy:
+            self._initialize_endpoints()
+
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails, i.e. for endpoints not yet materialized
+        attr_names = self.__dict__.get("_attr_names")
+        if attr_names is None or name not in attr_names:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        endpoint = self._load_endpoint(attr_names[name])
+        if endpoint is None:
+            raise AttributeError(f"Endpoint '{attr_names[name]}' failed to load")
+        return endpoint
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._attr_names))
 
     def _initialize_endpoints(self):
         """Load all available schemas and create endpoint instances."""
-        # Get list of available schemas
-        available_schemas = sl.get_available_schemas()
+        for endpoint_name in self._available:
+            self._load_endpoint(endpoint_name)
+
+    def _load_endpoint(self, endpoint_name: str) -> Endpoint | None:
+        """
+        Load one schema and create its endpoint instance (once).
 
-        for schema_file in available_schemas:
-            # Extract endpoint name (remove .json extension)
-            endpoint_name = schema_file.replace(".json", "")
+        Returns:
+            The endpoint, or None if its schema failed to load
+        """
+        with self._lock:
+            if endpoint_name in self._endpoints:
+                return self._endpoints[endpoint_name]
+            if endpoint_name in self._failed:
+                return None
 
             try:
                 # Load the schema
                 schema = sl.load_stats_schema(endpoint_name)
 
                 # Get endpoint config
+                if self._endpoint_config is None:
+                    self._endpoint_config = sl.load_endpoint_model()
                 endpoint_config = self._endpoint_config.get(endpoint_name, {})
 
                 # Get excluded methods for this endpoint
                 excluded = self.excluded_methods.get(endpoint_name, set())
 
                 # Create dynamic endpoint
-                endpoint = Endpoint(
+                endpoint = self.endpoint_class(
                     endpoint_name=endpoint_name,
                     schema=schema,
                     endpoint_config=endpoint_config,
                     excluded_methods=excluded,
+                    session=self.session,
+                    cache=self.cache,
+                    lazy=self.lazy,
+                    rate_limiter=self.rate_limiter,
+                    retry_policy=self.retry_policy,
+                    instrumentation=self.instrumentation,
+                    single_flight=self.single_flight,
                 )
 
-                self._endpoints[endpoint_name] = endpoint
+            except Exception as e:
+                self.log.error("Failed to load endpoint '%s': %s", endpoint_name, e)
+                self._failed.add(endpoint_name)
+                return None
 
-                # Add as attribute with capitalized name (e.g., schedule -> Schedule)
-                attr_name = endpoint_name.capitalize()
-                setattr(self, attr_name, endpoint)
+            self._endpoints[endpoint_name] = endpoint
 
-                self.log.debug(f"Loaded endpoint: {attr_name} ({endpoint_name})")
+            # Add as attribute with capitalized name (e.g., schedule -> Schedule)
+            attr_name = endpoint_name.capitalize()
+            setattr(self, attr_name, endpoint)
 
-            except Exception as e:
-                self.log.error(f"Failed to load endpoint '{endpoint_name}': {e}")
-                continue
+            self.log.debug("Loaded endpoint: %s (%s)", attr_name, endpoint_name)
+            return endpoint
 
     def get_endpoint_names(self) -> list[str]:
-        """Get list of all loaded endpoint names."""
-        return list(self._endpoints.keys())
+        """Get list of all endpoint names (without loading their schemas)."""
+        return [name for name in self._available if name not in self._failed]
 
     def get_endpoint(self, endpoint_name: str) -> Endpoint:
         """
-        Get an endpoint by name.
+        Get an endpoint by name, loading it if needed.
 
         Args:
             endpoint_name: The endpoint name (lowercase, e.g., 'schedule')
@@ -117,22 +222,26 @@ class StatsAPI(LogMixin):
         Raises:
             KeyError: If endpoint not found
         """
-        if endpoint_name not in self._endpoints:
+        endpoint = self._load_endpoint(endpoint_name) if endpoint_name in self._available else None
+        if endpoint is None:
             raise KeyError(
                 f"Endpoint '{endpoint_name}' not found. Available: {self.get_endpoint_names()}"
             )
-        return self._endpoints[endpoint_name]
+        return endpoint
 
     def list_all_methods(self) -> dict[str, list[str]]:
         """
         Get a mapping of all endpoints and their available methods.
 
+        Loads every endpoint schema, but compiles no methods.
+
         Returns:
             Dict mapping endpoint names to lists of method names
         """
         return {
-            endpoint_name: endpoint.get_method_names()
-            for endpoint_name, endpoint in self._endpoints.items()
+            endpoint_name: self._endpoints[endpoint_name].get_method_names()
+            for endpoint_name in self._available
+            if self._load_endpoint(endpoint_name) is not None
         }
 
     def get_method_info(self, endpoint_name: str, method_name: str) -> dict:
@@ -149,6 +258,63 @@ class StatsAPI(LogMixin):
         endpoint = self.get_endpoint(endpoint_name)
         return endpoint.get_method_info(method_name)
 
+    def _resolve_batch_calls(
+        self, calls: Iterable[tuple[str | Callable, dict]]
+    ) -> Iterator[BatchCall]:
+        """Turn (method, params) pairs into BatchCalls, resolving 'Endpoint.method' names."""
+        for method, params in calls:
+            if isinstance(method, str):
+                endpoint_name, _, method_name = method.partition(".")
+                endpoint = self.get_endpoint(endpoint_name.lower())
+                yield BatchCall(
+                    method=getattr(endpoint, method_name),
+                    params=dict(params),
+                    label=f"{endpoint.endpoint_name}.{method_name}",
+                )
+            else:
+                yield BatchCall(method=method, params=dict(params))
+
+    def batch(
+        self,
+        calls: Iterable[tuple[str | Callable, dict]],
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Execute many method calls concurrently.
+
+        Args:
+            calls: (method, params) pairs. ``method`` is either an endpoint method
+                   (e.g. ``api.Game.boxscore``) or its name (e.g. ``"Game.boxscore"``).
+            max_workers: Max concurrent calls (see batch.run_batch)
+            ordered: Yield results in submission order (True) or as they complete (False)
+
+        Returns:
+            Iterator of BatchResult, with per-call errors captured on ``.error``
+
+        Example:
+            >>> calls = [("Game.boxscore", {"game_pk": pk}) for pk in game_pks]
+            >>> for result in api.batch(calls, ordered=False):
+            ...     print(result.call, result.ok)
+        """
+        return run_batch(self._resolve_batch_calls(calls), max_workers=max_workers, ordered=ordered)
+
+    def close(self):
+        """
+        Close pooled HTTP connections.
+
+        Only closes the session if it was created by this registry; a session passed in
+        by the caller is left for the caller to close.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def __repr__(self):
         endpoints = ", ".join(self.get_endpoint_names())
         return f"{self.__class__.__name__}(endpoints=[{endpoints}])"
@@ -160,14 +326,39 @@ api = StatsAPI()
 
 
 # Alternative: Create a function that returns a new instance
-def create_stats_api(excluded_methods: dict[str, set[str]] | None = None) -> StatsAPI:
+def create_stats_api(
+    excluded_methods: dict[str, set[str]] | None = None,
+    session: HTTPSession | None = None,
+    cache: "ResponseCache | None" = None,
+    lazy: bool | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    instrumentation: Instrumentation | None = None,
+    single_flight: SingleFlight | None = None,
+) -> StatsAPI:
     """
     Create a new StatsAPI instance.
 
     Args:
         excluded_methods: Optional custom exclusion mapping
+        session: Optional shared connection-pooled session
+        cache: Optional response cache
+        lazy: Build endpoints and methods on first access (default: PYMLB_STATSAPI__LAZY)
+        rate_limiter: Optional client-side rate limiter
+        retry_policy: Optional retry policy
+        instrumentation: Optional request hooks and metrics
+        single_flight: Optional coalescing of identical in-flight requests
 
     Returns:
         StatsAPI instance
     """
-    return StatsAPI(excluded_methods=excluded_methods)
+    return StatsAPI(
+        excluded_methods=excluded_methods,
+        session=session,
+        cache=cache,
+        lazy=lazy,
+        rate_limiter=rate_limiter,
+        retry_policy=retry_policy,
+        instrumentation=instrumentation,
+        single_flight=single_flight,
+    )
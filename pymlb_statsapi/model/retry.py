@@ -0,0 +1,203 @@
+"""
+Retry policy for MLB StatsAPI requests.
+
+``Endpoint._fetch`` asks a ``RetryPolicy`` what to do after each failed attempt:
+
+- Connection errors, timeouts, 429 and 5xx responses are retried; other 4xx responses
+  (bad params, unknown ids) fail on the first attempt with ``RequestFailedError``
+- Delays grow exponentially with full jitter: ``uniform(0, min(max_delay,
+  base_delay * 2**attempt))``, so clients that failed together don't retry together
+- A ``Retry-After`` header sets the minimum delay; one longer than ``max_retry_after``
+  is not retried
+- A ``RetryBudget`` shared by every endpoint of a registry caps retries at a fraction
+  of requests, so an outage doesn't multiply traffic by ``max_retries``
+
+Attempts and time spent in backoff are recorded on ``APIResponse.retry_info`` and in
+``get_metadata()["retry"]``.
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.retry import RetryBudget, RetryPolicy
+
+    policy = RetryPolicy(max_retries=5, base_delay=1, budget=RetryBudget(ratio=0.1))
+    api = StatsAPI(retry_policy=policy)
+"""
+
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+
+import requests
+
+from pymlb_statsapi.utils.log import LogMixin
+
+from .ratelimit import parse_retry_after
+
+
+class RequestFailedError(AssertionError):
+    """
+    Non-success HTTP response.
+
+    Subclasses AssertionError, which is what request failures have always raised.
+    """
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+        self.status_code = response.status_code
+        super().__init__(
+            f"Request failed with status {response.status_code}: {response.text[:500]}"
+        )
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on retries relative to requests.
+
+    Each request deposits ``ratio`` tokens and each retry spends one, so at most about
+    ``ratio`` retries are made per request once the initial balance is used up.
+    ``min_per_second`` tokens are added over time so a quiet client can still retry.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ratio: Retry tokens earned per request
+            min_per_second: Retry tokens earned per second regardless of traffic
+            max_tokens: Balance cap (and initial balance)
+            clock: Time source in seconds
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.clock = clock
+        self._tokens = max_tokens
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(ratio={self.ratio}, tokens={self.tokens:.1f})"
+
+    def _refill(self, earned: float = 0.0):
+        now = self.clock()
+        earned += (now - self._updated) * self.min_per_second
+        self._tokens = min(self.max_tokens, self._tokens + earned)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Current retry balance."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def record_request(self):
+        """Earn ``ratio`` tokens for a new (non-retry) request."""
+        with self._lock:
+            self._refill(self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token for a retry; False if the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy(LogMixin):
+    """
+    Decides whether and how long to wait before retrying a failed attempt.
+
+    Environment Variables:
+        PYMLB_STATSAPI__MAX_RETRIES: Retries after the first attempt (default: 3)
+        PYMLB_STATSAPI__RETRY_BASE_DELAY: Backoff cap for the first retry, in seconds (default: 0.5)
+        PYMLB_STATSAPI__RETRY_MAX_DELAY: Backoff cap for any retry, in seconds (default: 30)
+    """
+
+    MAX_RETRIES = int(os.environ.get("PYMLB_STATSAPI__MAX_RETRIES", "3"))
+    BASE_DELAY = float(os.environ.get("PYMLB_STATSAPI__RETRY_BASE_DELAY", "0.5"))
+    MAX_DELAY = float(os.environ.get("PYMLB_STATSAPI__RETRY_MAX_DELAY", "30"))
+
+    # Statuses worth retrying; every other non-success status fails fast
+    RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        retry_statuses: frozenset[int] | None = None,
+        max_retry_after: float = 120.0,
+        budget: RetryBudget | None = None,
+        rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            max_retries: Retries after the first attempt (default: MAX_RETRIES)
+            base_delay: Backoff cap for the first retry (default: BASE_DELAY)
+            max_delay: Backoff cap for any retry (default: MAX_DELAY)
+            retry_statuses: HTTP statuses to retry (default: RETRY_STATUSES)
+            max_retry_after: Longest Retry-After honored; longer ones are not retried
+            budget: Retry budget (default: a new RetryBudget())
+            rng: Random source for jitter
+        """
+        super().__init__()
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = self.BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = self.MAX_DELAY if max_delay is None else max_delay
+        self.retry_statuses = self.RETRY_STATUSES if retry_statuses is None else retry_statuses
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.rng = rng or random.Random()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(max_retries={self.max_retries}, "
+            f"base_delay={self.base_delay}, max_delay={self.max_delay})"
+        )
+
+    def is_retryable(self, error: Exception) -> bool:
+        """True for transport errors and responses with a retryable status."""
+        if isinstance(error, RequestFailedError):
+            return error.status_code in self.retry_statuses
+        return isinstance(error, requests.exceptions.RequestException)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number ``attempt + 1``."""
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def record_request(self):
+        """Count a new request towards the retry budget."""
+        self.budget.record_request()
+
+    def next_delay(self, attempt: int, error: Exception) -> float | None:
+        """
+        Delay before retrying after ``error`` on zero-based ``attempt``.
+
+        Returns:
+            Seconds to wait, or None if the error should be raised instead
+        """
+        if attempt >= self.max_retries or not self.is_retryable(error):
+            return None
+
+        delay = self.backoff(attempt)
+        if isinstance(error, RequestFailedError):
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+
+        if not self.budget.try_spend():
+            self.log.warning("Retry budget exhausted, not retrying: %s", error)
+            return None
+        return delay
@@ -0,0 +1,365 @@
+"""
+Multi-game live polling scheduler.
+
+``LiveScheduler`` runs one ``LiveGameTracker`` per active game on a shared schedule
+instead of one polling loop per game:
+
+- Games are discovered with ``Schedule.schedule`` every ``DISCOVER_INTERVAL`` seconds.
+  Live games are tracked, and so are scheduled games from ``START_LEAD`` seconds before
+  first pitch; final games are dropped after their last update
+- Each game is polled on an interval chosen from its phase (in progress, between
+  innings, delayed, warming up) that stretches by ``BACKOFF`` after every poll without
+  changes, up to ``MAX_STRETCH`` times the phase interval, and snaps back on a change
+- All trackers share one registry, so one connection pool and (when the registry has
+  one) one ``RateLimiter`` budget; due games are polled on a small thread pool
+- Changes are delivered as ``(game_pk, LiveEvent)`` through the ``on_event`` callback,
+  the return value of ``run_pending()``, or the ``events()`` async iterator
+- ``metrics()`` reports scheduler lag (how late polls start) and requests per game
+
+Environment Variables:
+    PYMLB_STATSAPI__LIVE_POLL_INTERVAL: Seconds between polls of a game in progress
+        (default: 10)
+    PYMLB_STATSAPI__SCHEDULE_POLL_INTERVAL: Seconds between schedule discoveries
+        (default: 120)
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.ratelimit import RateLimiter
+    from pymlb_statsapi.model.scheduler import LiveScheduler
+
+    api = StatsAPI(rate_limiter=RateLimiter(rate=5))
+    scheduler = LiveScheduler(api=api, sport_ids=[1, 11], on_event=print)
+    scheduler.run()
+"""
+
+import heapq
+import os
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from pymlb_statsapi.utils.log import LogMixin
+
+from .live import LiveEvent, LiveGameTracker
+
+
+@dataclass
+class ScheduledGame:
+    """Scheduling state of one tracked game."""
+
+    game_pk: int
+    tracker: LiveGameTracker
+    phase: str = "live"
+    interval: float = 0.0
+    due: float = 0.0
+    idle_polls: int = 0
+    changes: int = 0
+    errors: int = 0
+
+
+class LiveScheduler(LogMixin):
+    """
+    Polls every active game on an interval adapted to its state and activity.
+
+    Call ``run()`` (blocking), iterate ``events()`` (asyncio), or call ``run_pending()``
+    from your own loop.
+    """
+
+    LIVE_INTERVAL = float(os.environ.get("PYMLB_STATSAPI__LIVE_POLL_INTERVAL", "10"))
+    DISCOVER_INTERVAL = float(os.environ.get("PYMLB_STATSAPI__SCHEDULE_POLL_INTERVAL", "120"))
+
+    # Poll interval of each phase, in multiples of LIVE_INTERVAL
+    PHASE_FACTORS = {"live": 1.0, "break": 3.0, "warmup": 6.0, "delayed": 12.0}
+    # Interval growth per poll without changes, and its cap (times the phase interval)
+    BACKOFF = 1.5
+    MAX_STRETCH = 4.0
+    # Seconds before first pitch that a scheduled game starts being tracked
+    START_LEAD = 900.0
+    # Lag samples kept for metrics()
+    LAG_SAMPLES = 1000
+
+    def __init__(
+        self,
+        api=None,
+        sport_ids: Iterable[int] = (1,),
+        date: str | None = None,
+        on_event: Callable[[int, LiveEvent], None] | None = None,
+        max_workers: int = 4,
+        live_interval: float | None = None,
+        discover_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        now: Callable[[], datetime] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            api: StatsAPI registry shared by every tracker (default: the shared ``api``)
+            sport_ids: Sports to discover games for (1 = MLB, 11-14 = MiLB levels)
+            date: Schedule date, YYYY-MM-DD (default: today, re-evaluated each discovery)
+            on_event: Called with ``(game_pk, event)`` for every change
+            max_workers: Games polled concurrently
+            live_interval: Seconds between polls of a game in progress (default: LIVE_INTERVAL)
+            discover_interval: Seconds between schedule discoveries (default: DISCOVER_INTERVAL)
+            clock: Monotonic time source for scheduling
+            now: Wall clock (UTC) for comparing with game start times
+            sleep: Sleep function used by run()
+        """
+        super().__init__()
+        if api is None:
+            from .registry import api
+        self.api = api
+        self.sport_ids = list(sport_ids)
+        self.date = date
+        self.on_event = on_event
+        self.max_workers = max_workers
+        self.live_interval = self.LIVE_INTERVAL if live_interval is None else live_interval
+        self.discover_interval = (
+            self.DISCOVER_INTERVAL if discover_interval is None else discover_interval
+        )
+        self.clock = clock
+        self.now = now or (lambda: datetime.now(timezone.utc))
+        self.sleep = sleep
+
+        self.games: dict[int, ScheduledGame] = {}
+        # Stats of games no longer tracked, kept for metrics()
+        self.finished: dict[int, dict] = {}
+        self._queue: list[tuple[float, int]] = []
+        self._next_discovery = clock()
+        self._lags: deque[float] = deque(maxlen=self.LAG_SAMPLES)
+        self._discoveries = 0
+        self._stopped = False
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(sport_ids={self.sport_ids}, games={len(self.games)})"
+
+    def phase_interval(self, phase: str) -> float:
+        """Base poll interval of a phase."""
+        return self.live_interval * self.PHASE_FACTORS.get(phase, 1.0)
+
+    @staticmethod
+    def phase_of(tracker: LiveGameTracker) -> str:
+        """Phase of a tracked game: final, delayed, warmup, break or live."""
+        status = tracker.status
+        state = status.get("detailedState") or ""
+        if status.get("abstractGameState") == "Final":
+            return "final"
+        if "Delay" in state or "Suspended" in state:
+            return "delayed"
+        if status.get("abstractGameState") == "Preview":
+            return "warmup"
+        linescore = (tracker.document or {}).get("liveData", {}).get("linescore", {})
+        if linescore.get("inningState") in ("Middle", "End"):
+            return "break"
+        return "live"
+
+    def discover(self) -> list[int]:
+        """
+        Start tracking games that are live or about to start.
+
+        Returns:
+            game_pks that started being tracked
+        """
+        self._discoveries += 1
+        date = self.date or self.now().astimezone().date().isoformat()
+        schedule = self.api.Schedule.schedule(sportId=self.sport_ids, date=date).json()
+        added = []
+        horizon = self.now() + timedelta(seconds=self.START_LEAD)
+        for day in schedule.get("dates", []):
+            for game in day.get("games", []):
+                game_pk = game["gamePk"]
+                if game_pk in self.games or game_pk in self.finished:
+                    continue
+                state = game.get("status", {}).get("abstractGameState")
+                if state == "Live" or (state == "Preview" and _starts_before(game, horizon)):
+                    self._track(game_pk)
+                    added.append(game_pk)
+        if added:
+            self.log.info("Tracking %s new games: %s", len(added), added)
+        return added
+
+    def _track(self, game_pk: int):
+        tracker = LiveGameTracker(game_pk, api=self.api, sleep=self.sleep)
+        scheduled = ScheduledGame(game_pk, tracker, due=self.clock())
+        self.games[game_pk] = scheduled
+        heapq.heappush(self._queue, (scheduled.due, game_pk))
+
+    def _poll(self, scheduled: ScheduledGame) -> tuple[ScheduledGame, float, list | Exception]:
+        started = self.clock()
+        try:
+            return scheduled, started, scheduled.tracker.poll()
+        except Exception as e:
+            return scheduled, started, e
+
+    def _reschedule(self, scheduled: ScheduledGame, changed: bool):
+        scheduled.phase = self.phase_of(scheduled.tracker)
+        scheduled.idle_polls = 0 if changed else scheduled.idle_polls + 1
+        base = self.phase_interval(scheduled.phase)
+        stretch = min(self.BACKOFF**scheduled.idle_polls, self.MAX_STRETCH)
+        scheduled.interval = base * stretch
+        scheduled.due = self.clock() + scheduled.interval
+        heapq.heappush(self._queue, (scheduled.due, scheduled.game_pk))
+
+    def run_pending(self) -> list[tuple[int, LiveEvent]]:
+        """
+        Discover games if due, then poll every game that is due.
+
+        Returns:
+            ``(game_pk, event)`` for every change found (also passed to on_event)
+        """
+        now = self.clock()
+        if now >= self._next_discovery:
+            try:
+                self.discover()
+            except Exception as e:
+                self.log.warning("Schedule discovery failed: %s", e)
+            self._next_discovery = now + self.discover_interval
+
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            _, game_pk = heapq.heappop(self._queue)
+            if game_pk in self.games:
+                due.append(self.games[game_pk])
+        if not due:
+            return []
+
+        if len(due) > 1 and self.max_workers > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="live-scheduler"
+                )
+            results = list(self._executor.map(self._poll, due))
+        else:
+            results = [self._poll(scheduled) for scheduled in due]
+
+        changes = []
+        for scheduled, started, outcome in results:
+            self._lags.append(max(0.0, started - scheduled.due))
+            if isinstance(outcome, Exception):
+                scheduled.errors += 1
+                self.log.warning("Polling game %s failed: %s", scheduled.game_pk, outcome)
+                self._reschedule(scheduled, changed=False)
+                continue
+            scheduled.changes += bool(outcome)
+            changes.extend((scheduled.game_pk, event) for event in outcome)
+            if scheduled.tracker.is_final:
+                self._finish(scheduled)
+            else:
+                self._reschedule(scheduled, changed=bool(outcome))
+
+        if self.on_event is not None:
+            for game_pk, event in changes:
+                self.on_event(game_pk, event)
+        return changes
+
+    def _finish(self, scheduled: ScheduledGame):
+        self.log.info("Game %s is final, no longer tracking it", scheduled.game_pk)
+        del self.games[scheduled.game_pk]
+        self.finished[scheduled.game_pk] = self._game_metrics(scheduled, phase="final")
+
+    def time_until_next(self) -> float:
+        """Seconds until the next game poll or discovery is due."""
+        next_due = min([self._next_discovery] + [due for due, _ in self._queue[:1]])
+        return max(0.0, next_due - self.clock())
+
+    def run(self, max_cycles: int | None = None):
+        """
+        Poll until stop() is called (blocking).
+
+        Args:
+            max_cycles: Return after this many scheduling cycles
+        """
+        self._stopped = False
+        cycles = 0
+        try:
+            while not self._stopped and (max_cycles is None or cycles < max_cycles):
+                self.run_pending()
+                cycles += 1
+                self.sleep(self.time_until_next())
+        finally:
+            self.close()
+
+    async def events(self) -> AsyncIterator[tuple[int, LiveEvent]]:
+        """
+        Poll until stop() is called, yielding ``(game_pk, event)`` changes.
+
+        Polls run in a worker thread so the event loop isn't blocked.
+        """
+        import asyncio
+
+        self._stopped = False
+        try:
+            while not self._stopped:
+                for change in await asyncio.to_thread(self.run_pending):
+                    yield change
+                await asyncio.sleep(self.time_until_next())
+        finally:
+            self.close()
+
+    def stop(self):
+        """Make run() / events() return after the current cycle."""
+        self._stopped = True
+
+    def close(self):
+        """Shut down the polling thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _game_metrics(self, scheduled: ScheduledGame, phase: str | None = None) -> dict:
+        stats = scheduled.tracker.stats
+        return {
+            "phase": phase or scheduled.phase,
+            "interval": scheduled.interval,
+            "polls": stats["polls"],
+            "requests": stats["requests"],
+            "bytes": stats["bytes"],
+            "full_fetches": stats["full_fetches"],
+            "changes": scheduled.changes,
+            "errors": scheduled.errors,
+        }
+
+    def metrics(self) -> dict:
+        """
+        Scheduler lag and request counts.
+
+        Returns:
+            Dict with ``games`` (per-game stats, tracked and finished), ``requests``
+            (game requests), ``requests_per_game``, ``discoveries`` and ``lag``
+            (p50 / p95 / max seconds that polls started after they were due)
+        """
+        games = dict(self.finished)
+        games.update({pk: self._game_metrics(g) for pk, g in self.games.items()})
+        requests = sum(game["requests"] for game in games.values())
+        lags = sorted(self._lags)
+        lag = {"p50": 0.0, "p95": 0.0, "max": 0.0}
+        if lags:
+            lag = {
+                "p50": statistics.median(lags),
+                "p95": lags[min(len(lags) - 1, int(len(lags) * 0.95))],
+                "max": lags[-1],
+            }
+        return {
+            "games": games,
+            "tracked": len(self.games),
+            "requests": requests,
+            "requests_per_game": requests / len(games) if games else 0.0,
+            "discoveries": self._discoveries,
+            "lag": lag,
+        }
+
+
+def _starts_before(game: dict, horizon: datetime) -> bool:
+    """True if a schedule entry's gameDate is before ``horizon``."""
+    game_date = game.get("gameDate")
+    if not game_date:
+        return False
+    try:
+        start = datetime.fromisoformat(game_date.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return start <= horizon
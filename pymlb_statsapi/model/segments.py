@@ -0,0 +1,347 @@
+"""
+Append-only segment log for high-frequency response capture.
+
+``save_json`` writes one file per response; capturing every pitch of every game that
+way leaves millions of small files. ``SegmentLog`` appends responses instead to a few
+large, rolling segment files (``segment-000001.log``, ...) and keeps a SQLite offset
+index (``index.sqlite``) next to them.
+
+Each record is a fixed header followed by its payload::
+
+    magic "MLBR" | flags (1 byte) | payload length | metadata length | CRC-32 of payload
+    payload = get_metadata() JSON + raw body, zlib-compressed when flags & 1
+
+Records can be read back by request key (one seek through the index) or by scanning
+segments sequentially without the index. Both yield ``APIResponse`` objects.
+
+A segment is only appended to, and the index only records complete records. Opening
+the log truncates a torn record left at the end of the last segment by a crash, and
+re-indexes complete records the index missed. The index can also be rebuilt from the
+segments alone with ``rebuild_index()``. One process should write to a directory at a
+time; any number may read.
+
+Usage:
+    from pymlb_statsapi import api
+    from pymlb_statsapi.model.segments import SegmentLog
+
+    log = SegmentLog("captures/2024-07-13")
+    log.append(api.Game.liveGameDiffPatchV1(game_pk=745804, startTimecode="..."))
+    log.get("game/liveGameDiffPatchV1/game_pk=745804/startTimecode=...")  # APIResponse
+    for response in log.scan():
+        ...
+"""
+
+import glob
+import os
+import sqlite3
+import struct
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+from pymlb_statsapi.utils.codec import codec
+from pymlb_statsapi.utils.log import LogMixin
+
+from .factory import APIResponse
+
+MAGIC = b"MLBR"
+FLAG_ZLIB = 1
+
+# magic, flags, payload length, metadata length, CRC-32 of the payload as stored
+_HEADER = struct.Struct("<4sBIII")
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}.log"
+
+
+def read_record(f: IO[bytes]) -> tuple[dict, bytes, int] | None:
+    """
+    Read the record at the current position of a segment file.
+
+    Returns:
+        Tuple of (metadata, body, record length), or None at the end of the segment
+        or at a torn or corrupt record
+    """
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    magic, flags, payload_length, metadata_length, crc = _HEADER.unpack(header)
+    if magic != MAGIC:
+        return None
+    payload = f.read(payload_length)
+    if len(payload) < payload_length or zlib.crc32(payload) != crc:
+        return None
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    metadata = codec.loads(payload[:metadata_length])
+    return metadata, payload[metadata_length:], _HEADER.size + payload_length
+
+
+class SegmentLog(LogMixin):
+    """
+    Rolling segment files of compressed response records with an offset index.
+
+    Environment Variables:
+        PYMLB_STATSAPI__SEGMENT_DIR: Default log directory
+            (default: <PYMLB_STATSAPI__BASE_FILE_PATH>/segments)
+        PYMLB_STATSAPI__SEGMENT_BYTES: Size at which a new segment is started
+            (default: 268435456, 256 MiB)
+    """
+
+    SEGMENT_BYTES = int(os.environ.get("PYMLB_STATSAPI__SEGMENT_BYTES", str(256 << 20)))
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        segment_bytes: int | None = None,
+        compress: bool = True,
+        compresslevel: int = 6,
+        fsync: bool = False,
+    ):
+        """
+        Args:
+            directory: Log directory (default: PYMLB_STATSAPI__SEGMENT_DIR)
+            segment_bytes: Roll to a new segment once the current one reaches this size
+                           (default: SEGMENT_BYTES)
+            compress: zlib-compress each record
+            compresslevel: zlib level (1-9)
+            fsync: fsync the segment after every append (durable, much slower)
+        """
+        super().__init__()
+        self.directory = directory or os.environ.get(
+            "PYMLB_STATSAPI__SEGMENT_DIR",
+            os.path.join(
+                os.environ.get("PYMLB_STATSAPI__BASE_FILE_PATH", "./.var/local/mlb_statsapi"),
+                "segments",
+            ),
+        )
+        self.segment_bytes = segment_bytes or self.SEGMENT_BYTES
+        self.compress = compress
+        self.compresslevel = compresslevel
+        self.fsync = fsync
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.directory, "index.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                key TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                PRIMARY KEY (segment, offset)
+            );
+            CREATE INDEX IF NOT EXISTS records_key ON records (key, timestamp);
+            """
+        )
+        self._file: IO[bytes] | None = None
+        self._segment = 0
+        self._recover()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(directory={self.directory})"
+
+    def segments(self) -> list[int]:
+        """Numbers of the segment files in the directory, in order."""
+        paths = glob.glob(os.path.join(self.directory, "segment-*.log"))
+        return sorted(int(os.path.basename(p)[8:-4]) for p in paths)
+
+    def segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, _segment_name(number))
+
+    def _index_rows(self, segment: int, start: int = 0) -> Iterator[tuple]:
+        """(key, timestamp, segment, offset, length) of complete records from ``start``."""
+        with open(self.segment_path(segment), "rb") as f:
+            f.seek(start)
+            offset = start
+            while (record := read_record(f)) is not None:
+                metadata, _, length = record
+                request = metadata["request"]
+                yield self._key(metadata), request.get("timestamp", ""), segment, offset, length
+                offset += length
+
+    @staticmethod
+    def _key(metadata: dict) -> str:
+        return metadata.get("key") or APIResponse.from_metadata(metadata, b"").get_path()
+
+    def _recover(self):
+        """Truncate a torn tail of the last segment and index records the index missed."""
+        segments = self.segments()
+        if not segments:
+            return
+        last = segments[-1]
+        with self._lock:
+            indexed_end = self._conn.execute(
+                "SELECT COALESCE(MAX(offset + length), 0) FROM records WHERE segment = ?",
+                (last,),
+            ).fetchone()[0]
+            rows = list(self._index_rows(last, indexed_end))
+            end = rows[-1][3] + rows[-1][4] if rows else indexed_end
+            if os.path.getsize(self.segment_path(last)) > end:
+                self.log.warning(
+                    "%s: truncating torn record at %s:%s", self, _segment_name(last), end
+                )
+                os.truncate(self.segment_path(last), end)
+            if rows:
+                self.log.warning("%s: indexing %s unindexed records", self, len(rows))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)", rows
+                )
+
+    def _current(self) -> IO[bytes]:
+        """The segment being appended to, rolling over once it is full."""
+        if self._file is not None and self._file.tell() >= self.segment_bytes:
+            self._file.close()
+            self._file = None
+            self._segment += 1
+        if self._file is None:
+            if not self._segment:
+                self._segment = max(self.segments(), default=1)
+            self._file = open(self.segment_path(self._segment), "ab")
+            if self._file.tell() >= self.segment_bytes:
+                return self._current()
+        return self._file
+
+    def _encode(self, metadata: dict, content: bytes) -> bytes:
+        encoded = codec.dumps(metadata)
+        payload = encoded + content
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload, self.compresslevel)
+            flags |= FLAG_ZLIB
+        return _HEADER.pack(MAGIC, flags, len(payload), len(encoded), zlib.crc32(payload)) + payload
+
+    def append(self, response: APIResponse, prefix: str = "") -> dict:
+        """
+        Append a response, keyed by ``get_path(prefix)``.
+
+        Returns:
+            Dict with 'key', 'timestamp', 'segment', 'offset' and 'length'
+        """
+        return self.append_many([response], prefix=prefix)[0]
+
+    def append_many(self, responses: Iterable[APIResponse], prefix: str = "") -> list[dict]:
+        """Append several responses with a single index transaction."""
+        encoded = []
+        for response in responses:
+            metadata = response.get_metadata()
+            metadata["key"] = response.get_path(prefix=prefix)
+            encoded.append(
+                (metadata["key"], response.timestamp, self._encode(metadata, response.content))
+            )
+
+        if not encoded:
+            return []
+        rows = []
+        with self._lock:
+            for key, timestamp, record in encoded:
+                f = self._current()
+                offset = f.tell()
+                f.write(record)
+                rows.append((key, timestamp, self._segment, offset, len(record)))
+            # Flushed on every append, so readers always see complete records
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            # Index only once the records are in the file
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.execute("COMMIT")
+        names = ("key", "timestamp", "segment", "offset", "length")
+        return [dict(zip(names, row, strict=True)) for row in rows]
+
+    def _read_at(self, segment: int, offset: int) -> APIResponse:
+        with open(self.segment_path(segment), "rb") as f:
+            f.seek(offset)
+            record = read_record(f)
+        if record is None:
+            raise ValueError(f"No valid record at {_segment_name(segment)}:{offset}")
+        return APIResponse.from_metadata(record[0], record[1])
+
+    def get(self, key: str, at: str | None = None) -> APIResponse | None:
+        """The latest record for ``key`` (at or before ``at``, if given), or None."""
+        query = "SELECT segment, offset FROM records WHERE key = ?"
+        params: tuple = (key,)
+        if at is not None:
+            query += " AND timestamp <= ?"
+            params += (at,)
+        with self._lock:
+            row = self._conn.execute(
+                query + " ORDER BY timestamp DESC, segment DESC, offset DESC LIMIT 1", params
+            ).fetchone()
+        return self._read_at(*row) if row is not None else None
+
+    def versions(self, key: str) -> list[dict]:
+        """Index entries of every record of ``key``, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, timestamp, segment, offset, length FROM records WHERE key = ? "
+                "ORDER BY timestamp, segment, offset",
+                (key,),
+            ).fetchall()
+        names = ("key", "timestamp", "segment", "offset", "length")
+        return [dict(zip(names, row, strict=True)) for row in rows]
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        """Indexed keys starting with ``prefix``, in order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT key FROM records WHERE substr(key, 1, ?) = ? ORDER BY key",
+                (len(prefix), prefix),
+            ).fetchall()
+        for (key,) in rows:
+            yield key
+
+    def scan(self, segments: Iterable[int] | None = None) -> Iterator[APIResponse]:
+        """
+        Read records sequentially, in append order, without the index.
+
+        Args:
+            segments: Segment numbers to read (default: all)
+
+        Yields:
+            APIResponse per record
+        """
+        for segment in segments if segments is not None else self.segments():
+            with open(self.segment_path(segment), "rb", buffering=1 << 20) as f:
+                while (record := read_record(f)) is not None:
+                    yield APIResponse.from_metadata(record[0], record[1])
+
+    def rebuild_index(self) -> int:
+        """Re-create the index by scanning every segment; returns the records indexed."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM records")
+            count = 0
+            for segment in self.segments():
+                rows = list(self._index_rows(segment))
+                self._conn.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?)", rows)
+                count += len(rows)
+            self._conn.execute("COMMIT")
+        return count
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,139 @@
+"""
+Connection-pooled HTTP sessions for MLB StatsAPI requests.
+
+The module-level ``requests.get`` opens a new TCP+TLS connection for every call.
+``HTTPSession`` wraps a single ``requests.Session`` with keep-alive and sized
+connection pools so that every ``Endpoint`` owned by a ``StatsAPI`` registry reuses
+the same warm connections to statsapi.mlb.com.
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.session import HTTPSession
+
+    with StatsAPI(session=HTTPSession(pool_maxsize=32)) as api:
+        api.Schedule.schedule(sportId=1, date="2025-06-01")
+"""
+
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pymlb_statsapi.utils.log import LogMixin
+
+
+class HTTPSession(LogMixin):
+    """
+    Shared, connection-pooled HTTP session.
+
+    The underlying ``requests.Session`` is created lazily on first use, so building a
+    registry never opens sockets. After ``close()`` the session can be used again; a
+    fresh pool is created on the next request.
+
+    Environment Variables:
+        PYMLB_STATSAPI__POOL_CONNECTIONS: Number of per-host pools to cache (default: 10)
+        PYMLB_STATSAPI__POOL_MAXSIZE: Max connections kept alive per host (default: 10)
+    """
+
+    POOL_CONNECTIONS = int(os.environ.get("PYMLB_STATSAPI__POOL_CONNECTIONS", "10"))
+    POOL_MAXSIZE = int(os.environ.get("PYMLB_STATSAPI__POOL_MAXSIZE", "10"))
+    DEFAULT_HEADERS = {
+        "Accept-Encoding": "gzip",
+        "Connection": "keep-alive",
+    }
+
+    def __init__(
+        self,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        host_pool_sizes: dict[str, int] | None = None,
+        headers: dict[str, str] | None = None,
+    ):
+        """
+        Configure the session (no connections are opened here).
+
+        Args:
+            pool_connections: Number of host pools each adapter caches
+            pool_maxsize: Max connections kept alive per host pool
+            pool_block: Block when a pool is exhausted instead of opening extra connections
+            host_pool_sizes: Per-host overrides of pool_maxsize, e.g. {"statsapi.mlb.com": 32}
+            headers: Extra default headers sent with every request
+        """
+        super().__init__()
+        self.pool_connections = pool_connections or self.POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.POOL_MAXSIZE
+        self.pool_block = pool_block
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.headers = {**self.DEFAULT_HEADERS, **(headers or {})}
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(pool_connections={self.pool_connections}, "
+            f"pool_maxsize={self.pool_maxsize}, open={self._session is not None})"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _make_adapter(self, pool_maxsize: int) -> HTTPAdapter:
+        # Retries are handled by Endpoint, so urllib3 must not retry on its own
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", self._make_adapter(self.pool_maxsize))
+        session.mount("http://", self._make_adapter(self.pool_maxsize))
+        # requests picks the longest matching prefix, so host mounts win over the defaults
+        for host, maxsize in self.host_pool_sizes.items():
+            session.mount(f"https://{host}", self._make_adapter(maxsize))
+            session.mount(f"http://{host}", self._make_adapter(maxsize))
+        self.log.debug("Opened %s", self)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The underlying ``requests.Session``, created on first access."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    @property
+    def is_open(self) -> bool:
+        """True if a pool is currently open."""
+        return self._session is not None
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Issue a GET request over the pooled session.
+
+        Args:
+            url: Fully resolved request URL
+            **kwargs: Passed through to ``requests.Session.get`` (timeout, headers, ...)
+
+        Returns:
+            requests.Response
+        """
+        return self.session.get(url, **kwargs)
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+            self.log.debug("Closed %s", self)
@@ -0,0 +1,190 @@
+"""
+Request coalescing (single-flight) for identical in-flight calls.
+
+When many threads or tasks request the same URL at the same instant, e.g. every
+worker of an API tier asking for today's ``Standings.standings``, only the first one
+(the leader) goes to the network. Callers that arrive while that request is still in
+flight wait for it and receive their own ``APIResponse`` built from the shared result
+(or the same exception). Once the request completes the key is released, so the next
+call fetches again (or hits the cache).
+
+Coalescing sits behind the cache lookup in ``Endpoint._request``: only cache misses
+are coalesced, and the leader stores the response for everyone.
+
+Usage:
+    from pymlb_statsapi import StatsAPI
+    from pymlb_statsapi.model.singleflight import SingleFlight
+
+    # Coalesce everything except the live timestamp polls
+    api = StatsAPI(single_flight=SingleFlight(rules={"game.liveTimestampv11": False}))
+    api.single_flight.stats()  # {"calls": ..., "coalesced": ..., "in_flight": ...}
+"""
+
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from pymlb_statsapi.utils.log import LogMixin
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Flight:
+    """A request in flight and, once done, its result or error."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(LogMixin):
+    """
+    Share one upstream request between concurrent identical calls.
+
+    Environment Variables:
+        PYMLB_STATSAPI__SINGLE_FLIGHT: Coalesce identical in-flight requests in every
+            registry created without an explicit ``single_flight`` (default: 0)
+    """
+
+    ENABLED = os.environ.get("PYMLB_STATSAPI__SINGLE_FLIGHT", "0").lower() in ("1", "true", "yes")
+
+    def __init__(self, rules: dict[str, bool] | None = None, default: bool = True):
+        """
+        Args:
+            rules: Whether to coalesce, by "endpoint.method" glob (e.g. {"game.*": False}).
+                   Exact names win over globs; longer globs win over shorter ones.
+            default: Whether to coalesce methods matching no rule
+        """
+        super().__init__()
+        self.rules = dict(rules or {})
+        self.default = default
+        self.calls = 0
+        self.coalesced = 0
+        self._enabled_cache: dict[str, bool] = {}
+        self._flights: dict[str, _Flight] = {}
+        self._tasks: dict[tuple[int, str], asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rules={self.rules}, default={self.default})"
+
+    @classmethod
+    def from_env(cls) -> "SingleFlight | None":
+        """Coalescer for a new registry if PYMLB_STATSAPI__SINGLE_FLIGHT is on, else None."""
+        return cls() if cls.ENABLED else None
+
+    def enabled_for(self, endpoint_name: str, method_name: str) -> bool:
+        """
+        Whether calls to an endpoint method are coalesced.
+
+        Example:
+            >>> SingleFlight(rules={"game.*": False}).enabled_for("game", "boxscore")
+            False
+        """
+        name = f"{endpoint_name}.{method_name}"
+        enabled = self._enabled_cache.get(name)
+        if enabled is None:
+            if name in self.rules:
+                enabled = self.rules[name]
+            else:
+                matches = [p for p in self.rules if fnmatchcase(name, p)]
+                enabled = self.rules[max(matches, key=len)] if matches else self.default
+            self._enabled_cache[name] = enabled
+        return enabled
+
+    def _count(self, shared: bool):
+        self.calls += 1
+        if shared:
+            self.coalesced += 1
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Call ``fn``, unless a call for ``key`` is already in flight; then wait for it.
+
+        Args:
+            key: Identity of the request (the resolved URL)
+            fn: Performs the request
+
+        Returns:
+            Tuple of (result, shared). ``shared`` is True for callers that received
+            another caller's result.
+
+        Raises:
+            Whatever ``fn`` raised, in the leader and every waiting caller
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            shared = flight is not None
+            if not shared:
+                flight = self._flights[key] = _Flight()
+            self._count(shared)
+
+        if shared:
+            self.log.debug("Coalesced: %s", key)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            # Release the key before waking the waiters, so later calls start a new flight
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """
+        Async ``do``: await ``fn()``, or the call for ``key`` already in flight.
+
+        The request runs in its own task, shielded from the callers: cancelling one
+        caller (the first included) doesn't cancel the request for the others.
+        Flights are tracked per event loop.
+
+        Returns:
+            Tuple of (result, shared)
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(flight_key)
+            shared = task is not None
+            if not shared:
+                task = loop.create_task(fn())
+                self._tasks[flight_key] = task
+                task.add_done_callback(partial(self._release, flight_key))
+            self._count(shared)
+        if shared:
+            self.log.debug("Coalesced: %s", key)
+        return await asyncio.shield(task), shared
+
+    def _release(self, flight_key: tuple[int, str], task: "asyncio.Task"):
+        with self._lock:
+            if self._tasks.get(flight_key) is task:
+                del self._tasks[flight_key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every caller was cancelled
+            task.exception()
+
+    def stats(self) -> dict:
+        """Calls made through the coalescer, how many shared a flight, and flights open."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._flights) + len(self._tasks),
+            }
@@ -0,0 +1,357 @@
+"""
+Slotted struct decoding for StatsAPI responses.
+
+``APIResponse.json()`` returns nested dicts, and a ``liveGameV1`` feed holds thousands
+of small objects with the same few key sets. ``APIResponse.decode()`` converts the body
+into instances of classes with ``__slots__`` instead, which need about half the memory
+and support attribute access::
+
+    game = api.Game.liveGameV1(game_pk=747175).decode()
+    game.gameData.teams.home.name
+    game.liveData.plays.allPlays[0].result.description
+
+Classes are generated from the ``models`` section of the endpoint's Swagger schema. The
+schemas only describe part of each response (``liveData.plays.allPlays`` isn't declared,
+for example), so every distinct key set gets its own class, derived from a family base:
+
+- An object the schema describes belongs to its model's family, so
+  ``isinstance(game, decoder.model("GameRestObject"))`` holds. Declared fields it
+  doesn't have read as None, and undeclared fields are kept
+- Any other object belongs to the family of its place in the document (e.g. every
+  ``allPlays`` item). Keys seen on any object of the family read as None on the others,
+  like ``dict.get``: ``event.pitchData`` is None for a pickoff
+- Objects keyed by ids (every key ends in a digit, e.g. boxscore ``players``), objects
+  with keys that aren't identifiers, and new key sets once ``MAX_SHAPES`` classes exist
+  stay dicts
+
+Nothing is dropped: ``to_builtins(response.decode()) == response.json()``.
+
+Environment Variables:
+    PYMLB_STATSAPI__STRUCT_MAX_SHAPES: Most struct classes generated per process
+        (default: 4096)
+"""
+
+import keyword
+import os
+import re
+import threading
+
+from pymlb_statsapi.utils.log import LogMixin
+from pymlb_statsapi.utils.schema_loader import sl
+
+# Swagger property types -> Python annotations
+_SCALARS = {"integer": "int", "number": "float", "string": "str", "boolean": "bool"}
+
+# Wrapper return types whose body is the wrapped model plus a copyright notice
+_WRAPPER = re.compile(r"^\w+ResponseEntity«(\w+)»$")
+
+# Cache miss marker (None is a cached "stays a dict")
+_MISSING = object()
+
+
+class Struct:
+    """
+    Base class of decoded objects.
+
+    Supports attribute access, ``struct[key]``, ``key in struct``, iteration over keys
+    and ``len()``. There are no public methods, so any key can be an attribute; use
+    ``to_builtins()`` to convert back to dicts.
+    """
+
+    __slots__ = ()
+
+    # Schema model name (None for objects the schema doesn't describe)
+    __model__: str | None = None
+    # Family name: the model name, or the object's place in the document
+    __family__: str = ""
+    # Fields declared by the schema model, in schema order
+    __fields__: tuple[str, ...] = ()
+    # Declared field -> model name of its object (or array items)
+    __types__: dict[str, str] = {}
+    # Keys held by this class, in wire order, and the family of each key's value
+    __keys__: tuple[str, ...] = ()
+    __children__: tuple[str, ...] = ()
+
+    def __getitem__(self, key: str):
+        if key not in self.__keys__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__keys__
+
+    def __iter__(self):
+        return iter(self.__keys__)
+
+    def __len__(self) -> int:
+        return len(self.__keys__)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Struct):
+            return NotImplemented
+        return self.__keys__ == other.__keys__ and all(
+            getattr(self, key) == getattr(other, key) for key in self.__keys__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__keys__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        values = tuple(getattr(self, key) for key in self.__keys__)
+        return _restore, (self.__family__, self.__keys__, values)
+
+
+def _restore(family: str, keys: tuple[str, ...], values: tuple):
+    """Unpickle a Struct through the default decoder's classes."""
+    cls = decoder.shape(family, keys)
+    if cls is None:
+        return dict(zip(keys, values, strict=True))
+    return cls(*values)
+
+
+def to_builtins(value):
+    """Convert decoded structs (and lists of them) back to plain dicts and lists."""
+    if isinstance(value, Struct):
+        return {key: to_builtins(getattr(value, key)) for key in value.__keys__}
+    if isinstance(value, list):
+        return [to_builtins(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_builtins(item) for key, item in value.items()}
+    return value
+
+
+def _is_field_name(key: str) -> bool:
+    return key.isidentifier() and not key.startswith("_") and not keyword.iskeyword(key)
+
+
+class StructDecoder(LogMixin):
+    """
+    Generates struct classes from schema models and decodes parsed JSON into them.
+
+    Classes are generated on first use and shared by every response, so decoding the
+    same kind of response twice creates no new classes. Thread-safe.
+    """
+
+    MAX_SHAPES = int(os.environ.get("PYMLB_STATSAPI__STRUCT_MAX_SHAPES", "4096"))
+
+    def __init__(self, max_shapes: int | None = None, schema_loader=None):
+        """
+        Args:
+            max_shapes: Most classes to generate before new key sets stay dicts
+                (default: MAX_SHAPES)
+            schema_loader: Source of endpoint schemas (default: the package SchemaLoader)
+        """
+        super().__init__()
+        self.max_shapes = self.MAX_SHAPES if max_shapes is None else max_shapes
+        self.schema_loader = schema_loader or sl
+        # Model name -> swagger model definition, from every endpoint loaded so far
+        self._definitions: dict[str, dict] = {}
+        # Endpoint name -> {method name: return model name}
+        self._returns: dict[str, dict[str, str | None]] = {}
+        # Family name -> base class
+        self._bases: dict[str, type[Struct]] = {}
+        # (family, keys) -> class, or None for key sets that stay dicts
+        self._shapes: dict[tuple[str, tuple[str, ...]], type[Struct] | None] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(models={len(self._definitions)}, shapes={len(self._shapes)})"
+
+    def load_endpoint(self, endpoint_name: str) -> dict[str, str | None]:
+        """
+        Register the models of an endpoint schema (once).
+
+        Returns:
+            Map of method name -> model name of its response (None if not a model)
+        """
+        returns = self._returns.get(endpoint_name)
+        if returns is not None:
+            return returns
+        with self._lock:
+            if endpoint_name in self._returns:
+                return self._returns[endpoint_name]
+            schema = self.schema_loader.load_stats_schema(endpoint_name)
+            for name, definition in schema.get("models", {}).items():
+                # Models are defined identically in every schema that lists them
+                self._definitions.setdefault(name, definition)
+            returns = {}
+            for api in schema.get("apis", []):
+                for operation in api.get("operations", []):
+                    returns.setdefault(operation["nickname"], self._model_name(operation))
+            self._returns[endpoint_name] = returns
+            self.log.debug("Loaded %s models for %s", len(schema.get("models", {})), endpoint_name)
+            return returns
+
+    def _model_name(self, definition: dict) -> str | None:
+        """Model name of an operation's response or of a property, if it has one."""
+        name = definition.get("type")
+        if name in ("array", "Array"):
+            name = definition.get("items", {}).get("type")
+        if name is None or name in _SCALARS:
+            return None
+        match = _WRAPPER.match(name)
+        return match.group(1) if match else name
+
+    def model(self, name: str) -> type[Struct]:
+        """
+        Base class of a schema model's decoded objects.
+
+        Raises:
+            KeyError: If no loaded endpoint schema defines the model
+        """
+        if name not in self._definitions:
+            raise KeyError(f"Unknown model {name!r}; load an endpoint schema that defines it")
+        return self._base(name)
+
+    def _base(self, family: str) -> type[Struct]:
+        base = self._bases.get(family)
+        if base is not None:
+            return base
+        with self._lock:
+            if family in self._bases:
+                return self._bases[family]
+            definition = self._definitions.get(family)
+            if definition is None:
+                namespace = {"__family__": family}
+            else:
+                namespace = self._model_namespace(family, definition)
+            base = type(
+                "Struct" if definition is None else family,
+                (Struct,),
+                {"__slots__": (), "__module__": __name__, **namespace},
+            )
+            self._bases[family] = base
+            return base
+
+    def _model_namespace(self, name: str, definition: dict) -> dict:
+        """Class attributes of a schema model's base class."""
+        properties = definition.get("properties", {})
+        annotations = {}
+        types = {}
+        for field, prop in properties.items():
+            nested = self._model_name(prop)
+            if nested is not None:
+                types[field] = nested
+            item = nested or _SCALARS.get(prop.get("items", prop).get("type"), "object")
+            is_array = prop.get("type") in ("array", "Array")
+            annotations[field] = f"list[{item}] | None" if is_array else f"{item} | None"
+        return {
+            "__doc__": definition.get("description") or f"StatsAPI {name} model.",
+            "__model__": name,
+            "__family__": name,
+            "__fields__": tuple(properties),
+            "__types__": types,
+            "__annotations__": annotations,
+            # Declared fields an object doesn't have read as None
+            **{field: None for field in properties if _is_field_name(field)},
+        }
+
+    def shape(self, family: str, keys: tuple[str, ...]) -> type[Struct] | None:
+        """
+        Class for objects of a family with exactly these keys.
+
+        Args:
+            family: Schema model name, or the place of the objects in their document
+            keys: The objects' keys, in order
+
+        Returns:
+            The class, or None if such objects stay dicts
+        """
+        cls = self._shapes.get((family, keys), _MISSING)
+        if cls is not _MISSING:
+            return cls
+        with self._lock:
+            cls = self._shapes.get((family, keys), _MISSING)
+            if cls is _MISSING:
+                cls = self._build_shape(family, keys)
+                self._shapes[(family, keys)] = cls
+            return cls
+
+    def _build_shape(self, family: str, keys: tuple[str, ...]) -> type[Struct] | None:
+        if not all(_is_field_name(key) for key in keys):
+            return None
+        # Objects keyed by ids ("ID660271", "1") are maps, not records
+        if keys and all(key[-1].isdigit() for key in keys):
+            return None
+        if len(self._shapes) >= self.max_shapes:
+            self.log.warning(
+                "%s struct classes generated, decoding %s as dict", self.max_shapes, keys
+            )
+            return None
+
+        base = self._base(family)
+        for key in keys:
+            # Keys of any shape in the family read as None on its other shapes
+            if not hasattr(base, key):
+                setattr(base, key, None)
+        children = tuple(base.__types__.get(key) or f"{family}.{key}" for key in keys)
+
+        args = ", ".join(f"_{i}" for i in range(len(keys)))
+        body = "".join(f"\n    self.{key} = _{i}" for i, key in enumerate(keys)) or "\n    pass"
+        namespace: dict = {}
+        # Safe: keys passed _is_field_name, so they are plain identifiers
+        exec(f"def __init__(self, {args}):{body}", namespace)  # nosec B102
+        return type(
+            base.__name__,
+            (base,),
+            {
+                "__slots__": keys,
+                "__module__": __name__,
+                "__keys__": keys,
+                "__children__": children,
+                "__init__": namespace["__init__"],
+            },
+        )
+
+    def decode(self, value, family: str = ""):
+        """
+        Convert parsed JSON into structs.
+
+        Args:
+            value: Parsed JSON (dicts, lists and scalars)
+            family: Schema model of the top-level object (or of each item of a list),
+                or any name grouping documents of the same kind
+
+        Returns:
+            The same data with objects replaced by structs; scalars are shared
+        """
+        if isinstance(value, dict):
+            keys = tuple(value)
+            cls = self._shapes.get((family, keys), _MISSING)
+            if cls is _MISSING:
+                cls = self.shape(family, keys)
+            if cls is None:
+                # Values of a map share a family
+                family = f"{family}.*"
+                return {key: self.decode(item, family) for key, item in value.items()}
+            decode = self.decode
+            return cls(
+                *[
+                    decode(item, child)
+                    for item, child in zip(value.values(), cls.__children__, strict=True)
+                ]
+            )
+        if isinstance(value, list):
+            return [self.decode(item, family) for item in value]
+        return value
+
+    def decode_response(self, data, endpoint_name: str, method_name: str):
+        """
+        Convert the parsed body of an endpoint method's response into structs.
+
+        Responses that aren't a schema model decode into anonymous structs, grouped by
+        endpoint method.
+        """
+        try:
+            model = self.load_endpoint(endpoint_name).get(method_name)
+        except (FileNotFoundError, ModuleNotFoundError, ValueError) as e:
+            self.log.debug("No schema models for %s: %s", endpoint_name, e)
+            model = None
+        return self.decode(data, model or f"{endpoint_name}.{method_name}")
+
+
+# Process-wide decoder used by APIResponse.decode()
+decoder = StructDecoder()
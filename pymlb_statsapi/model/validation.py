@@ -0,0 +1,264 @@
+"""
+Compiled parameter validation for endpoint methods.
+
+``EndpointMethod.validate_and_resolve_params`` runs on every request. Everything it
+checks against (required names, lowercase enum values, allowMultiple flags, the path
+template) is fixed by the schema, so ``ValidationPlan`` computes it once per method and
+validation then only touches the params that were actually passed.
+
+Well-formed calls take the fast path. Anything invalid is re-checked by walking the
+param definitions in schema order, so the first error reported (and its message) is the
+same no matter which params were passed or in what order.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .factory import EndpointMethod
+
+
+@dataclass(frozen=True, slots=True)
+class ParamRule:
+    """Precomputed checks for one parameter."""
+
+    name: str
+    position: int
+    required: bool
+    # Lowercase allowed values, or None if the param isn't an enum
+    enum: frozenset[str] | None
+    enum_values: tuple
+    allow_multiple: bool
+
+    @classmethod
+    def from_definition(cls, position: int, param_def: dict) -> "ParamRule":
+        enum = param_def.get("enum") or None
+        return cls(
+            name=param_def["name"],
+            position=position,
+            required=bool(param_def["required"]),
+            enum=frozenset(str(v).lower() for v in enum) if enum else None,
+            enum_values=tuple(enum or ()),
+            allow_multiple=bool(param_def.get("allowMultiple", False)),
+        )
+
+
+def _in_order(validated: dict, positions: dict[str, int]) -> dict:
+    """Reorder validated params to schema order (URLs and cache keys are built from them)."""
+    names = list(validated)
+    ordered = sorted(names, key=positions.__getitem__)
+    if ordered == names:
+        return validated
+    return {name: validated[name] for name in ordered}
+
+
+class ValidationPlan:
+    """
+    Validation plan compiled from one ``EndpointMethod``'s parameter definitions.
+
+    Example:
+        >>> plan = ValidationPlan(api.Game.get_method("boxscore"))
+        >>> plan.validate({"game_pk": 747175}, {"fields": ["teams", "info"]})
+        ({'game_pk': '747175'}, {'fields': 'teams,info'}, '/v1/game/747175/boxscore')
+    """
+
+    __slots__ = (
+        "method_name",
+        "path_template",
+        "path_rules",
+        "query_rules",
+        "required_path",
+        "required_query",
+        "_path_enums",
+        "_query_multiple",
+        "_query_positions",
+        "_static_path",
+        "_format_path",
+        "_has_duplicates",
+    )
+
+    def __init__(self, endpoint_method: "EndpointMethod"):
+        self.method_name = endpoint_method.method_name
+        self.path_template = endpoint_method.path_template
+        # Every definition in schema order, for the ordered walk
+        self.path_rules = tuple(
+            ParamRule.from_definition(i, p) for i, p in enumerate(endpoint_method.path_params)
+        )
+        self.query_rules = tuple(
+            ParamRule.from_definition(i, p) for i, p in enumerate(endpoint_method.query_params)
+        )
+        self.required_path = frozenset(r.name for r in self.path_rules if r.required)
+        self.required_query = frozenset(r.name for r in self.query_rules if r.required)
+
+        # Flat name -> value tables for the fast path (first definition of a name wins)
+        self._path_enums = {}
+        for rule in self.path_rules:
+            self._path_enums.setdefault(rule.name, rule.enum)
+        self._query_multiple = {}
+        self._query_positions = {}
+        for rule in self.query_rules:
+            self._query_multiple.setdefault(rule.name, rule.allow_multiple)
+            self._query_positions.setdefault(rule.name, rule.position)
+
+        # Templates without placeholders resolve to themselves
+        self._static_path = self.path_template if "{" not in self.path_template else None
+        self._format_path = self.path_template.format_map
+        # A name defined twice can fail on its second definition; only the walk sees that
+        self._has_duplicates = len(self._path_enums) < len(self.path_rules) or len(
+            self._query_multiple
+        ) < len(self.query_rules)
+
+    def __repr__(self):
+        return (
+            f"ValidationPlan({self.method_name}, path={[r.name for r in self.path_rules]}, "
+            f"query={[r.name for r in self.query_rules]})"
+        )
+
+    def validate(
+        self, path_params: dict | None = None, query_params: dict | None = None
+    ) -> tuple[dict, dict, str]:
+        """
+        Validate parameters and resolve the full URL path.
+
+        Only the params that were passed are looked at; the result is identical to
+        ``validate_ordered``, including which error is raised first.
+
+        Args:
+            path_params: Path parameter values
+            query_params: Query parameter values
+
+        Returns:
+            Tuple of (validated_path_params, validated_query_params, resolved_path)
+
+        Raises:
+            AssertionError: If required parameters are missing or invalid
+        """
+        if self._has_duplicates:
+            return self.validate_ordered(path_params, query_params)
+
+        validated_path = {}
+        if path_params:
+            enums = self._path_enums
+            for name, value in path_params.items():
+                enum = enums.get(name, False)
+                if enum is False:
+                    return self.validate_ordered(path_params, query_params)
+                if value.__class__ is not str:
+                    if isinstance(value, list):
+                        if len(value) != 1:
+                            return self.validate_ordered(path_params, query_params)
+                        value = value[0]
+                    value = str(value)
+                if enum is not None and value.lower() not in enum:
+                    return self.validate_ordered(path_params, query_params)
+                validated_path[name] = value
+            if len(validated_path) > 1:
+                # Few path params per method: rebuild in definition order
+                validated_path = {n: validated_path[n] for n in enums if n in validated_path}
+
+        validated_query = {}
+        if query_params:
+            allow_multiple = self._query_multiple
+            for name, value in query_params.items():
+                multiple = allow_multiple.get(name)
+                if multiple is None:
+                    return self.validate_ordered(path_params, query_params)
+                if value.__class__ is not str:
+                    if isinstance(value, list):
+                        if not multiple and len(value) > 1:
+                            return self.validate_ordered(path_params, query_params)
+                        value = ",".join(str(v) for v in value)
+                    else:
+                        value = str(value)
+                validated_query[name] = value
+            if len(validated_query) > 1:
+                validated_query = _in_order(validated_query, self._query_positions)
+
+        if (self.required_path and not self.required_path.issubset(validated_path)) or (
+            self.required_query and not self.required_query.issubset(validated_query)
+        ):
+            return self.validate_ordered(path_params, query_params)
+
+        resolved_path = self._static_path or self._format_path(validated_path)
+        return validated_path, validated_query, resolved_path
+
+    def validate_ordered(
+        self, path_params: dict | None = None, query_params: dict | None = None
+    ) -> tuple[dict, dict, str]:
+        """
+        Validate by walking every definition in schema order.
+
+        Same result as ``validate``; used to report the first error when the fast path
+        finds a problem.
+        """
+        path_params = dict(path_params or {})
+        query_params = dict(query_params or {})
+
+        # Validate path parameters
+        validated_path_params = {}
+        for rule in self.path_rules:
+            param_name = rule.name
+            if rule.required and param_name not in path_params:
+                raise AssertionError(
+                    f"{self.method_name}: path parameter '{param_name}' is required"
+                )
+
+            if param_name in path_params:
+                value = path_params.pop(param_name)
+
+                # Handle list values (should only have one item for path params)
+                if isinstance(value, list):
+                    if len(value) != 1:
+                        raise AssertionError(
+                            f"{self.method_name}: path parameter '{param_name}' must have exactly one value, got {value}"
+                        )
+                    value = value[0]
+
+                # Validate enum if present
+                if rule.enum is not None and str(value).lower() not in rule.enum:
+                    raise AssertionError(
+                        f"{self.method_name}: '{param_name}' must be one of {list(rule.enum_values)}, got '{value}'"
+                    )
+
+                validated_path_params[param_name] = str(value)
+
+        # Check for unrecognized path params
+        if path_params:
+            raise AssertionError(
+                f"{self.method_name}: unrecognized path parameters: {list(path_params.keys())}"
+            )
+
+        # Validate query parameters
+        validated_query_params = {}
+        for rule in self.query_rules:
+            param_name = rule.name
+            if rule.required and param_name not in query_params:
+                raise AssertionError(
+                    f"{self.method_name}: query parameter '{param_name}' is required"
+                )
+
+            if param_name in query_params:
+                value = query_params.pop(param_name)
+
+                # Handle list values
+                if isinstance(value, list):
+                    if not rule.allow_multiple and len(value) > 1:
+                        raise AssertionError(
+                            f"{self.method_name}: query parameter '{param_name}' does not allow multiple values"
+                        )
+                    value = ",".join(str(v) for v in value)
+                else:
+                    value = str(value)
+
+                validated_query_params[param_name] = value
+
+        # Check for unrecognized query params
+        if query_params:
+            raise AssertionError(
+                f"{self.method_name}: unrecognized query parameters: {list(query_params.keys())}"
+            )
+
+        # Resolve path with parameters
+        resolved_path = self.path_template.format(**validated_path_params)
+
+        return validated_path_params, validated_query_params, resolved_path
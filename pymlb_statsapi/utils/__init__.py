@@ -4,6 +4,7 @@ created by nikos at 5/2/21
 
 from .log import (
     LogMixin,
+    configure_logging,
     get_logger,
     loggers,
 )
@@ -0,0 +1,144 @@
+"""
+Pluggable JSON codec.
+
+Parsing and serializing StatsAPI documents (a ``liveGameV1`` feed can be several MB)
+is a measurable share of request time with the standard library. ``get_codec()``
+returns the fastest available implementation, in order: ``orjson``, ``msgspec``,
+``ujson``, then stdlib ``json``. None of them is required; install one with::
+
+    pip install 'pymlb-statsapi[fast]'
+
+Every codec parses ``bytes`` or ``str`` and serializes to ``bytes``. Anything the fast
+library can't serialize is retried with stdlib ``json``, so the choice of codec never
+changes what can be saved.
+
+Environment Variables:
+    PYMLB_STATSAPI__JSON_CODEC: ``auto`` (default), ``orjson``, ``msgspec``, ``ujson``
+        or ``json``
+
+Usage:
+    from pymlb_statsapi.utils.codec import codec
+
+    data = codec.loads(response.content)
+    payload = codec.dumps(data)            # compact bytes
+    pretty = codec.dumps(data, indent=2)   # pretty-printed bytes
+"""
+
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# Preference order for "auto"
+CODEC_NAMES = ("orjson", "msgspec", "ujson", "json")
+
+
+def _json_dumps(obj, indent: int | None = None) -> bytes:
+    return json.dumps(obj, indent=indent).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """A named pair of JSON parse / serialize functions."""
+
+    name: str
+    _loads: Callable[[bytes | str], object]
+    _dumps: Callable[..., bytes]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name})"
+
+    def loads(self, data: bytes | str):
+        """Parse a JSON document from bytes or str."""
+        return self._loads(data)
+
+    def dumps(self, obj, indent: int | None = None) -> bytes:
+        """
+        Serialize to UTF-8 JSON bytes.
+
+        Args:
+            obj: JSON-serializable object
+            indent: Pretty-print with this indent (default: compact)
+        """
+        try:
+            return self._dumps(obj, indent)
+        except (TypeError, ValueError, OverflowError):
+            # Types or options the fast library doesn't support (e.g. non-str keys)
+            return _json_dumps(obj, indent)
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    def dumps(obj, indent=None):
+        if indent is None:
+            return orjson.dumps(obj)
+        if indent == 2:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return _json_dumps(obj, indent)
+
+    return JSONCodec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj, indent=None):
+        data = encoder.encode(obj)
+        return data if indent is None else msgspec.json.format(data, indent=indent)
+
+    return JSONCodec("msgspec", decoder.decode, dumps)
+
+
+def _ujson_codec() -> JSONCodec:
+    import ujson
+
+    def dumps(obj, indent=None):
+        return ujson.dumps(obj, indent=indent or 0, ensure_ascii=False).encode("utf-8")
+
+    return JSONCodec("ujson", ujson.loads, dumps)
+
+
+def _stdlib_codec() -> JSONCodec:
+    return JSONCodec("json", json.loads, _json_dumps)
+
+
+_FACTORIES = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(name: str | None = None) -> JSONCodec:
+    """
+    Return a JSON codec by name, or the fastest installed one.
+
+    Args:
+        name: One of CODEC_NAMES or "auto" (default: PYMLB_STATSAPI__JSON_CODEC, else auto)
+
+    Returns:
+        JSONCodec
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If a specific codec was requested but isn't installed
+    """
+    name = (name or os.environ.get("PYMLB_STATSAPI__JSON_CODEC") or "auto").lower()
+    if name == "auto":
+        for candidate in CODEC_NAMES:
+            try:
+                return _FACTORIES[candidate]()
+            except ImportError:
+                continue
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected 'auto' or one of {CODEC_NAMES}")
+    return _FACTORIES[name]()
+
+
+# Process-wide default codec
+codec = get_codec()
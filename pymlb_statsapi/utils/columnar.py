@@ -0,0 +1,507 @@
+"""
+Columnar export of play-by-play data.
+
+Flattens ``Game.playByPlay`` and ``Game.liveGameV1`` payloads into three tables with a
+fixed column schema:
+
+- ``plays``: one row per plate appearance (``allPlays[]``)
+- ``events``: one row per ``playEvents[]`` item (pitches, pickoffs, actions), with
+  ``pitchData`` and ``hitData`` columns that are null where absent
+- ``runners``: one row per runner movement (``allPlays[].runners[]``)
+
+Every table starts with ``game_pk``; ``events`` and ``runners`` also carry the play's
+``at_bat_index`` and batter / pitcher ids, so they join back to ``plays``.
+
+Rows are appended column by column by an extractor generated once per table, which
+looks up each shared parent object (``pitchData``, ``pitchData.coordinates``...) once
+per row. The columns convert to an Apache Arrow table (``pip install 'pymlb-statsapi[arrow]'``)
+or a NumPy record array without going through row dicts, and a directory of saved
+responses exports to Parquet one game at a time::
+
+    from pymlb_statsapi.utils.columnar import ColumnarExporter, extract_game
+
+    tables = extract_game(api.Game.liveGameV1(game_pk=747175).json())
+    pitches = tables["events"].to_arrow()
+
+    ColumnarExporter().export_directory(".var/local/mlb_statsapi", "parquet/")
+"""
+
+import importlib
+import math
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+from .codec import codec
+from .compression import SAVED_SUFFIXES, ZstdDictionaries, read_saved
+from .log import LogMixin
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    One output column.
+
+    Attributes:
+        name: Column name
+        type: ``int64``, ``float64``, ``string`` or ``bool``
+        path: Keys leading to the value, from the row's object
+        play: True if the path starts at the enclosing play instead of the row
+    """
+
+    name: str
+    type: str
+    path: tuple[str, ...]
+    play: bool = False
+
+
+def _columns(spec: str, play: bool = False) -> list[Column]:
+    """Parse ``name type dotted.path`` lines."""
+    columns = []
+    for line in spec.strip().splitlines():
+        name, type_, path = line.split()
+        columns.append(Column(name, type_, tuple(path.split(".")), play))
+    return columns
+
+
+# Columns every table starts with; game_pk is filled in per game, not from a path
+GAME_PK = Column("game_pk", "int64", ())
+
+PLAY_COLUMNS = [
+    GAME_PK,
+    *_columns("""
+        at_bat_index int64 about.atBatIndex
+        inning int64 about.inning
+        half_inning string about.halfInning
+        is_top_inning bool about.isTopInning
+        start_time string about.startTime
+        end_time string about.endTime
+        is_complete bool about.isComplete
+        is_scoring_play bool about.isScoringPlay
+        has_review bool about.hasReview
+        has_out bool about.hasOut
+        batter_id int64 matchup.batter.id
+        batter_name string matchup.batter.fullName
+        bat_side string matchup.batSide.code
+        pitcher_id int64 matchup.pitcher.id
+        pitcher_name string matchup.pitcher.fullName
+        pitch_hand string matchup.pitchHand.code
+        men_on_base string matchup.splits.menOnBase
+        result_type string result.type
+        event string result.event
+        event_type string result.eventType
+        description string result.description
+        rbi int64 result.rbi
+        away_score int64 result.awayScore
+        home_score int64 result.homeScore
+        is_out bool result.isOut
+        balls int64 count.balls
+        strikes int64 count.strikes
+        outs int64 count.outs
+    """),
+]
+
+# Play context repeated on every event and runner row
+_PLAY_CONTEXT = _columns(
+    """
+    at_bat_index int64 about.atBatIndex
+    batter_id int64 matchup.batter.id
+    pitcher_id int64 matchup.pitcher.id
+    """,
+    play=True,
+)
+
+EVENT_COLUMNS = [
+    GAME_PK,
+    *_PLAY_CONTEXT,
+    *_columns("""
+        event_index int64 index
+        play_id string playId
+        pitch_number int64 pitchNumber
+        type string type
+        is_pitch bool isPitch
+        start_time string startTime
+        end_time string endTime
+        player_id int64 player.id
+        description string details.description
+        event string details.event
+        event_type string details.eventType
+        code string details.code
+        call_code string details.call.code
+        call_description string details.call.description
+        is_in_play bool details.isInPlay
+        is_strike bool details.isStrike
+        is_ball bool details.isBall
+        is_out bool details.isOut
+        pitch_type string details.type.code
+        pitch_type_description string details.type.description
+        balls int64 count.balls
+        strikes int64 count.strikes
+        outs int64 count.outs
+        start_speed float64 pitchData.startSpeed
+        end_speed float64 pitchData.endSpeed
+        strike_zone_top float64 pitchData.strikeZoneTop
+        strike_zone_bottom float64 pitchData.strikeZoneBottom
+        zone int64 pitchData.zone
+        type_confidence float64 pitchData.typeConfidence
+        plate_time float64 pitchData.plateTime
+        extension float64 pitchData.extension
+        px float64 pitchData.coordinates.pX
+        pz float64 pitchData.coordinates.pZ
+        pfx_x float64 pitchData.coordinates.pfxX
+        pfx_z float64 pitchData.coordinates.pfxZ
+        x float64 pitchData.coordinates.x
+        y float64 pitchData.coordinates.y
+        x0 float64 pitchData.coordinates.x0
+        y0 float64 pitchData.coordinates.y0
+        z0 float64 pitchData.coordinates.z0
+        vx0 float64 pitchData.coordinates.vX0
+        vy0 float64 pitchData.coordinates.vY0
+        vz0 float64 pitchData.coordinates.vZ0
+        ax float64 pitchData.coordinates.aX
+        ay float64 pitchData.coordinates.aY
+        az float64 pitchData.coordinates.aZ
+        break_angle float64 pitchData.breaks.breakAngle
+        break_length float64 pitchData.breaks.breakLength
+        break_y float64 pitchData.breaks.breakY
+        break_vertical float64 pitchData.breaks.breakVertical
+        break_vertical_induced float64 pitchData.breaks.breakVerticalInduced
+        break_horizontal float64 pitchData.breaks.breakHorizontal
+        spin_rate float64 pitchData.breaks.spinRate
+        spin_direction float64 pitchData.breaks.spinDirection
+        launch_speed float64 hitData.launchSpeed
+        launch_angle float64 hitData.launchAngle
+        total_distance float64 hitData.totalDistance
+        trajectory string hitData.trajectory
+        hardness string hitData.hardness
+        location string hitData.location
+        coord_x float64 hitData.coordinates.coordX
+        coord_y float64 hitData.coordinates.coordY
+    """),
+]
+
+RUNNER_COLUMNS = [
+    GAME_PK,
+    *_PLAY_CONTEXT,
+    *_columns("""
+        play_index int64 details.playIndex
+        runner_id int64 details.runner.id
+        runner_name string details.runner.fullName
+        origin_base string movement.originBase
+        start_base string movement.start
+        end_base string movement.end
+        out_base string movement.outBase
+        is_out bool movement.isOut
+        out_number int64 movement.outNumber
+        event string details.event
+        event_type string details.eventType
+        movement_reason string details.movementReason
+        responsible_pitcher_id int64 details.responsiblePitcher.id
+        is_scoring_event bool details.isScoringEvent
+        rbi bool details.rbi
+        earned bool details.earned
+        team_unearned bool details.teamUnearned
+    """),
+]
+
+TABLES = {"plays": PLAY_COLUMNS, "events": EVENT_COLUMNS, "runners": RUNNER_COLUMNS}
+
+# Read-only stand-in for a missing or non-object parent
+_EMPTY: dict = {}
+
+# NumPy has no nulls: missing values become these
+NUMPY_DTYPES = {"int64": "i8", "float64": "f8", "string": "O", "bool": "i1"}
+NUMPY_NULLS = {"int64": -1, "float64": math.nan, "string": None, "bool": -1}
+
+
+@cache
+def _compile_extractor(table: str) -> Callable[..., Callable[[dict, dict], None]]:
+    """
+    Generate ``bind(*appends) -> extract(row, play)`` for a table (once).
+
+    ``extract`` looks up each parent object once and appends one value per column
+    (GAME_PK excluded) to the matching ``appends`` list method.
+    """
+    columns = TABLES[table]
+    lines = ["def bind(" + ", ".join(f"a{i}" for i in range(len(columns))) + "):"]
+    lines.append("    def extract(row, play):")
+    variables: dict[tuple[bool, tuple[str, ...]], str] = {(False, ()): "row", (True, ()): "play"}
+
+    def parent(play: bool, path: tuple[str, ...]) -> str:
+        key = (play, path)
+        if key not in variables:
+            source = parent(play, path[:-1])
+            name = f"p{len(variables)}"
+            lines.append(f"        {name} = {source}.get({path[-1]!r})")
+            lines.append(f"        if {name}.__class__ is not dict: {name} = EMPTY")
+            variables[key] = name
+        return variables[key]
+
+    for i, column in enumerate(columns):
+        if column is GAME_PK:
+            continue
+        source = parent(column.play, column.path[:-1])
+        lines.append(f"        a{i}({source}.get({column.path[-1]!r}))")
+    lines.append("    return extract")
+
+    source = "\n".join(lines)
+    namespace = {"EMPTY": _EMPTY}
+    # Safe: the source is generated from the static TABLES columns, keys quoted with repr()
+    exec(source, namespace)  # nosec B102
+    return namespace["bind"]
+
+
+@dataclass
+class ColumnarTable:
+    """Column lists for one table, appendable game by game."""
+
+    name: str
+    columns: list[Column]
+    data: dict[str, list] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for column in self.columns:
+            self.data.setdefault(column.name, [])
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0].name])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name}, rows={len(self)}, columns={len(self.columns)})"
+
+    def clear(self):
+        """Drop all rows (keeps the schema)."""
+        for values in self.data.values():
+            values.clear()
+
+    def arrow_schema(self):
+        """The table's ``pyarrow.Schema``."""
+        pa = _import("pyarrow", "arrow")
+        types = {"int64": pa.int64(), "float64": pa.float64(), "string": pa.string()}
+        types["bool"] = pa.bool_()
+        return pa.schema([pa.field(column.name, types[column.type]) for column in self.columns])
+
+    def to_arrow(self):
+        """Convert to a ``pyarrow.Table`` (requires pyarrow)."""
+        pa = _import("pyarrow", "arrow")
+        schema = self.arrow_schema()
+        arrays = [
+            pa.array(self.data[column.name], type=schema.field(column.name).type)
+            for column in self.columns
+        ]
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def to_numpy(self):
+        """
+        Convert to a NumPy record array (requires numpy).
+
+        Missing values are NaN for floats, -1 for ints and bools (stored as int8) and
+        None for strings (object columns).
+        """
+        np = _import("numpy", "numpy")
+        arrays = []
+        for column in self.columns:
+            null = NUMPY_NULLS[column.type]
+            values = [null if value is None else value for value in self.data[column.name]]
+            arrays.append(np.array(values, dtype=NUMPY_DTYPES[column.type]))
+        dtype = [(column.name, NUMPY_DTYPES[column.type]) for column in self.columns]
+        return np.rec.fromarrays(arrays, dtype=dtype)
+
+    def write_parquet(self, path: str | Path, compression: str = "zstd") -> Path:
+        """Write the table to a Parquet file (requires pyarrow)."""
+        pq = _import("pyarrow.parquet", "arrow")
+        pq.write_table(self.to_arrow(), str(path), compression=compression)
+        return Path(path)
+
+
+def _import(module: str, extra: str):
+    """Import an optional dependency, pointing at the extra that installs it."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{module} is required for this export; install it with "
+            f"pip install 'pymlb-statsapi[{extra}]'"
+        ) from e
+
+
+def all_plays(data: dict) -> list:
+    """``allPlays`` of a liveGameV1 or playByPlay payload ([] if it has none)."""
+    if not isinstance(data, dict):
+        return []
+    plays = data.get("liveData", {}).get("plays", data)
+    return plays.get("allPlays") or []
+
+
+class PlayByPlayExtractor:
+    """
+    Appends rows of the plays, events and runners tables from play-by-play payloads.
+
+    Reuse one extractor to accumulate many games into the same tables.
+    """
+
+    def __init__(self, tables: Iterable[str] = TABLES):
+        """
+        Args:
+            tables: Names of the tables to fill (default: all of TABLES)
+        """
+        self.tables = {name: ColumnarTable(name, TABLES[name]) for name in tables}
+        self._extract = {
+            name: _compile_extractor(name)(
+                *(table.data[column.name].append for column in table.columns)
+            )
+            for name, table in self.tables.items()
+        }
+
+    def add_game(self, data: dict, game_pk: int | None = None) -> dict[str, int]:
+        """
+        Append one game's rows.
+
+        Args:
+            data: liveGameV1 or playByPlay payload (``APIResponse.json()``)
+            game_pk: Game id (default: the payload's ``gamePk``; playByPlay has none)
+
+        Returns:
+            Rows added per table
+        """
+        if game_pk is None and isinstance(data, dict):
+            game_pk = data.get("gamePk")
+        before = {name: len(table) for name, table in self.tables.items()}
+        plays = self._extract.get("plays")
+        events = self._extract.get("events")
+        runners = self._extract.get("runners")
+        for play in all_plays(data):
+            if plays is not None:
+                plays(play, play)
+            if events is not None:
+                for event in play.get("playEvents") or ():
+                    events(event, play)
+            if runners is not None:
+                for runner in play.get("runners") or ():
+                    runners(runner, play)
+
+        added = {}
+        for name, table in self.tables.items():
+            # Extractors fill every column but game_pk, which is the same for the game
+            added[name] = len(table.data[table.columns[1].name]) - before[name]
+            table.data[GAME_PK.name].extend([game_pk] * added[name])
+        return added
+
+    def clear(self):
+        """Drop all accumulated rows."""
+        for table in self.tables.values():
+            table.clear()
+
+
+def extract_game(
+    data: dict, game_pk: int | None = None, tables: Iterable[str] = TABLES
+) -> dict[str, ColumnarTable]:
+    """
+    Flatten one liveGameV1 or playByPlay payload.
+
+    Args:
+        data: Parsed payload (``APIResponse.json()``)
+        game_pk: Game id (default: the payload's ``gamePk``)
+        tables: Tables to build (default: plays, events and runners)
+
+    Returns:
+        Table name -> ColumnarTable
+    """
+    extractor = PlayByPlayExtractor(tables)
+    extractor.add_game(data, game_pk)
+    return extractor.tables
+
+
+class ColumnarExporter(LogMixin):
+    """
+    Batch export of saved play-by-play responses to Parquet.
+
+    Reads every ``*.json`` / ``*.json.gz`` / ``*.json.zst`` file under a directory, as
+    written by ``APIResponse.save_json`` with any ``compression`` (the metadata envelope,
+    or ``raw=True`` bodies with a ``.meta.json`` sidecar), and appends each game to one Parquet file per table as its
+    own row group, so memory stays bounded by the largest game.
+    """
+
+    def __init__(
+        self,
+        tables: Iterable[str] = TABLES,
+        compression: str = "zstd",
+        dictionaries: ZstdDictionaries | None = None,
+    ):
+        """
+        Args:
+            tables: Tables to export (default: plays, events and runners)
+            compression: Parquet compression codec
+            dictionaries: zstd dictionaries the saved files were compressed with, if any
+        """
+        super().__init__()
+        self.tables = list(tables)
+        self.compression = compression
+        self.dictionaries = dictionaries
+
+    def iter_saved(self, source: str | Path) -> Iterator[tuple[Path, dict, int | None]]:
+        """
+        Yield ``(path, payload, game_pk)`` for each saved play-by-play response.
+
+        Files that aren't liveGameV1 or playByPlay payloads are skipped.
+        """
+        for path in sorted(Path(source).rglob("*.json*")):
+            if path.name.endswith(".meta.json") or not path.name.endswith(SAVED_SUFFIXES):
+                continue
+            data = self._load(path)
+            metadata = None
+            if isinstance(data, dict) and set(data) == {"metadata", "data"}:
+                metadata, data = data["metadata"], data["data"]
+            else:
+                sidecar = path.with_name(path.name + ".meta.json")
+                if sidecar.exists():
+                    metadata = self._load(sidecar)
+            if not all_plays(data):
+                self.log.debug("Skipping %s: no allPlays", path)
+                continue
+            path_params = (metadata or {}).get("request", {}).get("path_params", {})
+            game_pk = path_params.get("game_pk") or path_params.get("gamePk")
+            yield path, data, int(game_pk) if game_pk is not None else None
+
+    def _load(self, path: Path):
+        return codec.loads(read_saved(path, self.dictionaries))
+
+    def export_directory(self, source: str | Path, dest: str | Path) -> dict[str, int]:
+        """
+        Export every saved play-by-play response under ``source``.
+
+        Args:
+            source: Directory of saved responses (searched recursively)
+            dest: Output directory; receives ``<table>.parquet`` per table
+
+        Returns:
+            Rows written per table, plus ``games``
+        """
+        pq = _import("pyarrow.parquet", "arrow")
+        dest = Path(dest)
+        dest.mkdir(parents=True, exist_ok=True)
+        extractor = PlayByPlayExtractor(self.tables)
+        writers = {}
+        totals = dict.fromkeys(self.tables, 0)
+        totals["games"] = 0
+        try:
+            for path, data, game_pk in self.iter_saved(source):
+                added = extractor.add_game(data, game_pk)
+                for name, table in extractor.tables.items():
+                    if name not in writers:
+                        writers[name] = pq.ParquetWriter(
+                            str(dest / f"{name}.parquet"),
+                            table.arrow_schema(),
+                            compression=self.compression,
+                        )
+                    writers[name].write_table(table.to_arrow())
+                    totals[name] += added[name]
+                extractor.clear()
+                totals["games"] += 1
+                self.log.debug("Exported %s (%s)", path, added)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        self.log.info("Exported %s games from %s to %s: %s", totals["games"], source, dest, totals)
+        return totals
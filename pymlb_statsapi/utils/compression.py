@@ -0,0 +1,409 @@
+"""
+Pluggable compression for saved responses.
+
+``save_json(gzip=True)`` writes gzip at one level for every response. StatsAPI payloads
+of one ``endpoint.method`` are highly self-similar (same keys, same nesting, same team
+and venue blocks), so an archive gains a lot from a stronger codec and more still from
+a zstd dictionary trained on earlier responses of the same method. ``get_compressor()``
+returns a ``Compressor`` by name:
+
+- ``none``: stored as-is (``.json``)
+- ``gzip`` / ``gzip:<1-9>``: stdlib gzip (``.json.gz``), level 6 by default
+- ``zstd`` / ``zstd:<1-22>``: Zstandard (``.json.zst``), level 3 by default
+
+``ZstdDictionaries`` trains one dictionary per ``endpoint.method`` from an existing
+archive, keeps them in a directory and hands out compressors bound to them. zstd
+frames record the ID of their dictionary, so ``read_saved()`` finds the right one when
+reading back. zstd is optional; install it with::
+
+    pip install 'pymlb-statsapi[zstd]'
+
+Environment Variables:
+    PYMLB_STATSAPI__COMPRESSION: Default for ``get_compressor()``, e.g. ``gzip:9`` or
+        ``zstd:19`` (default: gzip)
+    PYMLB_STATSAPI__ZSTD_DICT_DIR: Dictionary directory
+        (default: <PYMLB_STATSAPI__BASE_FILE_PATH>/dictionaries)
+
+Usage:
+    from pymlb_statsapi.utils.compression import ZstdDictionaries, read_saved
+
+    response.save_json(compression="zstd:19")
+
+    dictionaries = ZstdDictionaries()
+    dictionaries.train_archive(".var/local/mlb_statsapi")
+    response.save_json(compression=dictionaries.compressor("game", "liveGameV1"))
+    read_saved(path, dictionaries)  # bytes
+"""
+
+import gzip
+import os
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from pymlb_statsapi.utils.log import LogMixin
+
+COMPRESSION_NAMES = ("none", "gzip", "zstd")
+
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+LEVEL_RANGES = {"gzip": (1, 9), "zstd": (1, 22)}
+EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+SAVED_SUFFIXES = tuple(".json" + extension for extension in EXTENSIONS.values())
+
+
+@dataclass(frozen=True)
+class Compressor:
+    """A named compression codec: one-shot and streaming compression, and decompression."""
+
+    name: str
+    level: int | None
+    _compress: Callable[[bytes], bytes]
+    _decompress: Callable[[bytes], bytes]
+    _writer: Callable[[IO[bytes]], AbstractContextManager[IO[bytes]]]
+    dict_id: int = 0
+
+    def __repr__(self):
+        level = f":{self.level}" if self.level is not None else ""
+        dictionary = f", dict_id={self.dict_id}" if self.dict_id else ""
+        return f"{self.__class__.__name__}({self.name}{level}{dictionary})"
+
+    @property
+    def extension(self) -> str:
+        """File extension appended after ``.json`` ('' for none)."""
+        return EXTENSIONS[self.name]
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompress(data)
+
+    def writer(self, f: IO[bytes]) -> AbstractContextManager[IO[bytes]]:
+        """
+        Wrap a binary file so everything written through it is compressed.
+
+        The compressed stream is finished when the context exits; ``f`` stays open.
+        """
+        return self._writer(f)
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires the 'zstandard' package: pip install 'pymlb-statsapi[zstd]'"
+        ) from e
+    return zstandard
+
+
+def _none_compressor(level: int | None = None) -> Compressor:
+    return Compressor("none", None, bytes, bytes, nullcontext)
+
+
+def _gzip_compressor(level: int | None = None) -> Compressor:
+    level = DEFAULT_LEVELS["gzip"] if level is None else level
+
+    def writer(f):
+        # mtime=0 keeps the output deterministic, like atomic_open
+        return gzip.GzipFile(filename="", mode="wb", fileobj=f, compresslevel=level, mtime=0)
+
+    return Compressor(
+        "gzip",
+        level,
+        lambda data: gzip.compress(data, compresslevel=level, mtime=0),
+        gzip.decompress,
+        writer,
+    )
+
+
+def _zstd_compressor(level: int | None = None, dictionary=None) -> Compressor:
+    zstandard = _import_zstandard()
+    level = DEFAULT_LEVELS["zstd"] if level is None else level
+    # zstandard contexts aren't thread-safe, so each thread gets its own pair
+    local = threading.local()
+
+    def contexts():
+        if not hasattr(local, "cctx"):
+            local.cctx = zstandard.ZstdCompressor(level=level, dict_data=dictionary)
+            local.dctx = zstandard.ZstdDecompressor(dict_data=dictionary)
+        return local.cctx, local.dctx
+
+    def compress(data):
+        return contexts()[0].compress(data)
+
+    def decompress(data):
+        # Streamed frames don't record their content size, which one-shot decompress
+        # needs, and a file may hold several frames (e.g. appended writes)
+        with contexts()[1].stream_reader(data, read_across_frames=True) as reader:
+            return reader.read()
+
+    @contextmanager
+    def writer(f):
+        with contexts()[0].stream_writer(f, closefd=False) as stream:
+            yield stream
+
+    return Compressor(
+        "zstd",
+        level,
+        compress,
+        decompress,
+        writer,
+        dict_id=dictionary.dict_id() if dictionary is not None else 0,
+    )
+
+
+_FACTORIES = {
+    "none": _none_compressor,
+    "gzip": _gzip_compressor,
+    "zstd": _zstd_compressor,
+}
+
+
+def get_compressor(name: str | None = None, level: int | None = None) -> Compressor:
+    """
+    Return a compressor by name, optionally with its level (``"gzip:9"``).
+
+    Args:
+        name: One of COMPRESSION_NAMES, optionally ``:<level>``
+              (default: PYMLB_STATSAPI__COMPRESSION, else gzip)
+        level: Compression level; overrides a level given in ``name``
+
+    Returns:
+        Compressor
+
+    Raises:
+        ValueError: If the name or level is invalid
+        ImportError: If zstd was requested but zstandard isn't installed
+    """
+    name = (name or os.environ.get("PYMLB_STATSAPI__COMPRESSION") or "gzip").lower()
+    name, _, suffix = name.partition(":")
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown compression {name!r}, expected one of {COMPRESSION_NAMES}")
+    if level is None and suffix:
+        try:
+            level = int(suffix)
+        except ValueError:
+            raise ValueError(f"Invalid compression level {suffix!r} for {name}") from None
+    if level is not None and name in LEVEL_RANGES:
+        low, high = LEVEL_RANGES[name]
+        if not low <= level <= high:
+            raise ValueError(f"{name} level must be between {low} and {high}, got {level}")
+    return _FACTORIES[name](level)
+
+
+def iter_saved(root: str | Path) -> Iterator[tuple[str, str, Path]]:
+    """
+    Files saved by ``save_json`` under ``root``, with their endpoint and method.
+
+    ``root`` is the directory ``get_path()`` keys are relative to (the base file path,
+    or base path + prefix), so the first two path parts are endpoint and method.
+    ``.meta.json`` sidecars are skipped.
+
+    Yields:
+        Tuple of (endpoint, method, path)
+    """
+    root = Path(root)
+    for path in sorted(root.rglob("*.json*")):
+        if not path.name.endswith(SAVED_SUFFIXES) or path.name.endswith(".meta.json"):
+            continue
+        parts = path.relative_to(root).parts
+        if len(parts) >= 3:
+            yield parts[0], parts[1], path
+
+
+def read_saved(path: str | Path, dictionaries: "ZstdDictionaries | None" = None) -> bytes:
+    """
+    Read a saved file, decompressing it according to its extension.
+
+    Args:
+        path: ``.json``, ``.json.gz`` or ``.json.zst`` file
+        dictionaries: Dictionaries for zstd files written with one
+
+    Returns:
+        Uncompressed file contents
+    """
+    data = Path(path).read_bytes()
+    suffix = Path(path).suffix
+    if suffix == ".gz":
+        return gzip.decompress(data)
+    if suffix == ".zst":
+        if dictionaries is not None:
+            return dictionaries.decompress(data)
+        return get_compressor("zstd").decompress(data)
+    return data
+
+
+class ZstdDictionaries(LogMixin):
+    """
+    zstd dictionaries trained per ``endpoint.method``, stored as ``<endpoint>.<method>.zdict``.
+
+    Environment Variables:
+        PYMLB_STATSAPI__ZSTD_DICT_DIR: Default dictionary directory
+            (default: <PYMLB_STATSAPI__BASE_FILE_PATH>/dictionaries)
+        PYMLB_STATSAPI__ZSTD_DICT_SIZE: Dictionary size in bytes (default: 112640)
+    """
+
+    DICT_SIZE = int(os.environ.get("PYMLB_STATSAPI__ZSTD_DICT_SIZE", str(110 << 10)))
+
+    def __init__(self, directory: str | None = None, level: int | None = None):
+        """
+        Args:
+            directory: Dictionary directory (default: PYMLB_STATSAPI__ZSTD_DICT_DIR)
+            level: zstd level of the compressors handed out (default: 3)
+        """
+        super().__init__()
+        self.directory = directory or os.environ.get(
+            "PYMLB_STATSAPI__ZSTD_DICT_DIR",
+            os.path.join(
+                os.environ.get("PYMLB_STATSAPI__BASE_FILE_PATH", "./.var/local/mlb_statsapi"),
+                "dictionaries",
+            ),
+        )
+        self.level = level
+        self._dictionaries: dict[str, object] = {}
+        self._by_id: dict[int, object] | None = None
+        # One decompressor per dictionary ID (0: none), each with per-thread contexts
+        self._decompressors: dict[int, Compressor] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(directory={self.directory})"
+
+    def path(self, endpoint_name: str, method_name: str) -> str:
+        return os.path.join(self.directory, f"{endpoint_name}.{method_name}.zdict")
+
+    def train(
+        self,
+        endpoint_name: str,
+        method_name: str,
+        samples: Iterable[bytes],
+        dict_size: int | None = None,
+    ) -> int:
+        """
+        Train and save the dictionary of one endpoint method.
+
+        Args:
+            endpoint_name: Endpoint name (e.g. 'game')
+            method_name: Method name (e.g. 'liveGameV1')
+            samples: Uncompressed responses (or saved files) of that method
+            dict_size: Dictionary size in bytes (default: DICT_SIZE)
+
+        Returns:
+            ID of the new dictionary
+
+        Raises:
+            zstandard.ZstdError: If the samples are too few or too small to train on
+        """
+        zstandard = _import_zstandard()
+        dictionary = zstandard.train_dictionary(dict_size or self.DICT_SIZE, list(samples))
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(endpoint_name, method_name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(dictionary.as_bytes())
+        os.replace(tmp_path, path)
+
+        name = f"{endpoint_name}.{method_name}"
+        self._dictionaries[name] = dictionary
+        self._by_id = None
+        self._decompressors = {}
+        self.log.info(
+            "Trained %s dictionary %s (%s bytes)",
+            name,
+            dictionary.dict_id(),
+            len(dictionary.as_bytes()),
+        )
+        return dictionary.dict_id()
+
+    def train_archive(
+        self,
+        root: str | Path,
+        min_samples: int = 8,
+        max_samples: int = 2000,
+        dict_size: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Train a dictionary for every endpoint method with enough files under ``root``.
+
+        Args:
+            root: Directory of ``save_json`` files (see ``iter_saved``)
+            min_samples: Skip methods with fewer saved files
+            max_samples: Train on at most this many of the newest files per method
+            dict_size: Dictionary size in bytes (default: DICT_SIZE)
+
+        Returns:
+            Dict of "endpoint.method" to dictionary ID, for the methods trained
+        """
+        zstandard = _import_zstandard()
+        groups: dict[tuple[str, str], list[Path]] = defaultdict(list)
+        for endpoint_name, method_name, path in iter_saved(root):
+            groups[endpoint_name, method_name].append(path)
+
+        trained = {}
+        for (endpoint_name, method_name), paths in sorted(groups.items()):
+            if len(paths) < min_samples:
+                continue
+            paths = sorted(paths, key=lambda p: p.stat().st_mtime)[-max_samples:]
+            samples = [read_saved(p, self) for p in paths]
+            try:
+                dict_id = self.train(endpoint_name, method_name, samples, dict_size)
+            except zstandard.ZstdError as e:
+                self.log.warning("Can't train %s.%s dictionary: %s", endpoint_name, method_name, e)
+                continue
+            trained[f"{endpoint_name}.{method_name}"] = dict_id
+        return trained
+
+    def get(self, endpoint_name: str, method_name: str):
+        """The ``zstandard.ZstdCompressionDict`` of an endpoint method, or None."""
+        name = f"{endpoint_name}.{method_name}"
+        if name not in self._dictionaries:
+            path = self.path(endpoint_name, method_name)
+            if not os.path.exists(path):
+                return None
+            with open(path, "rb") as f:
+                self._dictionaries[name] = _import_zstandard().ZstdCompressionDict(f.read())
+        return self._dictionaries[name]
+
+    def compressor(self, endpoint_name: str, method_name: str) -> Compressor:
+        """
+        zstd compressor using the method's dictionary, or plain zstd if none is trained.
+
+        Only the dictionary is cached. The compressor creates its zstd contexts per
+        thread, so it can be shared by ``run_batch`` or ``Backfill`` workers.
+        """
+        return _zstd_compressor(self.level, self.get(endpoint_name, method_name))
+
+    def _dictionary_by_id(self, dict_id: int):
+        by_id = self._by_id
+        if by_id is None:
+            zstandard = _import_zstandard()
+            by_id = {}
+            for path in sorted(Path(self.directory).glob("*.zdict")):
+                dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+                by_id[dictionary.dict_id()] = dictionary
+            # Published once complete, so concurrent readers never see a partial map
+            self._by_id = by_id
+        return by_id.get(dict_id)
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompress a zstd frame with the dictionary it was written with (if any).
+
+        Raises:
+            KeyError: If the frame needs a dictionary that isn't in the directory
+        """
+        zstandard = _import_zstandard()
+        dict_id = zstandard.get_frame_parameters(data).dict_id
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            dictionary = self._dictionary_by_id(dict_id) if dict_id else None
+            if dict_id and dictionary is None:
+                raise KeyError(f"zstd dictionary {dict_id} not found in {self.directory}")
+            decompressor = self._decompressors.setdefault(
+                dict_id, _zstd_compressor(dictionary=dictionary)
+            )
+        return decompressor.decompress(data)
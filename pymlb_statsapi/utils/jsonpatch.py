@@ -0,0 +1,191 @@
+"""
+JSON Patch (RFC 6902) and JSON Pointer (RFC 6901).
+
+``Game.liveGameDiffPatchV1`` returns the changes to a ``liveGameV1`` document as JSON
+Patch operations. ``apply_patch`` applies them to a parsed document in place, so a live
+game can be kept current without downloading the whole feed again.
+
+Usage:
+    from pymlb_statsapi.utils.jsonpatch import apply_patch
+
+    document = apply_patch(document, [
+        {"op": "replace", "path": "/metaData/timeStamp", "value": "20240713_014130"},
+        {"op": "add", "path": "/liveData/plays/allPlays/-", "value": {...}},
+    ])
+"""
+
+import copy
+
+
+class JSONPatchError(ValueError):
+    """A patch operation can't be applied to the document."""
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def split_pointer(pointer: str) -> list[str]:
+    """
+    Split a JSON Pointer into unescaped reference tokens.
+
+    Raises:
+        JSONPatchError: If the pointer is neither empty nor starts with "/"
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JSONPatchError(f"Invalid JSON pointer {pointer!r}")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JSONPatchError(f"Invalid array index {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JSONPatchError(f"Array index {index} out of range ({len(container)} items)")
+    return index
+
+
+def _child(container, token: str):
+    if isinstance(container, dict):
+        if token not in container:
+            raise JSONPatchError(f"Member {token!r} not found")
+        return container[token]
+    if isinstance(container, list):
+        return container[_index(container, token)]
+    raise JSONPatchError(f"Can't descend into {type(container).__name__} with {token!r}")
+
+
+def resolve_pointer(document, pointer: str):
+    """
+    Value at a JSON Pointer.
+
+    Raises:
+        JSONPatchError: If any part of the path doesn't exist
+    """
+    value = document
+    for token in split_pointer(pointer):
+        value = _child(value, token)
+    return value
+
+
+def _parent(document, pointer: str) -> tuple[object, str]:
+    tokens = split_pointer(pointer)
+    if not tokens:
+        raise JSONPatchError("The document root has no parent")
+    parent = document
+    for token in tokens[:-1]:
+        parent = _child(parent, token)
+    return parent, tokens[-1]
+
+
+def _add(document, pointer: str, value):
+    if pointer == "":
+        return value
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, token, allow_end=True), value)
+    else:
+        raise JSONPatchError(f"Can't add to {type(parent).__name__} at {pointer!r}")
+    return document
+
+
+def _remove(document, pointer: str):
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JSONPatchError(f"Member {token!r} not found")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, token))
+    raise JSONPatchError(f"Can't remove from {type(parent).__name__} at {pointer!r}")
+
+
+def _replace(document, pointer: str, value):
+    if pointer == "":
+        return value
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JSONPatchError(f"Member {token!r} not found")
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent[_index(parent, token)] = value
+    else:
+        raise JSONPatchError(f"Can't replace in {type(parent).__name__} at {pointer!r}")
+    return document
+
+
+def apply_operation(document, operation: dict):
+    """
+    Apply one JSON Patch operation in place.
+
+    Returns:
+        The document (a new object only if the operation replaced the root)
+
+    Raises:
+        JSONPatchError: If the operation is malformed or doesn't apply
+    """
+    try:
+        op = operation["op"]
+        path = operation["path"]
+    except (KeyError, TypeError) as e:
+        raise JSONPatchError(f"Malformed operation {operation!r}") from e
+
+    if op == "add":
+        return _add(document, path, _value(operation))
+    if op == "remove":
+        if path == "":
+            raise JSONPatchError("Can't remove the document root")
+        _remove(document, path)
+        return document
+    if op == "replace":
+        return _replace(document, path, _value(operation))
+    if op in ("move", "copy"):
+        source = operation.get("from")
+        if source is None:
+            raise JSONPatchError(f"{op} operation without 'from': {operation!r}")
+        if op == "move":
+            if path.startswith(source + "/"):
+                raise JSONPatchError(f"Can't move {source!r} into its own child {path!r}")
+            if path == source:
+                return document
+            value = _remove(document, source)
+        else:
+            value = copy.deepcopy(resolve_pointer(document, source))
+        return _add(document, path, value)
+    if op == "test":
+        if resolve_pointer(document, path) != _value(operation):
+            raise JSONPatchError(f"Test failed at {path!r}")
+        return document
+    raise JSONPatchError(f"Unknown operation {op!r}")
+
+
+def _value(operation: dict):
+    if "value" not in operation:
+        raise JSONPatchError(f"{operation['op']} operation without 'value': {operation!r}")
+    return operation["value"]
+
+
+def apply_patch(document, operations: list[dict]):
+    """
+    Apply JSON Patch operations in order, in place.
+
+    Operations are applied one by one; if one fails, the ones before it have already
+    changed the document, so discard it (or start from a copy) on JSONPatchError.
+
+    Returns:
+        The patched document (a new object only if an operation replaced the root)
+
+    Raises:
+        JSONPatchError: If any operation is malformed or doesn't apply
+    """
+    for operation in operations:
+        document = apply_operation(document, operation)
+    return document
@@ -1,13 +1,33 @@
 """
 created by nikos at 5/2/21
+
+Package logging.
+
+Every ``LogMixin`` class logs to a child of the ``mlb_statsapi`` logger (e.g.
+``mlb_statsapi.model.factory.Endpoint``). Records propagate to the application's root
+logger, so stdlib logging configuration (``logging.basicConfig``, dictConfig, ...)
+receives them as-is. The package attaches no handler of its own until
+``configure_logging`` is called; it then puts one handler on the ``mlb_statsapi`` root
+and changes the handler, format, level or propagation for the whole package in one place.
+
+Per-request messages are logged with %-style arguments behind ``isEnabledFor`` and
+``sampled()``, so a request logs nothing, and formats nothing, unless the level is
+enabled and the request falls in the sample.
+
+Environment Variables:
+    PYMLB_STATSAPI__LOG_LEVEL: Level of the mlb_statsapi logger (default: WARNING)
+    PYMLB_STATSAPI__LOG_SAMPLE_RATE: Fraction of per-request messages logged (default: 1)
 """
 
 import logging
+import os
+import random
+
+LOG_LEVEL = os.environ.get("PYMLB_STATSAPI__LOG_LEVEL", "WARNING").upper()
+SAMPLE_RATE = float(os.environ.get("PYMLB_STATSAPI__LOG_SAMPLE_RATE", "1"))
 
 root = logging.getLogger("mlb_statsapi")
-root.setLevel(logging.INFO)
-# root.propagate = os.environ.get('AIRFLOW_CTX_EXECUTION_DATE') is None
-root.propagate = False
+root.setLevel(LOG_LEVEL)
 logging_format = [
     # '[%(asctime)s]',
     "{%(filename)s:%(lineno)d}",
@@ -19,8 +39,14 @@ logging_format = [
 ]
 formatter = logging.Formatter(" ".join(logging_format))
 
+# Attached by configure_logging when no other handler is given
+console = logging.StreamHandler()
+console.setFormatter(formatter)
+
 loggers = {}
 
+_sample_rate = SAMPLE_RATE
+
 
 class LogMixin:
     _log = None
@@ -35,10 +61,61 @@ class LogMixin:
 # noinspection PyPep8Naming
 def get_logger(logMixin: LogMixin):
     global loggers
-    name = logMixin.__class__.__module__ + "." + logMixin.__class__.__name__
+    cls = logMixin.__class__
+    name = cls.__module__.removeprefix("pymlb_statsapi.") + "." + cls.__name__
     if loggers.get(name) is None:
-        loggers[name] = logging.root.getChild(name)
-        console = logging.StreamHandler()
-        console.setFormatter(formatter)
-        loggers[name].addHandler(console)
+        # No handler of its own: records propagate through the mlb_statsapi root
+        loggers[name] = root.getChild(name)
     return loggers[name]
+
+
+def configure_logging(
+    level: int | str | None = None,
+    handler: logging.Handler | None = None,
+    fmt: str | None = None,
+    propagate: bool | None = None,
+    sample_rate: float | None = None,
+) -> logging.Logger:
+    """
+    Configure the package's logging (arguments left as None are unchanged).
+
+    The first call attaches a stderr handler to the mlb_statsapi logger unless
+    ``handler`` is given. Records still propagate to the application's root logger;
+    pass ``propagate=False`` if its handlers would print them a second time.
+
+    Args:
+        level: Level of the mlb_statsapi logger, e.g. ``"INFO"``
+        handler: Replaces the package's handler (e.g. a FileHandler)
+        fmt: Format string for the handler
+        propagate: Also pass records to the application's root logger handlers
+        sample_rate: Fraction (0-1) of per-request messages that are logged
+
+    Returns:
+        The mlb_statsapi logger
+    """
+    global _sample_rate
+    if level is not None:
+        root.setLevel(level.upper() if isinstance(level, str) else level)
+    if handler is not None:
+        for old in list(root.handlers):
+            root.removeHandler(old)
+        root.addHandler(handler)
+    elif not root.handlers:
+        root.addHandler(console)
+    if fmt is not None:
+        for current in root.handlers:
+            current.setFormatter(logging.Formatter(fmt))
+    elif handler is not None and handler.formatter is None:
+        handler.setFormatter(formatter)
+    if propagate is not None:
+        root.propagate = propagate
+    if sample_rate is not None:
+        assert 0.0 <= sample_rate <= 1.0, f"sample_rate must be within [0, 1], got {sample_rate}"
+        _sample_rate = sample_rate
+    return root
+
+
+def sampled() -> bool:
+    """True for the fraction of per-request messages kept by the sample rate."""
+    rate = _sample_rate
+    return rate >= 1.0 or random.random() < rate
@@ -1,13 +1,39 @@
+import hashlib
 import json
+import marshal
 import os
 from dataclasses import dataclass, field
 from importlib import resources
 from importlib.resources import as_file
 
+# Bump when the layout of the compiled index changes; older indexes are then ignored
+INDEX_FORMAT = 2
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.environ.get(name, default).lower() not in ("0", "false", "no")
+
 
 @dataclass
 class SchemaLoader:
+    """
+    Loads the endpoint model and StatsAPI schemas shipped with the package.
+
+    Schemas are read from a precompiled index (``stats_api_<version>.index``, built by
+    ``scripts/build_schema_index.py``) with a single file read. Each schema is stored as
+    its own marshalled blob, so loading one endpoint doesn't decode the others. If the
+    index is missing, was built for another format, or no longer matches the JSON files
+    next to it, the raw JSON files are used instead.
+
+    Environment Variables:
+        PYMLB_STATSAPI__SCHEMA_VERSION: StatsAPI schema version (default: 1.0)
+        PYMLB_STATSAPI__SCHEMA_INDEX: Use the precompiled index if valid (default: 1)
+    """
+
     version: str = field(default=os.environ.get("PYMLB_STATSAPI__SCHEMA_VERSION", "1.0"))
+    use_index: bool = field(default=_env_flag("PYMLB_STATSAPI__SCHEMA_INDEX", "1"))
+    _index: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _index_checked: bool = field(default=False, init=False, repr=False, compare=False)
 
     @property
     def dashed_version(self):
@@ -19,9 +45,18 @@ class SchemaLoader:
         """Version with underscores for directory names (e.g., '1.0' -> '1_0')"""
         return self.version.replace(".", "_")
 
-    @staticmethod
-    def load_endpoint_model():
+    @property
+    def index_filename(self):
+        """Filename of the compiled index (e.g., '1.0' -> 'stats_api_1_0.index')"""
+        return f"stats_api_{self.underscore_version}.index"
+
+    def load_endpoint_model(self):
         """Load the main endpoint model schema"""
+        index = self.load_index()
+        if index is not None:
+            # Safe: the index is checked before use, see _read_index
+            return marshal.loads(index["endpoint_model"])  # nosec B302
+
         resource = resources.files("pymlb_statsapi.resources.schemas") / "endpoint-model.json"
         with as_file(resource) as path:
             with open(path) as f:
@@ -48,14 +83,110 @@ class SchemaLoader:
                 return f.read()
 
     def load_stats_schema(self, schema_name):
+        index = self.load_index()
+        if index is not None and schema_name in index["schemas"]:
+            # Each call decodes a fresh copy, like json.loads on the raw file. Safe: the
+            # index is checked before use, see _read_index
+            return marshal.loads(index["schemas"][schema_name])  # nosec B302
         return json.loads(self.read_stats_schema(schema_name))
 
     def get_available_schemas(self):
         """Get list of available schema files"""
+        index = self.load_index()
+        if index is not None:
+            return [f"{name}.json" for name in index["schemas"]]
+
         schema_dir = f"stats_api_{self.underscore_version}"
         schema_files = resources.files(f"pymlb_statsapi.resources.schemas.statsapi.{schema_dir}")
         return [f.name for f in schema_files.iterdir() if f.name.endswith(".json")]
 
+    def _source_files(self) -> dict:
+        """Map of source file name -> Traversable for the endpoint model and all schemas."""
+        schema_dir = f"stats_api_{self.underscore_version}"
+        schema_files = resources.files(f"pymlb_statsapi.resources.schemas.statsapi.{schema_dir}")
+        sources = {
+            "endpoint-model.json": resources.files("pymlb_statsapi.resources.schemas")
+            / "endpoint-model.json"
+        }
+        for f in sorted(schema_files.iterdir(), key=lambda f: f.name):
+            if f.name.endswith(".json"):
+                sources[f.name] = f
+        return sources
+
+    def _source_digests(self) -> dict:
+        """SHA-256 of every source file, by name."""
+        return {
+            name: hashlib.sha256(f.read_bytes()).hexdigest()
+            for name, f in self._source_files().items()
+        }
+
+    def _index_resource(self):
+        return resources.files("pymlb_statsapi.resources.schemas.statsapi") / self.index_filename
+
+    def load_index(self) -> dict | None:
+        """
+        Load the compiled schema index (once), or None if it can't be used.
+
+        The index is rejected if its format or version differ, or if the names or
+        contents (SHA-256) of the source JSON files no longer match what the index was
+        built from.
+        """
+        if not self.use_index:
+            return None
+        if not self._index_checked:
+            self._index = self._read_index()
+            self._index_checked = True
+        return self._index
+
+    def _read_index(self) -> dict | None:
+        try:
+            # Safe: the index is the package's own resource, built in CI from the bundled
+            # JSON schemas and checked against their digests below before any use
+            index = marshal.loads(self._index_resource().read_bytes())  # nosec B302
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if (
+            not isinstance(index, dict)
+            or index.get("format") != INDEX_FORMAT
+            or index.get("version") != self.version
+        ):
+            return None
+
+        if self._source_digests() != index["digests"]:
+            return None
+        return index
+
+    def build_index(self) -> bytes:
+        """
+        Compile the endpoint model and every schema into index bytes.
+
+        Always reads the raw JSON files, regardless of ``use_index``.
+
+        Returns:
+            Marshalled index, ready to be written to ``index_filename``
+        """
+        sources = self._source_files()
+        digest = hashlib.sha256()
+        digests = {}
+        blobs = {}
+        for name, f in sources.items():
+            raw = f.read_bytes()
+            digest.update(name.encode() + b"\0" + raw)
+            digests[name] = hashlib.sha256(raw).hexdigest()
+            blobs[name] = marshal.dumps(json.loads(raw))
+
+        return marshal.dumps(
+            {
+                "format": INDEX_FORMAT,
+                "version": self.version,
+                "sha256": digest.hexdigest(),
+                "digests": digests,
+                "endpoint_model": blobs.pop("endpoint-model.json"),
+                "schemas": {name.removesuffix(".json"): blob for name, blob in blobs.items()},
+            }
+        )
+
 
 sl = SchemaLoader()
 # Usage examples:
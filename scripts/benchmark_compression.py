@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark compression codecs for saved responses on the BDD stubs.
+
+Reads every stub under tests/bdd/stubs (uncompressed first), then compresses each file
+with gzip at several levels and, if zstandard is installed, zstd with and without a
+per-endpoint.method dictionary. Reports the compression ratio (uncompressed / compressed
+bytes) and encode/decode throughput in MB/s of uncompressed data (best of --repeat).
+
+Dictionaries are evaluated leave-one-out: each file is compressed with a dictionary
+trained on the other stubs of its method, never on itself. Methods with fewer than
+--min-samples other stubs use plain zstd. A real archive has far more samples per
+method than the stubs, so expect better dictionary ratios there.
+
+Usage:
+    python scripts/benchmark_compression.py
+    python scripts/benchmark_compression.py --repeat 5 --dict-size 32768
+"""
+
+import argparse
+import importlib.util
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pymlb_statsapi.utils.compression import (  # noqa: E402
+    Compressor,
+    ZstdDictionaries,
+    get_compressor,
+    iter_saved,
+    read_saved,
+)
+
+STUBS = Path(__file__).resolve().parent.parent / "tests" / "bdd" / "stubs"
+
+
+def load_stubs(root: Path) -> dict[tuple[str, str], list[bytes]]:
+    """Uncompressed stub files grouped by (endpoint, method)."""
+    groups = defaultdict(list)
+    for endpoint_name, method_name, path in iter_saved(root):
+        groups[endpoint_name, method_name].append(read_saved(path))
+    return groups
+
+
+def dictionary_compressors(
+    groups: dict, level: int, dict_size: int, min_samples: int, tmp: str
+) -> list[tuple[bytes, Compressor]]:
+    """(sample, compressor) pairs, each compressor's dictionary trained without its sample."""
+    import zstandard
+
+    pairs = []
+    for (endpoint_name, method_name), samples in groups.items():
+        for i, sample in enumerate(samples):
+            others = samples[:i] + samples[i + 1 :]
+            dictionaries = ZstdDictionaries(f"{tmp}/{endpoint_name}.{method_name}.{i}", level)
+            if len(others) >= min_samples:
+                try:
+                    dictionaries.train(endpoint_name, method_name, others, dict_size)
+                except zstandard.ZstdError:
+                    pass
+            pairs.append((sample, dictionaries.compressor(endpoint_name, method_name)))
+    return pairs
+
+
+def measure(pairs: list[tuple[bytes, Compressor]], repeat: int) -> tuple[float, float, float]:
+    """Compression ratio, encode MB/s and decode MB/s over every (sample, compressor)."""
+    size = sum(len(sample) for sample, _ in pairs)
+    encode, decode = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = [(compressor.compress(sample), compressor) for sample, compressor in pairs]
+        encode = min(encode, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for data, compressor in compressed:
+            compressor.decompress(data)
+        decode = min(decode, time.perf_counter() - start)
+    stored = sum(len(data) for data, _ in compressed)
+    return size / stored, size / encode / 1e6, size / decode / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stubs", type=Path, default=STUBS, help="Directory of saved files")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per measurement")
+    parser.add_argument("--dict-size", type=int, default=16384, help="zstd dictionary bytes")
+    parser.add_argument(
+        "--min-samples", type=int, default=2, help="Other stubs needed to train a dictionary"
+    )
+    args = parser.parse_args()
+
+    groups = load_stubs(args.stubs)
+    samples = [sample for group in groups.values() for sample in group]
+    print(
+        f"{len(samples)} files, {len(groups)} methods, "
+        f"{sum(map(len, samples)) / 2**20:.1f} MiB uncompressed"
+    )
+
+    codecs = ["gzip:1", "gzip:6", "gzip:9"]
+    has_zstd = importlib.util.find_spec("zstandard") is not None
+    if has_zstd:
+        codecs += ["zstd:3", "zstd:19"]
+    else:
+        print("zstandard not installed, skipping zstd (pip install 'pymlb-statsapi[zstd]')")
+
+    print(f"{'codec':<16}{'ratio':>8}{'encode MB/s':>14}{'decode MB/s':>14}")
+    for name in codecs:
+        compressor = get_compressor(name)
+        ratio, encode, decode = measure([(s, compressor) for s in samples], args.repeat)
+        print(f"{name:<16}{ratio:>8.2f}{encode:>14.1f}{decode:>14.1f}")
+
+    if has_zstd:
+        with tempfile.TemporaryDirectory() as tmp:
+            for level in (3, 19):
+                pairs = dictionary_compressors(groups, level, args.dict_size, args.min_samples, tmp)
+                trained = sum(1 for _, compressor in pairs if compressor.dict_id)
+                ratio, encode, decode = measure(pairs, args.repeat)
+                label = f"zstd-dict:{level}"
+                print(
+                    f"{label:<16}{ratio:>8.2f}{encode:>14.1f}{decode:>14.1f}"
+                    f"  ({trained}/{len(pairs)} files with a dictionary)"
+                )
+
+
+if __name__ == "__main__":
+    main()
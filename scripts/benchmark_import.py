@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark registry construction cost: lazy vs eager.
+
+Each sample runs in a fresh interpreter so module caches don't hide the cost that a
+short-lived CLI or Lambda worker pays on a cold start.
+
+Usage:
+    python scripts/benchmark_import.py
+    python scripts/benchmark_import.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Prints seconds for: package import, a second StatsAPI() construction, first access to
+# Schedule.schedule (endpoint + method build), and list_all_methods()
+PROBE = """
+import time
+t0 = time.perf_counter()
+from pymlb_statsapi import StatsAPI
+t1 = time.perf_counter()
+api = StatsAPI()
+t2 = time.perf_counter()
+api.Schedule.schedule
+t3 = time.perf_counter()
+api.list_all_methods()
+t4 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2, t4 - t3)
+"""
+
+
+def sample(lazy: bool) -> list[float]:
+    env = {**os.environ, "PYMLB_STATSAPI__LAZY": "1" if lazy else "0"}
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return [float(x) for x in out.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per mode")
+    args = parser.parse_args()
+
+    columns = ("import", "StatsAPI()", "1st call", "list_all")
+    print(f"{'mode':<6} " + " ".join(f"{c:>10}" for c in columns) + f"  (median of {args.runs})")
+    for lazy in (False, True):
+        samples = [sample(lazy) for _ in range(args.runs)]
+        medians = [statistics.median(column) * 1000 for column in zip(*samples, strict=True)]
+        mode = "lazy" if lazy else "eager"
+        print(f"{mode:<6} " + " ".join(f"{m:>8.1f}ms" for m in medians))
+
+
+if __name__ == "__main__":
+    main()
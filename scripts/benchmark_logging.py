@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of per-request logging.
+
+Part one times a single "Success: <response>" log call that is disabled by the level:
+an eager f-string (which still builds the repr), lazy %-style arguments, and the
+isEnabledFor + sampled() guard used on the request path. Part two times whole
+requests through an Endpoint with the transport mocked out, at WARNING, at INFO
+(written to /dev/null) and at INFO with 1% sampling.
+
+Usage:
+    python scripts/benchmark_logging.py
+    python scripts/benchmark_logging.py --calls 200000 --requests 20000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pymlb_statsapi.model.factory import APIResponse, Endpoint, build_response  # noqa: E402
+from pymlb_statsapi.utils.log import configure_logging, root, sampled  # noqa: E402
+
+URL = "https://statsapi.mlb.com/api/v1/schedule?sportId=1"
+SCHEMA = {
+    "apis": [
+        {
+            "path": "/v1/schedule",
+            "description": "schedule",
+            "operations": [
+                {
+                    "method": "GET",
+                    "nickname": "schedule",
+                    "summary": "Get schedule",
+                    "notes": "",
+                    "parameters": [
+                        {
+                            "name": "sportId",
+                            "paramType": "query",
+                            "type": "integer",
+                            "required": False,
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+}
+
+
+def per_call_ns(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def bench_calls(n: int):
+    response = APIResponse(build_response(URL, 200, b"{}"), "schedule", "schedule")
+    log = logging.getLogger("mlb_statsapi.benchmark")
+    configure_logging(level="WARNING")
+
+    def eager():
+        log.info(f"Success: {response}")
+
+    def lazy():
+        log.info("Success: %r", response)
+
+    def guarded():
+        if log.isEnabledFor(logging.INFO) and sampled():
+            log.info("Success: %r", response)
+
+    print(f"{'disabled log call':<28}{'ns/call':>10}")
+    for label, fn in (("eager f-string", eager), ("lazy %-args", lazy), ("guarded", guarded)):
+        print(f"{label:<28}{per_call_ns(fn, n):>10.0f}")
+
+
+def bench_requests(n: int):
+    endpoint = Endpoint(
+        endpoint_name="schedule",
+        schema=SCHEMA,
+        endpoint_config={"schedule": {"path": "/v1/schedule"}},
+    )
+    devnull = open(os.devnull, "w")
+    modes = {
+        "WARNING": {"level": "WARNING", "sample_rate": 1.0},
+        "INFO": {"level": "INFO", "sample_rate": 1.0},
+        "INFO, 1% sampled": {"level": "INFO", "sample_rate": 0.01},
+    }
+    print(f"\n{'request path':<28}{'us/request':>10}")
+    with patch("requests.Session.get", return_value=build_response(URL, 200, b"{}")):
+        endpoint.schedule(sportId=1)
+        for label, kwargs in modes.items():
+            configure_logging(handler=logging.StreamHandler(devnull), **kwargs)
+            us = per_call_ns(lambda: endpoint.schedule(sportId=1), n) / 1000
+            print(f"{label:<28}{us:>10.1f}")
+    configure_logging(level="WARNING", handler=logging.StreamHandler(), sample_rate=1.0)
+    devnull.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200_000, help="Log calls per mode")
+    parser.add_argument("--requests", type=int, default=20_000, help="Requests per mode")
+    args = parser.parse_args()
+    print(f"mlb_statsapi handlers: {len(root.handlers)}")
+    bench_calls(args.calls)
+    bench_requests(args.requests)
+
+
+if __name__ == "__main__":
+    main()
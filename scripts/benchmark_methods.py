@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the method-construction engines: exec vs dispatch.
+
+Measures the time to build every endpoint with every method compiled (schemas are
+loaded once up front, so only method construction is timed), and the per-call overhead
+of a generated method with the HTTP request stubbed out.
+
+Usage:
+    python scripts/benchmark_methods.py
+    python scripts/benchmark_methods.py --repeat 20 --calls 100000
+"""
+
+import argparse
+import statistics
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pymlb_statsapi.model.factory import Endpoint  # noqa: E402
+from pymlb_statsapi.model.registry import EXCLUDED_METHODS  # noqa: E402
+from pymlb_statsapi.utils.schema_loader import sl  # noqa: E402
+
+ENGINES = ("exec", "dispatch")
+
+# (label, method, args, kwargs)
+CALLS = [
+    ("kwargs", ("game", "boxscore"), (), {"game_pk": 747175, "fields": "teams"}),
+    ("positional", ("game", "boxscore"), (747175,), {}),
+    ("overloaded", ("schedule", "schedule"), (), {"sportId": 1, "date": "2024-10-27"}),
+]
+
+
+def build_all(endpoint_class, schemas: dict, config: dict) -> dict:
+    return {
+        name: endpoint_class(
+            endpoint_name=name,
+            schema=schema,
+            endpoint_config=config.get(name, {}),
+            excluded_methods=EXCLUDED_METHODS.get(name, set()),
+            lazy=False,
+        )
+        for name, schema in schemas.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Samples per measurement")
+    parser.add_argument("--calls", type=int, default=50_000, help="Calls per call sample")
+    args = parser.parse_args()
+
+    config = sl.load_endpoint_model()
+    schemas = {
+        f.removesuffix(".json"): sl.load_stats_schema(f.removesuffix(".json"))
+        for f in sl.get_available_schemas()
+    }
+
+    results = {}
+    for engine in ENGINES:
+        endpoint_class = type(f"{engine}Endpoint", (Endpoint,), {"METHOD_ENGINE": engine})
+        build_ms = [
+            timeit.timeit(lambda c=endpoint_class: build_all(c, schemas, config), number=1) * 1000
+            for _ in range(args.repeat)
+        ]
+        endpoints = build_all(endpoint_class, schemas, config)
+        n_methods = sum(
+            1 for e in endpoints.values() for m in e.get_method_names() if not m.startswith("__")
+        )
+        row = {"build all (ms)": statistics.median(build_ms)}
+
+        for label, (endpoint_name, method_name), call_args, call_kwargs in CALLS:
+            endpoint = endpoints[endpoint_name]
+            # Stub the request so only argument routing is measured
+            endpoint._execute_request = lambda **kw: None
+            method = getattr(endpoint, method_name)
+            samples = timeit.repeat(
+                lambda m=method, a=call_args, k=call_kwargs: m(*a, **k),
+                number=args.calls,
+                repeat=args.repeat,
+            )
+            row[f"{label} call (us)"] = min(samples) / args.calls * 1e6
+        results[engine] = row
+
+    print(f"{n_methods} methods across {len(schemas)} endpoints")
+    columns = list(results[ENGINES[0]])
+    print(f"{'':<22}" + "".join(f"{engine:>12}" for engine in ENGINES))
+    for column in columns:
+        print(f"{column:<22}" + "".join(f"{results[e][column]:>12.2f}" for e in ENGINES))
+
+
+if __name__ == "__main__":
+    main()
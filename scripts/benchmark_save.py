@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark APIResponse.save_json: streamed body vs parse + pretty-print.
+
+Builds a synthetic liveGameV1-sized document, then measures wall time and peak
+Python memory (tracemalloc) for each save mode, plain and gzipped.
+
+Usage:
+    python scripts/benchmark_save.py
+    python scripts/benchmark_save.py --plays 2000 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pymlb_statsapi.model.factory import APIResponse, build_response  # noqa: E402
+
+MODES = {
+    "indent=2 (old)": {"indent": 2},
+    "stream": {},
+    "raw": {"raw": True},
+}
+
+
+def make_response(plays: int) -> APIResponse:
+    play = {
+        "result": {"type": "atBat", "event": "Single", "description": "x" * 120, "rbi": 0},
+        "about": {"atBatIndex": 0, "halfInning": "top", "inning": 1, "isComplete": True},
+        "playEvents": [
+            {"pitchNumber": i, "details": {"code": "B", "speed": 95.1}} for i in range(6)
+        ],
+    }
+    body = json.dumps(
+        {"gamePk": 747175, "liveData": {"plays": {"allPlays": [play] * plays}}}, indent=2
+    )
+    return APIResponse(
+        response=build_response(
+            url="https://statsapi.mlb.com/api/v1.1/game/747175/feed/live",
+            status_code=200,
+            content=body.encode(),
+            headers={"Content-Type": "application/json"},
+        ),
+        endpoint_name="game",
+        method_name="liveGameV1",
+        path_params={"game_pk": "747175"},
+    )
+
+
+def measure(response: APIResponse, path: str, gzip: bool, kwargs: dict) -> tuple[float, float]:
+    """Wall time in ms (untraced) and peak traced memory in MiB (separate run)."""
+    start = time.perf_counter()
+    response.save_json(file_path=path, gzip=gzip, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    response.save_json(file_path=path, gzip=gzip, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--plays", type=int, default=5000, help="Plays in the synthetic document")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per measurement")
+    args = parser.parse_args()
+
+    response = make_response(args.plays)
+    print(f"body: {len(response.content) / 2**20:.1f} MiB")
+    print(f"{'mode':<16}{'gzip':>6}{'time (ms)':>12}{'peak (MiB)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, kwargs in MODES.items():
+            for gzip in (False, True):
+                path = f"{tmp}/out.json" + (".gz" if gzip else "")
+                samples = [measure(response, path, gzip, kwargs) for _ in range(args.repeat)]
+                elapsed = statistics.median(s[0] for s in samples)
+                peak = max(s[1] for s in samples)
+                print(f"{label:<16}{str(gzip):>6}{elapsed:>12.1f}{peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark APIResponse.decode() structs against json() dicts on a recorded live game feed.
+
+Measures parse time, memory retained by the parsed document (tracemalloc), and the
+time to walk every pitch of the game reading a few nested fields.
+
+Usage:
+    python scripts/benchmark_structs.py
+    python scripts/benchmark_structs.py --stub path/to/liveGameV1.json.gz --repeat 10
+"""
+
+import argparse
+import gc
+import gzip
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pymlb_statsapi.model.factory import APIResponse, build_response  # noqa: E402
+
+DEFAULT_STUB = (
+    ROOT / "tests/bdd/stubs/game/liveGameV1/liveGameV1_game_pk=747175_4240fc08a038.json.gz"
+)
+
+
+def make_response(stub: Path) -> APIResponse:
+    with gzip.open(stub) as f:
+        recorded = json.load(f)
+    return APIResponse(
+        response=build_response(
+            url=recorded["url"],
+            status_code=200,
+            content=json.dumps(recorded["response"]).encode(),
+            headers={"Content-Type": "application/json"},
+        ),
+        endpoint_name="game",
+        method_name="liveGameV1",
+        path_params=recorded["path_params"],
+    )
+
+
+def parse(stub: Path, mode: str):
+    response = make_response(stub)
+    return response.json() if mode == "json" else response.decode()
+
+
+def walk_dicts(game) -> float:
+    total = 0.0
+    for play in game["liveData"]["plays"]["allPlays"]:
+        for event in play["playEvents"]:
+            pitch = event.get("pitchData")
+            if pitch is not None:
+                total += pitch.get("startSpeed") or 0
+        total += play["about"]["inning"]
+    return total
+
+
+def walk_structs(game) -> float:
+    total = 0.0
+    for play in game.liveData.plays.allPlays:
+        for event in play.playEvents:
+            pitch = getattr(event, "pitchData", None)
+            if pitch is not None:
+                total += getattr(pitch, "startSpeed", None) or 0
+        total += play.about.inning
+    return total
+
+
+def measure(stub: Path, mode: str, repeat: int) -> tuple[float, float, float]:
+    """Parse time (ms), retained memory (MiB) and walk time (ms)."""
+    parse_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(stub, mode)
+        parse_times.append(time.perf_counter() - start)
+
+    # Memory still referenced by the parsed document once the response is gone
+    gc.collect()
+    tracemalloc.start()
+    document = parse(stub, mode)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    walk = walk_dicts if mode == "json" else walk_structs
+    walk_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        walk(document)
+        walk_times.append(time.perf_counter() - start)
+    return (
+        statistics.median(parse_times) * 1000,
+        retained / 2**20,
+        statistics.median(walk_times) * 1000,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stub", type=Path, default=DEFAULT_STUB, help="Recorded liveGameV1 stub")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per measurement")
+    args = parser.parse_args()
+
+    print(f"stub: {args.stub.name}")
+    print(f"{'mode':<10}{'parse (ms)':>12}{'retained (MiB)':>16}{'walk (ms)':>12}")
+    for mode in ("json", "decode"):
+        parse_ms, retained, walk_ms = measure(args.stub, mode, args.repeat)
+        print(f"{mode:<10}{parse_ms:>12.1f}{retained:>16.2f}{walk_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
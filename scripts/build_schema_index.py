@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled schema index shipped in the wheel.
+
+Compiles ``endpoint-model.json`` and every ``stats_api_<version>/*.json`` schema into
+``pymlb_statsapi/resources/schemas/statsapi/stats_api_<version>.index``, which
+``SchemaLoader`` loads with a single read. Re-run after editing any schema.
+
+Usage:
+    python scripts/build_schema_index.py
+    python scripts/build_schema_index.py --check   # exit 1 if the index is out of date
+"""
+
+import argparse
+import marshal
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from pymlb_statsapi.utils.schema_loader import SchemaLoader  # noqa: E402
+
+INDEX_DIR = REPO_ROOT / "pymlb_statsapi" / "resources" / "schemas" / "statsapi"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--version", default=None, help="Schema version (default: loader default)")
+    parser.add_argument("--check", action="store_true", help="Only verify the index is current")
+    args = parser.parse_args()
+
+    loader = SchemaLoader(use_index=False)
+    if args.version:
+        loader = SchemaLoader(version=args.version, use_index=False)
+
+    index_bytes = loader.build_index()
+    index = marshal.loads(index_bytes)
+    index_path = INDEX_DIR / loader.index_filename
+
+    if args.check:
+        try:
+            current = marshal.loads(index_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            current = {}
+        if current.get("format") != index["format"] or current.get("sha256") != index["sha256"]:
+            print(f"{index_path.relative_to(REPO_ROOT)} is out of date; run 'make schema-index'")
+            sys.exit(1)
+        print(f"{index_path.relative_to(REPO_ROOT)} is up to date")
+        return
+
+    tmp_path = index_path.with_suffix(".index.tmp")
+    tmp_path.write_bytes(index_bytes)
+    tmp_path.replace(index_path)
+    print(
+        f"Wrote {index_path.relative_to(REPO_ROOT)}: {len(index['schemas'])} schemas, "
+        f"{len(index_bytes) / 1024:.0f} KiB, sha256 {index['sha256'][:12]}"
+    )
+
+
+if __name__ == "__main__":
+    main()
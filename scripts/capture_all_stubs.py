@@ -10,7 +10,11 @@ Usage:
 
 Options:
     --endpoint ENDPOINT  Only capture stubs for specified endpoint
-    --delay SECONDS      Delay between API calls (default: 2)
+    --delay SECONDS      Minimum interval between API calls (default: 2)
+
+Calls are paced by a RateLimiter (one request per --delay seconds), which also backs
+off automatically if the API answers 429 / Retry-After. Set
+PYMLB_STATSAPI__RATE_LIMIT_DIR to share the budget with other capture processes.
 
 Note:
     This script is designed to work with the BDD test infrastructure.
@@ -18,9 +22,9 @@ Note:
 """
 
 import argparse
-import time
 
-from pymlb_statsapi import api
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.ratelimit import RateLimiter
 
 # Test data for capturing stubs
 # Using completed games and stable dates to ensure data doesn't change
@@ -67,13 +71,13 @@ TEST_DATA = {
 }
 
 
-def capture_endpoint_stubs(endpoint_name: str, delay: float = 2.0):
+def capture_endpoint_stubs(api: StatsAPI, endpoint_name: str):
     """
     Capture stubs for a specific endpoint.
 
     Args:
+        api: Registry to call through (its rate limiter paces the calls)
         endpoint_name: Name of the endpoint to capture
-        delay: Delay between API calls in seconds
     """
     print(f"\n{'=' * 60}")
     print(f"Capturing stubs for endpoint: {endpoint_name}")
@@ -124,9 +128,6 @@ def capture_endpoint_stubs(endpoint_name: str, delay: float = 2.0):
                     print(f"    ⚠️  Failed with status {response.status_code}")
                     error_count += 1
 
-                # Rate limiting - be nice to the API
-                time.sleep(delay)
-
             except Exception as e:
                 print(f"    ❌ Error: {e}")
                 error_count += 1
@@ -146,10 +147,13 @@ def main():
         "--delay",
         type=float,
         default=2.0,
-        help="Delay between API calls in seconds (default: 2)",
+        help="Minimum interval between API calls in seconds (default: 2)",
     )
     args = parser.parse_args()
 
+    # Be nice to the API: one request per delay, no bursts
+    api = StatsAPI(rate_limiter=RateLimiter(rate=1 / args.delay, burst=1))
+
     # Get list of endpoints to capture
     if args.endpoint:
         endpoints = [args.endpoint]
@@ -167,7 +171,7 @@ def main():
     # Capture stubs for each endpoint
     for endpoint_name in endpoints:
         try:
-            capture_endpoint_stubs(endpoint_name, args.delay)
+            capture_endpoint_stubs(api, endpoint_name)
         except KeyboardInterrupt:
             print("\n\n⚠️  Capture interrupted by user")
             break
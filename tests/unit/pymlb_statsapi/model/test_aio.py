@@ -0,0 +1,181 @@
+"""
+Unit tests for the asyncio client (AsyncStatsAPI / AsyncEndpoint).
+"""
+
+import asyncio
+import inspect
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import requests
+
+from pymlb_statsapi.model.aio import AsyncEndpoint, AsyncHTTPSession, AsyncStatsAPI
+from pymlb_statsapi.model.factory import APIResponse, build_response
+
+
+class FakeAsyncSession:
+    """Async session stand-in that returns queued responses or raises queued errors."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.urls = []
+        self.closed = False
+
+    async def get(self, url, timeout=None):
+        self.urls.append(url)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _response(url="https://statsapi.mlb.com/api/v1/schedule?sportId=1", status=200, body=None):
+    content = json.dumps(body if body is not None else {"dates": []}).encode()
+    return build_response(url, status, content, {"Content-Type": "application/json"}, 12.5)
+
+
+@pytest.fixture
+def schedule_schema():
+    return {
+        "apis": [
+            {
+                "path": "/v1/schedule",
+                "operations": [
+                    {
+                        "method": "GET",
+                        "nickname": "schedule",
+                        "summary": "Get schedule",
+                        "parameters": [
+                            {
+                                "name": "sportId",
+                                "paramType": "query",
+                                "type": "integer",
+                                "required": False,
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class TestBuildResponse:
+    """Test the requests.Response builder used by async transports."""
+
+    def test_build_response(self):
+        response = build_response(
+            "https://statsapi.mlb.com/api/v1/sports", 200, b'{"sports": []}', {"ETag": "x"}, 50.0
+        )
+        assert isinstance(response, requests.Response)
+        assert response.ok
+        assert response.json() == {"sports": []}
+        assert response.headers["etag"] == "x"
+        assert response.elapsed.total_seconds() == 0.05
+
+
+class TestAsyncEndpoint:
+    """Test async method generation and request execution."""
+
+    def test_methods_are_coroutine_functions(self, schedule_schema):
+        endpoint = AsyncEndpoint(
+            endpoint_name="schedule",
+            schema=schedule_schema,
+            endpoint_config={},
+            session=FakeAsyncSession(_response()),
+        )
+        assert inspect.iscoroutinefunction(endpoint.schedule)
+        assert list(inspect.signature(endpoint.schedule).parameters) == ["sportId"]
+
+    def test_call_returns_api_response(self, schedule_schema):
+        session = FakeAsyncSession(_response(body={"copyright": "c", "dates": [1]}))
+        endpoint = AsyncEndpoint("schedule", schedule_schema, {}, session=session)
+
+        response = asyncio.run(endpoint.schedule(sportId=1))
+
+        assert isinstance(response, APIResponse)
+        assert response.json() == {"dates": [1]}
+        assert response.query_params == {"sportId": "1"}
+        assert session.urls == ["https://statsapi.mlb.com/api/v1/schedule?sportId=1"]
+
+    @patch("pymlb_statsapi.model.aio.asyncio.sleep", new_callable=AsyncMock)
+    def test_retries_connection_errors(self, mock_sleep, schedule_schema):
+        session = FakeAsyncSession(requests.exceptions.ConnectionError("down"), _response())
+        endpoint = AsyncEndpoint("schedule", schedule_schema, {}, session=session)
+
+        response = asyncio.run(endpoint.schedule())
+
+        assert response.status_code == 200
+        assert len(session.urls) == 2
+        assert mock_sleep.await_count == 1
+
+    def test_validation_errors_surface(self, schedule_schema):
+        endpoint = AsyncEndpoint(
+            "schedule", schedule_schema, {}, session=FakeAsyncSession(_response())
+        )
+        with pytest.raises(TypeError):
+            asyncio.run(endpoint.schedule(bogus=1))
+
+    def test_concurrent_calls(self, schedule_schema):
+        session = FakeAsyncSession(_response())
+        endpoint = AsyncEndpoint("schedule", schedule_schema, {}, session=session)
+
+        async def run():
+            return await asyncio.gather(*(endpoint.schedule(sportId=i) for i in range(20)))
+
+        responses = asyncio.run(run())
+        assert len(responses) == 20
+        assert len(session.urls) == 20
+
+
+class TestAsyncStatsAPI:
+    """Test the async registry."""
+
+    def test_all_schema_methods_are_async(self):
+        registry = AsyncStatsAPI(session=FakeAsyncSession(_response()))
+        for endpoint_name, method_names in registry.list_all_methods().items():
+            endpoint = registry.get_endpoint(endpoint_name)
+            for method_name in method_names:
+                if method_name.startswith("__"):
+                    continue
+                assert inspect.iscoroutinefunction(getattr(endpoint, method_name))
+
+    def test_default_session(self):
+        registry = AsyncStatsAPI()
+        assert isinstance(registry.session, AsyncHTTPSession)
+        assert registry.Schedule.session is registry.session
+
+    def test_async_context_manager(self):
+        session = FakeAsyncSession(_response())
+
+        async def run():
+            async with AsyncStatsAPI(session=session) as registry:
+                return await registry.Schedule.schedule(sportId=1)
+
+        response = asyncio.run(run())
+        assert response.ok
+        # Externally provided sessions are not closed by the registry
+        assert session.closed is False
+
+    def test_sync_close_not_supported(self):
+        registry = AsyncStatsAPI(session=FakeAsyncSession(_response()))
+        with pytest.raises(TypeError):
+            registry.close()
+
+
+class TestAsyncHTTPSession:
+    """Test AsyncHTTPSession configuration."""
+
+    def test_lazy_client(self):
+        session = AsyncHTTPSession(max_concurrency=5)
+        assert not session.is_open
+        assert session.max_concurrency == 5
+        assert session.headers["Accept-Encoding"] == "gzip"
+
+    def test_semaphore_bound(self):
+        session = AsyncHTTPSession(max_concurrency=3)
+        assert session.semaphore._value == 3
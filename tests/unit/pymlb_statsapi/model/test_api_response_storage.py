@@ -3,15 +3,16 @@ Unit tests for APIResponse storage methods (get_path, get_uri, save_json, gzip).
 """
 
 import gzip as gzip_module
+import io
 import json
 import os
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from urllib.parse import ParseResult
 
 import pytest
 import requests
 
-from pymlb_statsapi.model.factory import APIResponse
+from pymlb_statsapi.model.factory import APIResponse, atomic_open, build_response, write_chunks
 
 
 class TestAPIResponseStorage:
@@ -25,10 +26,12 @@ class TestAPIResponseStorage:
         mock_resp.status_code = 200
         mock_resp.ok = True
         mock_resp.headers = {"Content-Type": "application/json"}
-        mock_resp.content = b'{"dates": []}'
+        # Body bytes and parsed body agree: saving streams content, parsing uses json()
+        body = {"dates": [{"date": "2024-07-04"}]}
+        mock_resp.content = json.dumps(body).encode()
         mock_resp.elapsed = Mock()
         mock_resp.elapsed.total_seconds.return_value = 0.245
-        mock_resp.json.return_value = {"dates": [{"date": "2024-07-04"}]}
+        mock_resp.json.return_value = body
         return mock_resp
 
     @pytest.fixture
@@ -225,3 +228,149 @@ class TestAPIResponseStorage:
         assert resp["status_code"] == 200
         assert resp["ok"] is True
         assert "elapsed_ms" in resp
+
+
+class TestStreamingSave:
+    """Test that save_json streams the body and writes atomically."""
+
+    BODY = b'{\n  "gamePk" : 747175,\n  "liveData" : {"plays": [1, 2, 3]}\n}'
+
+    @pytest.fixture
+    def api_response(self):
+        """APIResponse over a real requests.Response with a formatted body."""
+        return APIResponse(
+            response=build_response(
+                url="https://statsapi.mlb.com/api/v1.1/game/747175/feed/live",
+                status_code=200,
+                content=self.BODY,
+                headers={"Content-Type": "application/json"},
+            ),
+            endpoint_name="game",
+            method_name="liveGameV1",
+            path_params={"game_pk": "747175"},
+        )
+
+    def test_envelope_without_parsing(self, api_response, tmp_path):
+        """Test the default envelope embeds the body bytes as-is, without json()."""
+        file_path = tmp_path / "live.json"
+        with patch.object(APIResponse, "json", side_effect=AssertionError("parsed")):
+            result = api_response.save_json(file_path=str(file_path))
+
+        written = file_path.read_bytes()
+        assert self.BODY in written
+        assert result["bytes_written"] == len(written)
+        data = json.loads(written)
+        assert data["data"] == json.loads(self.BODY)
+        assert data["metadata"]["request"]["method_name"] == "liveGameV1"
+
+    def test_envelope_gzip(self, api_response, tmp_path):
+        """Test the streamed envelope through gzip."""
+        file_path = tmp_path / "live.json.gz"
+        api_response.save_json(file_path=str(file_path), gzip=True)
+        with gzip_module.open(file_path, "rb") as f:
+            assert json.load(f)["data"]["gamePk"] == 747175
+
+    def test_raw_with_sidecar(self, api_response, tmp_path):
+        """Test raw mode writes exactly the body and metadata to a sidecar."""
+        file_path = tmp_path / "live.json.gz"
+        result = api_response.save_json(file_path=str(file_path), gzip=True, raw=True)
+
+        with gzip_module.open(file_path, "rb") as f:
+            assert f.read() == self.BODY
+        assert result["bytes_written"] == len(self.BODY)
+        assert result["metadata_path"] == str(file_path) + ".meta.json"
+        with open(result["metadata_path"]) as f:
+            assert json.load(f)["request"]["path_params"] == {"game_pk": "747175"}
+
+    def test_pretty_print_is_opt_in(self, api_response, tmp_path):
+        """Test indent re-serializes the document; the default does not."""
+        pretty = tmp_path / "pretty.json"
+        compact = tmp_path / "compact.json"
+        api_response.save_json(file_path=str(pretty), indent=2)
+        api_response.save_json(file_path=str(compact))
+
+        assert pretty.read_text().startswith('{\n  "metadata": {\n')
+        assert not compact.read_text().startswith("{\n")
+        assert json.loads(pretty.read_text()) == json.loads(compact.read_text())
+
+    def test_empty_body(self, tmp_path):
+        """Test an empty body is saved as null so the envelope stays valid JSON."""
+        response = APIResponse(
+            response=build_response(
+                url="https://statsapi.mlb.com/api/v1/x", status_code=200, content=b""
+            ),
+            endpoint_name="x",
+            method_name="x",
+        )
+        file_path = tmp_path / "empty.json"
+        response.save_json(file_path=str(file_path))
+        assert json.loads(file_path.read_text())["data"] is None
+
+    @pytest.mark.parametrize(
+        "body, data",
+        [
+            (b'{"copyright" : "Copyright 2024 \\"MLB\\"", "gamePk": 1}', {"gamePk": 1}),
+            (b'{ "copyright": "MLB" }', {}),
+            (b'{"gamePk": 1, "copyright": "MLB"}', {"gamePk": 1, "copyright": "MLB"}),
+            (b"[1, 2]", [1, 2]),
+            (b"42", 42),
+        ],
+    )
+    def test_envelope_drops_copyright(self, tmp_path, body, data):
+        """Test the envelope's data matches json(), including the removed copyright."""
+        response = APIResponse(
+            response=build_response(
+                url="https://statsapi.mlb.com/api/v1/x", status_code=200, content=body
+            ),
+            endpoint_name="x",
+            method_name="x",
+        )
+        file_path = tmp_path / "x.json"
+        response.save_json(file_path=str(file_path))
+        assert json.loads(file_path.read_bytes())["data"] == data
+
+    def test_non_json_body_raises(self, tmp_path):
+        """Test a non-JSON body raises instead of writing an invalid envelope."""
+        response = APIResponse(
+            response=build_response(
+                url="https://statsapi.mlb.com/api/v1/x",
+                status_code=200,
+                content=b"<html>Service Unavailable</html>",
+            ),
+            endpoint_name="x",
+            method_name="x",
+        )
+        with pytest.raises(ValueError):
+            response.save_json(file_path=str(tmp_path / "x.json"))
+        assert os.listdir(tmp_path) == []
+
+    def test_atomic_on_failure(self, api_response, tmp_path):
+        """Test a failed write leaves the previous file intact and no temp files."""
+        file_path = tmp_path / "live.json"
+        file_path.write_text("previous")
+
+        with patch("pymlb_statsapi.model.factory.write_chunks", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                api_response.save_json(file_path=str(file_path))
+
+        assert file_path.read_text() == "previous"
+        assert os.listdir(tmp_path) == ["live.json"]
+
+    def test_atomic_open_replaces(self, tmp_path):
+        """Test atomic_open only replaces the destination once the block completes."""
+        file_path = tmp_path / "sub" / "out.bin"
+        with atomic_open(str(file_path)) as f:
+            f.write(b"new")
+            assert not file_path.exists()
+        assert file_path.read_bytes() == b"new"
+
+    def test_write_chunks(self):
+        """Test write_chunks writes every byte in bounded slices."""
+        out = io.BytesIO()
+        sizes = []
+        original = out.write
+        out.write = lambda b: sizes.append(len(b)) or original(b)
+
+        assert write_chunks(out, b"x" * 10, chunk_size=4) == 10
+        assert out.getvalue() == b"x" * 10
+        assert sizes == [4, 4, 2]
@@ -0,0 +1,178 @@
+"""
+Unit tests for resumable backfills.
+"""
+
+import gzip
+import json
+from datetime import date
+
+import pytest
+
+from pymlb_statsapi.model.backfill import (
+    Backfill,
+    BackfillCheckpoint,
+    WorkItem,
+    date_range,
+)
+from pymlb_statsapi.model.factory import APIResponse, build_response
+
+SCHEDULES = {
+    "2024-07-13": [(1, "Final"), (2, "Final"), (3, "Preview")],
+    "2024-07-14": [(2, "Final"), (4, "Final")],
+}
+
+
+class FakeEndpoint:
+    """Endpoint returning real APIResponses and recording the calls made."""
+
+    def __init__(self, name: str, calls: list, fail: set):
+        self.name = name
+        self.calls = calls
+        self.fail = fail
+
+    def __getattr__(self, method_name: str):
+        def method(**params):
+            self.calls.append((self.name, method_name, params))
+            if (method_name, params.get("game_pk")) in self.fail:
+                raise ConnectionError("boom")
+            if self.name == "schedule":
+                games = [
+                    {"gamePk": pk, "status": {"abstractGameState": state}}
+                    for pk, state in SCHEDULES[params["date"]]
+                ]
+                body = {"dates": [{"date": params["date"], "games": games}]}
+                path, query = {}, {"date": params["date"], "sportId": "1"}
+            else:
+                body = {"game_pk": params["game_pk"], "method": method_name}
+                path, query = {"game_pk": str(params["game_pk"])}, {}
+            return APIResponse(
+                build_response(
+                    f"https://statsapi.mlb.com/{method_name}", 200, json.dumps(body).encode()
+                ),
+                endpoint_name=self.name,
+                method_name=method_name,
+                path_params=path,
+                query_params=query,
+            )
+
+        return method
+
+
+class FakeAPI:
+    def __init__(self):
+        self.calls: list = []
+        self.fail: set = set()
+
+    def get_endpoint(self, name: str) -> FakeEndpoint:
+        return FakeEndpoint(name, self.calls, self.fail)
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYMLB_STATSAPI__BASE_FILE_PATH", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def fake_api() -> FakeAPI:
+    return FakeAPI()
+
+
+def backfill(fake_api, **kwargs) -> Backfill:
+    kwargs.setdefault("methods", ("Game.boxscore", "Game.linescore"))
+    return Backfill("2024-07-13", "2024-07-14", api=fake_api, prefix="bf", max_workers=2, **kwargs)
+
+
+class TestBackfill:
+    """Test expansion, storage and resuming."""
+
+    def test_date_range_and_keys(self):
+        """Test dates are inclusive and keys are resource paths with list params joined."""
+        assert list(date_range("2024-02-28", date(2024, 3, 1))) == [
+            date(2024, 2, 28),
+            date(2024, 2, 29),
+            date(2024, 3, 1),
+        ]
+        item = WorkItem("schedule", "schedule", {"sportId": [1, 11], "date": "2024-07-13"})
+        assert item.key == "schedule/schedule/date=2024-07-13&sportId=1,11"
+
+    def test_run_saves_everything(self, base, fake_api):
+        """Test schedules expand to final games (deduplicated) and every response is saved."""
+        stats = backfill(fake_api).run()
+        game_calls = sorted((m, p["game_pk"]) for e, m, p in fake_api.calls if e == "game")
+        assert game_calls == [(m, pk) for m in ("boxscore", "linescore") for pk in (1, 2, 4)]
+        assert stats == {
+            "fetched": 8,
+            "skipped": 0,
+            "failed": 0,
+            "games": 3,
+            "bytes": stats["bytes"],
+        }
+        saved = base / "bf/game/boxscore/game_pk=4.json.gz"
+        with gzip.open(saved) as f:
+            assert json.load(f)["data"] == {"game_pk": 4, "method": "boxscore"}
+        assert (base / "bf/backfill.sqlite").exists()
+
+    def test_resume_skips_completed(self, base, fake_api):
+        """Test a second run only retries what failed and schedules with unfinished games."""
+        fake_api.fail.add(("linescore", 2))
+        first = backfill(fake_api)
+        assert first.run()["failed"] == 1
+        assert first.failures[0][0] == "game/linescore/game_pk=2"
+
+        fake_api.fail.clear()
+        fake_api.calls.clear()
+        stats = backfill(fake_api).run()
+        assert fake_api.calls == [
+            ("schedule", "schedule", {"sportId": [1], "date": "2024-07-13"}),
+            ("game", "linescore", {"game_pk": 2}),
+        ]
+        assert (stats["fetched"], stats["skipped"], stats["failed"]) == (2, 6, 0)
+
+    def test_games_finished_later_are_fetched(self, base, fake_api, monkeypatch):
+        """Test a game that wasn't final on the first run is fetched once it is."""
+        backfill(fake_api).run()
+        assert not (base / "bf/game/boxscore/game_pk=3.json.gz").exists()
+
+        monkeypatch.setitem(SCHEDULES, "2024-07-13", [(1, "Final"), (2, "Final"), (3, "Final")])
+        fake_api.calls.clear()
+        stats = backfill(fake_api).run()
+        assert sorted((m, p.get("game_pk")) for _, m, p in fake_api.calls) == [
+            ("boxscore", 3),
+            ("linescore", 3),
+            ("schedule", None),
+        ]
+        assert (base / "bf/game/boxscore/game_pk=3.json.gz").exists()
+        assert stats["games"] == 4
+
+        # Every game is final now: nothing left to fetch
+        fake_api.calls.clear()
+        backfill(fake_api).run()
+        assert fake_api.calls == []
+
+    def test_deleted_file_is_refetched(self, base, fake_api):
+        """Test a checkpointed item whose file is gone is fetched again."""
+        backfill(fake_api).run()
+        (base / "bf/game/boxscore/game_pk=1.json.gz").unlink()
+        fake_api.calls.clear()
+        backfill(fake_api).run()
+        game_calls = [call for call in fake_api.calls if call[0] == "game"]
+        assert game_calls == [("game", "boxscore", {"game_pk": 1})]
+
+    def test_game_filter_and_checkpoint(self, base, fake_api, tmp_path):
+        """Test game_filter=None includes every game and an explicit checkpoint is used."""
+        checkpoint = BackfillCheckpoint(str(tmp_path / "cp/manifest.sqlite"))
+        stats = backfill(
+            fake_api, game_filter=None, checkpoint=checkpoint, methods=["Game.boxscore"]
+        ).run()
+        assert stats["games"] == 4
+        assert len(checkpoint) == 6
+        path, children = checkpoint.get(
+            WorkItem("schedule", "schedule", {"sportId": [1], "date": "2024-07-13"}).key
+        )
+        assert [(g["gamePk"], g["status"]["abstractGameState"]) for g in children] == [
+            (1, "Final"),
+            (2, "Final"),
+            (3, "Preview"),
+        ]
+        assert path.endswith(".json.gz")
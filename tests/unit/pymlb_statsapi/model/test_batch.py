@@ -0,0 +1,157 @@
+"""
+Unit tests for batch execution (run_batch, arun_batch, Endpoint.batch, StatsAPI.batch).
+"""
+
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import requests
+
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.aio import AsyncStatsAPI
+from pymlb_statsapi.model.batch import BatchCall, arun_batch, run_batch
+from pymlb_statsapi.model.factory import build_response
+
+
+def _echo(value, delay=0.0):
+    time.sleep(delay)
+    if value < 0:
+        raise ValueError(f"bad value {value}")
+    return value
+
+
+def _mock_get(url, **kwargs):
+    response = Mock(spec=requests.Response)
+    response.status_code = 200
+    response.ok = True
+    response.url = url
+    response.headers = {"Content-Type": "application/json"}
+    response.content = b"{}"
+    response.elapsed = timedelta(milliseconds=5)
+    response.json.return_value = {"url": url}
+    return response
+
+
+class TestRunBatch:
+    """Test the thread-pool batch runner."""
+
+    def test_ordered_results(self):
+        calls = [BatchCall(_echo, {"value": i, "delay": 0.01 * (5 - i)}) for i in range(5)]
+        results = list(run_batch(calls, max_workers=5))
+        assert [r.response for r in results] == [0, 1, 2, 3, 4]
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+
+    def test_completion_order(self):
+        calls = [BatchCall(_echo, {"value": i, "delay": 0.05 * (3 - i)}) for i in range(3)]
+        results = list(run_batch(calls, max_workers=3, ordered=False))
+        assert [r.response for r in results] == [2, 1, 0]
+
+    def test_errors_are_captured(self):
+        calls = [BatchCall(_echo, {"value": v}, label="echo") for v in (1, -1, 2)]
+        results = list(run_batch(calls, max_workers=2))
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert str(results[1].call) == "echo(value=-1)"
+
+    def test_bounded_concurrency(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def track():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        list(run_batch((BatchCall(track) for _ in range(20)), max_workers=3))
+        assert peak <= 3
+
+    def test_lazy_consumption(self):
+        pulled = []
+
+        def calls():
+            for i in range(100):
+                pulled.append(i)
+                yield BatchCall(_echo, {"value": i})
+
+        results = run_batch(calls(), max_workers=2)
+        next(results)
+        assert len(pulled) < 100
+        results.close()
+
+
+class TestArunBatch:
+    """Test the asyncio batch runner."""
+
+    def test_ordered_and_errors(self):
+        async def echo(value):
+            await asyncio.sleep(0.001 * (5 - value))
+            if value == 3:
+                raise ValueError("three")
+            return value
+
+        async def run():
+            calls = [BatchCall(echo, {"value": i}) for i in range(5)]
+            return [r async for r in arun_batch(calls, max_concurrency=2)]
+
+        results = asyncio.run(run())
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert results[3].ok is False
+        assert results[4].response == 4
+
+
+@patch("requests.Session.get", side_effect=_mock_get)
+class TestEndpointBatch:
+    """Test batch entry points on endpoints and the registry."""
+
+    def test_endpoint_batch(self, mock_get):
+        registry = StatsAPI()
+        results = list(registry.Game.batch("boxscore", [{"game_pk": pk} for pk in (1, 2, 3)]))
+        assert [r.response.path_params for r in results] == [
+            {"game_pk": "1"},
+            {"game_pk": "2"},
+            {"game_pk": "3"},
+        ]
+        assert mock_get.call_count == 3
+
+    def test_endpoint_batch_validation_error_captured(self, mock_get):
+        registry = StatsAPI()
+        results = list(registry.Game.batch("boxscore", [{"game_pk": 1}, {"bogus": 1}]))
+        assert results[0].ok
+        assert isinstance(results[1].error, TypeError)
+
+    def test_registry_batch_by_name_and_callable(self, mock_get):
+        registry = StatsAPI()
+        calls = [
+            ("Game.boxscore", {"game_pk": 1}),
+            ("game.linescore", {"game_pk": 1}),
+            (registry.Game.playByPlay, {"game_pk": 2}),
+        ]
+        results = list(registry.batch(calls))
+        assert all(r.ok for r in results)
+        assert results[0].call.label == "game.boxscore"
+        assert [r.response.method_name for r in results] == ["boxscore", "linescore", "playByPlay"]
+
+
+class TestAsyncBatch:
+    """Test batch on the async registry."""
+
+    def test_async_registry_batch(self):
+        class Session:
+            async def get(self, url, timeout=None):
+                return build_response(url, 200, b"{}")
+
+        async def run():
+            registry = AsyncStatsAPI(session=Session())
+            calls = [("Game.boxscore", {"game_pk": pk}) for pk in range(4)]
+            return [r async for r in registry.batch(calls)]
+
+        results = asyncio.run(run())
+        assert [r.response.path_params["game_pk"] for r in results] == ["0", "1", "2", "3"]
@@ -0,0 +1,403 @@
+"""
+Unit tests for the response cache (ResponseCache and its backends).
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.aio import AsyncEndpoint
+from pymlb_statsapi.model.cache import (
+    CacheBackend,
+    CacheEntry,
+    FileCache,
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+)
+from pymlb_statsapi.model.factory import build_response
+
+
+def _entry(key, ttl=60.0, content=b'{"a": 1}'):
+    now = time.time()
+    return CacheEntry(
+        key=key,
+        url=f"https://statsapi.mlb.com/api/{key}",
+        status_code=200,
+        content=content,
+        headers={"Content-Type": "application/json"},
+        elapsed_ms=12.0,
+        stored_at=now,
+        expires_at=now + ttl,
+    )
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(max_entries=2)
+    if request.param == "file":
+        return FileCache(str(tmp_path / "cache"), max_entries=2)
+    return SQLiteCache(str(tmp_path / "cache.db"), max_entries=2)
+
+
+class TestBackends:
+    """Behavior shared by all cache backends."""
+
+    def test_roundtrip(self, backend):
+        backend.set(_entry("schedule/schedule/sportId=1"))
+        entry = backend.get("schedule/schedule/sportId=1")
+        assert entry.content == b'{"a": 1}'
+        assert entry.headers == {"Content-Type": "application/json"}
+        assert entry.to_response().json() == {"a": 1}
+        assert backend.get("missing") is None
+
+    def test_lru_eviction(self, backend):
+        backend.set(_entry("a"))
+        time.sleep(0.01)
+        backend.set(_entry("b"))
+        time.sleep(0.01)
+        backend.get("a")  # a is now more recently used than b
+        time.sleep(0.01)
+        backend.set(_entry("c"))
+
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        assert backend.evictions == 1
+
+    def test_expired_entries_are_kept(self, backend):
+        backend.set(_entry("old", ttl=-1))
+        assert backend.get("old") is not None
+
+    def test_delete_and_clear(self, backend):
+        backend.set(_entry("a"))
+        backend.set(_entry("b"))
+        backend.delete("a")
+        assert "a" not in backend
+        backend.clear()
+        assert len(backend) == 0
+
+
+class TestFileCache:
+    """FileCache eviction bookkeeping."""
+
+    def test_eviction_in_batches(self, tmp_path):
+        """Test the directory is walked once to count and once per eviction batch."""
+        cache = FileCache(str(tmp_path / "cache"), max_entries=20)
+        with patch.object(FileCache, "_meta_files", wraps=cache._meta_files) as walk:
+            for i in range(21):
+                cache.set(_entry(f"k{i}"))
+                cache.set(_entry(f"k{i}"))  # overwrites don't count
+            assert walk.call_count == 2
+        assert len(cache) == 18
+        assert cache.evictions == 3
+        assert cache.get("k20") is not None
+
+    def test_count_follows_delete_and_clear(self, tmp_path):
+        """Test deletes and clears keep the running count in step with the files."""
+        cache = FileCache(str(tmp_path / "cache"), max_entries=2)
+        cache.set(_entry("a"))
+        cache.set(_entry("b"))
+        cache.delete("a")
+        cache.delete("a")
+        cache.set(_entry("c"))
+        assert cache.evictions == 0 and len(cache) == 2
+        cache.clear()
+        cache.set(_entry("d"))
+        cache.set(_entry("e"))
+        assert cache.evictions == 0 and len(cache) == 2
+
+    def test_backend_is_abstract(self):
+        """Test backends must implement the storage methods."""
+        with pytest.raises(TypeError):
+            CacheBackend()
+
+
+class TestResponseCache:
+    """Test TTL resolution and hit/miss accounting."""
+
+    def test_ttl_rules(self):
+        cache = ResponseCache(ttls={"game.*": 30, "game.boxscore": 120}, default_ttl=7)
+        assert cache.ttl_for("config", "gameStatus") == 24 * 60 * 60
+        assert cache.ttl_for("game", "liveGameV1") == 5
+        assert cache.ttl_for("game", "boxscore") == 120
+        assert cache.ttl_for("game", "linescore") == 30
+        assert cache.ttl_for("person", "person") == 7
+
+    def test_stale_entry_is_a_miss(self):
+        cache = ResponseCache()
+        cache.backend.set(_entry("k", ttl=-1))
+        assert cache.get("k") is None
+        assert cache.stats["misses"] == 1
+
+    def test_stats(self):
+        cache = ResponseCache(MemoryCache(max_entries=1))
+        response = build_response("https://statsapi.mlb.com/api/v1/sports", 200, b"{}")
+        cache.put("a", response, 60)
+        cache.put("b", response, 60)
+        cache.get("b")
+        cache.get("a")
+        assert cache.stats == {
+            "hits": 1,
+            "misses": 1,
+            "stores": 2,
+            "revalidations": 0,
+            "stale": 0,
+            "stale_if_error": 0,
+            "evictions": 1,
+            "size": 1,
+        }
+
+
+def _fake_get(url, **kwargs):
+    return build_response(url, 200, b'{"copyright": "c", "url": "%s"}' % url.encode(), {}, 40.0)
+
+
+@patch("requests.Session.get", side_effect=_fake_get)
+class TestEndpointCaching:
+    """Test caching through generated endpoint methods."""
+
+    def test_second_call_is_served_from_cache(self, mock_get):
+        cache = ResponseCache()
+        registry = StatsAPI(cache=cache)
+
+        first = registry.Schedule.schedule(sportId=1, date="2024-10-27")
+        second = registry.Schedule.schedule(date="2024-10-27", sportId=1)
+
+        assert mock_get.call_count == 1
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert second.json() == first.json()
+        assert second.timestamp == first.timestamp
+        assert second.get_metadata()["cache"]["key"] == first.get_path()
+        assert cache.stats["hits"] == 1
+
+    def test_zero_ttl_is_not_cached(self, mock_get):
+        cache = ResponseCache()
+        registry = StatsAPI(cache=cache)
+
+        registry.Game.liveTimestampv11(game_pk=1)
+        response = registry.Game.liveTimestampv11(game_pk=1)
+
+        assert mock_get.call_count == 2
+        assert response.cache_info is None
+        assert "cache" not in response.get_metadata()
+        assert cache.stats["stores"] == 0
+
+    def test_expired_entry_is_refetched(self, mock_get):
+        registry = StatsAPI(cache=ResponseCache(ttls={"schedule.*": 0.05}))
+
+        registry.Schedule.schedule(sportId=1)
+        time.sleep(0.06)
+        response = registry.Schedule.schedule(sportId=1)
+
+        assert mock_get.call_count == 2
+        assert response.cache_info["status"] == "miss"
+
+    def test_no_cache_by_default(self, mock_get):
+        registry = StatsAPI()
+        registry.Schedule.schedule(sportId=1)
+        registry.Schedule.schedule(sportId=1)
+        assert mock_get.call_count == 2
+
+
+class TestRevalidation:
+    """Test conditional requests with ETag / Last-Modified validators."""
+
+    def _registry(self, **cache_kwargs):
+        cache = ResponseCache(ttls={"standings.*": 0.01}, revalidate=True, **cache_kwargs)
+        return StatsAPI(cache=cache), cache
+
+    def test_entry_validators(self):
+        entry = _entry("k")
+        assert not entry.has_validators
+        entry.headers = {"etag": '"abc"', "Last-Modified": "Sat, 26 Oct 2024 00:00:00 GMT"}
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sat, 26 Oct 2024 00:00:00 GMT",
+        }
+
+    @patch("requests.Session.get")
+    def test_304_serves_stored_body(self, mock_get):
+        url = "https://statsapi.mlb.com/api/v1/standings?leagueId=103"
+        mock_get.side_effect = [
+            build_response(url, 200, b'{"records": [1]}', {"ETag": '"v1"'}),
+            build_response(url, 304, b"", {"ETag": '"v1"', "Date": "later"}),
+        ]
+        registry, cache = self._registry()
+
+        registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.02)
+        response = registry.Standings.standings("regularSeason", leagueId=103)
+
+        assert mock_get.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+        assert response.status_code == 200
+        assert response.json() == {"records": [1]}
+        assert response.from_cache is True
+        assert response.cache_info["status"] == "revalidated"
+        assert cache.stats["revalidations"] == 1
+        # The TTL restarted and the 304's headers were merged in
+        entry = cache.backend.get(response.get_path())
+        assert entry.is_fresh()
+        assert entry.headers["Date"] == "later"
+
+    @patch("requests.Session.get")
+    def test_200_on_revalidation_replaces_entry(self, mock_get):
+        url = "https://statsapi.mlb.com/api/v1/standings?leagueId=103"
+        mock_get.side_effect = [
+            build_response(url, 200, b'{"records": [1]}', {"Last-Modified": "t1"}),
+            build_response(url, 200, b'{"records": [2]}', {"Last-Modified": "t2"}),
+        ]
+        registry, cache = self._registry()
+
+        registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.02)
+        response = registry.Standings.standings("regularSeason", leagueId=103)
+
+        assert mock_get.call_args_list[1][1]["headers"] == {"If-Modified-Since": "t1"}
+        assert response.json() == {"records": [2]}
+        assert response.cache_info["status"] == "miss"
+        assert cache.backend.get(response.get_path()).last_modified == "t2"
+
+    @patch("requests.Session.get")
+    def test_no_conditional_request_without_revalidate(self, mock_get):
+        url = "https://statsapi.mlb.com/api/v1/standings?leagueId=103"
+        mock_get.return_value = build_response(url, 200, b"{}", {"ETag": '"v1"'})
+        registry = StatsAPI(cache=ResponseCache(ttls={"standings.*": 0.01}))
+
+        registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.02)
+        registry.Standings.standings("regularSeason", leagueId=103)
+
+        assert "headers" not in mock_get.call_args_list[1][1]
+
+    @patch("pymlb_statsapi.model.factory.sleep")
+    @patch("requests.Session.get")
+    def test_unsolicited_304_is_an_error(self, mock_get, mock_sleep):
+        url = "https://statsapi.mlb.com/api/v1/standings?leagueId=103"
+        mock_get.return_value = build_response(url, 304, b"")
+        with pytest.raises(AssertionError, match="status 304"):
+            StatsAPI().Standings.standings("regularSeason", leagueId=103)
+
+
+class TestStaleServing:
+    """Test stale-while-revalidate and stale-if-error."""
+
+    URL = "https://statsapi.mlb.com/api/v1/standings?leagueId=103"
+
+    def _wait_refreshed(self, cache, key):
+        deadline = time.monotonic() + 5
+        while cache.is_refreshing(key):
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    @patch("requests.Session.get")
+    def test_stale_while_revalidate(self, mock_get):
+        """Test an expired entry is served at once and refreshed once in the background."""
+        release = threading.Event()
+
+        def get(url, **kwargs):
+            if mock_get.call_count > 1:
+                assert release.wait(5)
+            return build_response(url, 200, b'{"v": %d}' % mock_get.call_count)
+
+        mock_get.side_effect = get
+        cache = ResponseCache(ttls={"standings.*": 0.01}, stale_while_revalidate=60)
+        registry = StatsAPI(cache=cache)
+        registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.02)
+
+        first = registry.Standings.standings("regularSeason", leagueId=103)
+        second = registry.Standings.standings("regularSeason", leagueId=103)
+        release.set()
+        self._wait_refreshed(cache, first.cache_info["key"])
+        refreshed = registry.Standings.standings("regularSeason", leagueId=103)
+
+        assert mock_get.call_count == 2
+        assert first.json() == second.json() == {"v": 1}
+        assert first.from_cache and first.cache_info["status"] == "stale"
+        assert first.get_metadata()["cache"]["stale_seconds"] > 0
+        assert refreshed.json() == {"v": 2}
+        assert refreshed.cache_info["status"] == "hit"
+        assert cache.stats["stale"] == 2
+
+    @patch("pymlb_statsapi.model.factory.sleep")
+    @patch("requests.Session.get")
+    def test_stale_if_error(self, mock_get, mock_sleep):
+        """Test the last good copy replaces a failed request, recording the error."""
+        mock_get.return_value = build_response(self.URL, 200, b'{"v": 1}')
+        cache = ResponseCache(ttls={"standings.*": 0.01}, stale_if_error=60)
+        registry = StatsAPI(cache=cache)
+        registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.02)
+
+        mock_get.return_value = None
+        mock_get.side_effect = requests.exceptions.ConnectTimeout("timed out")
+        response = registry.Standings.standings("regularSeason", leagueId=103)
+
+        assert response.json() == {"v": 1}
+        metadata = response.get_metadata()["cache"]
+        assert metadata["status"] == "stale-if-error"
+        assert metadata["error"] == "ConnectTimeout: timed out"
+        assert metadata["stale_seconds"] > 0
+        assert cache.stats["stale_if_error"] == 1
+
+    @patch("pymlb_statsapi.model.factory.sleep")
+    @patch("requests.Session.get")
+    def test_client_errors_and_expired_windows_raise(self, mock_get, mock_sleep):
+        """Test a 404, or an entry past the stale_if_error window, is not served."""
+        mock_get.return_value = build_response(self.URL, 200, b'{"v": 1}')
+        cache = ResponseCache(ttls={"standings.*": 0.01}, stale_if_error=0.05)
+        registry = StatsAPI(cache=cache)
+        registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.02)
+
+        mock_get.return_value = build_response(self.URL, 404, b"not found")
+        with pytest.raises(AssertionError, match="status 404"):
+            registry.Standings.standings("regularSeason", leagueId=103)
+        time.sleep(0.05)
+        mock_get.return_value = build_response(self.URL, 503, b"down")
+        with pytest.raises(AssertionError, match="status 503"):
+            registry.Standings.standings("regularSeason", leagueId=103)
+        assert cache.stats["stale_if_error"] == 0
+
+    def test_async_stale_while_revalidate(self):
+        """Test the async endpoint serves stale and refreshes in a task."""
+        urls = []
+
+        class Session:
+            async def get(self, url, timeout=None):
+                urls.append(url)
+                return build_response(url, 200, b'{"v": %d}' % len(urls))
+
+        schema = {
+            "apis": [
+                {
+                    "path": "/v1/sports",
+                    "operations": [
+                        {"method": "GET", "nickname": "sports", "summary": "", "parameters": []}
+                    ],
+                }
+            ]
+        }
+        cache = ResponseCache(ttls={"sports.*": 0.01}, stale_while_revalidate=60)
+        endpoint = AsyncEndpoint("sports", schema, {}, session=Session(), cache=cache)
+
+        async def run():
+            await endpoint.sports()
+            await asyncio.sleep(0.02)
+            stale = await endpoint.sports()
+            while cache.is_refreshing("sports/sports"):
+                await asyncio.sleep(0.001)
+            return stale, await endpoint.sports()
+
+        stale, refreshed = asyncio.run(run())
+        assert len(urls) == 2
+        assert stale.cache_info["status"] == "stale" and stale.json() == {"v": 1}
+        assert refreshed.cache_info["status"] == "hit" and refreshed.json() == {"v": 2}
@@ -0,0 +1,133 @@
+"""
+Unit tests for the content-addressed response store.
+"""
+
+import hashlib
+import os
+
+import pytest
+
+from pymlb_statsapi.model.cas import ContentStore
+from pymlb_statsapi.model.factory import APIResponse, build_response
+
+ROSTER = b'{"roster": [{"person": {"id": 1}}]}'
+
+
+def roster(content: bytes = ROSTER, timestamp: str = "2024-07-01T00:00:00+00:00"):
+    return APIResponse(
+        build_response(
+            "https://statsapi.mlb.com/api/v1/teams/147/roster?date=2024-07-01",
+            200,
+            content,
+            {"Content-Type": "application/json", "ETag": '"v1"'},
+            35.0,
+        ),
+        endpoint_name="team",
+        method_name="roster",
+        path_params={"teamId": "147"},
+        query_params={"date": "2024-07-01"},
+        timestamp=timestamp,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContentStore(str(tmp_path / "cas"))
+    yield store
+    store.close()
+
+
+class TestContentStore:
+    """Test deduplicated storage, lookup, listing and garbage collection."""
+
+    def test_identical_bodies_are_stored_once(self, store):
+        """Test repeated captures add versions but share one object."""
+        first = store.put(roster(timestamp="2024-07-01T00:00:00+00:00"))
+        second = store.put(roster(timestamp="2024-07-02T00:00:00+00:00"))
+        store.put(roster(b'{"roster": []}', timestamp="2024-07-03T00:00:00+00:00"))
+
+        assert first["new"] and not second["new"]
+        assert first["hash"] == second["hash"] == hashlib.sha256(ROSTER).hexdigest()
+        assert first["key"] == "team/roster/teamId=147/date=2024-07-01"
+        assert os.path.exists(store.object_path(first["hash"]))
+        assert store.object_path(first["hash"]).endswith(".gz")
+        stats = store.stats()
+        assert (stats["responses"], stats["keys"], stats["objects"]) == (3, 1, 2)
+        assert stats["logical_bytes"] == 2 * len(ROSTER) + len(b'{"roster": []}')
+
+    def test_get_rebuilds_the_response(self, store):
+        """Test get returns the latest version, or the one as of a timestamp."""
+        store.put(roster(timestamp="2024-07-01T00:00:00+00:00"))
+        store.put(roster(b'{"roster": []}', timestamp="2024-07-03T00:00:00+00:00"))
+        key = "team/roster/teamId=147/date=2024-07-01"
+
+        latest = store.get(key)
+        assert isinstance(latest, APIResponse)
+        assert latest.json() == {"roster": []}
+        assert latest.timestamp == "2024-07-03T00:00:00+00:00"
+        assert latest.get_path() == key
+        assert latest.headers["ETag"] == '"v1"'
+
+        older = store.get(key, at="2024-07-02T00:00:00+00:00")
+        assert older.content == ROSTER
+        assert store.get(key, at="2024-06-30T00:00:00+00:00") is None
+        assert store.get("team/roster/teamId=111") is None
+        assert [v["timestamp"][:10] for v in store.versions(key)] == ["2024-07-01", "2024-07-03"]
+
+    def test_keys_and_bytes(self, store):
+        """Test listing by prefix and storing bytes without metadata."""
+        store.put_bytes("schedule/schedule/date=2024-07-01", b"{}", "2024-07-01T00:00:00+00:00")
+        store.put_bytes("schedule/schedule/date=2024-07-02", b"{}", "2024-07-02T00:00:00+00:00")
+        store.put(roster())
+
+        assert list(store.keys("schedule/")) == [
+            "schedule/schedule/date=2024-07-01",
+            "schedule/schedule/date=2024-07-02",
+        ]
+        assert len(list(store.keys())) == 3
+        assert store.read(store.lookup("schedule/schedule/date=2024-07-02")["hash"]) == b"{}"
+        with pytest.raises(ValueError, match="without metadata"):
+            store.get("schedule/schedule/date=2024-07-01")
+        with pytest.raises(KeyError):
+            store.read("0" * 64)
+
+    def test_delete_and_gc(self, store):
+        """Test gc removes only bodies no version refers to any more."""
+        old = store.put(roster(b'{"roster": []}', timestamp="2024-07-01T00:00:00+00:00"))
+        kept = store.put(roster(timestamp="2024-07-02T00:00:00+00:00"))
+        assert store.gc() == {"objects": 0, "bytes": 0}
+
+        assert store.delete(before="2024-07-02T00:00:00+00:00") == 1
+        result = store.gc()
+        assert result["objects"] == 1 and result["bytes"] > 0
+        assert not os.path.exists(store.object_path(old["hash"]))
+        assert store.read(kept["hash"]) == ROSTER
+
+        # A body that comes back after gc is written again
+        again = store.put(roster(b'{"roster": []}', timestamp="2024-07-03T00:00:00+00:00"))
+        assert again["new"] and store.read(again["hash"]) == b'{"roster": []}'
+
+    def test_delete_filters(self, store):
+        """Test delete by key, by key and time, and of everything."""
+        store.put(roster(timestamp="2024-07-01T00:00:00+00:00"))
+        store.put(roster(b'{"roster": []}', timestamp="2024-07-03T00:00:00+00:00"))
+        store.put_bytes("schedule/schedule/date=2024-07-01", b"{}", "2024-07-01T00:00:00+00:00")
+        key = "team/roster/teamId=147/date=2024-07-01"
+
+        assert store.delete(key, before="2024-07-02T00:00:00+00:00") == 1
+        assert len(store.versions(key)) == 1
+        assert store.delete(key) == 1
+        assert list(store.keys()) == ["schedule/schedule/date=2024-07-01"]
+        assert store.delete() == 1
+        assert list(store.keys()) == []
+
+    def test_uncompressed_objects(self, tmp_path):
+        """Test gzip=False stores bodies as-is, and a reopened store reads them."""
+        store = ContentStore(str(tmp_path / "plain"), gzip=False)
+        digest = store.put(roster())["hash"]
+        store.close()
+        with open(ContentStore(str(tmp_path / "plain")).object_path(digest, gzip=False), "rb") as f:
+            assert f.read() == ROSTER
+        reopened = ContentStore(str(tmp_path / "plain"))
+        assert reopened.get("team/roster/teamId=147/date=2024-07-01").content == ROSTER
+        assert reopened.stats()["dedup_ratio"] == 1.0
@@ -14,7 +14,7 @@ from pymlb_statsapi.model.registry import create_stats_api
 class TestFormatParamsDoc:
     """Test _format_params_doc method."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_format_params_doc_with_empty_params(self, mock_get):
         """Test _format_params_doc with empty parameter list."""
         from datetime import timedelta
@@ -62,7 +62,7 @@ class TestFormatParamsDoc:
 class TestDescribeMethod:
     """Test describe_method wrapper."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_describe_method(self, mock_get):
         """Test describe_method calls get_long_description."""
         from datetime import timedelta
@@ -121,7 +121,7 @@ class TestDescribeMethod:
 class TestGetMethodSchema:
     """Test get_method_schema wrapper."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_method_schema(self, mock_get):
         """Test get_method_schema calls get_schema."""
         from datetime import timedelta
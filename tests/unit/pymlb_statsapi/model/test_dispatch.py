@@ -0,0 +1,177 @@
+"""
+Unit tests for the dispatch method engine, checked against the exec engine.
+"""
+
+import inspect
+from unittest.mock import patch
+
+import pytest
+
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.dispatch import MethodRoute, OverloadRoute
+from pymlb_statsapi.model.factory import Endpoint
+
+
+def make_api(engine: str) -> StatsAPI:
+    endpoint_class = type(f"{engine}Endpoint", (Endpoint,), {"METHOD_ENGINE": engine})
+    registry_class = type(f"{engine}StatsAPI", (StatsAPI,), {"endpoint_class": endpoint_class})
+    return registry_class(lazy=False)
+
+
+@pytest.fixture(scope="module")
+def engines():
+    return make_api("exec"), make_api("dispatch")
+
+
+def public_methods(api: StatsAPI):
+    for endpoint_name in api.get_endpoint_names():
+        endpoint = api.get_endpoint(endpoint_name)
+        for method_name in endpoint.get_method_names():
+            if not method_name.startswith("__"):
+                yield endpoint_name, method_name
+
+
+def capture(endpoint: Endpoint, method_name: str, *args, **kwargs):
+    """Call a generated method and return what it passed to _execute_request."""
+    with patch.object(endpoint, "_execute_request", side_effect=lambda **kw: kw):
+        try:
+            routed = getattr(endpoint, method_name)(*args, **kwargs)
+        except (TypeError, AssertionError) as e:
+            return type(e)
+    return (
+        routed["endpoint_method"].path_template,
+        routed["path_params"],
+        routed["query_params"],
+    )
+
+
+class TestDispatchEngine:
+    """Test that dispatch-built methods behave like exec-built methods."""
+
+    def test_signatures_match(self, engines):
+        """Test every generated method has the same signature in both engines."""
+        exec_api, dispatch_api = engines
+        for endpoint_name, method_name in public_methods(exec_api):
+            exec_method = getattr(exec_api.get_endpoint(endpoint_name), method_name)
+            dispatch_method = getattr(dispatch_api.get_endpoint(endpoint_name), method_name)
+            assert inspect.signature(dispatch_method) == inspect.signature(exec_method)
+            assert dispatch_method.__name__ == exec_method.__name__
+            assert dispatch_method.__doc__ == exec_method.__doc__
+
+    def test_keyword_routing_matches(self, engines):
+        """Test calls with all params, and with each param alone, route identically."""
+        exec_api, dispatch_api = engines
+        for endpoint_name, method_name in public_methods(exec_api):
+            exec_endpoint = exec_api.get_endpoint(endpoint_name)
+            dispatch_endpoint = dispatch_api.get_endpoint(endpoint_name)
+            names = list(inspect.signature(getattr(exec_endpoint, method_name)).parameters)
+
+            calls = [{name: f"v-{name}" for name in names}]
+            calls += [{name: f"v-{name}"} for name in names]
+            calls.append({})
+            for kwargs in calls:
+                assert capture(dispatch_endpoint, method_name, **kwargs) == capture(
+                    exec_endpoint, method_name, **kwargs
+                ), f"{endpoint_name}.{method_name}({kwargs})"
+
+    def test_positional_routing_matches(self, engines):
+        """Test positional calls route identically, including too many positionals."""
+        exec_api, dispatch_api = engines
+        for endpoint_name, method_name in public_methods(exec_api):
+            exec_endpoint = exec_api.get_endpoint(endpoint_name)
+            dispatch_endpoint = dispatch_api.get_endpoint(endpoint_name)
+            signature = inspect.signature(getattr(exec_endpoint, method_name))
+            positional = [
+                name
+                for name, p in signature.parameters.items()
+                if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            ]
+            for count in range(len(positional) + 2):
+                args = [f"p{i}" for i in range(count)]
+                assert capture(dispatch_endpoint, method_name, *args) == capture(
+                    exec_endpoint, method_name, *args
+                ), f"{endpoint_name}.{method_name}{tuple(args)}"
+
+    def test_bad_calls_raise_type_error(self, engines):
+        """Test unknown keywords and duplicate arguments raise TypeError in both engines."""
+        for api in engines:
+            with pytest.raises(TypeError):
+                api.Game.boxscore(game_pk=1, not_a_param=2)
+            with pytest.raises(TypeError):
+                api.Game.boxscore(1, game_pk=1)
+            with pytest.raises(TypeError):
+                api.Game.boxscore()
+
+    def test_none_values_are_dropped(self, engines):
+        """Test None arguments are treated as not provided."""
+        _, dispatch_api = engines
+        _, path_params, query_params = capture(
+            dispatch_api.Game, "boxscore", game_pk=1, fields=None, timecode=None
+        )
+        assert path_params == {"game_pk": 1}
+        assert query_params is None
+
+    def test_no_matching_variant_message(self, engines):
+        """Test the no-match error is identical in both engines."""
+        messages = []
+        for api in engines:
+            with patch.object(api.League, "_execute_request"):
+                with pytest.raises(AssertionError) as exc_info:
+                    api.League.allStarFinalVote()
+            messages.append(str(exc_info.value))
+        assert messages[0] == messages[1]
+        assert "No matching variant" in messages[0]
+
+    def test_methods_share_code(self, engines):
+        """Test dispatch methods reuse one code object instead of compiling per method."""
+        _, dispatch_api = engines
+        assert dispatch_api.Game.boxscore.__code__ is dispatch_api.Game.linescore.__code__
+
+    def test_patched_execute_request_is_used(self, engines):
+        """Test _execute_request is looked up per call, so it can be patched after binding."""
+        _, dispatch_api = engines
+        method = dispatch_api.Game.boxscore
+        with patch.object(dispatch_api.Game, "_execute_request", return_value="patched"):
+            assert method(game_pk=1) == "patched"
+
+    def test_unknown_engine(self):
+        """Test an unknown engine name is rejected."""
+        endpoint_class = type("BadEndpoint", (Endpoint,), {"METHOD_ENGINE": "jit"})
+        with pytest.raises(AssertionError, match="Unknown method engine"):
+            endpoint_class(endpoint_name="game", schema={"apis": []}, endpoint_config={})
+
+
+class TestRoutes:
+    """Test routing tables directly."""
+
+    def test_method_route(self, engines):
+        """Test a single-operation route splits path and query params."""
+        _, dispatch_api = engines
+        route = MethodRoute.from_method(dispatch_api.Game.get_method("boxscore"))
+        assert route.path_names == frozenset({"game_pk"})
+        assert route.required == frozenset({"game_pk"})
+        assert route.route((747175,), {"fields": "teams"}) == (
+            {"game_pk": 747175},
+            {"fields": "teams"},
+        )
+
+    def test_overload_route(self, engines):
+        """Test an overload route picks the first variant whose path params were provided."""
+        _, dispatch_api = engines
+        endpoint = dispatch_api.Person
+        variants = [
+            (["personId", "gamePk"], endpoint.get_method("__currentGameStats_personId_gamePk")),
+            (["personId"], endpoint.get_method("__currentGameStats_personId")),
+        ]
+        route = OverloadRoute.from_variants("person", "currentGameStats", variants)
+
+        method, path_params, _ = route.route((), {"personId": 1, "gamePk": 2})
+        assert method is variants[0][1]
+        assert path_params == {"personId": 1, "gamePk": 2}
+
+        method, path_params, _ = route.route((), {"personId": 1})
+        assert method is variants[1][1]
+        assert path_params == {"personId": 1}
+
+        with pytest.raises(AssertionError, match="No matching variant"):
+            route.route((), {"gamePk": 2})
@@ -334,7 +334,7 @@ class TestParameterValidationEdgeCases:
 class TestEndpointMethodInfo:
     """Test endpoint method info retrieval."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_method_info(self, mock_get):
         """Test get_method_info returns dict with method details."""
         from datetime import timedelta
@@ -382,7 +382,7 @@ class TestEndpointMethodInfo:
         assert method_info["path"] == "/v1/schedule"
         assert method_info["http_method"] == "GET"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_method_info_not_found(self, mock_get):
         """Test get_method_info raises error for non-existent method."""
         schema = {
@@ -413,7 +413,7 @@ class TestEndpointMethodInfo:
         with pytest.raises(ValueError, match="Method 'nonexistent' not found"):
             endpoint.get_method_info("nonexistent")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_method_not_found(self, mock_get):
         """Test get_method raises error for non-existent method."""
         schema = {
@@ -87,7 +87,7 @@ class TestRegistryRepresentation:
 class TestEndpointGetMethod:
     """Test Endpoint.get_method() edge cases."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_method_returns_endpoint_method(self, mock_get):
         """Test get_method returns EndpointMethod instance."""
         from datetime import timedelta
@@ -8,6 +8,7 @@ import pytest
 import requests
 
 from pymlb_statsapi.model.factory import Endpoint
+from pymlb_statsapi.model.retry import RequestFailedError, RetryPolicy
 
 
 class TestHTTPRetry:
@@ -47,7 +48,7 @@ class TestHTTPRetry:
             endpoint_config={"schedule": {"path": "/v1/schedule"}},
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_successful_request_no_retry(self, mock_get, sample_endpoint):
         """Test that successful requests don't trigger retries."""
         from datetime import timedelta
@@ -69,7 +70,7 @@ class TestHTTPRetry:
         assert response.status_code == 200
 
     @patch("pymlb_statsapi.model.factory.sleep")  # Mock sleep to speed up test
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_retry_on_5xx_error(self, mock_get, mock_sleep, sample_endpoint):
         """Test retry logic for 5xx server errors."""
         from datetime import timedelta
@@ -105,7 +106,7 @@ class TestHTTPRetry:
         assert mock_sleep.call_count == 2
 
     @patch("pymlb_statsapi.model.factory.sleep")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_retry_on_connection_error(self, mock_get, mock_sleep, sample_endpoint):
         """Test retry logic for connection errors."""
         from datetime import timedelta
@@ -133,7 +134,7 @@ class TestHTTPRetry:
         assert mock_sleep.call_count == 1
 
     @patch("time.sleep")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_retry_exhaustion_raises_error(self, mock_get, mock_sleep, sample_endpoint):
         """Test that exhausting retries raises the last error."""
         # All attempts fail
@@ -146,7 +147,7 @@ class TestHTTPRetry:
         assert mock_get.call_count >= 3
 
     @patch("pymlb_statsapi.model.factory.sleep")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_retry_on_4xx_error(self, mock_get, mock_sleep, sample_endpoint):
         """Test that 4xx errors raise immediately without retries."""
         from datetime import timedelta
@@ -163,16 +164,17 @@ class TestHTTPRetry:
 
         mock_get.return_value = error_response
 
-        # Should raise AssertionError immediately (non-200 status)
-        with pytest.raises(AssertionError, match="Request failed with status 404"):
+        # Should raise immediately (RequestFailedError is still an AssertionError)
+        with pytest.raises(RequestFailedError, match="Request failed with status 404") as exc_info:
             sample_endpoint.schedule()
+        assert isinstance(exc_info.value, AssertionError)
+        assert exc_info.value.status_code == 404
 
-        # Should NOT retry for 4xx errors (retries happen for RequestException only)
-        # Since AssertionError triggers retry, we should see retries until MAX_RETRIES
-        # This test documents that behavior - 404s do actually retry with current implementation
-        assert mock_get.call_count >= 1
+        # Should NOT retry for 4xx errors: they will never succeed
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_timeout_configuration(self, mock_get, sample_endpoint):
         """Test that timeout is properly configured."""
         from datetime import timedelta
@@ -196,7 +198,7 @@ class TestHTTPRetry:
         assert call_kwargs["timeout"] == 30
 
     @patch("pymlb_statsapi.model.factory.sleep")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_exponential_backoff(self, mock_get, mock_sleep, sample_endpoint):
         """Test that retry delays increase with attempt number."""
         from datetime import timedelta
@@ -222,12 +224,16 @@ class TestHTTPRetry:
 
         mock_get.side_effect = [error_response, error_response, success_response]
 
-        sample_endpoint.schedule()
+        # Full jitter draws uniform(0, cap); take the upper bound to see the cap itself
+        rng = Mock()
+        rng.uniform.side_effect = lambda low, high: high
+        sample_endpoint.retry_policy = RetryPolicy(max_retries=3, base_delay=0.5, rng=rng)
+
+        response = sample_endpoint.schedule()
 
-        # Check that sleep was called with increasing delays
-        # Implementation uses sleep(attempt), so delays are 0, 1, 2, etc.
+        # Check that sleep was called with doubling delays
         assert mock_sleep.call_count == 2
         delays = [call[0][0] for call in mock_sleep.call_args_list]
-        # First retry: sleep(0), second retry: sleep(1)
-        assert delays[0] == 0
-        assert delays[1] == 1
+        assert delays == [0.5, 1.0]
+        assert response.retry_info == {"attempts": 3, "backoff_seconds": 1.5}
+        assert response.get_metadata()["retry"] == {"attempts": 3, "backoff_seconds": 1.5}
@@ -0,0 +1,224 @@
+"""
+Unit tests for request instrumentation and metrics export.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pymlb_statsapi.model.cache import ResponseCache
+from pymlb_statsapi.model.factory import Endpoint, build_response
+from pymlb_statsapi.model.instrumentation import (
+    Histogram,
+    Instrumentation,
+    MetricsRegistry,
+    RequestEvent,
+    wire_size,
+)
+from pymlb_statsapi.model.retry import RequestFailedError, RetryPolicy
+
+SCHEMA = {
+    "apis": [
+        {
+            "path": "/v1/schedule",
+            "description": "schedule",
+            "operations": [
+                {
+                    "method": "GET",
+                    "nickname": "schedule",
+                    "summary": "Get schedule",
+                    "notes": "",
+                    "parameters": [
+                        {
+                            "name": "sportId",
+                            "paramType": "query",
+                            "type": "integer",
+                            "required": False,
+                        },
+                    ],
+                }
+            ],
+        }
+    ]
+}
+
+BODY = b'{"copyright": "MLB", "dates": []}'
+
+
+def ok_response(url: str = "https://statsapi.mlb.com/api/v1/schedule") -> requests.Response:
+    return build_response(
+        url, 200, BODY, headers={"Content-Length": "20"}, elapsed_ms=40, reason="OK"
+    )
+
+
+def endpoint(instrumentation=None, **kwargs) -> Endpoint:
+    return Endpoint(
+        endpoint_name="schedule",
+        schema=SCHEMA,
+        endpoint_config={"schedule": {"path": "/v1/schedule"}},
+        instrumentation=instrumentation,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def events() -> list:
+    return []
+
+
+@pytest.fixture
+def instrumentation(events) -> Instrumentation:
+    return Instrumentation(hooks=[lambda kind, event: events.append((kind, event))])
+
+
+class TestHistogram:
+    """Test bucket counting and quantile estimates."""
+
+    def test_buckets(self):
+        """Test values land in the first bucket whose bound is >= the value."""
+        histogram = Histogram((1, 2, 4))
+        for value in (0.5, 1, 1.5, 3, 10):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1, 1]
+        assert histogram.cumulative() == [2, 3, 4, 5]
+        assert (histogram.count, histogram.sum) == (5, 16.0)
+
+    def test_quantile(self):
+        """Test quantiles interpolate within buckets and clamp to the last bound."""
+        histogram = Histogram((1, 2, 4))
+        assert histogram.quantile(0.5) == 0.0
+        for _ in range(4):
+            histogram.observe(1.5)
+        assert histogram.quantile(0.5) == 1.5
+        histogram.observe(100)
+        assert histogram.quantile(0.99) == 4
+
+
+class TestEndpointInstrumentation:
+    """Test events and metrics recorded by instrumented endpoints."""
+
+    @patch("requests.Session.get")
+    def test_disabled_by_default(self, mock_get):
+        """Test an endpoint without instrumentation records nothing."""
+        mock_get.return_value = ok_response()
+        response = endpoint().schedule(sportId=1)
+        assert response.instrumentation is None
+        assert response.json() == {"dates": []}
+
+    @patch("requests.Session.get")
+    def test_request_events(self, mock_get, instrumentation, events):
+        """Test start/end/parse events carry timings, sizes and attempts."""
+        mock_get.return_value = ok_response()
+        response = endpoint(instrumentation).schedule(sportId=1)
+        response.json()
+        response.json()
+
+        assert [kind for kind, _ in events] == ["start", "end", "parse"]
+        start, end = events[0][1], events[1][1]
+        assert start is end
+        assert end.url.endswith("/v1/schedule?sportId=1")
+        assert (end.status_code, end.attempts, end.cache, end.error) == (200, 1, None, None)
+        assert (end.bytes_wire, end.bytes_decoded) == (20, len(BODY))
+        assert end.timings["ttfb"] == pytest.approx(0.04)
+        assert set(end.timings) == {"ttfb", "download"}
+        assert end.duration >= 0
+        assert events[2][1].size == len(BODY)
+
+        metrics = instrumentation.snapshot()["schedule.schedule"]
+        assert metrics["requests_total"] == 1
+        assert metrics["wire_bytes_total"] == 20
+        assert metrics["parse_seconds"]["count"] == 1
+        assert metrics["request_duration_seconds"]["count"] == 1
+
+    @patch("pymlb_statsapi.model.factory.sleep")
+    @patch("requests.Session.get")
+    def test_retries_and_errors(self, mock_get, mock_sleep, instrumentation, events):
+        """Test retried attempts are counted and failures recorded with their status."""
+        failed = build_response("https://statsapi.mlb.com/api/v1/schedule", 503, b"")
+        mock_get.side_effect = [failed, ok_response(), failed, failed]
+        api = endpoint(instrumentation, retry_policy=RetryPolicy(max_retries=1))
+        api.schedule()
+        with pytest.raises(RequestFailedError):
+            api.schedule()
+
+        ends = [event for kind, event in events if kind == "end"]
+        assert [(e.attempts, e.status_code, e.error is None) for e in ends] == [
+            (2, 200, True),
+            (2, 503, False),
+        ]
+        metrics = instrumentation.snapshot()["schedule.schedule"]
+        assert metrics["retries_total"] == 2
+        assert metrics["errors_total"] == 1
+
+    @patch("requests.Session.get")
+    def test_cache_hits(self, mock_get, instrumentation, events):
+        """Test cache misses and hits are counted; hits have no wire bytes."""
+        mock_get.return_value = ok_response()
+        api = endpoint(instrumentation, cache=ResponseCache(default_ttl=60, ttls={"*": 60}))
+        api.schedule(sportId=1)
+        api.schedule(sportId=1)
+        hit = events[-1][1]
+        assert (hit.cache, hit.attempts, hit.bytes_wire) == ("hit", 0, 0)
+        assert hit.bytes_decoded == len(BODY)
+        metrics = instrumentation.snapshot()["schedule.schedule"]
+        assert (metrics["cache_misses_total"], metrics["cache_hits_total"]) == (1, 1)
+        assert mock_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_failing_hook_is_skipped(self, mock_get, instrumentation, events):
+        """Test a hook that raises doesn't break the request or other hooks."""
+        mock_get.return_value = ok_response()
+
+        @instrumentation.add_hook
+        def broken(kind, event):
+            raise RuntimeError("broken hook")
+
+        assert endpoint(instrumentation).schedule().ok
+        assert len(events) == 2
+        instrumentation.remove_hook(broken)
+
+
+class TestExport:
+    """Test Prometheus and OTLP rendering."""
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        registry = MetricsRegistry()
+        registry.increment("requests_total", "game", "boxscore", 3)
+        registry.observe("request_duration_seconds", "game", "boxscore", 0.2)
+        registry.observe("request_duration_seconds", "game", "boxscore", 0.02)
+        return registry
+
+    def test_prometheus(self, registry):
+        """Test counters and cumulative histogram series in exposition format."""
+        text = registry.to_prometheus()
+        assert "# TYPE pymlb_statsapi_requests_total counter\n" in text
+        assert 'pymlb_statsapi_requests_total{endpoint="game",method="boxscore"} 3\n' in text
+        labels = 'endpoint="game",method="boxscore"'
+        assert f'pymlb_statsapi_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+        assert f'pymlb_statsapi_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"pymlb_statsapi_request_duration_seconds_count{{{labels}}} 2" in text
+        assert MetricsRegistry().to_prometheus() == ""
+
+    def test_otlp(self, registry):
+        """Test the OTLP/JSON payload has a monotonic sum and an explicit-bounds histogram."""
+        payload = registry.to_otlp()
+        metrics = payload["resourceMetrics"][0]["scopeMetrics"][0]["metrics"]
+        by_name = {metric["name"]: metric for metric in metrics}
+        total = by_name["pymlb_statsapi.requests_total"]["sum"]
+        assert total["isMonotonic"] and total["dataPoints"][0]["asDouble"] == 3.0
+        histogram = by_name["pymlb_statsapi.request_duration_seconds"]["histogram"]
+        point = histogram["dataPoints"][0]
+        assert point["count"] == "2"
+        assert len(point["bucketCounts"]) == len(point["explicitBounds"]) + 1
+        assert {"key": "method", "value": {"stringValue": "boxscore"}} in point["attributes"]
+
+    def test_wire_size_fallbacks(self):
+        """Test wire size prefers the transport, then Content-Length, then the body."""
+        response = build_response("u", 200, b"12345")
+        assert wire_size(response) == 5
+        event = RequestEvent("game", "boxscore", "u")
+        event.record_transfer(response, 0.5, {"connect": 0.1, "tls": 0.2, "bytes_wire": 3})
+        assert event.bytes_wire == 3
+        assert event.timings == {"connect": 0.1, "tls": 0.2, "ttfb": 0.0, "download": 0.5}
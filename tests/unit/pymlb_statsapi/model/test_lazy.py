@@ -0,0 +1,168 @@
+"""
+Unit tests for lazy endpoint and method construction.
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.factory import Endpoint
+from pymlb_statsapi.utils.schema_loader import sl
+
+
+class TestLazyRegistry:
+    """Test that StatsAPI defers schema loading until an endpoint is used."""
+
+    def test_construction_loads_no_schemas(self):
+        """Test that building a lazy registry reads no schema files."""
+        with patch.object(sl, "load_stats_schema", wraps=sl.load_stats_schema) as load:
+            registry = StatsAPI(lazy=True)
+            assert load.call_count == 0
+            assert "schedule" in registry.get_endpoint_names()
+
+            registry.Schedule  # noqa: B018
+            load.assert_called_once_with("schedule")
+
+    def test_endpoint_materialized_once(self):
+        """Test that repeated access returns the same endpoint without reloading."""
+        registry = StatsAPI(lazy=True)
+        with patch.object(sl, "load_stats_schema", wraps=sl.load_stats_schema) as load:
+            first = registry.Game
+            assert registry.Game is first
+            assert registry.get_endpoint("game") is first
+            assert load.call_count == 1
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        registry = StatsAPI(lazy=True)
+        with pytest.raises(AttributeError):
+            registry.NotAnEndpoint  # noqa: B018
+        assert not hasattr(registry, "_private")
+
+    def test_dir_lists_unloaded_endpoints(self):
+        """Test that dir() advertises endpoints before they are loaded."""
+        registry = StatsAPI(lazy=True)
+        assert {"Schedule", "Game", "Team"} <= set(dir(registry))
+        assert registry._endpoints == {}
+
+    def test_list_all_methods_matches_eager(self):
+        """Test that introspection returns the same result in both modes."""
+        assert StatsAPI(lazy=True).list_all_methods() == StatsAPI(lazy=False).list_all_methods()
+
+    @patch("pymlb_statsapi.model.registry.sl")
+    def test_failed_endpoint(self, mock_sl):
+        """Test that an endpoint whose schema fails to load is dropped after first access."""
+        mock_sl.get_available_schemas.return_value = ["good.json", "bad.json"]
+        mock_sl.load_endpoint_model.return_value = {}
+
+        def mock_load_schema(name):
+            if name == "bad":
+                raise ValueError("Bad schema")
+            return {"apis": []}
+
+        mock_sl.load_stats_schema.side_effect = mock_load_schema
+
+        registry = StatsAPI(lazy=True)
+        assert registry.get_endpoint_names() == ["good", "bad"]
+
+        with pytest.raises(AttributeError, match="failed to load"):
+            registry.Bad  # noqa: B018
+        with pytest.raises(KeyError):
+            registry.get_endpoint("bad")
+        assert registry.get_endpoint_names() == ["good"]
+        assert mock_sl.load_stats_schema.call_count == 1
+
+
+class TestLazyMethods:
+    """Test that generated methods are compiled on first access."""
+
+    def test_methods_compiled_on_access(self):
+        """Test that methods are pending until accessed, then become instance attributes."""
+        endpoint = StatsAPI(lazy=True).Game
+        assert "boxscore" in endpoint._pending_methods
+        assert "boxscore" not in endpoint.__dict__
+        assert "boxscore" in endpoint.get_method_names()
+
+        method = endpoint.boxscore
+        assert callable(method)
+        assert endpoint.__dict__["boxscore"] is method
+        assert "boxscore" not in endpoint._pending_methods
+        assert endpoint.boxscore is method
+
+    def test_overloaded_method_introspection_before_compile(self):
+        """Test that overloaded methods are introspectable before they are compiled."""
+        eager = StatsAPI(lazy=False)
+        lazy = StatsAPI(lazy=True)
+        for name in eager.get_endpoint_names():
+            assert (
+                lazy.get_endpoint(name).get_method_names()
+                == eager.get_endpoint(name).get_method_names()
+            )
+
+    def test_eager_endpoint_has_no_pending_methods(self):
+        """Test that lazy=False compiles every method up front."""
+        endpoint = Endpoint(
+            endpoint_name="schedule",
+            schema=sl.load_stats_schema("schedule"),
+            endpoint_config={},
+            lazy=False,
+        )
+        assert endpoint._pending_methods == {}
+        assert "schedule" in endpoint.__dict__
+
+    def test_generated_signature(self):
+        """Test that a lazily compiled method has the same signature as an eager one."""
+        import inspect
+
+        lazy = inspect.signature(StatsAPI(lazy=True).Schedule.schedule)
+        eager = inspect.signature(StatsAPI(lazy=False).Schedule.schedule)
+        assert lazy == eager
+
+    @patch("requests.Session.get")
+    def test_lazy_method_call(self, mock_get):
+        """Test that calling a lazily compiled method issues the request."""
+        from pymlb_statsapi.model.factory import build_response
+
+        mock_get.return_value = build_response(
+            url="https://statsapi.mlb.com/api/v1/game/747175/boxscore",
+            status_code=200,
+            content=b"{}",
+        )
+        response = StatsAPI(lazy=True).Game.boxscore(game_pk=747175)
+        assert response.json() == {}
+        assert "747175" in mock_get.call_args[0][0]
+
+
+class TestLazyExports:
+    """Test that optional model exports are imported on first access."""
+
+    def test_import_skips_optional_modules(self):
+        """Test that importing the package in a fresh interpreter loads no optional module."""
+        optional = ["asyncio", "sqlite3"] + [
+            f"pymlb_statsapi.model.{name}"
+            for name in ("aio", "backfill", "cache", "cas", "live", "scheduler", "segments")
+        ]
+        probe = f"import sys, pymlb_statsapi; print([m for m in {optional!r} if m in sys.modules])"
+        out = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_async_exports(self):
+        """Test that lazy exports still import from both packages."""
+        import pymlb_statsapi
+        from pymlb_statsapi import model
+        from pymlb_statsapi.model.aio import AsyncStatsAPI
+
+        assert pymlb_statsapi.AsyncStatsAPI is AsyncStatsAPI
+        assert model.AsyncStatsAPI is AsyncStatsAPI
+        assert "AsyncEndpoint" in dir(model)
+        for name, module in model._LAZY.items():
+            assert getattr(model, name).__module__ == f"pymlb_statsapi.model{module}"
+        with pytest.raises(AttributeError):
+            model.NotAnExport  # noqa: B018
+        with pytest.raises(AttributeError):
+            pymlb_statsapi.NotAnExport  # noqa: B018
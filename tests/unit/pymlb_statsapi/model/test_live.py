@@ -0,0 +1,189 @@
+"""
+Unit tests for the incremental live game tracker.
+"""
+
+import copy
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from pymlb_statsapi.model.live import LiveGameTracker
+
+
+def play(index: int, events: int, complete: bool = False) -> dict:
+    return {
+        "about": {"atBatIndex": index, "isComplete": complete},
+        "playEvents": [{"index": i, "isPitch": True} for i in range(events)],
+    }
+
+
+DETAILED = {"Live": "In Progress", "Final": "Final"}
+
+
+def game(timecode: str, plays: list, state: str = "Live") -> dict:
+    return {
+        "gamePk": 1,
+        "metaData": {"timeStamp": timecode, "wait": 10},
+        "gameData": {"status": {"abstractGameState": state, "detailedState": DETAILED[state]}},
+        "liveData": {"plays": {"allPlays": plays}},
+    }
+
+
+def response(body) -> Mock:
+    return Mock(content=json.dumps(body).encode(), json=Mock(return_value=copy.deepcopy(body)))
+
+
+class FakeGame:
+    """Game endpoint serving a scripted feed."""
+
+    def __init__(self, document: dict):
+        self.document = document
+        self.timecodes = [document["metaData"]["timeStamp"]]
+        self.patches: list = []
+        self.calls: list[str] = []
+
+    def liveGameV1(self, game_pk):
+        self.calls.append("liveGameV1")
+        return response(self.document)
+
+    def liveTimestampv11(self, game_pk):
+        self.calls.append("liveTimestampv11")
+        return response(self.timecodes)
+
+    def liveGameDiffPatchV1(self, game_pk, startTimecode):
+        self.calls.append("liveGameDiffPatchV1")
+        return response(self.patches.pop(0))
+
+    def advance(self, timecode: str, operations: list, document: dict):
+        """Publish a new timecode, its diff, and the full document after it."""
+        operations = [
+            {"op": "replace", "path": "/metaData/timeStamp", "value": timecode},
+            *operations,
+        ]
+        self.timecodes.append(timecode)
+        self.patches.append([{"diff": operations}])
+        self.document = document
+
+
+@pytest.fixture
+def feed() -> FakeGame:
+    return FakeGame(game("t0", [play(0, 2, complete=True), play(1, 1)]))
+
+
+@pytest.fixture
+def tracker(feed) -> LiveGameTracker:
+    return LiveGameTracker(game_pk=1, api=Mock(Game=feed), sleep=Mock())
+
+
+class TestLiveGameTracker:
+    """Test polling, patching and event emission."""
+
+    def test_first_poll_fetches_full_feed(self, tracker, feed):
+        """Test the first poll downloads the feed and emits nothing by default."""
+        assert tracker.poll() == []
+        assert tracker.timecode == "t0"
+        assert feed.calls == ["liveGameV1"]
+
+    def test_replay(self, feed):
+        """Test replay=True emits the plays already in the first document."""
+        tracker = LiveGameTracker(game_pk=1, api=Mock(Game=feed), replay=True)
+        kinds = [event.kind for event in tracker.poll()]
+        assert kinds == ["status", "play", "event", "event", "complete", "play", "event"]
+
+    def test_unchanged_timestamp_skips_diff(self, tracker, feed):
+        """Test no diff is requested while the last timecode is the document's."""
+        tracker.poll()
+        assert tracker.poll() == []
+        assert feed.calls == ["liveGameV1", "liveTimestampv11"]
+
+    def test_patch_emits_new_events(self, tracker, feed):
+        """Test a diff is applied in place and new pitches, completions and plays emitted."""
+        tracker.poll()
+        new_pitch = {"index": 1, "isPitch": True}
+        feed.advance(
+            "t1",
+            [
+                {
+                    "op": "add",
+                    "path": "/liveData/plays/allPlays/1/playEvents/-",
+                    "value": new_pitch,
+                },
+                {
+                    "op": "replace",
+                    "path": "/liveData/plays/allPlays/1/about/isComplete",
+                    "value": True,
+                },
+                {"op": "add", "path": "/liveData/plays/allPlays/-", "value": play(2, 0)},
+            ],
+            game("t1", []),
+        )
+        events = tracker.poll()
+        assert [(e.kind, e.at_bat_index, e.event_index) for e in events] == [
+            ("event", 1, 1),
+            ("complete", 1, None),
+            ("play", 2, None),
+        ]
+        assert events[0].data == new_pitch
+        assert tracker.timecode == "t1"
+        assert tracker.stats["patches"] == 1
+        assert tracker.stats["full_fetches"] == 1
+        assert feed.calls[-1] == "liveGameDiffPatchV1"
+
+    def test_failed_patch_refetches(self, tracker, feed):
+        """Test a patch that doesn't apply falls back to the full feed, without losing events."""
+        tracker.poll()
+        after = game("t1", [play(0, 2, complete=True), play(1, 3)])
+        feed.advance("t1", [{"op": "replace", "path": "/no/such/path", "value": 1}], after)
+        events = tracker.poll()
+        assert [(e.kind, e.event_index) for e in events] == [("event", 1), ("event", 2)]
+        assert tracker.document == after
+        assert tracker.stats["patch_failures"] == 1
+        assert feed.calls[-1] == "liveGameV1"
+
+    def test_full_document_instead_of_diff(self, tracker, feed):
+        """Test a full document returned by the diff endpoint replaces the document."""
+        tracker.poll()
+        after = game("t1", [play(0, 2, complete=True), play(1, 1), play(2, 1)])
+        feed.timecodes.append("t1")
+        feed.patches.append(after)
+        kinds = [event.kind for event in tracker.poll()]
+        assert kinds == ["play", "event"]
+        assert tracker.timecode == "t1"
+
+    def test_stream_until_final(self, tracker, feed):
+        """Test stream() sleeps the feed's wait between polls and stops at Final."""
+        tracker.poll()
+        feed.advance(
+            "t1",
+            [
+                {
+                    "op": "replace",
+                    "path": "/gameData/status",
+                    "value": {"abstractGameState": "Final", "detailedState": "Final"},
+                }
+            ],
+            game("t1", [], state="Final"),
+        )
+        assert [event.kind for event in tracker.stream()] == ["status"]
+        assert tracker.is_final
+        tracker.sleep.assert_not_called()
+
+        idle = LiveGameTracker(game_pk=1, api=Mock(Game=FakeGame(game("t0", []))), sleep=Mock())
+        list(idle.stream(max_polls=3))
+        assert idle.sleep.call_count == 3
+        idle.sleep.assert_called_with(10)
+
+    def test_bandwidth(self):
+        """Test a pitch-by-pitch poll downloads an order of magnitude less than the feed."""
+        feed = FakeGame(game("t0", [play(i, 6, complete=True) for i in range(80)]))
+        tracker = LiveGameTracker(game_pk=1, api=Mock(Game=feed))
+        tracker.poll()
+        full = tracker.stats["bytes"]
+        for i in range(1, 11):
+            pitch = {"op": "add", "path": "/liveData/plays/allPlays/79/playEvents/-", "value": {}}
+            feed.advance(f"t{i}", [pitch], feed.document)
+            assert len(tracker.poll()) == 1
+        assert tracker.stats["full_fetches"] == 1
+        assert tracker.stats["patches"] == 10
+        assert (tracker.stats["bytes"] - full) / 10 < full / 10
@@ -0,0 +1,295 @@
+"""
+Unit tests for client-side rate limiting.
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pymlb_statsapi.model.factory import Endpoint, build_response
+from pymlb_statsapi.model.ratelimit import (
+    FileLockBucket,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from pymlb_statsapi.model.registry import StatsAPI
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def response(status: int = 200, headers: dict | None = None):
+    return build_response(
+        url="https://statsapi.mlb.com/api/v1/schedule",
+        status_code=status,
+        content=b'{"dates": []}',
+        headers=headers or {},
+    )
+
+
+@pytest.fixture
+def sample_endpoint():
+    schema = {
+        "apis": [
+            {
+                "path": "/v1/schedule",
+                "description": "schedule",
+                "operations": [
+                    {
+                        "method": "GET",
+                        "nickname": "schedule",
+                        "summary": "Get schedule",
+                        "notes": "",
+                        "parameters": [
+                            {
+                                "name": "sportId",
+                                "paramType": "query",
+                                "type": "integer",
+                                "required": False,
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+    return Endpoint(
+        endpoint_name="schedule",
+        schema=schema,
+        endpoint_config={"schedule": {"path": "/v1/schedule"}},
+    )
+
+
+class TestTokenBucket:
+    """Test the in-process token bucket."""
+
+    def test_burst_then_rate(self):
+        """Test a full bucket serves burst requests immediately, then one per 1/rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self):
+        """Test tokens come back at the configured rate, capped at burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now += 0.5
+        assert bucket.reserve() == 0.0
+        clock.now += 100
+        assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_pause(self):
+        """Test a pause delays reservations and only one token is left when it ends."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=5, clock=clock)
+        bucket.pause(10)
+        assert bucket.reserve() == pytest.approx(10.0)
+        assert bucket.reserve() == pytest.approx(11.0)
+        clock.now += 12
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_throttle_and_recover(self):
+        """Test the rate drops to a floor when throttled and recovers up to base_rate."""
+        bucket = TokenBucket(rate=10, clock=FakeClock())
+        bucket.throttle(0.5, min_rate=3)
+        assert bucket.rate == 5
+        bucket.throttle(0.5, min_rate=3)
+        assert bucket.rate == 3
+        bucket.recover(4)
+        assert bucket.rate == 7
+        bucket.recover(4)
+        assert bucket.rate == 10
+
+    def test_thread_safe(self):
+        """Test concurrent reservations hand out each token exactly once."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=100, clock=clock)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                wait = bucket.reserve()
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert waits.count(0.0) == 100
+        assert sorted(w for w in waits if w) == pytest.approx(list(range(1, 101)))
+
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected."""
+        with pytest.raises(AssertionError, match="rate must be positive"):
+            TokenBucket(rate=0)
+
+
+class TestFileLockBucket:
+    """Test the cross-process file bucket."""
+
+    def test_state_shared_between_instances(self, tmp_path):
+        """Test two buckets on the same file draw from one budget."""
+        path = tmp_path / "global.bucket"
+        first = FileLockBucket(path, rate=0.001, burst=2)
+        second = FileLockBucket(path, rate=0.001, burst=2)
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() > 0
+        assert path.stat().st_size == 24
+
+    def test_pause_is_shared(self, tmp_path):
+        """Test a pause recorded by one instance delays the other."""
+        path = tmp_path / "global.bucket"
+        FileLockBucket(path, rate=100, burst=10).pause(30)
+        assert FileLockBucket(path, rate=100, burst=10).reserve() > 29
+
+
+class TestRetryAfter:
+    """Test Retry-After parsing."""
+
+    def test_seconds(self):
+        """Test delay-seconds values."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+        assert parse_retry_after("-3") == 0.0
+
+    def test_http_date(self):
+        """Test HTTP-date values are converted to a delay."""
+        now = datetime(2024, 10, 27, 12, 0, tzinfo=timezone.utc)
+        value = format_datetime(now + timedelta(seconds=90), usegmt=True)
+        assert parse_retry_after(value, now=now.timestamp()) == pytest.approx(90)
+
+    def test_missing_or_malformed(self):
+        """Test missing or unparseable values return None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRateLimiter:
+    """Test global/per-endpoint budgets and server adaptation."""
+
+    def test_global_and_endpoint_buckets(self):
+        """Test a request waits for the slower of the global and endpoint buckets."""
+        limiter = RateLimiter(rate=100, burst=100, endpoint_limits={"game": (1, 1)})
+        assert limiter.reserve("game") == 0.0
+        assert limiter.reserve("game") == pytest.approx(1.0, abs=0.05)
+        assert limiter.reserve("schedule") == 0.0
+
+    def test_disabled_by_default(self):
+        """Test no global bucket exists without a rate."""
+        limiter = RateLimiter(rate=0)
+        assert limiter.global_bucket is None
+        assert limiter.reserve("game") == 0.0
+        assert RateLimiter.from_env() is None
+
+    def test_acquire_sleeps(self):
+        """Test acquire sleeps for the reserved wait."""
+        sleeps = []
+        limiter = RateLimiter(rate=1, burst=1, sleep=sleeps.append)
+        limiter.acquire("game")
+        limiter.acquire("game")
+        assert sleeps == [pytest.approx(1.0, abs=0.05)]
+        assert limiter.waited == pytest.approx(1.0, abs=0.05)
+
+    def test_aacquire(self):
+        """Test the async acquire awaits instead of blocking."""
+        limiter = RateLimiter(rate=1, burst=1, sleep=None)
+
+        async def run():
+            return [await limiter.aacquire("game") for _ in range(2)]
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            waits = asyncio.run(run())
+        assert waits[0] == 0.0
+        mock_sleep.assert_awaited_once_with(waits[1])
+        assert waits[1] == pytest.approx(1.0, abs=0.05)
+
+    def test_429_pauses_and_throttles(self):
+        """Test a 429 with Retry-After pauses and halves every bucket that applies."""
+        limiter = RateLimiter(rate=10, endpoint_limits={"game": 4})
+        limiter.observe("game", response(429, {"Retry-After": "5"}))
+        assert limiter.throttled == 1
+        assert limiter.global_bucket.rate == 5
+        assert limiter.endpoint_buckets["game"].rate == 2
+        assert limiter.reserve("schedule") > 4.9
+
+        for _ in range(20):
+            limiter.observe("game", response(200))
+        assert limiter.global_bucket.rate == 10
+        assert limiter.endpoint_buckets["game"].rate == 4
+
+    def test_429_without_retry_after(self):
+        """Test a bare 429 pauses for DEFAULT_PAUSE."""
+        limiter = RateLimiter(rate=10, burst=10)
+        limiter.observe("game", response(429))
+        assert limiter.reserve("game") == pytest.approx(RateLimiter.DEFAULT_PAUSE, abs=0.05)
+
+    def test_retry_after_on_other_status(self):
+        """Test Retry-After on a 503 is honoured, capped at max_pause."""
+        limiter = RateLimiter(rate=10, max_pause=2)
+        limiter.observe("game", response(503, {"Retry-After": "600"}))
+        assert limiter.reserve("game") == pytest.approx(2.0, abs=0.05)
+
+    def test_shared_lock_dir(self, tmp_path):
+        """Test limiters pointed at the same directory share budgets."""
+        first = RateLimiter(rate=0.001, burst=1, lock_dir=tmp_path)
+        second = RateLimiter(rate=0.001, burst=1, lock_dir=tmp_path)
+        assert isinstance(first.global_bucket, FileLockBucket)
+        assert first.reserve("game") == 0.0
+        assert second.reserve("game") > 0
+
+
+class TestEndpointIntegration:
+    """Test the limiter is used around every HTTP attempt."""
+
+    @patch("requests.Session.get")
+    def test_acquire_and_observe_per_attempt(self, mock_get, sample_endpoint):
+        """Test each attempt takes a token and each response is observed."""
+        sleeps = []
+        sample_endpoint.rate_limiter = RateLimiter(rate=1, burst=1, sleep=sleeps.append)
+        mock_get.side_effect = [response(429, {"Retry-After": "3"}), response(200)]
+
+        with patch("pymlb_statsapi.model.factory.sleep"):
+            result = sample_endpoint.schedule()
+
+        assert result.status_code == 200
+        assert mock_get.call_count == 2
+        # Second attempt waited out the Retry-After pause
+        assert sleeps and sleeps[0] > 2.9
+        assert sample_endpoint.rate_limiter.throttled == 1
+
+    def test_registry_shares_limiter(self):
+        """Test every endpoint of a registry uses the registry's limiter."""
+        limiter = RateLimiter(rate=5)
+        api = StatsAPI(rate_limiter=limiter)
+        assert api.Game.rate_limiter is limiter
+        assert api.Schedule.rate_limiter is limiter
+
+    def test_registry_reads_env(self):
+        """Test the registry builds a limiter from the environment when none is passed."""
+        with patch.object(RateLimiter, "RATE", 3.0):
+            api = StatsAPI()
+        assert api.rate_limiter.global_bucket.base_rate == 3.0
+        assert StatsAPI().rate_limiter is None
@@ -0,0 +1,148 @@
+"""
+Unit tests for the retry policy and retry budget.
+"""
+
+import random
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pymlb_statsapi.model.factory import build_response
+from pymlb_statsapi.model.registry import StatsAPI
+from pymlb_statsapi.model.retry import RequestFailedError, RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def failed(status: int, headers: dict | None = None) -> RequestFailedError:
+    return RequestFailedError(
+        build_response(
+            url="https://statsapi.mlb.com/api/v1/schedule",
+            status_code=status,
+            content=b"error",
+            headers=headers or {},
+        )
+    )
+
+
+class TestRetryPolicy:
+    """Test retry decisions and delays."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_retryable_statuses(self, status):
+        """Test throttling and server errors are retried."""
+        assert RetryPolicy().is_retryable(failed(status))
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+    def test_client_errors_fail_fast(self, status):
+        """Test client errors are not retried."""
+        assert RetryPolicy().next_delay(0, failed(status)) is None
+
+    def test_transport_errors_are_retryable(self):
+        """Test connection errors and timeouts are retried; other errors are not."""
+        policy = RetryPolicy()
+        assert policy.is_retryable(requests.exceptions.ConnectionError("down"))
+        assert policy.is_retryable(requests.exceptions.Timeout("slow"))
+        assert not policy.is_retryable(ValueError("bug"))
+
+    def test_full_jitter_bounds(self):
+        """Test delays are uniform below a cap that doubles per attempt up to max_delay."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3, rng=random.Random(7))
+        for attempt, cap in enumerate([0.5, 1, 2, 3, 3]):
+            samples = [policy.backoff(attempt) for _ in range(200)]
+            assert all(0 <= s <= cap for s in samples)
+            assert max(samples) > cap * 0.8
+
+    def test_max_retries(self):
+        """Test no delay is offered once max_retries attempts were retried."""
+        policy = RetryPolicy(max_retries=2)
+        error = failed(503)
+        assert policy.next_delay(1, error) is not None
+        assert policy.next_delay(2, error) is None
+
+    def test_retry_after_is_minimum_delay(self):
+        """Test Retry-After raises the delay, and an excessive one is not retried."""
+        policy = RetryPolicy(base_delay=0.1, max_retry_after=60)
+        assert policy.next_delay(0, failed(429, {"Retry-After": "5"})) == 5
+        assert policy.next_delay(0, failed(503, {"Retry-After": "600"})) is None
+
+    def test_error_message_unchanged(self):
+        """Test the error keeps the historical AssertionError message."""
+        error = failed(404)
+        assert isinstance(error, AssertionError)
+        assert str(error) == "Request failed with status 404: error"
+
+
+class TestRetryBudget:
+    """Test the retry budget."""
+
+    def test_spend_until_exhausted(self):
+        """Test the initial balance allows max_tokens retries, then none."""
+        budget = RetryBudget(max_tokens=3, min_per_second=0, clock=FakeClock())
+        assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+    def test_requests_earn_retries(self):
+        """Test each request earns ``ratio`` of a retry."""
+        budget = RetryBudget(ratio=0.25, max_tokens=5, min_per_second=0, clock=FakeClock())
+        while budget.try_spend():
+            pass
+        for _ in range(4):
+            budget.record_request()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+    def test_time_earns_retries(self):
+        """Test the balance refills at min_per_second, capped at max_tokens."""
+        clock = FakeClock()
+        budget = RetryBudget(max_tokens=2, min_per_second=0.5, clock=clock)
+        budget.try_spend()
+        budget.try_spend()
+        assert not budget.try_spend()
+        clock.now += 2
+        assert budget.try_spend()
+        clock.now += 100
+        assert budget.tokens == 2
+
+    def test_exhausted_budget_stops_retries(self):
+        """Test the policy gives up on a retryable error when the budget is empty."""
+        budget = RetryBudget(max_tokens=1, min_per_second=0, clock=FakeClock())
+        policy = RetryPolicy(budget=budget)
+        assert policy.next_delay(0, failed(503)) is not None
+        assert policy.next_delay(0, failed(503)) is None
+
+
+class TestRegistryRetries:
+    """Test the policy is shared across a registry's endpoints."""
+
+    def test_shared_policy(self):
+        """Test every endpoint uses the registry's policy, so the budget is global."""
+        policy = RetryPolicy()
+        api = StatsAPI(retry_policy=policy)
+        assert api.Game.retry_policy is policy
+        assert api.Schedule.retry_policy is policy
+        assert StatsAPI().Game.retry_policy is not None
+
+    @patch("pymlb_statsapi.model.factory.sleep")
+    @patch("requests.Session.get")
+    def test_outage_bounded_by_budget(self, mock_get, mock_sleep):
+        """Test an outage costs about (1 + ratio) calls per request, not 1 + max_retries."""
+        budget = RetryBudget(ratio=0.2, max_tokens=2, min_per_second=0, clock=FakeClock())
+        api = StatsAPI(retry_policy=RetryPolicy(max_retries=3, budget=budget))
+        mock_get.side_effect = requests.exceptions.ConnectionError("down")
+
+        for _ in range(20):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                api.Game.boxscore(game_pk=1)
+
+        # 20 first attempts + 2 initial tokens + 0.2 per request
+        assert mock_get.call_count <= 20 + 2 + 20 * 0.2 + 1
+        assert mock_get.call_count < 20 * 4
@@ -0,0 +1,219 @@
+"""
+Unit tests for the multi-game live scheduler.
+"""
+
+import asyncio
+import copy
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from pymlb_statsapi.model.scheduler import LiveScheduler
+
+NOW = datetime(2024, 7, 13, 23, 0, tzinfo=timezone.utc)
+
+
+def response(body) -> Mock:
+    return Mock(content=json.dumps(body).encode(), json=Mock(return_value=copy.deepcopy(body)))
+
+
+def feed(timecode: str, state: str = "Live", detailed: str = "In Progress", plays=()) -> dict:
+    return {
+        "metaData": {"timeStamp": timecode},
+        "gameData": {"status": {"abstractGameState": state, "detailedState": detailed}},
+        "liveData": {"plays": {"allPlays": list(plays)}, "linescore": {"inningState": "Top"}},
+    }
+
+
+class FakeGames:
+    """Game endpoint serving one feed per game; a new timecode replaces the whole feed."""
+
+    def __init__(self):
+        self.feeds: dict[int, dict] = {}
+        self.calls: list[tuple[str, int]] = []
+
+    def liveGameV1(self, game_pk):
+        self.calls.append(("liveGameV1", game_pk))
+        return response(self.feeds[game_pk])
+
+    def liveTimestampv11(self, game_pk):
+        self.calls.append(("liveTimestampv11", game_pk))
+        return response([self.feeds[game_pk]["metaData"]["timeStamp"]])
+
+    def liveGameDiffPatchV1(self, game_pk, startTimecode):
+        self.calls.append(("liveGameDiffPatchV1", game_pk))
+        return response(self.feeds[game_pk])
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def games() -> FakeGames:
+    games = FakeGames()
+    games.feeds[1] = feed("t0")
+    games.feeds[2] = feed("t0", state="Preview", detailed="Pre-Game")
+    return games
+
+
+@pytest.fixture
+def schedule() -> Mock:
+    return Mock(
+        return_value=response(
+            {
+                "dates": [
+                    {
+                        "games": [
+                            {"gamePk": 1, "status": {"abstractGameState": "Live"}},
+                            {
+                                "gamePk": 2,
+                                "gameDate": "2024-07-13T23:10:00Z",
+                                "status": {"abstractGameState": "Preview"},
+                            },
+                            {
+                                "gamePk": 3,
+                                "gameDate": "2024-07-14T02:10:00Z",
+                                "status": {"abstractGameState": "Preview"},
+                            },
+                            {"gamePk": 4, "status": {"abstractGameState": "Final"}},
+                        ]
+                    }
+                ]
+            }
+        )
+    )
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def scheduler(games, schedule, clock) -> LiveScheduler:
+    api = Mock(Game=games, Schedule=Mock(schedule=schedule))
+    return LiveScheduler(
+        api=api,
+        sport_ids=[1, 11],
+        live_interval=10,
+        discover_interval=120,
+        clock=clock,
+        now=lambda: NOW,
+        sleep=clock.sleep,
+    )
+
+
+class TestLiveScheduler:
+    """Test discovery, adaptive intervals, events and metrics."""
+
+    def test_discover(self, scheduler, schedule):
+        """Test live games and games starting soon are tracked; later and final ones aren't."""
+        assert scheduler.discover() == [1, 2]
+        schedule.assert_called_once_with(sportId=[1, 11], date="2024-07-13")
+        assert scheduler.discover() == []
+        assert sorted(scheduler.games) == [1, 2]
+
+    def test_intervals_follow_phase_and_activity(self, scheduler, games, clock):
+        """Test intervals depend on the phase, stretch while idle and reset on changes."""
+        scheduler.run_pending()
+        assert scheduler.games[1].phase == "live"
+        assert scheduler.games[1].interval == 15
+        assert scheduler.games[2].phase == "warmup"
+        assert scheduler.games[2].interval == 90
+
+        intervals = []
+        for _ in range(4):
+            clock.now = scheduler.games[1].due
+            scheduler.run_pending()
+            intervals.append(scheduler.games[1].interval)
+        assert intervals == [22.5, 33.75, 40, 40]
+
+        games.feeds[1] = feed("t1", plays=[{"about": {"atBatIndex": 0}, "playEvents": []}])
+        games.feeds[1]["liveData"]["linescore"]["inningState"] = "Middle"
+        clock.now = scheduler.games[1].due
+        assert [event.kind for _, event in scheduler.run_pending()] == ["play"]
+        assert scheduler.games[1].phase == "break"
+        assert scheduler.games[1].interval == 30
+
+        games.feeds[1] = feed("t2", detailed="Delayed: Rain")
+        clock.now = scheduler.games[1].due
+        scheduler.run_pending()
+        assert scheduler.games[1].phase == "delayed"
+        assert scheduler.games[1].interval == 120
+
+    def test_only_due_games_are_polled(self, scheduler, games, clock):
+        """Test a poll cycle only requests games whose interval has elapsed."""
+        scheduler.run_pending()
+        games.calls.clear()
+        clock.now = 20
+        scheduler.run_pending()
+        assert games.calls == [("liveTimestampv11", 1)]
+        assert scheduler.time_until_next() == pytest.approx(scheduler.games[1].due - 20)
+
+    def test_final_game_dropped_and_events_delivered(self, games, clock, scheduler):
+        """Test on_event receives changes and a final game stops being polled."""
+        received = []
+        scheduler.on_event = lambda game_pk, event: received.append((game_pk, event.kind))
+        scheduler.run_pending()
+        games.feeds[1] = feed("t1", state="Final", detailed="Final")
+        clock.now = scheduler.games[1].due
+        scheduler.run_pending()
+        assert received == [(1, "status")]
+        assert 1 not in scheduler.games
+        assert scheduler.finished[1]["phase"] == "final"
+
+        clock.now = 1000
+        scheduler.run_pending()
+        assert sorted(scheduler.games) == [2]
+
+    def test_failed_poll_is_rescheduled(self, scheduler, games, clock):
+        """Test a failing game is backed off instead of stopping the scheduler."""
+        scheduler.run_pending()
+        games.liveTimestampv11 = Mock(side_effect=ConnectionError("boom"))
+        clock.now = scheduler.games[1].due
+        assert scheduler.run_pending() == []
+        assert scheduler.games[1].errors == 1
+        assert scheduler.games[1].due > clock.now
+
+    def test_metrics(self, scheduler, clock):
+        """Test lag and per-game request counts are reported."""
+        scheduler.run_pending()
+        clock.now = scheduler.games[1].due + 2
+        scheduler.run_pending()
+        metrics = scheduler.metrics()
+        assert metrics["tracked"] == 2
+        assert metrics["games"][1]["requests"] == 2
+        assert metrics["requests"] == 3
+        assert metrics["requests_per_game"] == 1.5
+        assert metrics["lag"]["max"] == 2
+        assert metrics["discoveries"] == 1
+
+    def test_run_and_events(self, scheduler, games, clock):
+        """Test run() sleeps until the next due poll and events() yields changes."""
+        scheduler.run(max_cycles=3)
+        assert clock.now == 15 + 22.5 + 33.75
+        assert scheduler.metrics()["games"][1]["polls"] == 3
+
+        async def first_change():
+            games.feeds[1] = feed("t1", detailed="Manager challenge")
+            async for change in scheduler.events():
+                scheduler.stop()
+                return change
+
+        clock.now = scheduler.games[1].due
+        game_pk, event = asyncio.run(first_change())
+        assert (game_pk, event.kind, event.data["detailedState"]) == (
+            1,
+            "status",
+            "Manager challenge",
+        )
@@ -0,0 +1,120 @@
+"""
+Unit tests for the append-only segment log.
+"""
+
+import os
+
+import pytest
+
+from pymlb_statsapi.model.factory import APIResponse, build_response
+from pymlb_statsapi.model.segments import SegmentLog
+
+
+def diff_patch(timecode: str, body: bytes = b'[{"op": "replace"}]') -> APIResponse:
+    return APIResponse(
+        build_response(
+            f"https://statsapi.mlb.com/api/v1.1/game/1/feed/live/diffPatch?startTimecode={timecode}",
+            200,
+            body,
+            {"Content-Type": "application/json"},
+            20.0,
+        ),
+        endpoint_name="game",
+        method_name="liveGameDiffPatchV1",
+        path_params={"game_pk": "1"},
+        query_params={"startTimecode": timecode},
+        timestamp=f"2024-07-13T{timecode[-6:-4]}:{timecode[-4:-2]}:{timecode[-2:]}+00:00",
+    )
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / "segments")
+
+
+class TestSegmentLog:
+    """Test appends, random access, scans, rolling and crash recovery."""
+
+    def test_append_and_get(self, directory):
+        """Test records are found by key and rebuilt as APIResponses."""
+        with SegmentLog(directory) as log:
+            first = log.append(diff_patch("20240713_190000"))
+            log.append(diff_patch("20240713_190010", b"[]"))
+            response = log.get("game/liveGameDiffPatchV1/game_pk=1/startTimecode=20240713_190010")
+
+            assert first == {
+                "key": "game/liveGameDiffPatchV1/game_pk=1/startTimecode=20240713_190000",
+                "timestamp": "2024-07-13T19:00:00+00:00",
+                "segment": 1,
+                "offset": 0,
+                "length": first["length"],
+            }
+            assert response.json() == []
+            assert response.timestamp == "2024-07-13T19:00:10+00:00"
+            assert response.headers["Content-Type"] == "application/json"
+            assert response.get_path() == (
+                "game/liveGameDiffPatchV1/game_pk=1/startTimecode=20240713_190010"
+            )
+            assert log.get("game/liveGameDiffPatchV1/game_pk=2") is None
+            assert list(log.keys("game/")) == [first["key"], response.get_path()]
+
+    def test_latest_version_and_at(self, directory):
+        """Test repeated keys keep every version; get returns the latest as of ``at``."""
+        with SegmentLog(directory) as log:
+            response = diff_patch("20240713_190000")
+            log.append(response)
+            response.timestamp = "2024-07-13T20:00:00+00:00"
+            response.response._content = b"[1]"
+            log.append(response)
+            key = response.get_path()
+
+            assert log.get(key).json() == [1]
+            assert log.get(key, at="2024-07-13T19:30:00+00:00").json() == [{"op": "replace"}]
+            assert len(log.versions(key)) == 2
+
+    def test_rolling_segments_and_scan(self, directory):
+        """Test segments roll at the size limit and scans read everything in order."""
+        timecodes = [f"20240713_19{m:02d}00" for m in range(10)]
+        with SegmentLog(directory, segment_bytes=300) as log:
+            log.append_many([diff_patch(t) for t in timecodes])
+            assert len(log.segments()) > 2
+            assert len(log) == 10
+            scanned = [r.query_params["startTimecode"] for r in log.scan()]
+        assert scanned == timecodes
+
+        # Random access across segments after reopening
+        with SegmentLog(directory, segment_bytes=300) as log:
+            key = "game/liveGameDiffPatchV1/game_pk=1/startTimecode=20240713_190500"
+            assert log.get(key).query_params["startTimecode"] == "20240713_190500"
+            log.append(diff_patch("20240713_191000"))
+            assert len(log) == 11
+
+    def test_torn_tail_is_truncated(self, directory):
+        """Test a partial record from a crash is dropped and appends continue after it."""
+        with SegmentLog(directory) as log:
+            log.append(diff_patch("20240713_190000"))
+            path, size = log.segment_path(1), os.path.getsize(log.segment_path(1))
+        with open(path, "ab") as f:
+            f.write(b"MLBR\x01\xff\xff")
+
+        with SegmentLog(directory) as log:
+            assert os.path.getsize(path) == size
+            log.append(diff_patch("20240713_190010"))
+            assert [r.query_params["startTimecode"] for r in log.scan()] == [
+                "20240713_190000",
+                "20240713_190010",
+            ]
+
+    def test_index_recovery(self, directory):
+        """Test records missing from the index are re-indexed, or the index rebuilt."""
+        with SegmentLog(directory, compress=False) as log:
+            log.append_many([diff_patch("20240713_190000"), diff_patch("20240713_190010")])
+            # A crash between writing a record and indexing it
+            log._conn.execute("DELETE FROM records WHERE offset > 0")
+        with SegmentLog(directory) as log:
+            assert len(log) == 2
+            log._conn.execute("DELETE FROM records")
+            assert log.rebuild_index() == 2
+            assert log.get(
+                "game/liveGameDiffPatchV1/game_pk=1/startTimecode=20240713_190010"
+            ).json() == [{"op": "replace"}]
@@ -0,0 +1,144 @@
+"""
+Unit tests for the connection-pooled HTTPSession.
+"""
+
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import requests
+
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.factory import Endpoint
+from pymlb_statsapi.model.session import HTTPSession
+
+
+def _schedule_endpoint(session=None):
+    schema = {
+        "apis": [
+            {
+                "path": "/v1/schedule",
+                "operations": [
+                    {
+                        "method": "GET",
+                        "nickname": "schedule",
+                        "summary": "Get schedule",
+                        "parameters": [
+                            {
+                                "name": "sportId",
+                                "paramType": "query",
+                                "type": "integer",
+                                "required": False,
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+    return Endpoint(
+        endpoint_name="schedule",
+        schema=schema,
+        endpoint_config={"schedule": {"path": "/v1/schedule"}},
+        session=session,
+    )
+
+
+def _ok_response():
+    response = Mock(spec=requests.Response)
+    response.status_code = 200
+    response.ok = True
+    response.url = "https://statsapi.mlb.com/api/v1/schedule?sportId=1"
+    response.headers = {"Content-Type": "application/json"}
+    response.content = b'{"dates": []}'
+    response.elapsed = timedelta(milliseconds=10)
+    response.json.return_value = {"dates": []}
+    return response
+
+
+class TestHTTPSession:
+    """Test HTTPSession pooling and lifecycle."""
+
+    def test_session_is_lazy(self):
+        """No requests.Session is built until first use."""
+        session = HTTPSession()
+        assert not session.is_open
+        assert isinstance(session.session, requests.Session)
+        assert session.is_open
+
+    def test_session_reused_across_calls(self):
+        """The same requests.Session is returned every time."""
+        session = HTTPSession()
+        assert session.session is session.session
+
+    def test_default_headers(self):
+        """Keep-alive and gzip headers are set on the pooled session."""
+        session = HTTPSession(headers={"User-Agent": "pymlb-test"})
+        headers = session.session.headers
+        assert headers["Accept-Encoding"] == "gzip"
+        assert headers["Connection"] == "keep-alive"
+        assert headers["User-Agent"] == "pymlb-test"
+
+    def test_pool_sizing(self):
+        """Default and per-host pool sizes are applied to mounted adapters."""
+        session = HTTPSession(pool_maxsize=4, host_pool_sizes={"statsapi.mlb.com": 32})
+        default_adapter = session.session.get_adapter("https://example.com/")
+        host_adapter = session.session.get_adapter("https://statsapi.mlb.com/api/v1/schedule")
+        assert default_adapter._pool_maxsize == 4
+        assert host_adapter._pool_maxsize == 32
+        assert host_adapter.max_retries.total == 0
+
+    def test_close_and_reopen(self):
+        """close() drops the pool; the next request opens a new one."""
+        session = HTTPSession()
+        first = session.session
+        session.close()
+        assert not session.is_open
+        assert session.session is not first
+
+    def test_context_manager_closes(self):
+        """Using HTTPSession as a context manager closes it on exit."""
+        with HTTPSession() as session:
+            assert session.session is not None
+            assert session.is_open
+        assert not session.is_open
+
+    @patch("requests.Session.get")
+    def test_endpoint_uses_session(self, mock_get):
+        """Endpoint requests go through the shared session with the configured timeout."""
+        mock_get.return_value = _ok_response()
+        session = HTTPSession()
+        endpoint = _schedule_endpoint(session=session)
+
+        endpoint.schedule(sportId=1)
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[0][0] == "https://statsapi.mlb.com/api/v1/schedule?sportId=1"
+        assert mock_get.call_args[1]["timeout"] == Endpoint.TIMEOUT
+        assert endpoint.session is session
+
+
+class TestStatsAPISession:
+    """Test that the registry owns and shares one session."""
+
+    def test_endpoints_share_registry_session(self):
+        """Every endpoint reuses the registry's session."""
+        registry = StatsAPI()
+        sessions = {
+            id(registry.get_endpoint(name).session) for name in registry.get_endpoint_names()
+        }
+        assert sessions == {id(registry.session)}
+
+    def test_registry_close_owned_session(self):
+        """close() closes a session created by the registry."""
+        with StatsAPI() as registry:
+            assert registry.session.session is not None
+        assert not registry.session.is_open
+
+    def test_registry_does_not_close_external_session(self):
+        """A caller-provided session is left open."""
+        session = HTTPSession()
+        assert session.session is not None
+        registry = StatsAPI(session=session)
+        registry.close()
+        assert session.is_open
+        session.close()
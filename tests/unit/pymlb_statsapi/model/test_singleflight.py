@@ -0,0 +1,226 @@
+"""
+Unit tests for request coalescing (single-flight).
+"""
+
+import asyncio
+import threading
+import time
+
+from pymlb_statsapi.model.aio import AsyncEndpoint
+from pymlb_statsapi.model.factory import Endpoint, build_response
+from pymlb_statsapi.model.instrumentation import Instrumentation
+from pymlb_statsapi.model.registry import StatsAPI
+from pymlb_statsapi.model.singleflight import SingleFlight
+
+SCHEMA = {
+    "apis": [
+        {
+            "path": "/v1/schedule",
+            "description": "schedule",
+            "operations": [
+                {
+                    "method": "GET",
+                    "nickname": "schedule",
+                    "summary": "Get schedule",
+                    "notes": "",
+                    "parameters": [
+                        {
+                            "name": "sportId",
+                            "paramType": "query",
+                            "type": "integer",
+                            "required": False,
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+}
+
+
+def wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class BlockingSession:
+    """Session whose requests block until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.urls: list[str] = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        assert self.release.wait(5)
+        return build_response(url, 200, b'{"dates": []}')
+
+
+class SlowAsyncSession:
+    def __init__(self):
+        self.urls: list[str] = []
+
+    async def get(self, url, timeout=None):
+        self.urls.append(url)
+        await asyncio.sleep(0.01)
+        return build_response(url, 200, b'{"dates": []}')
+
+
+def call_in_threads(fn, n: int) -> tuple[list[threading.Thread], list]:
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fn())) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class TestSingleFlight:
+    """Test the coalescer on its own."""
+
+    def test_concurrent_calls_share_one_flight(self):
+        """Test callers arriving while a call is in flight wait for and share its result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            assert release.wait(5)
+            return "body"
+
+        threads, results = call_in_threads(lambda: flight.do("url", fetch), 8)
+        wait_until(lambda: flight.stats()["calls"] == 8)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(results) == [("body", False)] + [("body", True)] * 7
+        assert flight.stats() == {"calls": 8, "coalesced": 7, "in_flight": 0}
+        # The key is released: the next call runs again
+        assert flight.do("url", lambda: "again") == ("again", False)
+
+    def test_error_reaches_every_caller(self):
+        """Test the leader's exception is raised in waiting callers too."""
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fetch():
+            assert release.wait(5)
+            raise ConnectionError("down")
+
+        def call():
+            try:
+                flight.do("url", fetch)
+            except ConnectionError as e:
+                errors.append(e)
+
+        threads, _ = call_in_threads(call, 3)
+        wait_until(lambda: flight.stats()["calls"] == 3)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == 3 and len(set(map(id, errors))) == 1
+        assert flight.stats()["in_flight"] == 0
+
+    def test_rules(self):
+        """Test per-endpoint rules, exact names winning over globs."""
+        flight = SingleFlight(rules={"game.*": False, "game.boxscore": True}, default=True)
+        assert flight.enabled_for("schedule", "schedule")
+        assert not flight.enabled_for("game", "liveTimestampv11")
+        assert flight.enabled_for("game", "boxscore")
+        assert not SingleFlight(default=False).enabled_for("schedule", "schedule")
+
+    def test_from_env(self, monkeypatch):
+        """Test the registry default follows PYMLB_STATSAPI__SINGLE_FLIGHT."""
+        assert SingleFlight.from_env() is None
+        assert StatsAPI().single_flight is None
+        monkeypatch.setattr(SingleFlight, "ENABLED", True)
+        assert isinstance(SingleFlight.from_env(), SingleFlight)
+        assert isinstance(StatsAPI().single_flight, SingleFlight)
+
+
+class TestEndpointIntegration:
+    """Test coalescing of identical calls through Endpoint and AsyncEndpoint."""
+
+    def test_identical_calls_share_one_request(self):
+        """Test concurrent identical calls send one request and get their own responses."""
+        session = BlockingSession()
+        instrumentation = Instrumentation()
+        endpoint = Endpoint(
+            "schedule",
+            SCHEMA,
+            {},
+            session=session,
+            single_flight=SingleFlight(),
+            instrumentation=instrumentation,
+        )
+        threads, responses = call_in_threads(lambda: endpoint.schedule(sportId=1), 6)
+        wait_until(lambda: endpoint.single_flight.stats()["calls"] == 6)
+        session.release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(session.urls) == 1
+        assert len({id(response) for response in responses}) == 6
+        assert all(response.json() == {"dates": []} for response in responses)
+        assert instrumentation.metrics.counter("coalesced_total", "schedule", "schedule") == 5
+        assert instrumentation.metrics.counter("requests_total", "schedule", "schedule") == 6
+
+    def test_disabled_method_is_not_coalesced(self):
+        """Test methods turned off by a rule each send their own request."""
+        barrier = threading.Barrier(3, timeout=5)
+        urls = []
+
+        class Session:
+            def get(self, url, **kwargs):
+                urls.append(url)
+                barrier.wait()
+                return build_response(url, 200, b"{}")
+
+        endpoint = Endpoint(
+            "schedule",
+            SCHEMA,
+            {},
+            session=Session(),
+            single_flight=SingleFlight(rules={"schedule.schedule": False}),
+        )
+        threads, responses = call_in_threads(lambda: endpoint.schedule(sportId=1), 3)
+        for thread in threads:
+            thread.join()
+        assert len(urls) == 3 and len(responses) == 3
+
+    def test_async_identical_calls_share_one_request(self):
+        """Test gathered identical coroutines share a request, even if one is cancelled."""
+        session = SlowAsyncSession()
+        endpoint = AsyncEndpoint(
+            "schedule", SCHEMA, {}, session=session, single_flight=SingleFlight()
+        )
+
+        async def run():
+            first = asyncio.ensure_future(endpoint.schedule(sportId=1))
+            await asyncio.sleep(0)
+            others = [endpoint.schedule(sportId=1) for _ in range(4)]
+            others.append(endpoint.schedule(sportId=2))
+            gathered = asyncio.gather(*others)
+            await asyncio.sleep(0)
+            first.cancel()
+            return await gathered
+
+        responses = asyncio.run(run())
+        assert sorted(session.urls) == [
+            "https://statsapi.mlb.com/api/v1/schedule?sportId=1",
+            "https://statsapi.mlb.com/api/v1/schedule?sportId=2",
+        ]
+        assert len(responses) == 5 and all(r.status_code == 200 for r in responses)
+        assert endpoint.single_flight.stats() == {"calls": 6, "coalesced": 4, "in_flight": 0}
+
+    def test_registry_shares_single_flight(self):
+        """Test every endpoint of a registry uses the registry's coalescer."""
+        single_flight = SingleFlight()
+        api = StatsAPI(single_flight=single_flight)
+        assert api.Schedule.single_flight is single_flight
+        assert api.Game.single_flight is single_flight
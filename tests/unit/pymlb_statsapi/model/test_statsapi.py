@@ -2,6 +2,7 @@
 Unit tests for the dynamic API system.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,7 +13,9 @@ from pymlb_statsapi.model.factory import (
     APIResponse,
     Endpoint,
     EndpointMethod,
+    build_response,
 )
+from pymlb_statsapi.utils.codec import get_codec
 
 
 class TestAPIResponse:
@@ -44,10 +47,12 @@ class TestAPIResponse:
         """Test that copyright is removed from JSON response."""
         mock_response = Mock(spec=requests.Response)
         mock_response.url = "https://statsapi.mlb.com/api/v1/schedule"
-        mock_response.json.return_value = {
+        body = {
             "copyright": "Copyright 2024 MLB Advanced Media",
             "dates": [{"date": "2024-07-04"}],
         }
+        mock_response.json.return_value = body
+        mock_response.content = json.dumps(body).encode()
 
         response = APIResponse(
             response=mock_response,
@@ -59,6 +64,32 @@ class TestAPIResponse:
         assert "copyright" not in data
         assert "dates" in data
 
+    def test_json_is_memoized(self):
+        """Test the body is parsed once and shared until a fresh copy is requested."""
+        response = APIResponse(
+            response=build_response(
+                url="https://statsapi.mlb.com/api/v1/schedule",
+                status_code=200,
+                content=b'{"copyright": "MLB", "dates": [{"date": "2024-07-04"}]}',
+            ),
+            endpoint_name="schedule",
+            method_name="schedule",
+        )
+
+        with patch("pymlb_statsapi.model.factory.codec", wraps=get_codec("json")) as codec:
+            first = response.json()
+            assert response.json() is first
+            assert response.to_dict()["data"] is first
+            assert codec.loads.call_count == 1
+
+            fresh = response.json(fresh=True)
+            assert codec.loads.call_count == 2
+
+        assert fresh == first and fresh is not first
+        fresh["dates"].clear()
+        assert response.json()["dates"] == [{"date": "2024-07-04"}]
+        assert "copyright" not in fresh
+
     def test_get_metadata(self):
         """Test get_metadata returns all request and response metadata."""
         from datetime import timedelta
@@ -111,7 +142,7 @@ class TestAPIResponse:
         mock_response.status_code = 200
         mock_response.ok = True
         mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.content = b'{"dates": []}'
+        mock_response.content = b'{"dates": [{"date": "2024-07-04"}]}'
         mock_response.elapsed = Mock()
         mock_response.elapsed.total_seconds.return_value = 0.245
         mock_response.json.return_value = {"dates": [{"date": "2024-07-04"}]}
@@ -265,7 +296,7 @@ class TestEndpointMethod:
         assert query_params["teamId"] == "147,111"
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 class TestDynamicEndpoint:
     """Test DynamicEndpoint class."""
 
@@ -0,0 +1,144 @@
+"""
+Unit tests for slotted struct decoding.
+"""
+
+import gzip
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+from pymlb_statsapi.model.factory import APIResponse, build_response
+from pymlb_statsapi.model.structs import Struct, StructDecoder, decoder, to_builtins
+
+STUB = (
+    Path(__file__).parents[3]
+    / "bdd/stubs/game/liveGameV1/liveGameV1_game_pk=747175_4240fc08a038.json.gz"
+)
+
+
+@pytest.fixture(scope="module")
+def live_game() -> dict:
+    with gzip.open(STUB) as f:
+        return json.load(f)["response"]
+
+
+def make_response(body: dict, endpoint_name="game", method_name="liveGameV1") -> APIResponse:
+    return APIResponse(
+        response=build_response(
+            url="https://statsapi.mlb.com/api/v1.1/game/747175/feed/live",
+            status_code=200,
+            content=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+        ),
+        endpoint_name=endpoint_name,
+        method_name=method_name,
+    )
+
+
+class TestDecode:
+    """Test decoding parsed JSON into structs."""
+
+    def test_round_trip(self, live_game):
+        """Test a recorded live feed decodes without losing anything."""
+        response = make_response(live_game)
+        game = response.decode()
+        assert isinstance(game, Struct)
+        assert to_builtins(game) == response.json()
+
+    def test_attribute_access(self, live_game):
+        """Test nested objects, declared or not, support attribute access."""
+        game = make_response(live_game).decode()
+        assert game.gamePk == live_game["gamePk"]
+        assert game.gameData.teams.home.name == live_game["gameData"]["teams"]["home"]["name"]
+        first_result = live_game["liveData"]["plays"]["allPlays"][0]["result"]
+        assert game.liveData.plays.allPlays[0].result.description == first_result["description"]
+
+    def test_schema_models(self, live_game):
+        """Test objects described by the schema are instances of their model class."""
+        game = make_response(live_game).decode()
+        assert isinstance(game, decoder.model("GameRestObject"))
+        assert isinstance(game.gameData.venue, decoder.model("VenueRestObject"))
+        assert decoder.model("GameRestObject").__annotations__["gamePk"] == "int | None"
+        with pytest.raises(KeyError):
+            decoder.model("NoSuchRestObject")
+
+    def test_missing_keys_read_as_none(self):
+        """Test keys seen on siblings, and declared fields, read as None when absent."""
+        body = {"gamePk": 1, "liveData": {"plays": {"allPlays": [{"a": 1, "b": 2}, {"a": 3}]}}}
+        game = StructDecoder().decode_response(body, "game", "liveGameV1")
+        plays = game.liveData.plays.allPlays
+        assert plays[1].b is None
+        assert game.gameData is None
+        with pytest.raises(AttributeError):
+            plays[0].unknown  # noqa: B018
+
+    def test_mapping_protocol(self):
+        """Test structs support item access, membership, iteration and len."""
+        struct = StructDecoder().decode({"name": "Yankees", "id": 147})
+        assert struct["name"] == "Yankees"
+        assert "id" in struct and "abbreviation" not in struct
+        assert list(struct) == ["name", "id"]
+        assert len(struct) == 2
+        with pytest.raises(KeyError):
+            struct["abbreviation"]  # noqa: B018
+
+    def test_maps_and_odd_keys_stay_dicts(self):
+        """Test id-keyed objects and non-identifier keys are decoded as dicts."""
+        value = {"players": {"ID1": {"id": 1}, "ID2": {"id": 2}}, "x": {"a-b": 1, "_c": 2}}
+        struct = StructDecoder().decode(value)
+        assert isinstance(struct.players, dict)
+        assert struct.players["ID1"].id == 1
+        assert struct.x == {"a-b": 1, "_c": 2}
+
+    def test_shapes_are_shared(self):
+        """Test objects with the same keys in the same place share one class."""
+        structs = StructDecoder().decode([{"a": 1}, {"a": 2}, {"b": 3}])
+        assert type(structs[0]) is type(structs[1])
+        assert type(structs[0]) is not type(structs[2])
+
+    def test_max_shapes(self):
+        """Test new key sets stay dicts once the class limit is reached."""
+        structs = StructDecoder(max_shapes=1).decode([{"a": 1}, {"b": 2}, {"a": 3}])
+        assert isinstance(structs[0], Struct) and isinstance(structs[2], Struct)
+        assert structs[1] == {"b": 2}
+
+    def test_slots_save_memory(self, live_game):
+        """Test structs have no per-instance __dict__."""
+        game = make_response(live_game).decode()
+        play = game.liveData.plays.allPlays[0]
+        assert not hasattr(play, "__dict__")
+        assert sys.getsizeof(play) < sys.getsizeof(live_game["liveData"]["plays"]["allPlays"][0])
+
+    def test_pickle(self, live_game):
+        """Test decoded structs survive pickling."""
+        game = make_response(live_game).decode()
+        assert pickle.loads(pickle.dumps(game)) == game
+
+
+class TestAPIResponseDecode:
+    """Test APIResponse.decode()."""
+
+    def test_memoized(self):
+        """Test decode() returns the same structs each call and drops the copyright."""
+        response = make_response({"copyright": "MLB", "dates": []}, "schedule", "schedule")
+        first = response.decode()
+        assert response.decode() is first
+        assert "copyright" not in first
+        assert first.dates == []
+
+    def test_reuses_parsed_json(self):
+        """Test decode() converts the memoized json() dicts rather than parsing again."""
+        response = make_response({"gamePk": 1})
+        data = response.json()
+        data["gamePk"] = 2
+        assert response.decode().gamePk == 2
+
+    def test_unknown_method(self):
+        """Test a method the schema doesn't know decodes into anonymous structs."""
+        response = make_response({"a": {"b": 1}}, "game", "notAMethod")
+        decoded = response.decode()
+        assert type(decoded).__model__ is None
+        assert decoded.a.b == 1
@@ -0,0 +1,224 @@
+"""
+Unit tests for compiled parameter validation plans.
+"""
+
+import random
+import timeit
+
+import pytest
+
+from pymlb_statsapi import StatsAPI
+from pymlb_statsapi.model.factory import EndpointMethod
+from pymlb_statsapi.model.validation import ValidationPlan
+
+
+def reference_validate(method: EndpointMethod, path_params=None, query_params=None):
+    """Validation as implemented before plans were compiled (the behavior to preserve)."""
+    path_params = dict(path_params or {})
+    query_params = dict(query_params or {})
+
+    validated_path_params = {}
+    for param_def in method.path_params:
+        param_name = param_def["name"]
+        if param_def["required"] and param_name not in path_params:
+            raise AssertionError(f"{method.method_name}: path parameter '{param_name}' is required")
+        if param_name in path_params:
+            value = path_params.pop(param_name)
+            if isinstance(value, list):
+                if len(value) != 1:
+                    raise AssertionError(
+                        f"{method.method_name}: path parameter '{param_name}' must have exactly one value, got {value}"
+                    )
+                value = value[0]
+            if "enum" in param_def and param_def["enum"]:
+                valid_values = {str(v).lower() for v in param_def["enum"]}
+                if str(value).lower() not in valid_values:
+                    raise AssertionError(
+                        f"{method.method_name}: '{param_name}' must be one of {param_def['enum']}, got '{value}'"
+                    )
+            validated_path_params[param_name] = str(value)
+    if path_params:
+        raise AssertionError(
+            f"{method.method_name}: unrecognized path parameters: {list(path_params.keys())}"
+        )
+
+    validated_query_params = {}
+    for param_def in method.query_params:
+        param_name = param_def["name"]
+        if param_def["required"] and param_name not in query_params:
+            raise AssertionError(
+                f"{method.method_name}: query parameter '{param_name}' is required"
+            )
+        if param_name in query_params:
+            value = query_params.pop(param_name)
+            if isinstance(value, list):
+                if not param_def.get("allowMultiple", False) and len(value) > 1:
+                    raise AssertionError(
+                        f"{method.method_name}: query parameter '{param_name}' does not allow multiple values"
+                    )
+                value = ",".join(str(v) for v in value)
+            else:
+                value = str(value)
+            validated_query_params[param_name] = value
+    if query_params:
+        raise AssertionError(
+            f"{method.method_name}: unrecognized query parameters: {list(query_params.keys())}"
+        )
+
+    resolved_path = method.path_template.format(**validated_path_params)
+    return validated_path_params, validated_query_params, resolved_path
+
+
+def outcome(func, *args):
+    """Result (with dict key order) or the exception type and message."""
+    try:
+        path, query, resolved = func(*args)
+    except (AssertionError, KeyError) as e:
+        return type(e), str(e)
+    return list(path.items()), list(query.items()), resolved
+
+
+def make_method(path_params=(), query_params=(), path="/v1/things") -> EndpointMethod:
+    parameters = [{"paramType": "path", "required": True, **p} for p in path_params]
+    parameters += [{"paramType": "query", "required": False, **p} for p in query_params]
+    return EndpointMethod(
+        endpoint_name="things",
+        method_name="things",
+        api_definition={"path": path},
+        operation_definition={"method": "GET", "parameters": parameters},
+        config_path=path,
+    )
+
+
+def random_values(method: EndpointMethod, rng: random.Random) -> tuple[dict, dict]:
+    """Random mix of valid values, lists, enum misses, unknown and missing params."""
+
+    def value(param_def):
+        choice = rng.random()
+        if param_def.get("enum") and choice < 0.5:
+            return rng.choice([*param_def["enum"], "NotAnEnumValue"])
+        if choice < 0.65:
+            return [rng.randint(1, 9) for _ in range(rng.randint(0, 3))]
+        return rng.choice([1, "abc", 2024, True])
+
+    path = {p["name"]: value(p) for p in method.path_params if rng.random() < 0.85}
+    query = {p["name"]: value(p) for p in method.query_params if rng.random() < 0.2}
+    if rng.random() < 0.1:
+        path["unknownPath"] = 1
+    if rng.random() < 0.1:
+        query["unknownQuery"] = 1
+    path = dict(rng.sample(list(path.items()), len(path)))
+    query = dict(rng.sample(list(query.items()), len(query)))
+    return path, query
+
+
+@pytest.fixture(scope="module")
+def all_methods():
+    api = StatsAPI(lazy=False)
+    return [
+        api.get_endpoint(name).get_method(method_name)
+        for name in api.get_endpoint_names()
+        for method_name in api.get_endpoint(name).get_method_names()
+    ]
+
+
+class TestValidationPlan:
+    """Test that compiled plans validate exactly like the original implementation."""
+
+    def test_matches_reference_for_random_calls(self, all_methods):
+        """Test results, key order and first error match for random calls on every method."""
+        rng = random.Random(20241027)
+        for method in all_methods:
+            for _ in range(60):
+                path, query = random_values(method, rng)
+                expected = outcome(reference_validate, method, path, query)
+                assert outcome(method.validate_and_resolve_params, path, query) == expected, (
+                    f"{method} path={path} query={query}"
+                )
+                assert outcome(method.validation_plan.validate_ordered, path, query) == expected
+
+    def test_inputs_are_not_mutated(self, all_methods):
+        """Test the caller's dicts are left untouched."""
+        method = next(m for m in all_methods if m.path_params and m.query_params)
+        path = {p["name"]: "1" for p in method.path_params}
+        query = {method.query_params[0]["name"]: ["a"]}
+        before = (dict(path), dict(query))
+        method.validate_and_resolve_params(path, query)
+        assert (path, query) == before
+
+    def test_schema_order_regardless_of_call_order(self):
+        """Test validated params come back in schema order."""
+        method = make_method(
+            path_params=[{"name": "a"}, {"name": "b"}],
+            query_params=[{"name": "x"}, {"name": "y"}, {"name": "z"}],
+            path="/v1/{a}/{b}",
+        )
+        path, query, resolved = method.validate_and_resolve_params(
+            {"b": 2, "a": 1}, {"z": 3, "x": 1}
+        )
+        assert list(path) == ["a", "b"]
+        assert list(query) == ["x", "z"]
+        assert resolved == "/v1/1/2"
+
+    def test_enum_is_case_insensitive(self):
+        """Test enum values are matched case-insensitively and kept as passed."""
+        method = make_method(
+            path_params=[{"name": "kind", "enum": ["Hitting", "Pitching"]}],
+            path="/v1/{kind}",
+        )
+        assert method.validate_and_resolve_params({"kind": "HITTING"})[2] == "/v1/HITTING"
+        with pytest.raises(AssertionError, match=r"must be one of \['Hitting', 'Pitching'\]"):
+            method.validate_and_resolve_params({"kind": "fielding"})
+
+    def test_duplicate_definitions_use_ordered_walk(self):
+        """Test a param defined twice fails on its second definition, like before."""
+        method = make_method(path_params=[{"name": "id"}, {"name": "id"}], path="/v1/{id}")
+        assert outcome(method.validate_and_resolve_params, {"id": 1}, None) == outcome(
+            reference_validate, method, {"id": 1}, None
+        )
+
+    def test_missing_placeholder_raises_key_error(self):
+        """Test an optional path param missing from the template args raises KeyError."""
+        method = make_method(path_params=[{"name": "id", "required": False}], path="/v1/{id}")
+        with pytest.raises(KeyError):
+            method.validate_and_resolve_params()
+
+    def test_plan_is_cached(self, all_methods):
+        """Test the plan is compiled once per method."""
+        method = all_methods[0]
+        assert method.validation_plan is method.validation_plan
+        assert isinstance(method.validation_plan, ValidationPlan)
+
+
+@pytest.mark.benchmark
+class TestValidationBenchmark:
+    """Micro-benchmarks: validation cost must follow the params passed, not the schema size."""
+
+    @staticmethod
+    def best_of(func, *args, number=2000, repeat=7) -> float:
+        return min(timeit.repeat(lambda: func(*args), number=number, repeat=repeat)) / number
+
+    def test_cost_independent_of_definition_count(self):
+        """Test two params cost about the same on a 400-param method as on a 4-param one."""
+        small = make_method(query_params=[{"name": f"q{i}"} for i in range(4)])
+        large = make_method(query_params=[{"name": f"q{i}"} for i in range(400)])
+        query = {"q1": 1, "q3": "x"}
+
+        small_time = self.best_of(small.validate_and_resolve_params, None, query)
+        large_time = self.best_of(large.validate_and_resolve_params, None, query)
+        ordered_time = self.best_of(large.validation_plan.validate_ordered, None, query)
+
+        assert large_time < 3 * small_time
+        assert large_time * 5 < ordered_time
+
+    def test_hot_method_not_slower_than_ordered_walk(self, all_methods):
+        """Test a real method with many query params validates faster than the full walk."""
+        method = max(all_methods, key=lambda m: len(m.query_params))
+        query = {p["name"]: "1" for p in method.query_params if p["required"]}
+        query.setdefault(method.query_params[-1]["name"], "1")
+        path = {p["name"]: "1" for p in method.path_params}
+        method.validate_and_resolve_params(path, query)
+
+        planned = self.best_of(method.validate_and_resolve_params, path, query)
+        ordered = self.best_of(method.validation_plan.validate_ordered, path, query)
+        assert planned < ordered * 1.25
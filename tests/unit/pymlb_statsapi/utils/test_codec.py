@@ -0,0 +1,91 @@
+"""
+Unit tests for the pluggable JSON codec.
+"""
+
+import importlib.util
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pymlb_statsapi.utils.codec import CODEC_NAMES, JSONCodec, get_codec
+
+INSTALLED = [
+    name for name in CODEC_NAMES if name == "json" or importlib.util.find_spec(name) is not None
+]
+
+DOCUMENT = {
+    "gamePk": 747175,
+    "gameData": {"teams": {"away": {"name": "Yankees"}, "home": {"name": "Dodgers"}}},
+    "plays": [{"speed": 95.1, "desc": "Ohtani — single"}, None, True],
+}
+
+
+@pytest.fixture(params=INSTALLED)
+def installed_codec(request) -> JSONCodec:
+    return get_codec(request.param)
+
+
+class TestCodecs:
+    """Test every installed codec behaves like stdlib json."""
+
+    def test_round_trip(self, installed_codec):
+        """Test dumps/loads round-trips and matches stdlib parsing."""
+        payload = installed_codec.dumps(DOCUMENT)
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == DOCUMENT
+        assert installed_codec.loads(payload) == DOCUMENT
+        assert installed_codec.loads(payload.decode()) == DOCUMENT
+
+    def test_indent(self, installed_codec):
+        """Test indent produces pretty-printed output with the same content."""
+        pretty = installed_codec.dumps(DOCUMENT, indent=2)
+        assert b'\n  "gamePk"' in pretty
+        assert json.loads(pretty) == DOCUMENT
+        assert json.loads(installed_codec.dumps(DOCUMENT, indent=4)) == DOCUMENT
+
+    def test_unsupported_input_falls_back(self, installed_codec):
+        """Test input the fast library rejects is serialized by stdlib json."""
+        assert json.loads(installed_codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_invalid_json_raises(self, installed_codec):
+        """Test malformed input raises ValueError (JSONDecodeError and friends)."""
+        with pytest.raises(ValueError):
+            installed_codec.loads(b"{not json")
+
+
+class TestGetCodec:
+    """Test codec selection."""
+
+    def test_auto_prefers_fastest_installed(self):
+        """Test auto picks the first installed codec in preference order."""
+        assert get_codec("auto").name == INSTALLED[0]
+        assert get_codec().name == INSTALLED[0]
+
+    def test_env_selection(self):
+        """Test PYMLB_STATSAPI__JSON_CODEC selects a codec."""
+        with patch.dict("os.environ", {"PYMLB_STATSAPI__JSON_CODEC": "json"}):
+            assert get_codec().name == "json"
+
+    def test_auto_skips_missing(self):
+        """Test auto falls through to stdlib when no fast library imports."""
+        real_import = __import__
+
+        def no_fast_libs(name, *args, **kwargs):
+            if name in ("orjson", "msgspec", "ujson"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        with patch("builtins.__import__", side_effect=no_fast_libs):
+            assert get_codec("auto").name == "json"
+
+    def test_unknown(self):
+        """Test an unknown codec name is rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("simplejson")
+
+    @pytest.mark.skipif("msgspec" in INSTALLED, reason="msgspec is installed")
+    def test_missing_explicit_codec(self):
+        """Test asking for a specific codec that isn't installed raises ImportError."""
+        with pytest.raises(ImportError):
+            get_codec("msgspec")
@@ -0,0 +1,189 @@
+"""
+Unit tests for columnar play-by-play export.
+"""
+
+import gzip
+import importlib.util
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from pymlb_statsapi.model.factory import APIResponse, build_response
+from pymlb_statsapi.utils.columnar import (
+    EVENT_COLUMNS,
+    TABLES,
+    ColumnarExporter,
+    PlayByPlayExtractor,
+    extract_game,
+)
+
+STUBS = Path(__file__).parents[3] / "bdd/stubs/game"
+LIVE_GAME = STUBS / "liveGameV1/liveGameV1_game_pk=747175_4240fc08a038.json.gz"
+PLAY_BY_PLAY = STUBS / "playByPlay/playByPlay_game_pk=747175_4240fc08a038.json.gz"
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def load(stub: Path) -> dict:
+    with gzip.open(stub) as f:
+        return json.load(f)["response"]
+
+
+@pytest.fixture(scope="module")
+def live_game() -> dict:
+    return load(LIVE_GAME)
+
+
+def make_response(body: dict, method_name: str, game_pk: int = 747175) -> APIResponse:
+    return APIResponse(
+        response=build_response(
+            url=f"https://statsapi.mlb.com/api/v1/game/{game_pk}/{method_name}",
+            status_code=200,
+            content=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+        ),
+        endpoint_name="game",
+        method_name=method_name,
+        path_params={"game_pk": str(game_pk)},
+    )
+
+
+class TestExtract:
+    """Test flattening payloads into columns."""
+
+    def test_row_counts(self, live_game):
+        """Test one row per play, play event and runner, with equal-length columns."""
+        tables = extract_game(live_game)
+        plays = live_game["liveData"]["plays"]["allPlays"]
+        assert len(tables["plays"]) == len(plays)
+        assert len(tables["events"]) == sum(len(p["playEvents"]) for p in plays)
+        assert len(tables["runners"]) == sum(len(p["runners"]) for p in plays)
+        for table in tables.values():
+            assert {len(values) for values in table.data.values()} == {len(table)}
+            assert list(table.data) == [column.name for column in TABLES[table.name]]
+
+    def test_pitch_values(self, live_game):
+        """Test event rows carry play context, pitchData and hitData."""
+        events = extract_game(live_game)["events"].data
+        play = live_game["liveData"]["plays"]["allPlays"][0]
+        for i, event in enumerate(play["playEvents"]):
+            assert events["game_pk"][i] == live_game["gamePk"]
+            assert events["at_bat_index"][i] == play["about"]["atBatIndex"]
+            assert events["pitcher_id"][i] == play["matchup"]["pitcher"]["id"]
+            assert events["is_pitch"][i] == event["isPitch"]
+            pitch = event.get("pitchData", {})
+            assert events["start_speed"][i] == pitch.get("startSpeed")
+            assert events["spin_rate"][i] == pitch.get("breaks", {}).get("spinRate")
+            assert events["launch_speed"][i] == event.get("hitData", {}).get("launchSpeed")
+
+    def test_missing_and_non_object_parents(self):
+        """Test absent or null parents give None instead of raising."""
+        data = {
+            "gamePk": 1,
+            "allPlays": [{"about": {"atBatIndex": 0}, "playEvents": [{"pitchData": None}]}],
+        }
+        events = extract_game(data, tables=["events"])["events"].data
+        assert events["start_speed"] == [None]
+        assert events["px"] == [None]
+        assert events["at_bat_index"] == [0]
+
+    def test_play_by_play_payload(self, live_game):
+        """Test playByPlay gives the same rows as liveGameV1, with game_pk passed in."""
+        from_feed = extract_game(live_game)
+        from_pbp = extract_game(load(PLAY_BY_PLAY), game_pk=live_game["gamePk"])
+        for name in TABLES:
+            assert from_pbp[name].data == from_feed[name].data
+
+    def test_accumulates_games(self, live_game):
+        """Test one extractor appends several games to the same tables."""
+        extractor = PlayByPlayExtractor(["plays"])
+        first = extractor.add_game(live_game)
+        second = extractor.add_game(live_game, game_pk=2)
+        assert first == second == {"plays": len(live_game["liveData"]["plays"]["allPlays"])}
+        game_pks = extractor.tables["plays"].data["game_pk"]
+        assert set(game_pks[: first["plays"]]) == {live_game["gamePk"]}
+        assert set(game_pks[first["plays"] :]) == {2}
+        extractor.clear()
+        assert len(extractor.tables["plays"]) == 0
+
+    def test_no_plays(self):
+        """Test payloads without allPlays give empty tables."""
+        assert all(len(table) == 0 for table in extract_game({"gamePk": 1}).values())
+
+
+class TestConversions:
+    """Test Arrow and NumPy conversion."""
+
+    def test_numpy(self, live_game):
+        """Test record arrays use the schema's dtypes and null stand-ins."""
+        np = pytest.importorskip("numpy")
+        events = extract_game(live_game)["events"]
+        array = events.to_numpy()
+        assert array.dtype.names == tuple(column.name for column in EVENT_COLUMNS)
+        assert len(array) == len(events)
+        non_pitch = events.data["is_pitch"].index(False)
+        assert math.isnan(array.start_speed[non_pitch])
+        assert array.zone[non_pitch] == -1
+        assert array.start_speed.dtype == np.float64
+
+    def test_arrow_and_parquet(self, live_game, tmp_path):
+        """Test Arrow tables have the fixed schema and round-trip through Parquet."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        events = extract_game(live_game)["events"]
+        table = events.to_arrow()
+        assert table.schema == events.arrow_schema()
+        assert table.num_rows == len(events)
+        path = events.write_parquet(tmp_path / "events.parquet")
+        assert pq.read_table(path).to_pydict() == table.to_pydict()
+
+    @pytest.mark.skipif(HAS_PYARROW, reason="pyarrow is installed")
+    def test_missing_pyarrow(self, live_game):
+        """Test a helpful ImportError names the extra to install."""
+        with pytest.raises(ImportError, match=r"pymlb-statsapi\[arrow\]"):
+            extract_game(live_game)["plays"].to_arrow()
+
+
+class TestExporter:
+    """Test the batch export over saved responses."""
+
+    @pytest.fixture
+    def saved(self, live_game, tmp_path) -> Path:
+        """A directory with an envelope, a raw body with sidecar, and a non-game file."""
+        source = tmp_path / "saved"
+        make_response(live_game, "liveGameV1", 747175).save_json(
+            str(source / "live.json.gz"), gzip=True
+        )
+        make_response(load(PLAY_BY_PLAY), "playByPlay", 747176).save_json(
+            str(source / "nested/pbp.json"), raw=True
+        )
+        make_response({"dates": []}, "schedule").save_json(str(source / "schedule.json"))
+        return source
+
+    def test_iter_saved(self, saved, live_game):
+        """Test saved play-by-play files are found, with game_pk from their metadata."""
+        found = [(path.name, game_pk) for path, _, game_pk in ColumnarExporter().iter_saved(saved)]
+        assert found == [("live.json.gz", 747175), ("pbp.json", 747176)]
+
+    def test_iter_saved_zstd(self, saved, live_game):
+        """Test files saved with zstd compression are read back too."""
+        pytest.importorskip("zstandard")
+        make_response(live_game, "liveGameV1", 747177).save_json(
+            str(saved / "zstd/live.json.zst"), compression="zstd", raw=True
+        )
+        found = [(path.name, game_pk) for path, _, game_pk in ColumnarExporter().iter_saved(saved)]
+        assert ("live.json.zst", 747177) in found
+
+    def test_export_directory(self, saved, live_game, tmp_path):
+        """Test each table is written to one Parquet file with a row group per game."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        totals = ColumnarExporter(["plays", "events"]).export_directory(saved, tmp_path / "out")
+        plays = len(live_game["liveData"]["plays"]["allPlays"])
+        assert totals["games"] == 2
+        assert totals["plays"] == 2 * plays
+        table = pq.read_table(tmp_path / "out/plays.parquet")
+        assert table.num_rows == 2 * plays
+        assert set(table.column("game_pk").to_pylist()) == {747175, 747176}
+        assert pq.ParquetFile(tmp_path / "out/events.parquet").num_row_groups == 2
+        assert not (tmp_path / "out/runners.parquet").exists()
@@ -0,0 +1,182 @@
+"""
+Unit tests for pluggable compression of saved responses.
+"""
+
+import gzip
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from pymlb_statsapi.model.factory import APIResponse, build_response
+from pymlb_statsapi.utils.compression import (
+    ZstdDictionaries,
+    get_compressor,
+    iter_saved,
+    read_saved,
+)
+
+DOCUMENT = json.dumps(
+    {"copyright": "MLB", "dates": [{"date": "2024-07-04", "games": []}] * 50}
+).encode()
+
+
+def make_response(game_pk: int = 747175, body: bytes = DOCUMENT) -> APIResponse:
+    return APIResponse(
+        response=build_response(
+            url=f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live",
+            status_code=200,
+            content=body,
+        ),
+        endpoint_name="game",
+        method_name="liveGameV1",
+        path_params={"game_pk": str(game_pk)},
+    )
+
+
+class TestCompressors:
+    """Test compressor lookup and the stdlib codecs."""
+
+    @pytest.mark.parametrize("name", ["none", "gzip", "gzip:1", "gzip:9"])
+    def test_round_trip(self, name):
+        """Test one-shot and streaming compression both round-trip."""
+        compressor = get_compressor(name)
+        assert compressor.decompress(compressor.compress(DOCUMENT)) == DOCUMENT
+
+        buffer = io.BytesIO()
+        with compressor.writer(buffer) as f:
+            f.write(DOCUMENT[:100])
+            f.write(DOCUMENT[100:])
+        assert not buffer.closed
+        assert compressor.decompress(buffer.getvalue()) == DOCUMENT
+
+    def test_names_and_levels(self, monkeypatch):
+        """Test level parsing, defaults, extensions and validation."""
+        assert get_compressor("gzip").level == 6
+        assert get_compressor("gzip:9").level == 9
+        assert get_compressor("gzip:1", level=4).level == 4
+        assert get_compressor("none").extension == ""
+        assert get_compressor("GZIP").extension == ".gz"
+        assert len(get_compressor("gzip:9").compress(DOCUMENT)) <= len(
+            get_compressor("gzip:1").compress(DOCUMENT)
+        )
+        monkeypatch.setenv("PYMLB_STATSAPI__COMPRESSION", "gzip:2")
+        assert get_compressor().level == 2
+
+        for name in ("brotli", "gzip:fast", "gzip:10"):
+            with pytest.raises(ValueError):
+                get_compressor(name)
+
+    def test_save_json_compression(self, tmp_path, monkeypatch):
+        """Test save_json writes through the compressor and takes its extension."""
+        monkeypatch.setenv("PYMLB_STATSAPI__BASE_FILE_PATH", str(tmp_path))
+        response = make_response()
+
+        result = response.save_json(compression="gzip:9", raw=True)
+        assert result["path"].endswith("game/liveGameV1/game_pk=747175.json.gz")
+        assert read_saved(result["path"]) == DOCUMENT
+
+        result = response.save_json(compression="none")
+        assert result["path"].endswith(".json")
+        assert json.loads(read_saved(result["path"]))["data"] == response.json()
+
+        # Unchanged default
+        result = response.save_json(gzip=True, raw=True)
+        with gzip.open(result["path"]) as f:
+            assert f.read() == DOCUMENT
+
+    def test_iter_saved(self, tmp_path):
+        """Test saved files are grouped by endpoint and method; sidecars are skipped."""
+        response = make_response()
+        response.save_json(prefix=str(tmp_path), raw=True)
+        response.save_json(prefix=str(tmp_path), gzip=True)
+        found = [(e, m, os.path.basename(p)) for e, m, p in iter_saved(tmp_path)]
+        assert found == [
+            ("game", "liveGameV1", "game_pk=747175.json"),
+            ("game", "liveGameV1", "game_pk=747175.json.gz"),
+        ]
+
+
+class TestZstd:
+    """Test zstd and trained dictionaries (skipped without zstandard)."""
+
+    @pytest.fixture(autouse=True)
+    def zstandard(self):
+        return pytest.importorskip("zstandard")
+
+    def test_round_trip(self, tmp_path):
+        """Test zstd compression, streamed saves and reading them back."""
+        compressor = get_compressor("zstd:19")
+        assert compressor.extension == ".zst"
+        assert compressor.decompress(compressor.compress(DOCUMENT)) == DOCUMENT
+
+        response = make_response()
+        path = response.save_json(str(tmp_path / "live.json.zst"), compression="zstd")
+        assert json.loads(read_saved(path["path"]))["data"] == response.json()
+
+    def test_multiple_frames(self):
+        """Test every frame is read, from streamed and one-shot writes alike."""
+        compressor = get_compressor("zstd")
+        buffer = io.BytesIO()
+        with compressor.writer(buffer) as f:
+            f.write(DOCUMENT)
+        data = buffer.getvalue() + compressor.compress(DOCUMENT)
+        assert compressor.decompress(data) == DOCUMENT + DOCUMENT
+
+    def test_dictionary(self, tmp_path):
+        """Test dictionaries trained from an archive are found again by frame ID."""
+        archive = tmp_path / "archive"
+        for game_pk in range(700000, 700200):
+            body = json.dumps(
+                {"gamePk": game_pk, "gameData": {"teams": ["Yankees", "Dodgers"]}, "n": game_pk}
+            ).encode()
+            make_response(game_pk, body).save_json(prefix=str(archive), gzip=True)
+
+        dictionaries = ZstdDictionaries(str(tmp_path / "dictionaries"))
+        trained = dictionaries.train_archive(archive, dict_size=4096)
+        assert list(trained) == ["game.liveGameV1"]
+
+        compressor = dictionaries.compressor("game", "liveGameV1")
+        assert compressor.dict_id == trained["game.liveGameV1"]
+        saved = make_response(1).save_json(
+            str(tmp_path / "new.json.zst"), compression=compressor, raw=True
+        )
+        # A fresh instance loads the dictionary from disk by the frame's ID
+        reader = ZstdDictionaries(str(tmp_path / "dictionaries"))
+        assert read_saved(saved["path"], reader) == DOCUMENT
+        with pytest.raises(KeyError):
+            read_saved(saved["path"], ZstdDictionaries(str(tmp_path / "empty")))
+
+        # One decompressor per dictionary ID, reused by later reads
+        with patch("pymlb_statsapi.utils.compression._zstd_compressor") as factory:
+            assert read_saved(saved["path"], reader) == DOCUMENT
+        factory.assert_not_called()
+
+        # Methods without a dictionary fall back to plain zstd
+        assert dictionaries.compressor("schedule", "schedule").dict_id == 0
+
+    def test_compressor_shared_across_threads(self, tmp_path):
+        """Test one dictionary compressor used by many threads at once round-trips."""
+        archive = tmp_path / "archive"
+        for game_pk in range(700000, 700200):
+            body = json.dumps({"gamePk": game_pk, "teams": ["Yankees", "Dodgers"]}).encode()
+            make_response(game_pk, body).save_json(prefix=str(archive), gzip=True)
+        dictionaries = ZstdDictionaries(str(tmp_path / "dictionaries"))
+        dictionaries.train_archive(archive, dict_size=4096)
+        compressor = dictionaries.compressor("game", "liveGameV1")
+
+        def save(game_pk: int) -> bool:
+            body = json.dumps({"gamePk": game_pk, "plays": list(range(game_pk % 500))}).encode()
+            saved = make_response(game_pk, body).save_json(
+                str(tmp_path / f"out/{game_pk}.json.zst"), compression=compressor, raw=True
+            )
+            return (
+                read_saved(saved["path"], dictionaries) == body
+                and compressor.decompress(compressor.compress(body)) == body
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(save, range(1000, 1400)))
@@ -0,0 +1,112 @@
+"""
+Unit tests for JSON Patch / JSON Pointer.
+"""
+
+import pytest
+
+from pymlb_statsapi.utils.jsonpatch import (
+    JSONPatchError,
+    apply_patch,
+    resolve_pointer,
+    split_pointer,
+)
+
+
+@pytest.fixture
+def document() -> dict:
+    return {
+        "metaData": {"timeStamp": "20240713_014130"},
+        "plays": [{"id": 0}, {"id": 1}],
+        "a/b": {"m~n": 1},
+    }
+
+
+class TestPointer:
+    """Test JSON Pointer parsing and resolution."""
+
+    def test_split_and_escapes(self):
+        """Test ~1 and ~0 unescape to / and ~."""
+        assert split_pointer("") == []
+        assert split_pointer("/a~1b/m~0n") == ["a/b", "m~n"]
+        with pytest.raises(JSONPatchError):
+            split_pointer("no-slash")
+
+    def test_resolve(self, document):
+        """Test members and array indexes resolve; missing paths raise."""
+        assert resolve_pointer(document, "/plays/1/id") == 1
+        assert resolve_pointer(document, "/a~1b/m~0n") == 1
+        assert resolve_pointer(document, "") is document
+        for pointer in ("/missing", "/plays/2", "/plays/01", "/plays/x", "/metaData/timeStamp/0"):
+            with pytest.raises(JSONPatchError):
+                resolve_pointer(document, pointer)
+
+
+class TestApplyPatch:
+    """Test RFC 6902 operations."""
+
+    def test_add(self, document):
+        """Test add sets members, inserts at an index and appends with '-'."""
+        apply_patch(
+            document,
+            [
+                {"op": "add", "path": "/metaData/wait", "value": 10},
+                {"op": "add", "path": "/plays/0", "value": {"id": -1}},
+                {"op": "add", "path": "/plays/-", "value": {"id": 2}},
+            ],
+        )
+        assert document["metaData"]["wait"] == 10
+        assert [play["id"] for play in document["plays"]] == [-1, 0, 1, 2]
+
+    def test_remove_and_replace(self, document):
+        """Test remove and replace require an existing target."""
+        apply_patch(
+            document,
+            [
+                {"op": "remove", "path": "/plays/0"},
+                {"op": "replace", "path": "/metaData/timeStamp", "value": "20240713_020000"},
+            ],
+        )
+        assert document["plays"] == [{"id": 1}]
+        assert document["metaData"]["timeStamp"] == "20240713_020000"
+        with pytest.raises(JSONPatchError):
+            apply_patch(document, [{"op": "replace", "path": "/missing", "value": 1}])
+        with pytest.raises(JSONPatchError):
+            apply_patch(document, [{"op": "remove", "path": "/plays/5"}])
+
+    def test_move_copy_test(self, document):
+        """Test move, copy (deep) and test."""
+        apply_patch(
+            document,
+            [
+                {"op": "copy", "from": "/plays/0", "path": "/first"},
+                {"op": "move", "from": "/plays/1", "path": "/last"},
+                {"op": "test", "path": "/last/id", "value": 1},
+            ],
+        )
+        document["first"]["id"] = 99
+        assert document["plays"] == [{"id": 0}]
+        assert document["last"] == {"id": 1}
+        with pytest.raises(JSONPatchError, match="Test failed"):
+            apply_patch(document, [{"op": "test", "path": "/last/id", "value": 2}])
+        with pytest.raises(JSONPatchError):
+            apply_patch(document, [{"op": "move", "from": "/last", "path": "/last/child"}])
+
+    def test_replace_root(self, document):
+        """Test replacing the root returns the new document."""
+        assert apply_patch(document, [{"op": "replace", "path": "", "value": [1]}]) == [1]
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"path": "/a"},
+            {"op": "add", "path": "/a"},
+            {"op": "copy", "path": "/a"},
+            {"op": "frobnicate", "path": "/a"},
+            {"op": "remove", "path": ""},
+            {"op": "add", "path": "/plays/7", "value": 1},
+        ],
+    )
+    def test_malformed(self, document, operation):
+        """Test malformed or inapplicable operations raise JSONPatchError."""
+        with pytest.raises(JSONPatchError):
+            apply_patch(document, [operation])
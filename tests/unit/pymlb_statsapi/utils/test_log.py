@@ -0,0 +1,142 @@
+"""
+Unit tests for package logging configuration.
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from pymlb_statsapi.model.factory import Endpoint, build_response
+from pymlb_statsapi.utils import log
+from pymlb_statsapi.utils.log import LogMixin, configure_logging, get_logger, sampled
+
+SCHEMA = {
+    "apis": [
+        {
+            "path": "/v1/schedule",
+            "description": "schedule",
+            "operations": [
+                {
+                    "method": "GET",
+                    "nickname": "schedule",
+                    "summary": "Get schedule",
+                    "notes": "",
+                    "parameters": [],
+                }
+            ],
+        }
+    ]
+}
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured():
+    """Route package logs to a list handler, restoring the configuration afterwards."""
+    handlers, level, rate = list(log.root.handlers), log.root.level, log._sample_rate
+    handler = ListHandler()
+    configure_logging(level="INFO", handler=handler)
+    yield handler
+    for current in list(log.root.handlers):
+        log.root.removeHandler(current)
+    for original in handlers:
+        log.root.addHandler(original)
+    log.root.setLevel(level)
+    log._sample_rate = rate
+
+
+def endpoint() -> Endpoint:
+    return Endpoint(
+        endpoint_name="schedule",
+        schema=SCHEMA,
+        endpoint_config={"schedule": {"path": "/v1/schedule"}},
+    )
+
+
+class TestLogging:
+    """Test logger hierarchy, configuration and sampling."""
+
+    def test_single_root_handler(self):
+        """Test class loggers are handler-less children of a propagating mlb_statsapi root."""
+
+        class Thing(LogMixin):
+            pass
+
+        logger = get_logger(Thing())
+        assert logger.name == f"mlb_statsapi.{Thing.__module__}.Thing"
+        assert get_logger(Thing()) is logger
+        assert logger.handlers == []
+        assert get_logger(endpoint()).name == "mlb_statsapi.model.factory.Endpoint"
+        # No handler until configure_logging is called; records reach the stdlib root
+        assert log.root.handlers == []
+        assert log.root.propagate
+
+    @patch("requests.Session.get")
+    def test_request_messages(self, mock_get, captured):
+        """Test GET and Success lines are logged once each at INFO with lazy arguments."""
+        mock_get.return_value = build_response(
+            "https://statsapi.mlb.com/api/v1/schedule", 200, b"{}"
+        )
+        endpoint().schedule()
+        messages = [(r.msg, r.getMessage()) for r in captured.records]
+        assert [msg for msg, _ in messages] == ["GET %s", "Success: %r"]
+        assert messages[0][1] == "GET https://statsapi.mlb.com/api/v1/schedule"
+
+    @patch("requests.Session.get")
+    def test_disabled_level_formats_nothing(self, mock_get, captured):
+        """Test nothing is formatted or emitted when INFO is disabled."""
+        mock_get.return_value = build_response(
+            "https://statsapi.mlb.com/api/v1/schedule", 200, b"{}"
+        )
+        configure_logging(level="WARNING")
+        with patch("pymlb_statsapi.model.factory.APIResponse.__repr__") as mock_repr:
+            endpoint().schedule()
+        mock_repr.assert_not_called()
+        assert captured.records == []
+
+    @patch("requests.Session.get")
+    def test_sampling(self, mock_get, captured):
+        """Test a sample rate of 0 drops per-request messages but not warnings."""
+        mock_get.return_value = build_response(
+            "https://statsapi.mlb.com/api/v1/schedule", 200, b"{}"
+        )
+        configure_logging(sample_rate=0.0)
+        assert not sampled()
+        endpoint().schedule()
+        assert captured.records == []
+        get_logger(endpoint()).warning("still logged")
+        assert [r.getMessage() for r in captured.records] == ["still logged"]
+        with pytest.raises(AssertionError):
+            configure_logging(sample_rate=2)
+
+    def test_format_and_propagate(self, captured):
+        """Test fmt applies to the handler and propagate is configurable."""
+        configure_logging(fmt="%(levelname)s %(message)s", propagate=False)
+        try:
+            assert captured.formatter._fmt == "%(levelname)s %(message)s"
+            assert not log.root.propagate
+        finally:
+            configure_logging(propagate=True)
+
+    def test_console_attached_on_configure(self, captured):
+        """Test configure_logging attaches the package's stderr handler when there is none."""
+        log.root.removeHandler(captured)
+        configure_logging(level="INFO")
+        assert log.root.handlers == [log.console]
+        configure_logging(level="WARNING")
+        assert log.root.handlers == [log.console]
+
+    def test_records_reach_application_root(self, caplog):
+        """Test records propagate to handlers on the stdlib root logger."""
+        with caplog.at_level(logging.WARNING):
+            get_logger(endpoint()).warning("to the application")
+        assert [r.name for r in caplog.records] == ["mlb_statsapi.model.factory.Endpoint"]
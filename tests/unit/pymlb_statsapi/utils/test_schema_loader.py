@@ -25,7 +25,7 @@ class TestSchemaLoader(TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.default_version = "1.0"
-        self.schema_loader = SchemaLoader(version=self.default_version)
+        self.schema_loader = SchemaLoader(version=self.default_version, use_index=False)
 
         # Sample test data
         self.sample_endpoint_model = {
@@ -56,7 +56,7 @@ class TestSchemaLoader(TestCase):
     )
     def test_initialization_custom_version(self, version):
         """Test SchemaLoader initialization with custom version."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         self.assertEqual(loader.version, version)
 
     @parameterize_versions(
@@ -67,7 +67,7 @@ class TestSchemaLoader(TestCase):
     )
     def test_dashed_version_property(self, version):
         """Test dashed_version property converts dots to dashes."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         expected = version.replace(".", "-")
         self.assertEqual(loader.dashed_version, expected)
 
@@ -82,7 +82,7 @@ class TestSchemaLoader(TestCase):
 
         for version, expected in test_cases:
             with self.subTest(version=version):
-                loader = SchemaLoader(version=version)
+                loader = SchemaLoader(version=version, use_index=False)
                 self.assertEqual(loader.dashed_version, expected)
 
     @patch("pymlb_statsapi.utils.schema_loader.as_file")
@@ -107,7 +107,7 @@ class TestSchemaLoader(TestCase):
             mock_file = MagicMock()
             mock_files.return_value.__truediv__.return_value = mock_file
 
-            result = SchemaLoader.load_endpoint_model()
+            result = SchemaLoader(use_index=False).load_endpoint_model()
 
             # Assertions
             mock_files.assert_called_once_with("pymlb_statsapi.resources.schemas")
@@ -121,7 +121,7 @@ class TestSchemaLoader(TestCase):
         mock_files.return_value.__truediv__.side_effect = FileNotFoundError("File not found")
 
         with self.assertRaises(FileNotFoundError):
-            SchemaLoader.load_endpoint_model()
+            SchemaLoader(use_index=False).load_endpoint_model()
 
     @patch("pymlb_statsapi.utils.schema_loader.as_file")
     @patch("pymlb_statsapi.utils.schema_loader.resources.files")
@@ -146,7 +146,7 @@ class TestSchemaLoader(TestCase):
             mock_files.return_value.__truediv__.return_value = mock_file
 
             with self.assertRaises(json.JSONDecodeError):
-                SchemaLoader.load_endpoint_model()
+                SchemaLoader(use_index=False).load_endpoint_model()
         finally:
             temp_path.unlink()
 
@@ -164,7 +164,7 @@ class TestSchemaLoader(TestCase):
         import tempfile
         from pathlib import Path
 
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         expected_filename = f"api_docs-{version.replace('.', '-')}.json"
 
         # Create a real temp file
@@ -196,7 +196,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.resources.files")
     def test_load_api_docs_file_not_found(self, version, mock_files):
         """Test load_api_docs when file is not found."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         mock_files.return_value.__truediv__.side_effect = FileNotFoundError("File not found")
 
         with self.assertRaises(FileNotFoundError):
@@ -215,7 +215,7 @@ class TestSchemaLoader(TestCase):
         import tempfile
         from pathlib import Path
 
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         schema_name = "team"
         expected_dir = (
             f"pymlb_statsapi.resources.schemas.statsapi.stats_api_{version.replace('.', '_')}"
@@ -249,7 +249,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.resources.files")
     def test_read_stats_schema_file_not_found(self, version, mock_files):
         """Test read_stats_schema when file is not found."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         mock_files.return_value.__truediv__.side_effect = FileNotFoundError("File not found")
 
         with self.assertRaises(FileNotFoundError):
@@ -265,7 +265,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.json.loads")
     def test_load_stats_schema_success(self, version, mock_json_loads, mock_read_schema):
         """Test successful loading and parsing of stats schema."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         schema_name = "team"
 
         # Setup mocks
@@ -284,7 +284,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.json.loads")
     def test_load_stats_schema_json_error(self, version, mock_json_loads, mock_read_schema):
         """Test load_stats_schema when JSON parsing fails."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
 
         mock_read_schema.return_value = "invalid json"
         mock_json_loads.side_effect = json.JSONDecodeError("Invalid JSON", "doc", 0)
@@ -301,7 +301,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.resources.files")
     def test_get_available_schemas_success(self, version, mock_files):
         """Test successful retrieval of available schemas."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         expected_dir = (
             f"pymlb_statsapi.resources.schemas.statsapi.stats_api_{version.replace('.', '_')}"
         )
@@ -337,7 +337,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.resources.files")
     def test_get_available_schemas_empty_directory(self, version, mock_files):
         """Test get_available_schemas with empty directory."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
 
         mock_schema_files = MagicMock()
         mock_schema_files.iterdir.return_value = []
@@ -351,7 +351,7 @@ class TestSchemaLoader(TestCase):
     @patch("pymlb_statsapi.utils.schema_loader.resources.files")
     def test_get_available_schemas_directory_not_found(self, version, mock_files):
         """Test get_available_schemas when directory is not found."""
-        loader = SchemaLoader(version=version)
+        loader = SchemaLoader(version=version, use_index=False)
         mock_files.side_effect = FileNotFoundError("Directory not found")
 
         with self.assertRaises(FileNotFoundError):
@@ -377,7 +377,7 @@ class TestSchemaLoader(TestCase):
                 patch("pymlb_statsapi.utils.schema_loader.resources.files") as mock_files,
                 patch("pymlb_statsapi.utils.schema_loader.json.loads") as mock_json_loads,
             ):
-                loader = SchemaLoader(version="1.0")
+                loader = SchemaLoader(version="1.0", use_index=False)
 
                 # Setup mocks - as_file returns different paths for different calls
                 mock_as_file.return_value.__enter__.side_effect = [api_docs_path, team_schema_path]
@@ -401,7 +401,7 @@ class TestSchemaLoader(TestCase):
     def test_edge_cases_schema_names(self):
         """Test edge cases for schema names."""
         with patch.object(SchemaLoader, "read_stats_schema") as mock_read_schema:
-            loader = SchemaLoader(version="1.0")
+            loader = SchemaLoader(version="1.0", use_index=False)
 
             # Test various schema name formats
             test_cases = [
@@ -418,3 +418,119 @@ class TestSchemaLoader(TestCase):
                     result = loader.read_stats_schema(schema_name)
                     mock_read_schema.assert_called_with(schema_name)
                     self.assertEqual(result, '{"test": "schema"}')
+
+
+class TestSchemaIndex(TestCase):
+    """Test loading schemas from the precompiled index."""
+
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+
+        self.raw = SchemaLoader(version="1.0", use_index=False)
+        self.indexed = SchemaLoader(version="1.0")
+
+        # The index is a build artifact (make schema-index), so build one for these tests
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.index_path = Path(tmp_dir.name) / self.raw.index_filename
+        self.index_path.write_bytes(self.raw.build_index())
+        patcher = patch.object(SchemaLoader, "_index_resource", return_value=self.index_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_built_index_is_loaded(self):
+        """Test an index built from the current JSON files is used."""
+        import marshal
+
+        index = self.indexed.load_index()
+        self.assertIsNotNone(index)
+        self.assertEqual(index["sha256"], marshal.loads(self.raw.build_index())["sha256"])
+
+    def test_index_matches_raw_json(self):
+        """Test every schema and the endpoint model match the raw JSON files."""
+        self.assertEqual(
+            sorted(self.indexed.get_available_schemas()), sorted(self.raw.get_available_schemas())
+        )
+        self.assertEqual(self.indexed.load_endpoint_model(), self.raw.load_endpoint_model())
+        for schema_file in self.raw.get_available_schemas():
+            name = schema_file.removesuffix(".json")
+            with self.subTest(schema=name):
+                self.assertEqual(
+                    self.indexed.load_stats_schema(name), self.raw.load_stats_schema(name)
+                )
+
+    def test_index_read_once(self):
+        """Test the index file is read once and schemas don't touch the JSON files."""
+        with (
+            patch.object(SchemaLoader, "_read_index", wraps=self.indexed._read_index) as read_index,
+            patch.object(SchemaLoader, "read_stats_schema") as read_raw,
+        ):
+            self.indexed.get_available_schemas()
+            self.indexed.load_stats_schema("team")
+            self.indexed.load_endpoint_model()
+            read_index.assert_called_once()
+            read_raw.assert_not_called()
+
+    def test_schemas_are_independent_copies(self):
+        """Test callers can mutate a loaded schema without affecting later loads."""
+        schema = self.indexed.load_stats_schema("team")
+        schema["apis"].clear()
+        self.assertTrue(self.indexed.load_stats_schema("team")["apis"])
+
+    def test_missing_index_falls_back(self):
+        """Test a missing index falls back to the raw JSON files."""
+        from pathlib import Path
+
+        with patch.object(
+            SchemaLoader, "_index_resource", return_value=Path("/nonexistent/x.index")
+        ):
+            self.assertIsNone(self.indexed.load_index())
+            self.assertEqual(
+                self.indexed.load_stats_schema("team"), self.raw.load_stats_schema("team")
+            )
+
+    def test_stale_index_falls_back(self):
+        """Test a same-size edit to a schema makes the index stale."""
+        import tempfile
+        from pathlib import Path
+
+        sources = self.raw._source_files()
+        raw = sources["team.json"].read_bytes()
+        # Flip a required flag without changing the file size
+        edited = raw.replace(b'"required": false', b'"required": true ', 1)
+        self.assertNotEqual(edited, raw)
+        self.assertEqual(len(edited), len(raw))
+        with tempfile.TemporaryDirectory() as tmp:
+            team = Path(tmp) / "team.json"
+            team.write_bytes(edited)
+            with patch.object(
+                SchemaLoader, "_source_files", return_value={**sources, "team.json": team}
+            ):
+                self.assertIsNone(self.indexed.load_index())
+
+    def test_other_format_falls_back(self):
+        """Test an index built with another format version is ignored."""
+        with patch("pymlb_statsapi.utils.schema_loader.INDEX_FORMAT", -1):
+            self.assertIsNone(self.indexed.load_index())
+
+    def test_other_version_falls_back(self):
+        """Test an index built for another schema version is ignored."""
+        import marshal
+
+        with patch("pymlb_statsapi.utils.schema_loader.marshal.loads") as mock_loads:
+            mock_loads.return_value = {**marshal.loads(self.raw.build_index()), "version": "2.0"}
+            self.assertIsNone(self.indexed._read_index())
+
+    def test_corrupt_index_falls_back(self):
+        """Test unreadable index bytes are ignored."""
+        mock_resource = MagicMock()
+        mock_resource.read_bytes.return_value = b"not marshal"
+        with patch.object(SchemaLoader, "_index_resource", return_value=mock_resource):
+            self.assertIsNone(self.indexed.load_index())
+
+    def test_use_index_disabled(self):
+        """Test use_index=False never reads the index."""
+        with patch.object(SchemaLoader, "_read_index") as read_index:
+            self.assertIsNone(self.raw.load_index())
+            read_index.assert_not_called()